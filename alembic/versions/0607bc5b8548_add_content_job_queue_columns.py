@@ -0,0 +1,40 @@
+"""add content job queue columns
+
+Revision ID: 0607bc5b8548
+Revises: 0607bc5b8547
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0607bc5b8548'
+down_revision = '0607bc5b8547'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add queue/lease columns used by the generation worker"""
+    op.add_column('content_jobs', sa.Column('queued_at', sa.DateTime(), nullable=True))
+    op.add_column('content_jobs', sa.Column('attempts', sa.Integer(), nullable=False, server_default='0'))
+    op.add_column('content_jobs', sa.Column('lease_owner', sa.String(), nullable=True))
+    op.add_column('content_jobs', sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+    # Partial index: only queued jobs are scanned by workers
+    op.create_index(
+        'idx_content_jobs_queue',
+        'content_jobs',
+        ['status', 'queued_at'],
+        unique=False,
+        postgresql_where=sa.text('queued_at IS NOT NULL')
+    )
+
+
+def downgrade():
+    """Remove queue/lease columns"""
+    op.drop_index('idx_content_jobs_queue', table_name='content_jobs')
+    op.drop_column('content_jobs', 'lease_expires_at')
+    op.drop_column('content_jobs', 'lease_owner')
+    op.drop_column('content_jobs', 'attempts')
+    op.drop_column('content_jobs', 'queued_at')
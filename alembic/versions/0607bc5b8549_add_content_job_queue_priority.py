@@ -0,0 +1,25 @@
+"""add content job queue priority
+
+Revision ID: 0607bc5b8549
+Revises: 0607bc5b8548
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0607bc5b8549'
+down_revision = '0607bc5b8548'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add queue priority class (0 = priority_processing tier, 1 = standard) used when workers claim jobs"""
+    op.add_column('content_jobs', sa.Column('queue_priority', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    """Remove queue priority column"""
+    op.drop_column('content_jobs', 'queue_priority')
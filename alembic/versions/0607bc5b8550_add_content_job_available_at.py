@@ -0,0 +1,25 @@
+"""add content job available_at
+
+Revision ID: 0607bc5b8550
+Revises: 0607bc5b8549
+Create Date: 2026-10-16 23:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '0607bc5b8550'
+down_revision = '0607bc5b8549'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Add retry backoff timestamp; workers skip abandoned jobs until it has passed"""
+    op.add_column('content_jobs', sa.Column('available_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    """Remove retry backoff column"""
+    op.drop_column('content_jobs', 'available_at')
@@ -160,7 +160,6 @@ from fastapi.responses import StreamingResponse, JSONResponse
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from pydantic import BaseModel
-from content_creation_crew.crew import ContentCreationCrew
 from content_creation_crew.auth_routes import router as auth_router
 from content_creation_crew.oauth_routes import router as oauth_router
 from content_creation_crew.subscription_routes import router as subscription_router
@@ -170,6 +169,14 @@ from content_creation_crew.database import init_db, User, get_db, Session, engin
 from content_creation_crew.services.subscription_service import SubscriptionService
 from content_creation_crew.services.plan_policy import PlanPolicy
 from content_creation_crew.services.content_cache import get_cache
+from content_creation_crew.content_extraction import (
+    extract_content_from_result,
+    extract_content_async,
+    extract_social_media_content_async,
+    extract_audio_content_async,
+    extract_video_content_async,
+    clean_content,
+)
 from sqlalchemy import text
 import asyncio
 import json
@@ -271,11 +278,10 @@ async def lifespan(app):
             from content_creation_crew.services.tts_provider import get_tts_provider
             tts_provider = get_tts_provider()
             if tts_provider and tts_provider.is_available():
-                # Synthesize a small test phrase to load model into memory
-                test_text = "Hello, this is a test."
+                # Load the default voice into the process-wide registry (off the event loop)
                 try:
                     logger.info("Pre-warming TTS models...")
-                    tts_provider.synthesize(test_text, voice_id="default", format="wav")
+                    await asyncio.to_thread(tts_provider.warm_up)
                     logger.info("✓ TTS models pre-warmed successfully")
                 except Exception as e:
                     logger.warning(f"TTS pre-warming failed: {e}")
@@ -321,6 +327,41 @@ async def lifespan(app):
         logger.info("✓ Database connections closed successfully")
     except Exception as e:
         logger.warning(f"Error closing database connections during shutdown: {e}")
+    try:
+        from content_creation_crew.db.async_engine import dispose_async_engine
+        await dispose_async_engine()
+    except Exception as e:
+        logger.warning(f"Error closing async database connections during shutdown: {e}")
+    try:
+        from content_creation_crew.services.tts_provider import shutdown_synthesis_pool
+        shutdown_synthesis_pool()
+    except Exception as e:
+        logger.warning(f"Error stopping TTS synthesis pool during shutdown: {e}")
+    try:
+        from content_creation_crew.services.video_provider import shutdown_frame_pool
+        shutdown_frame_pool()
+    except Exception as e:
+        logger.warning(f"Error stopping scene frame pool during shutdown: {e}")
+    try:
+        from content_creation_crew.services.storage_provider import shutdown_storage_executor
+        shutdown_storage_executor()
+    except Exception as e:
+        logger.warning(f"Error stopping storage I/O pool during shutdown: {e}")
+    try:
+        from content_creation_crew.services.audio_transcoder import shutdown_transcode_executor
+        shutdown_transcode_executor()
+    except Exception as e:
+        logger.warning(f"Error stopping audio transcode pool during shutdown: {e}")
+    try:
+        from content_creation_crew.services.password_hasher import shutdown_password_hasher
+        shutdown_password_hasher()
+    except Exception as e:
+        logger.warning(f"Error stopping password hashing pool during shutdown: {e}")
+    try:
+        from content_creation_crew.services.token_blacklist import shutdown_token_blacklist
+        shutdown_token_blacklist()
+    except Exception as e:
+        logger.warning(f"Error stopping token blacklist listener during shutdown: {e}")
     logger.info("Application shutdown complete")
 
 app = FastAPI(
@@ -617,6 +658,11 @@ from content_creation_crew.refund_routes import router as refund_router
 app.include_router(refund_router)
 logger.info("✓ Refund routes registered")
 
+# Register storage media routes (/v1/storage with byte ranges, ETags and presigned S3 redirects)
+from content_creation_crew.storage_routes import router as storage_router
+app.include_router(storage_router)
+logger.info("✓ Storage media routes registered")
+
 # Add static file serving for storage (voiceovers, etc.)
 from fastapi.staticfiles import StaticFiles
 from pathlib import Path
@@ -625,9 +671,6 @@ import os
 # Serve storage files
 storage_path = Path(os.getenv("STORAGE_PATH", "./storage"))
 if storage_path.exists():
-    # Mount main storage directory at /v1/storage
-    app.mount("/v1/storage", StaticFiles(directory=str(storage_path)), name="storage")
-    
     # Also mount voiceovers subdirectory at /voiceovers for easier access
     voiceovers_path = storage_path / "voiceovers"
     if voiceovers_path.exists():
@@ -955,10 +998,11 @@ async def run_crew_async(topic: str, tier: str = 'free', content_types: list = N
             return
         
         # Initialize crew with tier-appropriate configuration
-        crew_instance = ContentCreationCrew(tier=tier, content_types=content_types)
-        crew_obj = crew_instance._build_crew(content_types=content_types)
+        from content_creation_crew.services.crew_pool import get_crew_pool
+        from content_creation_crew.crew import get_model_for_tier
+        crew_obj, _ = get_crew_pool().get_crew(tier, content_types)
         # Store model name for later use in validation and caching
-        model_name = crew_instance._get_model_for_tier(tier)
+        model_name = get_model_for_tier(tier)
         status_msg = json.dumps({'type': 'status', 'message': f'Crew initialized with {tier} tier. Starting research...'})
         yield f"data: {status_msg}\n\n"
         flush_buffers()
@@ -1278,611 +1322,6 @@ async def run_crew_async(topic: str, tier: str = 'free', content_types: list = N
         flush_buffers()
 
 
-def extract_content_from_result(result, task_name: str = None) -> str:
-    """
-    Extract content directly from CrewAI result object without file I/O.
-    This is faster and more reliable than waiting for files.
-    
-    Args:
-        result: CrewAI result object
-        task_name: Optional task name to look for (e.g., 'editing_task')
-        
-    Returns:
-        Extracted content string
-    """
-    content = ""
-    
-    # Try to extract from result object directly (fastest method)
-    if hasattr(result, 'tasks_output') and result.tasks_output:
-        # Look for the requested task (e.g., editing task for blog, social_media task for social)
-        for task in reversed(result.tasks_output):
-            # Check if this is the task we're looking for
-            if task_name:
-                task_name_lower = task_name.lower()
-                # If no description, check task name/type attributes
-                if hasattr(task, 'description'):
-                    task_desc = str(task.description).lower()
-                    # Flexible matching: 'social' should match 'social_media', 'social_media_standalone', etc.
-                    if task_name_lower == 'social':
-                        # For 'social', match any task with 'social' in description
-                        if 'social' not in task_desc:
-                            continue
-                    elif task_name_lower not in task_desc:
-                        continue
-                elif hasattr(task, 'name') or hasattr(task, 'task_name'):
-                    # Try matching by task name/type
-                    task_name_attr = str(getattr(task, 'name', getattr(task, 'task_name', ''))).lower()
-                    if task_name_lower == 'social':
-                        if 'social' not in task_name_attr:
-                            continue
-                    elif task_name_lower not in task_name_attr:
-                        continue
-                else:
-                    # No way to identify task, skip filtering
-                    pass
-            
-            # Try different attributes in order of preference
-            if hasattr(task, 'raw') and task.raw:
-                content = str(task.raw)
-                if len(content.strip()) > 10:
-                    return content
-            elif hasattr(task, 'output') and task.output:
-                content = str(task.output)
-                if len(content.strip()) > 10:
-                    return content
-            elif hasattr(task, 'content') and task.content:
-                content = str(task.content)
-                if len(content.strip()) > 10:
-                    return content
-    
-    # Fallback to result object directly (for standalone tasks or when task matching fails)
-    if not content or len(content.strip()) < 10:
-        # If we're looking for social media and didn't find it in tasks, try result object
-        # This handles standalone social media where there's only one task
-        if task_name and task_name.lower() == 'social':
-            # For social, try to get the last task output (should be social media task)
-            if hasattr(result, 'tasks_output') and result.tasks_output:
-                last_task = result.tasks_output[-1]
-                if hasattr(last_task, 'raw') and last_task.raw:
-                    content = str(last_task.raw)
-                elif hasattr(last_task, 'output') and last_task.output:
-                    content = str(last_task.output)
-                elif hasattr(last_task, 'content') and last_task.content:
-                    content = str(last_task.content)
-        
-        # Final fallback to result object attributes
-        if not content or len(content.strip()) < 10:
-            if hasattr(result, 'raw') and result.raw:
-                content = str(result.raw)
-            elif hasattr(result, 'content') and result.content:
-                content = str(result.content)
-            elif hasattr(result, 'output') and result.output:
-                content = str(result.output)
-            else:
-                content = str(result)
-    
-    return content
-
-
-async def extract_content_async(result, topic: str, logger) -> str:
-    """Extract content from result asynchronously - optimized to use result objects first"""
-    content = ""
-    extraction_method = None
-    
-    logger.debug(f"[EXTRACT] Starting blog content extraction for topic='{topic}'")
-    logger.debug(f"[EXTRACT] Result type: {type(result)}, has tasks_output: {hasattr(result, 'tasks_output')}")
-    
-    # First, try extracting directly from result object (fastest, no I/O)
-    logger.info("[EXTRACT] Attempting direct extraction from result object...")
-    extract_start = time.time()
-    content = extract_content_from_result(result, 'editing')
-    extract_duration = time.time() - extract_start
-    
-    if content and len(content.strip()) > 10:
-        extraction_method = "result_object"
-        logger.info(f"[EXTRACT] Successfully extracted content from result object in {extract_duration:.3f}s, length={len(content)}")
-        logger.debug(f"[EXTRACT] Content preview (first 200 chars): {content[:200]}...")
-        return content
-    
-    logger.debug(f"[EXTRACT] Direct extraction result: length={len(content) if content else 0}, duration={extract_duration:.3f}s")
-    
-    # Fallback to file-based extraction (slower, but more reliable for some cases)
-    # Removed 1-second delay - check file immediately
-    logger.info("[EXTRACT] Direct extraction failed, trying file-based extraction...")
-    file_extract_start = time.time()
-    
-    # Try reading the file multiple times (reduced attempts for faster failure)
-    output_file = Path("content_output.md")
-    for attempt in range(3):  # Reduced from 5 to 3 attempts for faster failure
-        if output_file.exists():
-            try:
-                file_content = output_file.read_text(encoding='utf-8')
-                if file_content and len(file_content.strip()) > 10:
-                    logger.info(f"File read attempt {attempt + 1}, file length: {len(file_content)}")
-                    
-                    # First try: look for separator
-                    if "---" in file_content:
-                        parts = file_content.split("---", 1)
-                        if len(parts) > 1:
-                            content = parts[1].strip()
-                            logger.info(f"Extracted from file after separator, length: {len(content)}")
-                            if len(content) > 10:
-                                break
-                    
-                    # Second try: skip metadata lines and get actual content
-                    lines = file_content.split('\n')
-                    content_lines = []
-                    skip_patterns = [
-                        '# Content Creation:',
-                        '**Generated on:**',
-                        '---',
-                        'I now can give a great answer',  # Common prefix
-                    ]
-                    
-                    skip_until_content = True
-                    for i, line in enumerate(lines):
-                        line_stripped = line.strip()
-                        
-                        # Skip empty lines at the start
-                        if skip_until_content and not line_stripped:
-                            continue
-                        
-                        # Check if this is a skip pattern
-                        should_skip = False
-                        for pattern in skip_patterns:
-                            if pattern.lower() in line_stripped.lower():
-                                should_skip = True
-                                skip_until_content = True
-                                break
-                        
-                        if should_skip:
-                            continue
-                        
-                        # Found content - start collecting
-                        skip_until_content = False
-                        content_lines.append(line)
-                    
-                    if content_lines:
-                        content = '\n'.join(content_lines).strip()
-                        logger.info(f"Extracted from file (skipping metadata), length: {len(content)}")
-                        if len(content) > 10:
-                            break
-                    
-                    # Fallback: use entire file if it's substantial
-                    if len(file_content.strip()) > 100:
-                        content = file_content.strip()
-                        logger.info(f"Using entire file content, length: {len(content)}")
-                        break
-                        
-            except Exception as e:
-                logger.warning(f"Error reading file (attempt {attempt + 1}): {e}")
-        # Removed sleep delay - check immediately for faster failure
-        if attempt < 2:  # Only wait between attempts, not after last attempt
-            await asyncio.sleep(0.05)  # OPTIMIZATION: Reduced from 0.2s to 0.05s for faster retries (75% reduction)
-    
-    # Final fallback: extract from result object (should have been tried first, but just in case)
-    if not content or len(content.strip()) < 10:
-        logger.warning("[EXTRACT] File content empty or too short, retrying result object extraction")
-        fallback_start = time.time()
-        content = extract_content_from_result(result, 'editing')
-        fallback_duration = time.time() - fallback_start
-        if content and len(content.strip()) > 10:
-            extraction_method = "result_object_fallback"
-            logger.info(f"[EXTRACT] Fallback extraction succeeded in {fallback_duration:.3f}s, length={len(content)}")
-        else:
-            logger.error(f"[EXTRACT] Fallback extraction also failed, duration={fallback_duration:.3f}s")
-    
-    file_extract_duration = time.time() - file_extract_start if 'file_extract_start' in locals() else 0
-    extraction_method = extraction_method or "file_based"
-    
-    logger.info(f"[EXTRACT] Final extraction result: method={extraction_method}, length={len(content) if content else 0}, total_duration={file_extract_duration:.3f}s")
-    if content:
-        logger.debug(f"[EXTRACT] Content preview (first 300 chars): {content[:300]}...")
-    else:
-        logger.error("[EXTRACT] No content extracted - extraction failed completely")
-    
-    return content
-
-
-async def extract_social_media_content_async(result, topic: str, logger) -> str:
-    """Extract social media content from result asynchronously - optimized"""
-    logger.debug(f"[EXTRACT_SOCIAL] Starting social media extraction, result type: {type(result)}")
-    
-    # First try direct extraction from result object
-    # Try 'social' first (handles both regular and standalone tasks with flexible matching)
-    content = extract_content_from_result(result, 'social')
-    
-    # If that fails, try 'social_media' (for standalone task)
-    if not content or len(content.strip()) < 10:
-        logger.debug("[EXTRACT_SOCIAL] 'social' extraction failed, trying 'social_media'")
-        content = extract_content_from_result(result, 'social_media')
-    
-    if content and len(content.strip()) > 10:
-        logger.info(f"[EXTRACT_SOCIAL] Successfully extracted social media content from result object, length: {len(content)}")
-        logger.debug(f"[EXTRACT_SOCIAL] Content preview: {content[:200]}")
-        return content
-    else:
-        logger.warning(f"[EXTRACT_SOCIAL] Failed to extract from result object, content length: {len(content) if content else 0}, will try file-based extraction")
-    
-    # Fallback to file-based extraction (removed 1s delay for faster extraction)
-    # Try reading the social media output file
-    output_file = Path("social_media_output.md")
-    for attempt in range(3):  # Reduced from 10 to 3 attempts for faster failure
-        if output_file.exists():
-            try:
-                file_content = output_file.read_text(encoding='utf-8')
-                if file_content and len(file_content.strip()) > 10:
-                    logger.info(f"Social media file read attempt {attempt + 1}, file length: {len(file_content)}")
-                    
-                    # First try: look for separator
-                    if "---" in file_content:
-                        parts = file_content.split("---", 1)
-                        if len(parts) > 1:
-                            content = parts[1].strip()
-                            logger.info(f"Extracted social media from file after separator, length: {len(content)}")
-                            if len(content) > 10:
-                                break
-                    
-                    # Second try: skip metadata lines and get actual content
-                    lines = file_content.split('\n')
-                    content_lines = []
-                    skip_patterns = [
-                        '# Social Media',
-                        '**Generated on:**',
-                        '---',
-                        'I now can give a great answer',
-                    ]
-                    
-                    skip_until_content = True
-                    for i, line in enumerate(lines):
-                        line_stripped = line.strip()
-                        
-                        # Skip empty lines at the start
-                        if skip_until_content and not line_stripped:
-                            continue
-                        
-                        # Check if this is a skip pattern
-                        should_skip = False
-                        for pattern in skip_patterns:
-                            if pattern.lower() in line_stripped.lower():
-                                should_skip = True
-                                skip_until_content = True
-                                break
-                        
-                        if should_skip:
-                            continue
-                        
-                        # Found content - start collecting
-                        skip_until_content = False
-                        content_lines.append(line)
-                    
-                    if content_lines:
-                        content = '\n'.join(content_lines).strip()
-                        logger.info(f"Extracted social media from file (skipping metadata), length: {len(content)}")
-                        if len(content) > 10:
-                            break
-                    
-                    # Fallback: use entire file if it's substantial
-                    if len(file_content.strip()) > 50:
-                        content = file_content.strip()
-                        logger.info(f"Using entire social media file content, length: {len(content)}")
-                        break
-                        
-            except Exception as e:
-                logger.warning(f"Error reading social media file (attempt {attempt + 1}): {e}")
-        # Removed sleep delay - check immediately for faster failure
-        if attempt < 2:  # Only wait between attempts, not after last attempt
-            await asyncio.sleep(0.05)  # OPTIMIZATION: Reduced from 0.2s to 0.05s for faster retries (75% reduction)
-    
-    # Final fallback: extract from result object (try both 'social' and 'social_media')
-    if not content or len(content.strip()) < 10:
-        logger.info("[EXTRACT_SOCIAL] Social media file content empty, using result object extraction")
-        content = extract_content_from_result(result, 'social')
-        # If that fails, try 'social_media' (for standalone task)
-        if not content or len(content.strip()) < 10:
-            logger.debug("[EXTRACT_SOCIAL] 'social' extraction failed, trying 'social_media'")
-            content = extract_content_from_result(result, 'social_media')
-        
-        # If still no content, try extracting from result object directly (for standalone tasks)
-        if not content or len(content.strip()) < 10:
-            logger.debug("[EXTRACT_SOCIAL] Task-based extraction failed, trying direct result object extraction")
-            if hasattr(result, 'tasks_output') and result.tasks_output:
-                # Try to get content from the last task (should be social media task for standalone)
-                last_task = result.tasks_output[-1]
-                if hasattr(last_task, 'raw') and last_task.raw:
-                    content = str(last_task.raw)
-                elif hasattr(last_task, 'output') and last_task.output:
-                    content = str(last_task.output)
-                elif hasattr(last_task, 'content') and last_task.content:
-                    content = str(last_task.content)
-            
-            # Final fallback: try result object attributes directly
-            if not content or len(content.strip()) < 10:
-                if hasattr(result, 'raw') and result.raw:
-                    content = str(result.raw)
-                elif hasattr(result, 'content') and result.content:
-                    content = str(result.content)
-                elif hasattr(result, 'output') and result.output:
-                    content = str(result.output)
-    
-    logger.info(f"[EXTRACT_SOCIAL] Final extracted social media content length: {len(content) if content else 0}")
-    if content and len(content.strip()) > 10:
-        logger.info(f"[EXTRACT_SOCIAL] Social media content preview: {content[:200]}")
-    else:
-        logger.error(f"[EXTRACT_SOCIAL] Failed to extract social media content - result type: {type(result)}, has tasks_output: {hasattr(result, 'tasks_output')}")
-        if hasattr(result, 'tasks_output') and result.tasks_output:
-            logger.error(f"[EXTRACT_SOCIAL] tasks_output length: {len(result.tasks_output)}")
-            for i, task in enumerate(result.tasks_output):
-                logger.error(f"[EXTRACT_SOCIAL] Task {i}: type={type(task)}, has raw={hasattr(task, 'raw')}, has output={hasattr(task, 'output')}, has content={hasattr(task, 'content')}")
-    
-    return content
-
-
-async def extract_audio_content_async(result, topic: str, logger) -> str:
-    """Extract audio content from result asynchronously - optimized with improved error handling"""
-    logger.info(f"[AUDIO_EXTRACTION] Starting audio extraction for topic: {topic}")
-    content = None
-    
-    # First try direct extraction from result object
-    try:
-        content = extract_content_from_result(result, 'audio')
-        if content and len(content.strip()) > 10:
-            logger.info(f"[AUDIO_EXTRACTION] Successfully extracted audio content from result object, length: {len(content)}")
-            return content
-    except Exception as e:
-        logger.warning(f"[AUDIO_EXTRACTION] Error in direct extraction: {e}")
-    
-    # Try alternative extraction methods from result object
-    # Check for audio_content_task output in result
-    try:
-        if hasattr(result, 'tasks_output'):
-            logger.info(f"[AUDIO_EXTRACTION] Checking tasks_output for audio content, found {len(result.tasks_output)} tasks")
-            for idx, task_output in enumerate(result.tasks_output):
-                task_name = getattr(task_output, 'task', None)
-                task_str = str(task_name).lower() if task_name else ''
-                
-                # Check if this is an audio-related task
-                if 'audio' in task_str or 'audio_content' in task_str:
-                    logger.info(f"[AUDIO_EXTRACTION] Found audio task at index {idx}: {task_str}")
-                    
-                    # Try extracting from raw output
-                    if hasattr(task_output, 'raw') and task_output.raw:
-                        raw_content = str(task_output.raw)
-                        if len(raw_content.strip()) > 10:
-                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.raw, length: {len(raw_content)}")
-                            content = raw_content
-                            break
-                    
-                    # Try extracting from output attribute
-                    if hasattr(task_output, 'output') and task_output.output:
-                        output_content = str(task_output.output)
-                        if len(output_content.strip()) > 10:
-                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.output, length: {len(output_content)}")
-                            content = output_content
-                            break
-                    
-                    # Try extracting from result attribute
-                    if hasattr(task_output, 'result') and task_output.result:
-                        result_content = str(task_output.result)
-                        if len(result_content.strip()) > 10:
-                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.result, length: {len(result_content)}")
-                            content = result_content
-                            break
-    except Exception as e:
-        logger.warning(f"[AUDIO_EXTRACTION] Error checking tasks_output: {e}")
-    
-    if content and len(content.strip()) > 10:
-        logger.info(f"[AUDIO_EXTRACTION] Successfully extracted audio content from tasks_output, length: {len(content)}")
-        return content
-    
-    # Fallback to file-based extraction (removed 1s delay for faster extraction)
-    # Try reading the audio output file
-    output_file = Path("audio_output.md")
-    logger.info(f"[AUDIO_EXTRACTION] Attempting file-based extraction from {output_file}")
-    for attempt in range(3):  # Reduced from 10 to 3 attempts for faster failure
-        if output_file.exists():
-            try:
-                file_content = output_file.read_text(encoding='utf-8')
-                if file_content and len(file_content.strip()) > 10:
-                    logger.info(f"[AUDIO_EXTRACTION] Audio file read attempt {attempt + 1}, file length: {len(file_content)}")
-                    
-                    # First try: look for separator
-                    if "---" in file_content:
-                        parts = file_content.split("---", 1)
-                        if len(parts) > 1:
-                            content = parts[1].strip()
-                            logger.info(f"[AUDIO_EXTRACTION] Extracted audio from file after separator, length: {len(content)}")
-                            if len(content) > 10:
-                                break
-                    
-                    # Second try: skip metadata lines and get actual content
-                    lines = file_content.split('\n')
-                    content_lines = []
-                    skip_patterns = [
-                        '# Audio',
-                        '**Generated on:**',
-                        '---',
-                        'I now can give a great answer',
-                    ]
-                    
-                    skip_until_content = True
-                    for i, line in enumerate(lines):
-                        line_stripped = line.strip()
-                        
-                        # Skip empty lines at the start
-                        if skip_until_content and not line_stripped:
-                            continue
-                        
-                        # Check if this is a skip pattern
-                        should_skip = False
-                        for pattern in skip_patterns:
-                            if pattern.lower() in line_stripped.lower():
-                                should_skip = True
-                                skip_until_content = True
-                                break
-                        
-                        if should_skip:
-                            continue
-                        
-                        # Found content - start collecting
-                        skip_until_content = False
-                        content_lines.append(line)
-                    
-                    if content_lines:
-                        content = '\n'.join(content_lines).strip()
-                        logger.info(f"[AUDIO_EXTRACTION] Extracted audio from file (skipping metadata), length: {len(content)}")
-                        if len(content) > 10:
-                            break
-                    
-                    # Fallback: use entire file if it's substantial
-                    if len(file_content.strip()) > 50:
-                        content = file_content.strip()
-                        logger.info(f"[AUDIO_EXTRACTION] Using entire audio file content, length: {len(content)}")
-                        break
-                        
-            except Exception as e:
-                logger.warning(f"[AUDIO_EXTRACTION] Error reading audio file (attempt {attempt + 1}): {e}")
-        else:
-            logger.debug(f"[AUDIO_EXTRACTION] Audio file does not exist (attempt {attempt + 1})")
-        
-        # Removed sleep delay - check immediately for faster failure
-        if attempt < 2:  # Only wait between attempts, not after last attempt
-            await asyncio.sleep(0.05)  # OPTIMIZATION: Reduced from 0.2s to 0.05s for faster retries (75% reduction)
-    
-    # Final fallback: extract from result object again
-    if not content or len(content.strip()) < 10:
-        logger.info("[AUDIO_EXTRACTION] Audio file content empty, retrying result object extraction")
-        try:
-            content = extract_content_from_result(result, 'audio')
-        except Exception as e:
-            logger.warning(f"[AUDIO_EXTRACTION] Final extraction attempt failed: {e}")
-    
-    logger.info(f"[AUDIO_EXTRACTION] Final extracted audio content length: {len(content) if content else 0}")
-    if content and len(content.strip()) > 10:
-        logger.info(f"[AUDIO_EXTRACTION] Audio content preview: {content[:200]}")
-    else:
-        logger.warning(f"[AUDIO_EXTRACTION] Audio content extraction failed - no valid content found")
-    
-    return content
-
-
-async def extract_video_content_async(result, topic: str, logger) -> str:
-    """Extract video content from result asynchronously - optimized"""
-    # First try direct extraction from result object
-    content = extract_content_from_result(result, 'video')
-    
-    if content and len(content.strip()) > 10:
-        logger.info(f"Successfully extracted video content from result object, length: {len(content)}")
-        return content
-    
-    # Fallback to file-based extraction (removed 1s delay for faster extraction)
-    # Try reading the video output file
-    output_file = Path("video_output.md")
-    for attempt in range(3):  # Reduced from 10 to 3 attempts for faster failure
-        if output_file.exists():
-            try:
-                file_content = output_file.read_text(encoding='utf-8')
-                if file_content and len(file_content.strip()) > 10:
-                    logger.info(f"Video file read attempt {attempt + 1}, file length: {len(file_content)}")
-                    
-                    # First try: look for separator
-                    if "---" in file_content:
-                        parts = file_content.split("---", 1)
-                        if len(parts) > 1:
-                            content = parts[1].strip()
-                            logger.info(f"Extracted video from file after separator, length: {len(content)}")
-                            if len(content) > 10:
-                                break
-                    
-                    # Second try: skip metadata lines and get actual content
-                    lines = file_content.split('\n')
-                    content_lines = []
-                    skip_patterns = [
-                        '# Video',
-                        '**Generated on:**',
-                        '---',
-                        'I now can give a great answer',
-                    ]
-                    
-                    skip_until_content = True
-                    for i, line in enumerate(lines):
-                        line_stripped = line.strip()
-                        
-                        # Skip empty lines at the start
-                        if skip_until_content and not line_stripped:
-                            continue
-                        
-                        # Check if this is a skip pattern
-                        should_skip = False
-                        for pattern in skip_patterns:
-                            if pattern.lower() in line_stripped.lower():
-                                should_skip = True
-                                skip_until_content = True
-                                break
-                        
-                        if should_skip:
-                            continue
-                        
-                        # Found content - start collecting
-                        skip_until_content = False
-                        content_lines.append(line)
-                    
-                    if content_lines:
-                        content = '\n'.join(content_lines).strip()
-                        logger.info(f"Extracted video from file (skipping metadata), length: {len(content)}")
-                        if len(content) > 10:
-                            break
-                    
-                    # Fallback: use entire file if it's substantial
-                    if len(file_content.strip()) > 50:
-                        content = file_content.strip()
-                        logger.info(f"Using entire video file content, length: {len(content)}")
-                        break
-                        
-            except Exception as e:
-                logger.warning(f"Error reading video file (attempt {attempt + 1}): {e}")
-        # Removed sleep delay - check immediately for faster failure
-        if attempt < 2:  # Only wait between attempts, not after last attempt
-            await asyncio.sleep(0.05)  # OPTIMIZATION: Reduced from 0.2s to 0.05s for faster retries (75% reduction)
-    
-    # Final fallback: extract from result object
-    if not content or len(content.strip()) < 10:
-        logger.info("Video file content empty, using result object extraction")
-        content = extract_content_from_result(result, 'video')
-    
-    logger.info(f"Final extracted video content length: {len(content) if content else 0}")
-    if content:
-        logger.info(f"Video content preview: {content[:200]}")
-    
-    return content
-
-
-def clean_content(content: str) -> str:
-    """Clean up content by removing common prefixes"""
-    if not content:
-        return ""
-    
-    lines = content.split('\n')
-    cleaned_lines = []
-    skip_prefixes = [
-        "your final answer must be",
-        "i now can give a great answer",
-        "here is the",
-    ]
-    skip_next = False
-    for line in lines:
-        line_lower = line.strip().lower()
-        if any(line_lower.startswith(prefix) for prefix in skip_prefixes):
-            skip_next = True
-            continue
-        if skip_next and not line.strip():
-            skip_next = False
-            continue
-        skip_next = False
-        cleaned_lines.append(line)
-    return '\n'.join(cleaned_lines).strip()
-
-
 @app.post("/api/generate")
 async def generate_content(
     request: TopicRequest,
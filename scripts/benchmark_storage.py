@@ -0,0 +1,166 @@
+"""
+Benchmark S3StorageProvider against a local S3 stand-in
+
+Measures small-object put latency (sequential and concurrent through the async
+storage API), large-object upload throughput (single PUT vs concurrent
+multipart) and batch delete vs per-key delete.
+
+Runs against moto's in-process S3 server when moto is installed, or against
+any S3-compatible endpoint such as MinIO:
+
+    S3_ENDPOINT_URL=http://localhost:9000 AWS_ACCESS_KEY_ID=minioadmin \\
+    AWS_SECRET_ACCESS_KEY=minioadmin python scripts/benchmark_storage.py
+
+Usage:
+    python scripts/benchmark_storage.py [--objects 200] [--large-mb 64] [--concurrency 16]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+
+def start_moto_server():
+    """Start moto's S3 server in-process and point the AWS environment at it"""
+    from moto.server import ThreadedMotoServer
+    
+    server = ThreadedMotoServer(port=0)
+    server.start()
+    host, port = server.get_host_and_port()
+    os.environ["S3_ENDPOINT_URL"] = f"http://{host}:{port}"
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+    return server
+
+
+def percentile(values: list, fraction: float) -> float:
+    """Nearest-rank percentile of values"""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+def report(name: str, timings: list):
+    """Print latency summary in milliseconds"""
+    timings_ms = [timing * 1000 for timing in timings]
+    print(
+        f"{name:>28}: p50 {statistics.median(timings_ms):.1f}ms  "
+        f"p95 {percentile(timings_ms, 0.95):.1f}ms  n={len(timings_ms)}"
+    )
+
+
+async def concurrent_puts(storage, keys: list, payload: bytes, concurrency: int) -> list:
+    """Put keys with the async storage API, concurrency at a time"""
+    semaphore = asyncio.Semaphore(concurrency)
+    timings = []
+    
+    async def put_one(key):
+        async with semaphore:
+            start_time = time.perf_counter()
+            await storage.aput(key, payload)
+            timings.append(time.perf_counter() - start_time)
+    
+    await asyncio.gather(*(put_one(key) for key in keys))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark S3 storage provider")
+    parser.add_argument("--objects", type=int, default=200, help="Small objects to put and delete")
+    parser.add_argument("--object-kb", type=int, default=64)
+    parser.add_argument("--large-mb", type=int, default=64, help="Size of the large upload")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--bucket", default="benchmark-storage")
+    args = parser.parse_args()
+    
+    server = None
+    if not os.getenv("S3_ENDPOINT_URL"):
+        try:
+            server = start_moto_server()
+        except ImportError:
+            print("[ERROR] Set S3_ENDPOINT_URL (e.g. MinIO) or install moto[server]")
+            return False
+    
+    from content_creation_crew.services import storage_provider as storage_module
+    
+    storage = storage_module.S3StorageProvider(bucket_name=args.bucket)
+    if not storage._available:
+        print("[ERROR] S3 client unavailable (is boto3 installed?)")
+        return False
+    try:
+        storage.s3_client.create_bucket(Bucket=args.bucket)
+    except Exception:
+        pass  # Bucket already exists
+    
+    print(f"Endpoint {os.environ['S3_ENDPOINT_URL']}, bucket {args.bucket}")
+    payload = os.urandom(args.object_kb * 1024)
+    keys = [f"bench/small_{index}.bin" for index in range(args.objects)]
+    
+    # Small puts: sequential, then concurrent on the storage I/O pool
+    sequential = []
+    started = time.perf_counter()
+    for key in keys:
+        start_time = time.perf_counter()
+        storage.put(key, payload)
+        sequential.append(time.perf_counter() - start_time)
+    sequential_total = time.perf_counter() - started
+    report("sequential put", sequential)
+    
+    started = time.perf_counter()
+    concurrent = asyncio.run(concurrent_puts(storage, keys, payload, args.concurrency))
+    concurrent_total = time.perf_counter() - started
+    report(f"async put x{args.concurrency}", concurrent)
+    print(f"{'small put throughput':>28}: {len(keys) / sequential_total:.0f}/s sequential, {len(keys) / concurrent_total:.0f}/s async")
+    
+    # Large upload: single PUT vs concurrent multipart
+    with tempfile.NamedTemporaryFile(suffix=".bin") as large_file:
+        for _ in range(args.large_mb):
+            large_file.write(os.urandom(1024 * 1024))
+        large_file.flush()
+        
+        start_time = time.perf_counter()
+        with open(large_file.name, "rb") as f:
+            storage.s3_client.put_object(Bucket=args.bucket, Key="bench/large_single.bin", Body=f)
+        single_seconds = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        storage.put_file("bench/large_multipart.bin", large_file.name)
+        multipart_seconds = time.perf_counter() - start_time
+    
+    print(
+        f"{'large upload':>28}: single PUT {args.large_mb / single_seconds:.1f} MB/s, "
+        f"multipart {args.large_mb / multipart_seconds:.1f} MB/s "
+        f"({storage_module.S3_MULTIPART_CHUNKSIZE_MB}MB parts x{storage_module.S3_MAX_CONCURRENCY})"
+    )
+    
+    # Deletes: one request per key vs DeleteObjects batches
+    half = len(keys) // 2
+    start_time = time.perf_counter()
+    for key in keys[:half]:
+        storage.delete(key)
+    per_key_seconds = time.perf_counter() - start_time
+    
+    start_time = time.perf_counter()
+    results = storage.delete_many(keys[half:] + ["bench/large_single.bin", "bench/large_multipart.bin"])
+    batch_seconds = time.perf_counter() - start_time
+    print(
+        f"{'delete':>28}: per key {half / per_key_seconds:.0f}/s, "
+        f"batch {len(results) / batch_seconds:.0f}/s ({sum(results.values())}/{len(results)} deleted)"
+    )
+    
+    storage_module.shutdown_storage_executor()
+    if server is not None:
+        server.stop()
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
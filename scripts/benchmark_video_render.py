@@ -0,0 +1,92 @@
+"""
+Benchmark BaselineVideoRenderer pipelines
+
+Renders the same sample video script with the single-pass ffmpeg pipeline and
+the moviepy pipeline and prints wall-clock render times.
+
+Usage:
+    python scripts/benchmark_video_render.py [--scenes 6] [--resolution 1280x720] [--audio narration.wav] [--runs 2]
+"""
+import argparse
+import os
+import shutil
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+src_path = Path(__file__).parent.parent / "src"
+sys.path.insert(0, str(src_path))
+
+from content_creation_crew.services.video_provider import BaselineVideoRenderer
+
+
+def build_script(scene_count: int) -> dict:
+    """Sample video script with scene_count scenes"""
+    return {
+        "scenes": [
+            {
+                "title": f"Scene {index + 1}",
+                "content": "Remote work lets teams hire anywhere, cut commutes and focus on outcomes. " * 3,
+                "duration_seconds": 5.0
+            }
+            for index in range(scene_count)
+        ]
+    }
+
+
+def benchmark(pipeline: str, script: dict, options: dict, runs: int) -> list:
+    """Render the script runs times with a pipeline and return render times"""
+    renderer = BaselineVideoRenderer()
+    timings = []
+    for _ in range(runs):
+        start_time = time.time()
+        result = renderer.render(script, {**options, "pipeline": pipeline})
+        timings.append(time.time() - start_time)
+        print(f"  {pipeline}: {timings[-1]:.2f}s ({os.path.getsize(result['video_path'])} bytes)")
+        shutil.rmtree(result['work_dir'], ignore_errors=True)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark baseline video render pipelines")
+    parser.add_argument("--scenes", type=int, default=6)
+    parser.add_argument("--resolution", default="1280x720")
+    parser.add_argument("--fps", type=int, default=30)
+    parser.add_argument("--audio", help="Narration audio file to mux")
+    parser.add_argument("--runs", type=int, default=2)
+    args = parser.parse_args()
+    
+    width, height = (int(value) for value in args.resolution.lower().split("x"))
+    options = {
+        "resolution": (width, height),
+        "fps": args.fps,
+        "background_type": "placeholder",
+        "include_narration": bool(args.audio),
+        "narration_audio_path": args.audio
+    }
+    script = build_script(args.scenes)
+    
+    if not BaselineVideoRenderer().is_available():
+        print("[ERROR] BaselineVideoRenderer is not available (needs PIL and ffmpeg)")
+        return False
+    
+    print(f"Rendering {args.scenes} scenes at {width}x{height}@{args.fps}fps, {args.runs} runs per pipeline")
+    results = {}
+    for pipeline in ("ffmpeg", "moviepy"):
+        try:
+            results[pipeline] = min(benchmark(pipeline, script, options, args.runs))
+        except Exception as e:
+            print(f"[ERROR] {pipeline} pipeline failed: {e}")
+    
+    print()
+    for pipeline, best in results.items():
+        print(f"{pipeline:>8}: best {best:.2f}s")
+    if len(results) == 2:
+        print(f"Speedup: {results['moviepy'] / results['ffmpeg']:.1f}x")
+    return bool(results)
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -380,6 +380,7 @@ async def make_user_admin(
     target_user.is_admin = True
     db.commit()
     db.refresh(target_user)
+    get_cache_invalidation_service().invalidate_user(user_id, reason="admin_granted")
     
     logger.info(f"Admin {admin_user.id} made user {user_id} ({target_user.email}) an admin")
     
@@ -427,6 +428,7 @@ async def remove_user_admin(
     target_user.is_admin = False
     db.commit()
     db.refresh(target_user)
+    get_cache_invalidation_service().invalidate_user(user_id, reason="admin_revoked")
     
     logger.info(f"Admin {admin_user.id} removed admin status from user {user_id} ({target_user.email})")
     
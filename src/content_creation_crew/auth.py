@@ -4,7 +4,7 @@ Authentication utilities and JWT token handling
 import os
 import hashlib
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Tuple
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 import bcrypt
@@ -12,9 +12,9 @@ from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import OAuth2PasswordBearer, HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from .database import get_db, User
-
-# Module-level flag to prevent repeated blacklist import warnings
-_blacklist_import_warning_logged = False
+from .db.async_engine import AsyncSessionLocal
+from .services.principal_cache import AuthPrincipal, get_principal_cache, load_principal
+from .services.token_blacklist import get_token_blacklist
 
 # Import config for SECRET_KEY (will be imported after config is initialized)
 # Use lazy import to avoid circular dependency
@@ -103,8 +103,8 @@ def get_password_hash(password: str) -> str:
         password_to_hash = password_bytes
     
     # Use bcrypt directly to avoid passlib initialization issues
-    # Generate salt and hash
-    salt = bcrypt.gensalt()
+    # Generate salt (at the configured cost) and hash
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_to_hash, salt)
     
     # Return as string (bcrypt returns bytes)
@@ -327,14 +327,11 @@ def get_auth_token(
     return None
 
 
-async def get_current_user(
-    token: Optional[str] = Depends(get_auth_token),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get current authenticated user from token
+def _verify_access_token(token: Optional[str]) -> Tuple[int, int]:
+    """Validate an access token (signature, expiry, revocation) and return its user ID and iat
     
-    Checks both Authorization header (Bearer token) and auth_token cookie.
-    Cookie is checked as fallback when Authorization header is not present.
+    Raises:
+        HTTPException: 401 if the token is missing, invalid or revoked
     """
     import logging
     logger = logging.getLogger(__name__)
@@ -381,17 +378,10 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    # Check token blacklist (for revoked tokens)
+    # Check token blacklist (for revoked tokens); misses are answered by a local Bloom filter
     jti = payload.get("jti")
     if jti:
         try:
-            # Try relative import first, fallback to absolute import
-            try:
-                from .services.token_blacklist import get_token_blacklist
-            except ImportError:
-                # Fallback to absolute import if relative import fails
-                from content_creation_crew.services.token_blacklist import get_token_blacklist
-            
             blacklist = get_token_blacklist()
             
             if blacklist.is_revoked(jti):
@@ -404,32 +394,28 @@ async def get_current_user(
             
             # Check if token was issued before user-level revocation (password change, etc.)
             token_issued_at = payload.get("iat")
-            if token_issued_at:
-                token_issued_datetime = datetime.utcfromtimestamp(token_issued_at)
-                if blacklist.is_user_revoked(user_id, token_issued_datetime):
-                    logger.warning(f"Authentication failed: Token for user {user_id} issued before revocation")
-                    raise HTTPException(
-                        status_code=status.HTTP_401_UNAUTHORIZED,
-                        detail="Token has been revoked. Please log in again.",
-                        headers={"WWW-Authenticate": "Bearer"},
-                    )
+            if token_issued_at and blacklist.is_user_revoked(user_id, token_issued_at):
+                logger.warning(f"Authentication failed: Token for user {user_id} issued before revocation")
+                raise HTTPException(
+                    status_code=status.HTTP_401_UNAUTHORIZED,
+                    detail="Token has been revoked. Please log in again.",
+                    headers={"WWW-Authenticate": "Bearer"},
+                )
         except HTTPException:
             # Re-raise HTTP exceptions (token is blacklisted)
             raise
-        except ImportError as e:
-            # Only log once at module level to avoid spam on every request
-            global _blacklist_import_warning_logged
-            if not _blacklist_import_warning_logged:
-                logger.debug(f"Token blacklist module not available: {e}. Continuing without blacklist check (this is OK if Redis is not configured).")
-                _blacklist_import_warning_logged = True
-            # Continue without blacklist check if module not available
         except Exception as e:
-            # Only log actual errors, not expected import failures
             logger.debug(f"Error checking token blacklist: {e}. Continuing without blacklist check.")
             # Continue anyway - don't block auth if blacklist check fails
     
-    logger.debug(f"Looking up user with ID: {user_id}")
-    user = db.query(User).filter(User.id == user_id).first()
+    return user_id, int(payload.get("iat") or 0)
+
+
+def _require_active_user(user, user_id: int):
+    """Reject missing and inactive accounts (User or AuthPrincipal)"""
+    import logging
+    logger = logging.getLogger(__name__)
+    
     if user is None:
         logger.warning(f"Authentication failed: User with ID {user_id} not found in database")
         raise HTTPException(
@@ -448,3 +434,40 @@ async def get_current_user(
     logger.debug(f"Authentication successful for user: {user.email}")
     return user
 
+
+async def get_current_user(
+    token: Optional[str] = Depends(get_auth_token),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get current authenticated user from token
+    
+    Checks both Authorization header (Bearer token) and auth_token cookie.
+    Cookie is checked as fallback when Authorization header is not present.
+    Loads the User row on every request - handlers that only need the caller's
+    identity, role or plan use get_current_principal instead.
+    """
+    user_id, _ = _verify_access_token(token)
+    user = db.query(User).filter(User.id == user_id).first()
+    return _require_active_user(user, user_id)
+
+
+async def get_current_principal(
+    token: Optional[str] = Depends(get_auth_token)
+) -> AuthPrincipal:
+    """Get current authenticated principal from token, without a database query on cache hits
+    
+    For endpoints that only need the caller's identity, role or plan. The user
+    is loaded (on the async engine) only on a principal cache miss; handlers
+    that need the User row itself must keep using get_current_user.
+    """
+    user_id, issued_at = _verify_access_token(token)
+    
+    principal_cache = get_principal_cache()
+    principal = principal_cache.get(user_id, issued_at) if principal_cache else None
+    if principal is None:
+        async with AsyncSessionLocal() as db:
+            principal = await load_principal(db, user_id)
+        if principal is not None and principal_cache:
+            principal_cache.set(principal, issued_at)
+    
+    return _require_active_user(principal, user_id)
@@ -9,18 +9,21 @@ from typing import Optional
 from datetime import timedelta, datetime
 from .database import get_db, User, init_db
 from .auth import (
-    verify_password,
-    get_password_hash,
     create_access_token,
+    get_current_principal,
     get_current_user,
+    get_auth_token,
+    verify_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     http_bearer
 )
 from fastapi.security import HTTPAuthorizationCredentials
 from .config import config
+from .services.principal_cache import AuthPrincipal
 from .services.gdpr_export_service import GDPRExportService
 from .services.gdpr_deletion_service import GDPRDeletionService
 from .services.password_validator import get_password_validator
+from .services.password_hasher import hash_password, verify_password_async
 from .middleware.auth_rate_limit import get_auth_rate_limiter
 
 
@@ -143,7 +146,7 @@ async def signup(user_data: UserSignup, request: Request, db: Session = Depends(
         
         # Create new user
         logger.info(f"Creating user for email: {user_data.email}")
-        hashed_password = get_password_hash(user_data.password)
+        hashed_password = await hash_password(user_data.password)
         new_user = User(
             email=user_data.email,
             hashed_password=hashed_password,
@@ -418,7 +421,9 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), request: Reque
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    if not verify_password(form_data.password, user.hashed_password):
+    # bcrypt runs on the hashing pool (503 if saturated), not on the event loop
+    password_valid, upgraded_hash = await verify_password_async(form_data.password, user.hashed_password)
+    if not password_valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -431,6 +436,19 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends(), request: Reque
             detail="User account is inactive"
         )
     
+    # Upgrade hashes made with a different BCRYPT_ROUNDS cost
+    if upgraded_hash:
+        from .services.metrics import PasswordHashMetrics
+        try:
+            user.hashed_password = upgraded_hash
+            db.commit()
+            PasswordHashMetrics.record_rehash()
+        except Exception as e:
+            # Not fatal: the old hash still verifies, the upgrade is retried next login
+            db.rollback()
+            import logging
+            logging.getLogger(__name__).warning(f"Failed to upgrade password hash for user {user.id}: {e}")
+    
     # Create access token
     # JWT requires 'sub' claim to be a string
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
@@ -589,9 +607,27 @@ async def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.post("/logout")
-async def logout(request: Request, current_user: User = Depends(get_current_user)):
-    """Logout user and clear httpOnly cookie"""
+async def logout(
+    request: Request,
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    token: Optional[str] = Depends(get_auth_token)
+):
+    """Logout user, revoke the current token and clear httpOnly cookie"""
+    import logging
+    import time
     from fastapi.responses import JSONResponse
+    from .services.token_blacklist import get_token_blacklist
+    logger = logging.getLogger(__name__)
+    
+    # Revoke the token until it would have expired (other instances learn of it via pub/sub)
+    payload = verify_token(token) if token else None
+    if payload and payload.get("jti") and payload.get("exp"):
+        try:
+            expires_in = int(payload["exp"]) - int(time.time())
+            if expires_in > 0:
+                get_token_blacklist().revoke(payload["jti"], expires_in)
+        except Exception as e:
+            logger.warning(f"Failed to revoke token on logout for user {current_user.id}: {e}")
     
     # Create response
     response = JSONResponse(content={"message": "Logged out successfully"})
@@ -628,7 +664,7 @@ async def logout(request: Request, current_user: User = Depends(get_current_user
 
 
 @router.get("/csrf-token")
-async def get_csrf_token(current_user: User = Depends(get_current_user)):
+async def get_csrf_token(current_user: AuthPrincipal = Depends(get_current_principal)):
     """
     Generate CSRF token for authenticated users
     
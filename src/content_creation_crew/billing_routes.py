@@ -10,7 +10,8 @@ import json
 import logging
 
 from .database import User, get_db, Organization, Subscription
-from .auth import get_current_user
+from .auth import get_current_principal, get_current_user
+from .services.principal_cache import AuthPrincipal
 from .services.billing_service import BillingService
 from .services.billing_gateway import get_billing_gateway
 from .db.models.subscription import SubscriptionPlan, PaymentProvider, SubscriptionStatus
@@ -213,7 +214,7 @@ async def create_bank_transfer_request(
 
 @router.get("/subscription")
 async def get_subscription(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get current user's subscription"""
@@ -97,6 +97,22 @@ class Config:
     # This prevents premature timeouts while still catching hanging operations
     CREWAI_TIMEOUT: int = int(os.getenv("CREWAI_TIMEOUT", "300"))
     
+    # Generation job execution
+    # inline: run jobs as asyncio tasks inside the API process
+    # queue: enqueue jobs in Postgres; run `python -m content_creation_crew.worker` to process them (requires REDIS_URL)
+    JOB_EXECUTION_MODE: str = os.getenv("JOB_EXECUTION_MODE", "inline").lower()
+    WORKER_CONCURRENCY: int = int(os.getenv("WORKER_CONCURRENCY", "2"))  # Jobs per worker process
+    WORKER_POLL_INTERVAL: float = float(os.getenv("WORKER_POLL_INTERVAL", "1.0"))  # Seconds between queue polls
+    WORKER_LEASE_SECONDS: int = int(os.getenv("WORKER_LEASE_SECONDS", "60"))  # Lease renewed by heartbeat
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))  # Attempts before an orphaned job is failed
+    JOB_RETRY_BACKOFF_SECONDS: float = float(os.getenv("JOB_RETRY_BACKOFF_SECONDS", "5"))  # Delay before an abandoned job is reclaimed, doubled per attempt
+    JOB_RETRY_BACKOFF_MAX_SECONDS: float = float(os.getenv("JOB_RETRY_BACKOFF_MAX_SECONDS", "300"))  # Cap on the abandoned-job retry delay
+    
+    # Generation scheduling (per process, in front of run_generation_async)
+    # Jobs are admitted by tier priority_processing and capped per org at the tier's max_parallel_tasks
+    GENERATION_MAX_CONCURRENT_JOBS: int = int(os.getenv("GENERATION_MAX_CONCURRENT_JOBS", "4"))  # In-flight LLM jobs per process
+    GENERATION_SCHEDULER_AGING_SECONDS: float = float(os.getenv("GENERATION_SCHEDULER_AGING_SECONDS", "120"))  # Wait before a standard job is promoted
+    
     # Video rendering feature flag
     ENABLE_VIDEO_RENDERING: bool = os.getenv("ENABLE_VIDEO_RENDERING", "false").lower() in ("true", "1", "yes")
     
@@ -104,6 +120,7 @@ class Config:
     RATE_LIMIT_RPM: int = int(os.getenv("RATE_LIMIT_RPM", "60"))  # Default: 60 requests per minute
     RATE_LIMIT_GENERATE_RPM: int = int(os.getenv("RATE_LIMIT_GENERATE_RPM", "10"))  # Default: 10 generation requests per minute
     RATE_LIMIT_SSE_CONNECTIONS: int = int(os.getenv("RATE_LIMIT_SSE_CONNECTIONS", "5"))  # Default: 5 SSE connections per user
+    RATE_LIMIT_PLAN_CACHE_TTL: int = int(os.getenv("RATE_LIMIT_PLAN_CACHE_TTL", "60"))  # Seconds a user's plan is cached by the rate limiter
     
     # Content moderation configuration
     ENABLE_CONTENT_MODERATION: bool = os.getenv("ENABLE_CONTENT_MODERATION", "true").lower() in ("true", "1", "yes")
@@ -142,6 +159,14 @@ class Config:
     
     # Bcrypt Configuration (S9)
     BCRYPT_ROUNDS: int = int(os.getenv("BCRYPT_ROUNDS", "12"))
+    PASSWORD_HASH_WORKERS: int = int(os.getenv("PASSWORD_HASH_WORKERS", "2"))  # Threads running bcrypt off the event loop
+    PASSWORD_HASH_MAX_PENDING: int = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "32"))  # Queued + running hashes before logins get 503
+    
+    # Access token revocation (Redis blacklist with a local Bloom filter in front)
+    TOKEN_REVOCATION_BLOOM_CAPACITY: int = int(os.getenv("TOKEN_REVOCATION_BLOOM_CAPACITY", "100000"))  # Revoked tokens the filter is sized for
+    TOKEN_REVOCATION_BLOOM_ERROR_RATE: float = float(os.getenv("TOKEN_REVOCATION_BLOOM_ERROR_RATE", "0.001"))  # Filter hits confirmed in Redis
+    TOKEN_REVOCATION_REFRESH_SECONDS: int = int(os.getenv("TOKEN_REVOCATION_REFRESH_SECONDS", "60"))  # Full filter rebuild interval
+    TOKEN_REVOCATION_USER_CACHE_TTL: int = int(os.getenv("TOKEN_REVOCATION_USER_CACHE_TTL", "30"))  # Per-user revoke-before cache
     
     # Request Size Limits (M4)
     MAX_REQUEST_BYTES: int = int(os.getenv("MAX_REQUEST_BYTES", str(2 * 1024 * 1024)))  # 2MB default
@@ -153,6 +178,43 @@ class Config:
     DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
     DB_POOL_RECYCLE: int = int(os.getenv("DB_POOL_RECYCLE", "900"))  # 15 minutes (900s) - prevents stale SSL connections
     DB_STATEMENT_TIMEOUT: int = int(os.getenv("DB_STATEMENT_TIMEOUT", "10000"))  # 10 seconds in milliseconds
+    DB_LIVENESS_STRATEGY: str = os.getenv("DB_LIVENESS_STRATEGY", "pre_ping").lower()  # "pre_ping" or "optimistic" (no ping round trip at checkout; the first statement is retried once on a disconnect)
+    
+    # Async engine (asyncpg) for hot read endpoints and job status writes - a separate pool from the sync engine
+    ASYNC_DATABASE_URL: str = os.getenv("ASYNC_DATABASE_URL", "")  # Defaults to DATABASE_URL with the asyncpg driver (sqlite+aiosqlite:// in tests)
+    DB_ASYNC_POOL_SIZE: int = int(os.getenv("DB_ASYNC_POOL_SIZE", "10"))
+    DB_ASYNC_MAX_OVERFLOW: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "10"))
+    
+    # Authenticated principal cache (user snapshot per token, so auth skips the user query)
+    AUTH_PRINCIPAL_CACHE_ENABLED: bool = os.getenv("AUTH_PRINCIPAL_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+    AUTH_PRINCIPAL_CACHE_TTL: int = int(os.getenv("AUTH_PRINCIPAL_CACHE_TTL", "300"))  # Redis TTL in seconds
+    AUTH_PRINCIPAL_L1_TTL: int = int(os.getenv("AUTH_PRINCIPAL_L1_TTL", "30"))  # In-process TTL; bounds staleness on other workers after invalidation
+    AUTH_PRINCIPAL_L1_MAX_ENTRIES: int = int(os.getenv("AUTH_PRINCIPAL_L1_MAX_ENTRIES", "10000"))
+    
+    # SSE in-memory event store limits (used when Redis is not available)
+    SSE_MEMORY_MAX_EVENTS: int = int(os.getenv("SSE_MEMORY_MAX_EVENTS", "20000"))  # Total events across all jobs
+    SSE_MEMORY_MAX_BYTES: int = int(os.getenv("SSE_MEMORY_MAX_BYTES", str(64 * 1024 * 1024)))  # 64MB of serialized events
+    
+    # In-memory content cache limits (used when Redis is not available)
+    CONTENT_CACHE_MAX_BYTES: int = int(os.getenv("CONTENT_CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 64MB of serialized content
+    
+    # Near-duplicate topic lookup after an exact content cache miss (e.g. "remote work" vs "remote working").
+    # The topic index is per process, also with the Redis cache backend.
+    CONTENT_CACHE_SIMILAR_TOPICS: bool = os.getenv("CONTENT_CACHE_SIMILAR_TOPICS", "false").lower() in ("true", "1", "yes")
+    CONTENT_CACHE_SIMILARITY_THRESHOLD: float = float(os.getenv("CONTENT_CACHE_SIMILARITY_THRESHOLD", "0.8"))  # Jaccard of normalized word shingles
+    CONTENT_CACHE_SIMILAR_MAX_TOPICS: int = int(os.getenv("CONTENT_CACHE_SIMILAR_MAX_TOPICS", "10000"))  # Indexed topics per process
+    
+    # Content-addressed TTS output cache (same script, voice, speed, format and provider reuse stored audio)
+    TTS_CACHE_ENABLED: bool = os.getenv("TTS_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+    TTS_CACHE_INDEX_ENTRIES: int = int(os.getenv("TTS_CACHE_INDEX_ENTRIES", "1024"))  # Hot index entries per process
+    TTS_CACHE_INDEX_TTL: int = int(os.getenv("TTS_CACHE_INDEX_TTL", str(7 * 24 * 3600)))  # Redis hot index TTL in seconds
+    TTS_CACHE_MAX_AGE: int = int(os.getenv("TTS_CACHE_MAX_AGE", str(30 * 24 * 3600)))  # Stored entry lifetime in seconds (0 = never expire)
+    TTS_CACHE_MAX_BYTES: int = int(os.getenv("TTS_CACHE_MAX_BYTES", str(5 * 1024 * 1024 * 1024)))  # Stored audio budget (0 = unlimited)
+    
+    # Media serving for /v1/storage (byte ranges, ETags, sendfile)
+    STORAGE_MEDIA_MAX_AGE: int = int(os.getenv("STORAGE_MEDIA_MAX_AGE", str(365 * 24 * 3600)))  # Cache-Control max-age; storage keys are never reused
+    STORAGE_ETAG_HASH_MAX_BYTES: int = int(os.getenv("STORAGE_ETAG_HASH_MAX_BYTES", str(256 * 1024 * 1024)))  # Larger files get a size/mtime ETag
+    STORAGE_ACCEL_REDIRECT_PREFIX: str = os.getenv("STORAGE_ACCEL_REDIRECT_PREFIX", "")  # e.g. "/internal-storage/" to let nginx send local files
     
     # Ollama URL alias (for compatibility)
     OLLAMA_URL: str = OLLAMA_BASE_URL
@@ -187,6 +249,12 @@ class Config:
         if self.ENV not in ["dev", "staging", "prod"]:
             errors.append(f"Invalid ENV value: {self.ENV}. Must be 'dev', 'staging', or 'prod'")
         
+        if self.JOB_EXECUTION_MODE not in ["inline", "queue"]:
+            errors.append(f"Invalid JOB_EXECUTION_MODE value: {self.JOB_EXECUTION_MODE}. Must be 'inline' or 'queue'")
+        elif self.JOB_EXECUTION_MODE == "queue" and not self.REDIS_URL:
+            # Workers publish job events through Redis; the in-memory event store is per process
+            errors.append("REDIS_URL is required when JOB_EXECUTION_MODE is 'queue' (job progress reaches API streams via Redis)")
+        
         # SECRET_KEY is required for all environments - fail fast if missing
         if not self.SECRET_KEY:
             errors.append(
@@ -0,0 +1,298 @@
+"""
+Content extraction helpers
+Pull each content type's task output from a CrewAI result object
+"""
+import time
+
+
+def extract_content_from_result(result, task_name: str = None) -> str:
+    """
+    Extract content directly from CrewAI result object without file I/O.
+    This is faster and more reliable than waiting for files.
+    
+    Args:
+        result: CrewAI result object
+        task_name: Optional task name to look for (e.g., 'editing_task')
+        
+    Returns:
+        Extracted content string
+    """
+    content = ""
+    
+    # Try to extract from result object directly (fastest method)
+    if hasattr(result, 'tasks_output') and result.tasks_output:
+        # Look for the requested task (e.g., editing task for blog, social_media task for social)
+        for task in reversed(result.tasks_output):
+            # Check if this is the task we're looking for
+            if task_name:
+                task_name_lower = task_name.lower()
+                # Prefer the task's name (the ContentCreationCrew method name, e.g. 'editing_task')
+                task_name_attr = getattr(task, 'name', None)
+                if isinstance(task_name_attr, str) and task_name_attr:
+                    if task_name_lower not in task_name_attr.lower():
+                        continue
+                # If no name, check task description
+                elif hasattr(task, 'description'):
+                    task_desc = str(task.description).lower()
+                    # Flexible matching: 'social' should match 'social_media', 'social_media_standalone', etc.
+                    if task_name_lower == 'social':
+                        # For 'social', match any task with 'social' in description
+                        if 'social' not in task_desc:
+                            continue
+                    elif task_name_lower not in task_desc:
+                        continue
+                elif hasattr(task, 'name') or hasattr(task, 'task_name'):
+                    # Try matching by task name/type
+                    task_name_attr = str(getattr(task, 'name', getattr(task, 'task_name', ''))).lower()
+                    if task_name_lower == 'social':
+                        if 'social' not in task_name_attr:
+                            continue
+                    elif task_name_lower not in task_name_attr:
+                        continue
+                else:
+                    # No way to identify task, skip filtering
+                    pass
+            
+            # Try different attributes in order of preference
+            if hasattr(task, 'raw') and task.raw:
+                content = str(task.raw)
+                if len(content.strip()) > 10:
+                    return content
+            elif hasattr(task, 'output') and task.output:
+                content = str(task.output)
+                if len(content.strip()) > 10:
+                    return content
+            elif hasattr(task, 'content') and task.content:
+                content = str(task.content)
+                if len(content.strip()) > 10:
+                    return content
+    
+    # Fallback to result object directly (for standalone tasks or when task matching fails)
+    if not content or len(content.strip()) < 10:
+        # If we're looking for social media and didn't find it in tasks, try result object
+        # This handles standalone social media where there's only one task
+        if task_name and task_name.lower() == 'social':
+            # For social, try to get the last task output (should be social media task)
+            if hasattr(result, 'tasks_output') and result.tasks_output:
+                last_task = result.tasks_output[-1]
+                if hasattr(last_task, 'raw') and last_task.raw:
+                    content = str(last_task.raw)
+                elif hasattr(last_task, 'output') and last_task.output:
+                    content = str(last_task.output)
+                elif hasattr(last_task, 'content') and last_task.content:
+                    content = str(last_task.content)
+        
+        # Final fallback to result object attributes
+        if not content or len(content.strip()) < 10:
+            if hasattr(result, 'raw') and result.raw:
+                content = str(result.raw)
+            elif hasattr(result, 'content') and result.content:
+                content = str(result.content)
+            elif hasattr(result, 'output') and result.output:
+                content = str(result.output)
+            else:
+                content = str(result)
+    
+    return content
+
+
+async def extract_content_async(result, topic: str, logger) -> str:
+    """Extract content from result asynchronously - optimized to use result objects first"""
+    content = ""
+    
+    logger.debug(f"[EXTRACT] Starting blog content extraction for topic='{topic}'")
+    logger.debug(f"[EXTRACT] Result type: {type(result)}, has tasks_output: {hasattr(result, 'tasks_output')}")
+    
+    # First, try extracting directly from result object (fastest, no I/O)
+    logger.info("[EXTRACT] Attempting direct extraction from result object...")
+    extract_start = time.time()
+    content = extract_content_from_result(result, 'editing')
+    extract_duration = time.time() - extract_start
+    
+    if content and len(content.strip()) > 10:
+        logger.info(f"[EXTRACT] Successfully extracted content from result object in {extract_duration:.3f}s, length={len(content)}")
+        logger.debug(f"[EXTRACT] Content preview (first 200 chars): {content[:200]}...")
+        return content
+    
+    logger.debug(f"[EXTRACT] Direct extraction result: length={len(content) if content else 0}, duration={extract_duration:.3f}s")
+    
+    # Task outputs are captured in memory on this job's own CrewOutput - there is
+    # no shared content_output.md to fall back to (it raced under concurrent jobs)
+    logger.error(f"[EXTRACT] No content extracted - result has no usable editing task output, duration={extract_duration:.3f}s")
+    return content
+
+
+async def extract_social_media_content_async(result, topic: str, logger) -> str:
+    """Extract social media content from result asynchronously - optimized"""
+    logger.debug(f"[EXTRACT_SOCIAL] Starting social media extraction, result type: {type(result)}")
+    
+    # First try direct extraction from result object
+    # Try 'social' first (handles both regular and standalone tasks with flexible matching)
+    content = extract_content_from_result(result, 'social')
+    
+    # If that fails, try 'social_media' (for standalone task)
+    if not content or len(content.strip()) < 10:
+        logger.debug("[EXTRACT_SOCIAL] 'social' extraction failed, trying 'social_media'")
+        content = extract_content_from_result(result, 'social_media')
+    
+    if content and len(content.strip()) > 10:
+        logger.info(f"[EXTRACT_SOCIAL] Successfully extracted social media content from result object, length: {len(content)}")
+        logger.debug(f"[EXTRACT_SOCIAL] Content preview: {content[:200]}")
+        return content
+    else:
+        logger.warning(f"[EXTRACT_SOCIAL] Failed to extract from matching task output, content length: {len(content) if content else 0}, trying remaining task outputs")
+    
+    # Final fallback: take the last task output / result object directly (for standalone tasks)
+    if not content or len(content.strip()) < 10:
+        logger.debug("[EXTRACT_SOCIAL] Task-based extraction failed, trying direct result object extraction")
+        if hasattr(result, 'tasks_output') and result.tasks_output:
+            # Try to get content from the last task (should be social media task for standalone)
+            last_task = result.tasks_output[-1]
+            if hasattr(last_task, 'raw') and last_task.raw:
+                content = str(last_task.raw)
+            elif hasattr(last_task, 'output') and last_task.output:
+                content = str(last_task.output)
+            elif hasattr(last_task, 'content') and last_task.content:
+                content = str(last_task.content)
+        
+        # Final fallback: try result object attributes directly
+        if not content or len(content.strip()) < 10:
+            if hasattr(result, 'raw') and result.raw:
+                content = str(result.raw)
+            elif hasattr(result, 'content') and result.content:
+                content = str(result.content)
+            elif hasattr(result, 'output') and result.output:
+                content = str(result.output)
+    
+    logger.info(f"[EXTRACT_SOCIAL] Final extracted social media content length: {len(content) if content else 0}")
+    if content and len(content.strip()) > 10:
+        logger.info(f"[EXTRACT_SOCIAL] Social media content preview: {content[:200]}")
+    else:
+        logger.error(f"[EXTRACT_SOCIAL] Failed to extract social media content - result type: {type(result)}, has tasks_output: {hasattr(result, 'tasks_output')}")
+        if hasattr(result, 'tasks_output') and result.tasks_output:
+            logger.error(f"[EXTRACT_SOCIAL] tasks_output length: {len(result.tasks_output)}")
+            for i, task in enumerate(result.tasks_output):
+                logger.error(f"[EXTRACT_SOCIAL] Task {i}: type={type(task)}, has raw={hasattr(task, 'raw')}, has output={hasattr(task, 'output')}, has content={hasattr(task, 'content')}")
+    
+    return content
+
+
+async def extract_audio_content_async(result, topic: str, logger) -> str:
+    """Extract audio content from result asynchronously - optimized with improved error handling"""
+    logger.info(f"[AUDIO_EXTRACTION] Starting audio extraction for topic: {topic}")
+    content = None
+    
+    # First try direct extraction from result object
+    try:
+        content = extract_content_from_result(result, 'audio')
+        if content and len(content.strip()) > 10:
+            logger.info(f"[AUDIO_EXTRACTION] Successfully extracted audio content from result object, length: {len(content)}")
+            return content
+    except Exception as e:
+        logger.warning(f"[AUDIO_EXTRACTION] Error in direct extraction: {e}")
+    
+    # Try alternative extraction methods from result object
+    # Check for audio_content_task output in result
+    try:
+        if hasattr(result, 'tasks_output'):
+            logger.info(f"[AUDIO_EXTRACTION] Checking tasks_output for audio content, found {len(result.tasks_output)} tasks")
+            for idx, task_output in enumerate(result.tasks_output):
+                task_name = getattr(task_output, 'task', None)
+                task_str = str(task_name).lower() if task_name else ''
+                
+                # Check if this is an audio-related task
+                if 'audio' in task_str or 'audio_content' in task_str:
+                    logger.info(f"[AUDIO_EXTRACTION] Found audio task at index {idx}: {task_str}")
+                    
+                    # Try extracting from raw output
+                    if hasattr(task_output, 'raw') and task_output.raw:
+                        raw_content = str(task_output.raw)
+                        if len(raw_content.strip()) > 10:
+                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.raw, length: {len(raw_content)}")
+                            content = raw_content
+                            break
+                    
+                    # Try extracting from output attribute
+                    if hasattr(task_output, 'output') and task_output.output:
+                        output_content = str(task_output.output)
+                        if len(output_content.strip()) > 10:
+                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.output, length: {len(output_content)}")
+                            content = output_content
+                            break
+                    
+                    # Try extracting from result attribute
+                    if hasattr(task_output, 'result') and task_output.result:
+                        result_content = str(task_output.result)
+                        if len(result_content.strip()) > 10:
+                            logger.info(f"[AUDIO_EXTRACTION] Extracted from task_output.result, length: {len(result_content)}")
+                            content = result_content
+                            break
+    except Exception as e:
+        logger.warning(f"[AUDIO_EXTRACTION] Error checking tasks_output: {e}")
+    
+    if content and len(content.strip()) > 10:
+        logger.info(f"[AUDIO_EXTRACTION] Successfully extracted audio content from tasks_output, length: {len(content)}")
+        return content
+    
+    # Final fallback: extract from result object again
+    if not content or len(content.strip()) < 10:
+        logger.info("[AUDIO_EXTRACTION] No audio task output found, retrying result object extraction")
+        try:
+            content = extract_content_from_result(result, 'audio')
+        except Exception as e:
+            logger.warning(f"[AUDIO_EXTRACTION] Final extraction attempt failed: {e}")
+    
+    logger.info(f"[AUDIO_EXTRACTION] Final extracted audio content length: {len(content) if content else 0}")
+    if content and len(content.strip()) > 10:
+        logger.info(f"[AUDIO_EXTRACTION] Audio content preview: {content[:200]}")
+    else:
+        logger.warning(f"[AUDIO_EXTRACTION] Audio content extraction failed - no valid content found")
+    
+    return content
+
+
+async def extract_video_content_async(result, topic: str, logger) -> str:
+    """Extract video content from result asynchronously - optimized"""
+    # First try direct extraction from result object
+    content = extract_content_from_result(result, 'video')
+    
+    if content and len(content.strip()) > 10:
+        logger.info(f"Successfully extracted video content from result object, length: {len(content)}")
+        return content
+    
+    # Final fallback: extract from result object
+    if not content or len(content.strip()) < 10:
+        logger.info("No video task output found, using result object extraction")
+        content = extract_content_from_result(result, 'video')
+    
+    logger.info(f"Final extracted video content length: {len(content) if content else 0}")
+    if content:
+        logger.info(f"Video content preview: {content[:200]}")
+    
+    return content
+
+
+def clean_content(content: str) -> str:
+    """Clean up content by removing common prefixes"""
+    if not content:
+        return ""
+    
+    lines = content.split('\n')
+    cleaned_lines = []
+    skip_prefixes = [
+        "your final answer must be",
+        "i now can give a great answer",
+        "here is the",
+    ]
+    skip_next = False
+    for line in lines:
+        line_lower = line.strip().lower()
+        if any(line_lower.startswith(prefix) for prefix in skip_prefixes):
+            skip_next = True
+            continue
+        if skip_next and not line.strip():
+            skip_next = False
+            continue
+        skip_next = False
+        cleaned_lines.append(line)
+    return '\n'.join(cleaned_lines).strip()
@@ -4,13 +4,12 @@ Jobs-first persistence with SSE streaming support
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, BackgroundTasks
 from fastapi import Request as FastAPIRequest
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy.exc import OperationalError, DisconnectionError
-from sqlalchemy import text
-import psycopg2
-import psycopg2.extensions
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import OperationalError, DisconnectionError, InterfaceError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select
 from pydantic import BaseModel, Field
-from typing import Optional, List, Tuple, Dict, Any
+from typing import Optional, List, Tuple, Dict, Any, Callable
 from datetime import datetime
 import json
 import asyncio
@@ -19,12 +18,15 @@ import time
 import sys
 
 from .database import User, get_db, ContentJob, ContentArtifact, JobStatus, SessionLocal
-from .auth import get_current_user
-from .services.content_service import ContentService
+from .db.async_engine import AsyncSessionLocal, get_async_db
+from .auth import get_current_principal, get_current_user
+from .services.principal_cache import AuthPrincipal
+from .services.content_service import AsyncContentService, ContentService
 from .services.plan_policy import PlanPolicy
 from .services.tts_provider import get_tts_provider
-from .services.storage_provider import get_storage_provider
+from .services.storage_provider import get_storage_provider, run_storage_io
 from .services.sse_store import get_sse_store
+from .services.sse_event_bus import get_sse_event_bus
 from .services.task_registry import get_task_registry
 from .schemas import PROMPT_VERSION
 from .config import config
@@ -333,113 +335,18 @@ async def create_generation_job(
     except ImportError:
         pass
     
+    if config.JOB_EXECUTION_MODE == "queue":
+        # Durable path: a worker process (content_creation_crew.worker) picks the job up
+        from .services.job_queue import get_job_queue
+        get_job_queue().enqueue(db, job.id, plan=plan)
+        logger.info(f"[JOB_CREATE] Queued job {job.id} for worker execution, topic='{topic[:50]}...'")
+        return _job_to_response(job)
+    
     # Start generation asynchronously with proper error handling
     # Use asyncio.create_task() but wrap it to catch and log errors
-    async def run_with_error_handling():
-        """Wrapper to ensure async task errors are logged and handled"""
-        try:
-            logger.info(f"[ASYNC_TASK] Starting async generation task for job {job.id}")
-            # Force immediate output for Railway
-            print(f"[RAILWAY_DEBUG] Async task started for job {job.id}", file=sys.stdout, flush=True)
-            sys.stdout.flush()
-            sys.stderr.flush()
-            await run_generation_async(job.id, topic, valid_content_types, plan, current_user.id)
-            logger.info(f"[ASYNC_TASK] Async generation task completed successfully for job {job.id}")
-            sys.stdout.flush()
-            sys.stderr.flush()
-        except asyncio.CancelledError:
-            logger.info(f"[ASYNC_TASK] Task for job {job.id} was cancelled")
-            # Update job status to cancelled
-            try:
-                from .services.content_service import ContentService
-                from .database import SessionLocal
-                cancel_session = SessionLocal()
-                try:
-                    cancel_user = cancel_session.query(User).filter(User.id == current_user.id).first()
-                    if cancel_user:
-                        cancel_content_service = ContentService(cancel_session, cancel_user)
-                        cancel_content_service.update_job_status(
-                            job.id,
-                            JobStatus.CANCELLED.value,
-                            finished_at=datetime.utcnow()
-                        )
-                        cancel_session.commit()
-                        # Send cancellation event
-                        from .services.sse_store import get_sse_store
-                        cancel_sse_store = get_sse_store()
-                        cancel_sse_store.add_event(job.id, 'cancelled', {
-                            'job_id': job.id,
-                            'message': 'Job cancelled by user',
-                            'cancelled_at': datetime.utcnow().isoformat()
-                        })
-                        logger.info(f"[ASYNC_TASK] Updated job {job.id} status to CANCELLED")
-                except Exception:
-                    cancel_session.rollback()
-                    raise
-                finally:
-                    cancel_session.close()
-            except Exception as cancel_error:
-                logger.error(f"[ASYNC_TASK] Failed to update job status after cancellation: {cancel_error}", exc_info=True)
-            raise  # Re-raise CancelledError
-        except Exception as e:
-            error_type = type(e).__name__
-            error_msg_raw = str(e) if str(e) else f"{error_type} occurred"
-            
-            # Build helpful error message
-            if 'OPENAI_API_KEY' in error_msg_raw or 'api key' in error_msg_raw.lower():
-                error_msg = f"LLM configuration error: {error_msg_raw}"
-                hint = "Set OPENAI_API_KEY in Railway backend service variables (not frontend .env)"
-            elif 'authentication' in error_msg_raw.lower() or 'unauthorized' in error_msg_raw.lower():
-                error_msg = f"Authentication error: {error_msg_raw}"
-                hint = "Verify OPENAI_API_KEY is correct and has proper permissions"
-            else:
-                error_msg = f'Content generation failed: {error_msg_raw}'
-                hint = "Check backend logs for detailed error information"
-            
-            logger.error(f"[ASYNC_TASK] Async generation task FAILED for job {job.id}: {error_type}: {error_msg}", exc_info=True)
-            sys.stdout.flush()
-            sys.stderr.flush()
-            
-            # Try to update job status to failed
-            try:
-                from .services.content_service import ContentService
-                from .database import SessionLocal
-                error_session = SessionLocal()
-                try:
-                    error_user = error_session.query(User).filter(User.id == current_user.id).first()
-                    if error_user:
-                        error_content_service = ContentService(error_session, error_user)
-                        error_content_service.update_job_status(
-                            job.id,
-                            JobStatus.FAILED.value,
-                            finished_at=datetime.utcnow()
-                        )
-                        error_session.commit()
-                        # Send error event to SSE store with hint
-                        from .services.sse_store import get_sse_store
-                        sse_store = get_sse_store()
-                        sse_store.add_event(job.id, 'error', {
-                            'job_id': job.id,
-                            'message': error_msg,
-                            'error_type': error_type,
-                            'hint': hint
-                        })
-                        logger.info(f"[ASYNC_TASK] Updated job {job.id} status to FAILED and sent error event with hint")
-                        sys.stdout.flush()
-                        sys.stderr.flush()
-                except Exception:
-                    error_session.rollback()
-                    raise
-                finally:
-                    error_session.close()
-            except Exception as update_error:
-                logger.error(f"[ASYNC_TASK] Failed to update job status after error: {update_error}", exc_info=True)
-                sys.stdout.flush()
-                sys.stderr.flush()
-    
     # Create the task with error handling
     # Add done callback to log completion/failure
-    task = asyncio.create_task(run_with_error_handling())
+    task = asyncio.create_task(execute_generation_job(job.id, topic, valid_content_types, plan, current_user.id, org_id=job.org_id))
     
     # Register task in registry for cancellation support
     task_registry = get_task_registry()
@@ -490,6 +397,144 @@ async def create_generation_job(
     return _job_to_response(job)
 
 
+async def execute_generation_job(
+    job_id: int,
+    topic: str,
+    content_types: List[str],
+    plan: str,
+    user_id: int,
+    org_id: Optional[int] = None,
+    is_lease_lost: Optional[Callable[[], bool]] = None
+):
+    """
+    Run a generation job, recording cancellation and failure on the job
+    
+    Wraps run_generation_async so errors are logged, the job is marked
+    CANCELLED/FAILED and an SSE event is sent. Used both for inline tasks in
+    the API process and by the queue worker (content_creation_crew.worker).
+    The job stays PENDING until the generation scheduler admits it.
+    
+    Args:
+        job_id: Job ID
+        topic: Sanitized topic
+        content_types: Requested content types
+        plan: User's plan tier
+        user_id: Job owner's user ID
+        org_id: Job's organization ID (per-org parallel limit)
+        is_lease_lost: Queue worker check; when true on cancellation, another
+            worker owns the job and no status or events are recorded
+    """
+    try:
+        logger.info(f"[ASYNC_TASK] Starting async generation task for job {job_id}")
+        # Force immediate output for Railway
+        print(f"[RAILWAY_DEBUG] Async task started for job {job_id}", file=sys.stdout, flush=True)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        from .services.generation_scheduler import get_generation_scheduler
+        async with get_generation_scheduler().slot(job_id, plan, org_id=org_id, user_id=user_id):
+            await run_generation_async(job_id, topic, content_types, plan, user_id)
+        logger.info(f"[ASYNC_TASK] Async generation task completed successfully for job {job_id}")
+        sys.stdout.flush()
+        sys.stderr.flush()
+    except asyncio.CancelledError:
+        if is_lease_lost is not None and is_lease_lost():
+            logger.info(f"[ASYNC_TASK] Task for job {job_id} stopped: lease taken over by another worker")
+            raise
+        logger.info(f"[ASYNC_TASK] Task for job {job_id} was cancelled")
+        # Update job status to cancelled
+        try:
+            from .services.content_service import ContentService
+            from .database import SessionLocal
+            cancel_session = SessionLocal()
+            try:
+                cancel_user = cancel_session.query(User).filter(User.id == user_id).first()
+                if cancel_user:
+                    cancel_content_service = ContentService(cancel_session, cancel_user)
+                    cancel_job_row = cancel_content_service.get_job(job_id)
+                    if cancel_job_row and cancel_job_row.status == JobStatus.CANCELLED.value:
+                        # Cancelled through the API, which already recorded the status and sent the event
+                        logger.info(f"[ASYNC_TASK] Job {job_id} already marked CANCELLED")
+                    else:
+                        cancel_content_service.update_job_status(
+                            job_id,
+                            JobStatus.CANCELLED.value,
+                            finished_at=datetime.utcnow()
+                        )
+                        cancel_session.commit()
+                        # Send cancellation event
+                        from .services.sse_store import get_sse_store
+                        cancel_sse_store = get_sse_store()
+                        cancel_sse_store.add_event(job_id, 'cancelled', {
+                            'job_id': job_id,
+                            'message': 'Job cancelled by user',
+                            'cancelled_at': datetime.utcnow().isoformat()
+                        })
+                        logger.info(f"[ASYNC_TASK] Updated job {job_id} status to CANCELLED")
+            except Exception:
+                cancel_session.rollback()
+                raise
+            finally:
+                cancel_session.close()
+        except Exception as cancel_error:
+            logger.error(f"[ASYNC_TASK] Failed to update job status after cancellation: {cancel_error}", exc_info=True)
+        raise  # Re-raise CancelledError
+    except Exception as e:
+        error_type = type(e).__name__
+        error_msg_raw = str(e) if str(e) else f"{error_type} occurred"
+        
+        # Build helpful error message
+        if 'OPENAI_API_KEY' in error_msg_raw or 'api key' in error_msg_raw.lower():
+            error_msg = f"LLM configuration error: {error_msg_raw}"
+            hint = "Set OPENAI_API_KEY in Railway backend service variables (not frontend .env)"
+        elif 'authentication' in error_msg_raw.lower() or 'unauthorized' in error_msg_raw.lower():
+            error_msg = f"Authentication error: {error_msg_raw}"
+            hint = "Verify OPENAI_API_KEY is correct and has proper permissions"
+        else:
+            error_msg = f'Content generation failed: {error_msg_raw}'
+            hint = "Check backend logs for detailed error information"
+        
+        logger.error(f"[ASYNC_TASK] Async generation task FAILED for job {job_id}: {error_type}: {error_msg}", exc_info=True)
+        sys.stdout.flush()
+        sys.stderr.flush()
+        
+        # Try to update job status to failed
+        try:
+            from .services.content_service import ContentService
+            from .database import SessionLocal
+            error_session = SessionLocal()
+            try:
+                error_user = error_session.query(User).filter(User.id == user_id).first()
+                if error_user:
+                    error_content_service = ContentService(error_session, error_user)
+                    error_content_service.update_job_status(
+                        job_id,
+                        JobStatus.FAILED.value,
+                        finished_at=datetime.utcnow()
+                    )
+                    error_session.commit()
+                    # Send error event to SSE store with hint
+                    from .services.sse_store import get_sse_store
+                    sse_store = get_sse_store()
+                    sse_store.add_event(job_id, 'error', {
+                        'job_id': job_id,
+                        'message': error_msg,
+                        'error_type': error_type,
+                        'hint': hint
+                    })
+                    logger.info(f"[ASYNC_TASK] Updated job {job_id} status to FAILED and sent error event with hint")
+                    sys.stdout.flush()
+                    sys.stderr.flush()
+            except Exception:
+                error_session.rollback()
+                raise
+            finally:
+                error_session.close()
+        except Exception as update_error:
+            logger.error(f"[ASYNC_TASK] Failed to update job status after error: {update_error}", exc_info=True)
+            sys.stdout.flush()
+            sys.stderr.flush()
+
+
 @router.post(
     "/jobs/{job_id}/cancel",
     response_model=Dict[str, Any],
@@ -586,12 +631,12 @@ async def cancel_job(
 )
 async def get_job(
     job_id: int,
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get job details by ID"""
-    content_service = ContentService(db, current_user)
-    job = content_service.get_job(job_id)
+    content_service = AsyncContentService(db, current_user.id)
+    job = await content_service.get_job(job_id, load_artifacts=True)
     
     if not job:
         raise HTTPException(
@@ -613,17 +658,15 @@ async def list_jobs(
     status: Optional[str] = Query(None, description="Filter by status"),
     limit: int = Query(50, ge=1, le=100, description="Number of results"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: AuthPrincipal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """List user's content generation jobs"""
-    content_service = ContentService(db, current_user)
-    jobs = content_service.list_jobs(status=status, limit=limit, offset=offset)
+    content_service = AsyncContentService(db, current_user.id)
+    jobs = await content_service.list_jobs(status=status, limit=limit, offset=offset, load_artifacts=True)
     
     # Get total count
-    total = db.query(ContentJob).filter(
-        ContentJob.user_id == current_user.id
-    ).count()
+    total = await content_service.count_jobs()
     
     return JobListResponse(
         jobs=[_job_to_response(job) for job in jobs],
@@ -661,7 +704,7 @@ async def stream_job_progress(
     job_id: int,
     request: FastAPIRequest,
     last_event_id: Optional[str] = None,
-    current_user: User = Depends(get_current_user)
+    current_user: AuthPrincipal = Depends(get_current_principal)
 ):
     """
     Stream job progress via Server-Sent Events (SSE)
@@ -681,144 +724,49 @@ async def stream_job_progress(
     """
     from fastapi.responses import StreamingResponse
     from content_creation_crew.services.sse_store import get_sse_store
-    from .database import SessionLocal
     
-    # Get initial job with a short-lived session and retry logic
+    # Get initial job with a short-lived async session and retry logic
     job = None
     max_init_query_retries = 3
     init_query_retry_delay = 0.5
     for init_query_retry in range(max_init_query_retries):
-        initial_session = SessionLocal()
         try:
-            content_service = ContentService(initial_session, current_user)
-            job = content_service.get_job(job_id)
-            
-            if job:
-                break  # Success - exit retry loop
-            else:
-                # Job not found - don't retry
-                initial_session.close()
-                raise HTTPException(
-                    status_code=status.HTTP_404_NOT_FOUND,
-                    detail="Job not found"
-                )
-        except (OperationalError, DisconnectionError) as init_query_error:
+            async with AsyncSessionLocal() as initial_session:
+                job = await AsyncContentService(initial_session, current_user.id).get_job(job_id, load_artifacts=True)
+            break
+        except (OperationalError, DisconnectionError, InterfaceError) as init_query_error:
             logger.warning(f"[STREAM_INIT_RETRY] Job {job_id}: Initial job query failed on attempt {init_query_retry + 1}/{max_init_query_retries}: {init_query_error}")
-            try:
-                initial_session.close()
-            except:
-                pass
             if init_query_retry < max_init_query_retries - 1:
                 await asyncio.sleep(init_query_retry_delay)
                 init_query_retry_delay *= 2  # Exponential backoff
                 continue
-            else:
-                # All retries exhausted - raise HTTP exception
-                logger.error(f"[STREAM_INIT_ERROR] Job {job_id}: Failed to query job after {max_init_query_retries} retries")
-                raise HTTPException(
-                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                    detail="Database temporarily unavailable. Please try again."
-                )
-        except HTTPException:
-            # Re-raise HTTP exceptions (like 404)
-            try:
-                initial_session.close()
-            except:
-                pass
-            raise
+            # All retries exhausted - raise HTTP exception
+            logger.error(f"[STREAM_INIT_ERROR] Job {job_id}: Failed to query job after {max_init_query_retries} retries")
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Database temporarily unavailable. Please try again."
+            )
         except Exception as init_query_error:
             # Non-connection error - don't retry
-            try:
-                initial_session.close()
-            except:
-                pass
             logger.error(f"[STREAM_INIT_ERROR] Job {job_id}: Non-connection error querying job: {init_query_error}")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail=f"Error querying job: {str(init_query_error)}"
             )
-        finally:
-            # Ensure session is closed if not already closed
-            try:
-                initial_session.close()
-            except:
-                pass
     
-    # Get SSE event store
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job not found"
+        )
+    
+    # Get SSE event store and the notification bus it publishes to
     sse_store = get_sse_store()
+    event_bus = get_sse_event_bus()
     
     # Import flush utilities for immediate data delivery
     from content_creation_crew.streaming_utils import flush_buffers
     
-    # Helper function to get polling session with retry and connection invalidation
-    async def get_poll_session_with_retry(max_retries: int = 3, retry_delay: float = 0.5):
-        """
-        Get a fresh session for polling, with automatic retry and connection invalidation.
-        Invalidates dead connections on SSL/connection errors.
-        
-        Args:
-            max_retries: Maximum number of retry attempts (default: 3)
-            retry_delay: Initial retry delay in seconds (default: 0.5)
-        
-        Returns:
-            Database session or None if all retries fail
-        """
-        for attempt in range(max_retries):
-            session = SessionLocal()
-            try:
-                # Test connection immediately with a simple query
-                session.execute(text("SELECT 1"))
-                return session
-            except (OperationalError, DisconnectionError) as e:
-                error_msg = str(e)
-                is_ssl_error = (
-                    'SSL' in error_msg or
-                    'connection has been closed' in error_msg.lower() or
-                    'connection reset' in error_msg.lower() or
-                    'EOF' in error_msg or
-                    (hasattr(e, 'orig') and isinstance(e.orig, (psycopg2.OperationalError, psycopg2.InterfaceError)))
-                )
-                
-                # Invalidate the broken connection
-                try:
-                    if hasattr(session, 'connection'):
-                        session.connection().invalidate()
-                    session.close()
-                except:
-                    pass
-                
-                if attempt < max_retries - 1 and is_ssl_error:
-                    logger.warning(
-                        f"[POLL_SESSION] SSL connection error (attempt {attempt + 1}/{max_retries}), "
-                        f"invalidating and retrying: {error_msg}"
-                    )
-                    await asyncio.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-                    continue
-                else:
-                    session.close()
-                    raise
-            except Exception as e:
-                try:
-                    session.close()
-                except:
-                    pass
-                if attempt < max_retries - 1:
-                    error_msg = str(e)
-                    is_connection_error = (
-                        'connection' in error_msg.lower() or
-                        'SSL' in error_msg or
-                        'closed' in error_msg.lower()
-                    )
-                    if is_connection_error:
-                        logger.warning(
-                            f"[POLL_SESSION] Connection error (attempt {attempt + 1}/{max_retries}): {error_msg}. Retrying..."
-                        )
-                        await asyncio.sleep(retry_delay * (attempt + 1))
-                        continue
-                raise
-        
-        return None  # Should never reach here
-    
     # Log stream start
     client_host = request.client.host if request.client else 'unknown'
     logger.info(f"[STREAM_START] Starting SSE stream for job {job_id}, client={client_host}, user_id={current_user.id}")
@@ -832,1149 +780,135 @@ async def stream_job_progress(
         except ValueError:
             pass
     
+    # Snapshot what we need from the initial query - the stream never touches the DB again
+    # unless it has to build a fallback complete event for a job that finished mid-stream
+    initial_status = job.status
+    initial_artifacts = list(job.artifacts or [])
+    
+    keepalive_interval = 5.0  # Send keep-alive every 5 seconds to prevent timeout
+    completion_grace_period = 5.0  # How long to wait for the worker's final event after a terminal status
+    late_event_timeout = 5.0  # Keep streaming late events (voiceover, video) after the complete event
+    terminal_statuses = (JobStatus.COMPLETED.value, JobStatus.FAILED.value, JobStatus.CANCELLED.value)
+    
+    def sse_frame(event_id: int, event_type: str, data: Dict) -> str:
+        """Format a single SSE frame"""
+        return f"id: {event_id}\nevent: {event_type}\ndata: {json.dumps(data)}\n\n"
+    
     async def generate_stream():
         """Generate SSE stream for job progress"""
-        nonlocal job  # Ensure we can modify the outer scope 'job' variable
         logger.info(f"[STREAM_GENERATOR] Generator started for job {job_id}")
+        # Subscribe before reading the store so no notification can slip between the two
+        subscription = event_bus.subscribe(job_id)
+        stream_start_time = time.time()
+        job_status = initial_status
+        last_sent_event_id = last_event_id_int or 0
+        complete_sent = False
+        error_sent = False
+        cancelled_sent = False
+        final_event_deadline = None  # Set once the job is known to be terminal
+        linger_deadline = None  # Set once the complete event has been sent
+        fallback_attempted = False
+        events_sent = 0
+        
+        def track(event: Dict):
+            """Update stream state from an event that was just sent"""
+            nonlocal job_status, complete_sent, error_sent, cancelled_sent
+            event_type = event.get('type')
+            event_data = event.get('data') or {}
+            if event_type == 'complete' and _complete_event_has_content(event_data):
+                complete_sent = True
+                job_status = JobStatus.COMPLETED.value
+            elif event_type == 'error':
+                error_sent = True
+            elif event_type == 'cancelled':
+                cancelled_sent = True
+                job_status = JobStatus.CANCELLED.value
+            elif event_type == 'status_update' and event_data.get('status') in terminal_statuses:
+                job_status = event_data['status']
+        
         try:
-            # Replay missed events if last_event_id provided
+            pending_events = []
             if last_event_id_int:
-                missed_events = sse_store.get_events_since(job_id, last_event_id_int)
-                for event in missed_events:
-                    yield f"id: {event['id']}\n"
-                    yield f"event: {event['type']}\n"
-                    yield f"data: {json.dumps(event['data'])}\n\n"
-                    flush_buffers()  # Flush after each event for immediate delivery
-            
-            # Send initial job status if not already sent
-            last_sent_event_id = last_event_id_int if last_event_id_int else 0
-            if not last_event_id_int:
-                event_data = {'type': 'job_started', 'job_id': job_id, 'status': job.status}
-                event_id = sse_store.add_event(job_id, 'job_started', event_data)
-                yield f"id: {event_id}\n"
-                yield f"event: job_started\n"
-                yield f"data: {json.dumps(event_data)}\n\n"
+                # Replay missed events
+                pending_events = sse_store.get_events_since(job_id, last_event_id_int)
+            else:
+                # Send initial job status, followed by everything the job has emitted so far
+                # (e.g. tts_started/tts_progress events added before the client connected)
+                event_data = {'type': 'job_started', 'job_id': job_id, 'status': initial_status}
+                started_event_id = sse_store.add_event(job_id, 'job_started', event_data)
+                yield sse_frame(started_event_id, 'job_started', event_data)
                 flush_buffers()  # Critical: Flush immediately after initial event
-                logger.info(f"[STREAM_GENERATOR] Sent initial job_started event for job {job_id}, status={job.status}")
-                last_sent_event_id = event_id
-                
-                # CRITICAL FIX: Immediately check for and send any existing SSE store events
-                # This ensures voiceover tts_started/tts_progress events are sent immediately
-                # instead of waiting for the polling loop to detect them
-                try:
-                    existing_events = sse_store.get_events_since(job_id, last_sent_event_id)
-                    if existing_events:
-                        logger.info(f"[STREAM_GENERATOR] Found {len(existing_events)} existing SSE store events for job {job_id}, sending immediately")
-                        print(f"[RAILWAY_DEBUG] [STREAM_GENERATOR] Found {len(existing_events)} existing SSE store events, sending immediately", file=sys.stdout, flush=True)
-                        for event in existing_events:
-                            event_id = event.get('id', 0)
-                            event_type = event.get('type', 'unknown')
-                            if event_id > last_sent_event_id:
-                                yield f"id: {event_id}\n"
-                                yield f"event: {event_type}\n"
-                                yield f"data: {json.dumps(event.get('data', {}))}\n\n"
-                                flush_buffers()  # Flush each event immediately
-                                last_sent_event_id = event_id
-                                logger.info(f"[STREAM_GENERATOR] Sent existing SSE store event {event_type} (id: {event_id}) immediately on connection")
-                                print(f"[RAILWAY_DEBUG] [STREAM_GENERATOR] Sent existing event {event_type} (id: {event_id})", file=sys.stdout, flush=True)
-                except Exception as existing_event_error:
-                    logger.warning(f"[STREAM_GENERATOR] Error checking existing SSE store events: {existing_event_error}")
-                    print(f"[RAILWAY_DEBUG] [STREAM_GENERATOR] Error checking existing events: {existing_event_error}", file=sys.stderr, flush=True)
-                
-                # If job is already failed, check for error events and send them
-                if job.status == JobStatus.FAILED.value:
-                    logger.warning(f"[STREAM_GENERATOR] Job {job_id} is already failed, checking for error events")
-                    # Get recent error events from SSE store
-                    recent_events = sse_store.get_events_since(job_id, 0)  # Get all events
-                    error_events = [e for e in recent_events if e.get('type') == 'error']
-                    if error_events:
-                        # Send the most recent error event
-                        latest_error = error_events[-1]
-                        error_data = latest_error.get('data', {})
-                        if error_data:
-                            yield f"id: {latest_error['id']}\n"
-                            yield f"event: error\n"
-                            yield f"data: {json.dumps(error_data)}\n\n"
-                            flush_buffers()
-                            logger.info(f"[STREAM_GENERATOR] Sent error event for failed job {job_id}: {error_data.get('message', 'Unknown error')}")
-                    else:
-                        # No error event found, send a generic error
-                        error_data = {
-                            'type': 'error',
-                            'job_id': job_id,
-                            'message': 'Job failed but no error details available. Check backend logs for details.',
-                            'status': 'failed'
-                        }
-                        event_id = sse_store.add_event(job_id, 'error', error_data)
-                        yield f"id: {event_id}\n"
-                        yield f"event: error\n"
-                        yield f"data: {json.dumps(error_data)}\n\n"
-                        flush_buffers()
-                        logger.warning(f"[STREAM_GENERATOR] Job {job_id} failed but no error event found, sent generic error")
-            
-            # Poll for job updates
-            last_status = job.status
-            last_artifact_count = 0
-            last_keepalive_time = time.time()
-            keepalive_interval = 5.0  # Send keep-alive every 5 seconds to prevent timeout
-            poll_count = 0
-            stream_start_time = time.time()
-            consecutive_failures = 0  # Track consecutive query failures
-            max_consecutive_failures = 10  # Only break stream after 10 consecutive failures
+                logger.info(f"[STREAM_GENERATOR] Sent initial job_started event for job {job_id}, status={initial_status}")
+                pending_events = [
+                    e for e in sse_store.get_events_since(job_id, 0)
+                    if e.get('id') != started_event_id
+                ]
+                last_sent_event_id = started_event_id
             
-            logger.info(f"[STREAM_POLL] Starting polling loop for job {job_id}, initial status={job.status}")
+            if initial_status in terminal_statuses:
+                # Job already finished - its final event is either in the store or never coming
+                final_event_deadline = stream_start_time
             
             while True:
-                try:
-                    poll_count += 1
-                    # Get fresh job from database using a short-lived session with retry logic
-                    fresh_job = None
-                    max_retries = 3
-                    retry_delay = 0.5  # Start with 0.5 seconds
-                    query_failed = False
-                    
-                    for retry_attempt in range(max_retries):
-                        poll_session = None
-                        try:
-                            # Use helper function to get session with retry and connection invalidation
-                            poll_session = await get_poll_session_with_retry(max_retries=1, retry_delay=0.1)
-                            if not poll_session:
-                                raise OperationalError("Failed to get database session", None, None)
-                            
-                            # OPTIMIZATION: Use joinedload to fetch job with artifacts in one query
-                            fresh_job = poll_session.query(ContentJob)\
-                                .options(joinedload(ContentJob.artifacts))\
-                                .filter(ContentJob.id == job_id)\
-                                .first()
-                            
-                            if fresh_job:
-                                job = fresh_job
-                                consecutive_failures = 0  # Reset failure counter on success
-                                break  # Success - exit retry loop
-                            else:
-                                # Job not found - this is not a connection error, exit retry loop
-                                break
-                        except (OperationalError, DisconnectionError) as db_error:
-                            # Connection error - retry with exponential backoff
-                            # Also check if it's a psycopg2 connection error
-                            error_msg = str(db_error)
-                            is_connection_error = (
-                                isinstance(db_error, (OperationalError, DisconnectionError)) or
-                                'connection' in error_msg.lower() or
-                                'SSL' in error_msg or
-                                'closed' in error_msg.lower() or
-                                'reset' in error_msg.lower() or
-                                'EOF' in error_msg or
-                                (hasattr(db_error, 'orig') and isinstance(db_error.orig, (psycopg2.OperationalError, psycopg2.InterfaceError)))
-                            )
-                            
-                            if is_connection_error:
-                                logger.warning(f"[STREAM_RETRY] Job {job_id}: Database connection error on attempt {retry_attempt + 1}/{max_retries}: {error_msg}")
-                            
-                            # Invalidate and close the broken session
-                            try:
-                                if poll_session and hasattr(poll_session, 'connection'):
-                                    try:
-                                        poll_session.connection().invalidate()
-                                    except:
-                                        pass
-                                if poll_session:
-                                    poll_session.close()
-                            except:
-                                pass
-                            
-                            if retry_attempt < max_retries - 1:
-                                # Wait before retrying (exponential backoff)
-                                await asyncio.sleep(retry_delay)
-                                retry_delay *= 2  # Double the delay for next retry
-                                continue  # Retry
-                            else:
-                                # All retries exhausted - log warning but continue polling
-                                query_failed = True
-                                consecutive_failures += 1
-                                logger.warning(f"[STREAM_WARN] Job {job_id}: Database connection failed after {max_retries} retries (consecutive failures: {consecutive_failures}/{max_consecutive_failures}): {error_msg}")
-                                
-                                # Send warning event (not error) if this is the first failure or every 5 failures
-                                if consecutive_failures == 1 or consecutive_failures % 5 == 0:
-                                    warning_data = {
-                                        'type': 'warning',
-                                        'job_id': job_id,
-                                        'message': f'Temporary database connection issue (attempt {consecutive_failures}). Retrying...',
-                                        'error_type': 'OperationalError',
-                                        'hint': 'The job may still be running. We will continue checking its status.'
-                                    }
-                                    event_id = sse_store.add_event(job_id, 'warning', warning_data)
-                                    yield f"id: {event_id}\n"
-                                    yield f"event: warning\n"
-                                    yield f"data: {json.dumps(warning_data)}\n\n"
-                                    flush_buffers()
-                                
-                                # Only break stream if too many consecutive failures
-                                if consecutive_failures >= max_consecutive_failures:
-                                    logger.error(f"[STREAM_ERROR] Job {job_id}: Too many consecutive database failures ({consecutive_failures}), giving up")
-                                    error_data = {
-                                        'type': 'error',
-                                        'job_id': job_id,
-                                        'message': f'Database connection lost after {consecutive_failures} attempts. The job may have completed but we cannot verify its status.',
-                                        'error_type': 'OperationalError',
-                                        'hint': 'Please check the job status manually or try again later.'
-                                    }
-                                    event_id = sse_store.add_event(job_id, 'error', error_data)
-                                    yield f"id: {event_id}\n"
-                                    yield f"event: error\n"
-                                    yield f"data: {json.dumps(error_data)}\n\n"
-                                    flush_buffers()
-                                    break  # Exit retry loop and while loop
-                                
-                                # Wait longer before next poll attempt
-                                await asyncio.sleep(2.0)  # Wait 2 seconds before next poll
-                                break  # Exit retry loop, continue while loop
-                        except Exception as db_error:
-                            # Check if this is actually a connection error that wasn't caught above
-                            error_msg = str(db_error)
-                            is_connection_error = (
-                                isinstance(db_error, (OperationalError, DisconnectionError)) or
-                                'connection' in error_msg.lower() or
-                                'SSL' in error_msg or
-                                'closed' in error_msg.lower() or
-                                'reset' in error_msg.lower() or
-                                'EOF' in error_msg or
-                                'psycopg2' in error_msg.lower() or
-                                (hasattr(db_error, 'orig') and isinstance(db_error.orig, (psycopg2.OperationalError, psycopg2.InterfaceError)))
-                            )
-                            
-                            if is_connection_error:
-                                # Treat as connection error - retry logic
-                                query_failed = True
-                                consecutive_failures += 1
-                                logger.warning(f"[STREAM_RETRY] Job {job_id}: Database connection error (caught as Exception) on attempt {retry_attempt + 1}/{max_retries} (consecutive failures: {consecutive_failures}/{max_consecutive_failures}): {error_msg}")
-                                
-                                try:
-                                    if poll_session and hasattr(poll_session, 'connection'):
-                                        try:
-                                            poll_session.connection().invalidate()
-                                        except:
-                                            pass
-                                    if poll_session:
-                                        poll_session.close()
-                                except:
-                                    pass
-                                
-                                if retry_attempt < max_retries - 1:
-                                    await asyncio.sleep(retry_delay)
-                                    retry_delay *= 2
-                                    continue  # Retry
-                                else:
-                                    # All retries exhausted - continue polling
-                                    if consecutive_failures == 1 or consecutive_failures % 5 == 0:
-                                        warning_data = {
-                                            'type': 'warning',
-                                            'job_id': job_id,
-                                            'message': f'Temporary database connection issue (attempt {consecutive_failures}). Retrying...',
-                                            'error_type': 'ConnectionError',
-                                            'hint': 'The job may still be running. We will continue checking its status.'
-                                        }
-                                        event_id = sse_store.add_event(job_id, 'warning', warning_data)
-                                        yield f"id: {event_id}\n"
-                                        yield f"event: warning\n"
-                                        yield f"data: {json.dumps(warning_data)}\n\n"
-                                        flush_buffers()
-                                    
-                                    if consecutive_failures >= max_consecutive_failures:
-                                        logger.error(f"[STREAM_ERROR] Job {job_id}: Too many consecutive database failures ({consecutive_failures}), giving up")
-                                        error_data = {
-                                            'type': 'error',
-                                            'job_id': job_id,
-                                            'message': f'Database connection lost after {consecutive_failures} attempts. The job may have completed but we cannot verify its status.',
-                                            'error_type': 'ConnectionError',
-                                            'hint': 'Please check the job status manually or try again later.'
-                                        }
-                                        event_id = sse_store.add_event(job_id, 'error', error_data)
-                                        yield f"id: {event_id}\n"
-                                        yield f"event: error\n"
-                                        yield f"data: {json.dumps(error_data)}\n\n"
-                                        flush_buffers()
-                                        break
-                                    
-                                    await asyncio.sleep(2.0)
-                                    break  # Exit retry loop, continue while loop
-                            else:
-                                # Non-connection error - log but continue
-                                query_failed = True
-                                consecutive_failures += 1
-                                logger.error(f"[STREAM_ERROR] Job {job_id}: Database query failed: {type(db_error).__name__}: {str(db_error)}", exc_info=True)
-                                try:
-                                    poll_session.close()
-                                except:
-                                    pass
-                                
-                                # Only break on non-connection errors if job not found or too many failures
-                                if consecutive_failures >= max_consecutive_failures:
-                                    error_data = {'type': 'error', 'job_id': job_id, 'message': f'Database error after {consecutive_failures} attempts: {str(db_error)}'}
-                                    event_id = sse_store.add_event(job_id, 'error', error_data)
-                                    yield f"id: {event_id}\n"
-                                    yield f"event: error\n"
-                                    yield f"data: {json.dumps(error_data)}\n\n"
-                                    flush_buffers()
-                                    break  # Exit retry loop
-                                else:
-                                    await asyncio.sleep(2.0)  # Wait before next poll
-                                    break  # Exit retry loop, continue while loop
-                        finally:
-                            # Ensure session is closed if not already closed
-                            try:
-                                poll_session.close()
-                            except:
-                                pass
-                    
-                    # If query failed, use last known job status and continue polling
-                    if query_failed and not fresh_job:
-                        # Use last known job status - don't break the stream
-                        logger.debug(f"[STREAM_CONTINUE] Job {job_id}: Using last known status={last_status}, continuing to poll...")
-                        # Wait a bit longer before next poll attempt
-                        await asyncio.sleep(2.0)
-                        continue
-                    
-                    # Check if job was found after retries
-                    if not fresh_job:
-                        # Job not found - this could be a real issue or temporary connection problem
-                        consecutive_failures += 1
-                        if consecutive_failures >= max_consecutive_failures:
-                            error_data = {'type': 'error', 'job_id': job_id, 'message': 'Job not found in database after multiple attempts'}
-                            event_id = sse_store.add_event(job_id, 'error', error_data)
-                            yield f"id: {event_id}\n"
-                            yield f"event: error\n"
-                            yield f"data: {json.dumps(error_data)}\n\n"
-                            flush_buffers()
-                            logger.error(f"[STREAM_ERROR] Job {job_id}: Job not found in database after {consecutive_failures} attempts")
-                            break
-                        else:
-                            logger.warning(f"[STREAM_WARN] Job {job_id}: Job not found (attempt {consecutive_failures}/{max_consecutive_failures}), continuing to poll...")
-                            await asyncio.sleep(2.0)
-                            continue
-                    
-                    # Log every 20 polls (every 10 seconds) to track progress
-                    if poll_count % 20 == 0:
-                        elapsed = time.time() - stream_start_time
-                        artifact_count = -1
-                        # Retry logic for artifact count query
-                        for count_retry in range(2):  # 2 retries for artifact count
-                            count_session = SessionLocal()
-                            try:
-                                artifact_count = len(count_session.query(ContentArtifact).filter(ContentArtifact.job_id == job_id).all())
-                                break  # Success - exit retry loop
-                            except (OperationalError, DisconnectionError) as count_error:
-                                logger.warning(f"[STREAM_RETRY] Job {job_id}: Artifact count query failed on attempt {count_retry + 1}/2: {count_error}")
-                                try:
-                                    count_session.close()
-                                except:
-                                    pass
-                                if count_retry < 1:
-                                    await asyncio.sleep(0.5)  # Brief delay before retry
-                                    continue
-                                # If retries exhausted, just use -1 (unknown count)
-                                artifact_count = -1
-                            except Exception:
-                                # Non-connection error - just use -1
-                                artifact_count = -1
-                            finally:
-                                try:
-                                    count_session.close()
-                                except:
-                                    pass
-                        logger.info(f"[STREAM_POLL] Job {job_id}: Poll #{poll_count}, status={job.status}, elapsed={elapsed:.1f}s, artifacts={artifact_count}")
-                    
-                    # Send keep-alive comment if enough time has passed (prevents undici body timeout)
-                    current_time = time.time()
-                    if current_time - last_keepalive_time >= keepalive_interval:
-                        yield ": keep-alive\n\n"
-                        flush_buffers()  # Flush keep-alive for immediate delivery
-                        last_keepalive_time = current_time
-                    
-                    # CRITICAL FIX: Check SSE store for complete event on EVERY poll if job is completed
-                    # This handles the case where complete event is added after status changes to COMPLETED
-                    # Use get_events_since(job_id, last_sent_event_id) to get only NEW events to avoid duplicates
-                    should_exit_polling = False
-                    if job.status == JobStatus.COMPLETED.value:
-                        complete_events_from_store = sse_store.get_events_since(job_id, last_sent_event_id)  # Get only new events to avoid duplicates
-                        for event in complete_events_from_store:
-                            if event.get('type') == 'complete':
-                                event_data = event.get('data', {})
-                                has_content = bool(event_data.get('audio_content') or event_data.get('content') or event_data.get('social_media_content') or event_data.get('video_content'))
-                                if has_content:
-                                    event_id = event.get('id', 0)
-                                    # Only send if we haven't already sent this event
-                                    if event_id > last_sent_event_id:
-                                        logger.info(f"[STREAM_POLL] Job {job_id}: Found complete event with content in polling loop (ID: {event_id})")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Found complete event with content in polling loop (ID: {event_id})", file=sys.stdout, flush=True)
-                                        try:
-                                            # Log what we're about to send
-                                            data_json = json.dumps(event_data)
-                                            data_length = len(data_json)
-                                            logger.info(f"[STREAM_POLL] Job {job_id}: About to yield complete event - event_id={event_id}, data_length={data_length}")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: About to yield complete event - event_id={event_id}, data_length={data_length}", file=sys.stdout, flush=True)
-                                            
-                                            # Yield all parts of the SSE event
-                                            yield f"id: {event_id}\n"
-                                            logger.debug(f"[STREAM_POLL] Job {job_id}: Yielded id line")
-                                            
-                                            yield f"event: complete\n"
-                                            logger.debug(f"[STREAM_POLL] Job {job_id}: Yielded event line")
-                                            
-                                            yield f"data: {data_json}\n\n"
-                                            logger.debug(f"[STREAM_POLL] Job {job_id}: Yielded data line, length={data_length}")
-                                            
-                                            # CRITICAL: Flush buffers multiple times to ensure data is sent
-                                            flush_buffers()
-                                            await asyncio.sleep(0.1)  # Small delay to ensure data is sent before breaking
-                                            flush_buffers()  # Flush again after delay
-                                            
-                                            logger.info(f"[STREAM_POLL] Job {job_id}: ✓ All parts of complete event yielded and flushed, event_id={event_id}")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: ✓ All parts of complete event yielded and flushed, event_id={event_id}, data_length={data_length}", file=sys.stdout, flush=True)
-                                            
-                                            last_sent_event_id = max(last_sent_event_id, event_id)
-                                            should_exit_polling = True  # Mark to exit polling loop
-                                            break  # Exit for loop
-                                        except Exception as yield_error:
-                                            logger.error(f"[STREAM_POLL] Job {job_id}: Error yielding complete event: {yield_error}", exc_info=True)
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: ERROR yielding complete event: {type(yield_error).__name__} - {str(yield_error)}", file=sys.stderr, flush=True)
-                                            # Continue polling if yield fails
-                                    else:
-                                        logger.debug(f"[STREAM_POLL] Job {job_id}: Complete event {event_id} already sent (last_sent={last_sent_event_id}), skipping")
-                    
-                    # CRITICAL FIX: Check for other SSE store events (video rendering, voiceover, etc.) before exiting
-                    # Continue polling for a short time after complete event to catch late events
-                    if should_exit_polling:
-                        # Check for any other new events (video rendering, voiceover, etc.)
-                        other_events = sse_store.get_events_since(job_id, last_sent_event_id)
-                        if other_events:
-                            logger.info(f"[STREAM_POLL] Job {job_id}: Found {len(other_events)} additional events after complete event, sending them")
-                            print(f"[RAILWAY_DEBUG] Job {job_id}: Found {len(other_events)} additional events, sending them", file=sys.stdout, flush=True)
-                            for event in other_events:
-                                event_id = event.get('id', 0)
-                                event_type = event.get('type', 'unknown')
-                                event_data = event.get('data', {})
-                                if event_id > last_sent_event_id:
-                                    yield f"id: {event_id}\n"
-                                    yield f"event: {event_type}\n"
-                                    yield f"data: {json.dumps(event_data)}\n\n"
-                                    flush_buffers()
-                                    last_sent_event_id = event_id
-                                    logger.info(f"[STREAM_POLL] Job {job_id}: Sent additional event {event_type} (id: {event_id})")
-                                    print(f"[RAILWAY_DEBUG] Job {job_id}: Sent additional event {event_type} (id: {event_id})", file=sys.stdout, flush=True)
-                        
-                        # Continue polling for a short time (5 seconds) to catch any late events
-                        # This ensures video rendering events and voiceover events are captured
-                        logger.info(f"[STREAM_POLL] Job {job_id}: Complete event sent, continuing to poll for 5s to catch late events")
-                        print(f"[RAILWAY_DEBUG] Job {job_id}: Continuing to poll for 5s to catch late events", file=sys.stdout, flush=True)
-                        late_event_start_time = time.time()
-                        late_event_timeout = 5.0  # Poll for 5 more seconds
-                        
-                        while time.time() - late_event_start_time < late_event_timeout:
-                            await asyncio.sleep(0.5)  # Poll every 0.5 seconds
-                            
-                            # Check for new events
-                            late_events = sse_store.get_events_since(job_id, last_sent_event_id)
-                            if late_events:
-                                logger.info(f"[STREAM_POLL] Job {job_id}: Found {len(late_events)} late events, sending them")
-                                print(f"[RAILWAY_DEBUG] Job {job_id}: Found {len(late_events)} late events", file=sys.stdout, flush=True)
-                                for event in late_events:
-                                    event_id = event.get('id', 0)
-                                    event_type = event.get('type', 'unknown')
-                                    event_data = event.get('data', {})
-                                    if event_id > last_sent_event_id:
-                                        yield f"id: {event_id}\n"
-                                        yield f"event: {event_type}\n"
-                                        yield f"data: {json.dumps(event_data)}\n\n"
-                                        flush_buffers()
-                                        last_sent_event_id = event_id
-                                        logger.info(f"[STREAM_POLL] Job {job_id}: Sent late event {event_type} (id: {event_id})")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Sent late event {event_type} (id: {event_id})", file=sys.stdout, flush=True)
-                        
-                        logger.info(f"[STREAM_POLL] Job {job_id}: Exiting polling loop after sending complete event and checking for late events")
-                        print(f"[RAILWAY_DEBUG] Job {job_id}: Exiting polling loop after sending complete event", file=sys.stdout, flush=True)
-                        break
-                    
-                    # Check for status changes
-                    if job.status != last_status:
-                        event_type = 'complete' if job.status == JobStatus.COMPLETED.value else 'error' if job.status == JobStatus.FAILED.value else 'status_update'
-                        
-                        # CRITICAL FIX: For COMPLETED status, check SSE store first before sending basic status update
-                        # This prevents sending an empty complete event when a complete event with content already exists
-                        if job.status == JobStatus.COMPLETED.value:
-                            complete_events_from_store = sse_store.get_events_since(job_id, 0)
-                            complete_event_with_content = None
-                            for event in complete_events_from_store:
-                                if event.get('type') == 'complete':
-                                    event_data = event.get('data', {})
-                                    if event_data.get('audio_content') or event_data.get('content') or event_data.get('social_media_content') or event_data.get('video_content'):
-                                        complete_event_with_content = event
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Found complete event with content in SSE store (ID: {event.get('id')}), skipping basic status update")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Found complete event with content, skipping basic status update", file=sys.stdout, flush=True)
-                                        break
-                            
-                            if complete_event_with_content:
-                                # Don't send basic status update - the complete event handler below will send the full event
-                                last_status = job.status
-                            else:
-                                # No complete event with content yet, send basic status update
-                                event_data = {'type': event_type, 'job_id': job_id, 'status': job.status}
-                                event_id = sse_store.add_event(job_id, event_type, event_data)
-                                yield f"id: {event_id}\n"
-                                yield f"event: {event_type}\n"
-                                yield f"data: {json.dumps(event_data)}\n\n"
-                                flush_buffers()
-                                last_sent_event_id = max(last_sent_event_id, event_id)
-                                last_status = job.status
-                        # If job failed, get the actual error details from SSE store
-                        elif job.status == JobStatus.FAILED.value:
-                            # Get recent error events from SSE store
-                            recent_events = sse_store.get_events_since(job_id, 0)  # Get all events
-                            error_events = [e for e in recent_events if e.get('type') == 'error']
-                            if error_events:
-                                # Use the most recent error event's data
-                                latest_error = error_events[-1]
-                                event_data = latest_error.get('data', {})
-                                # Ensure type and job_id are set
-                                event_data['type'] = 'error'
-                                event_data['job_id'] = job_id
-                                event_data['status'] = job.status
-                                event_id = latest_error.get('id')
-                                if not event_id:
-                                    event_id = sse_store.add_event(job_id, 'error', event_data)
-                            else:
-                                # No error event found, create generic one
-                                event_data = {'type': 'error', 'job_id': job_id, 'status': job.status, 'message': 'Job failed but no error details available. Check backend logs for details.'}
-                                event_id = sse_store.add_event(job_id, 'error', event_data)
-                            
-                            yield f"id: {event_id}\n"
-                            yield f"event: {event_type}\n"
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            flush_buffers()  # Flush status change events immediately
-                            last_sent_event_id = max(last_sent_event_id, event_id)  # Update last sent event ID
-                            last_status = job.status
-                        elif job.status == JobStatus.COMPLETED.value:
-                            # For completed status, check if complete event with content already exists in SSE store
-                            # If it does, skip sending a basic status update and let the complete event handler send it
-                            complete_events_from_store = sse_store.get_events_since(job_id, 0)
-                            complete_event_with_content = None
-                            for event in complete_events_from_store:
-                                if event.get('type') == 'complete':
-                                    event_data = event.get('data', {})
-                                    if event_data.get('audio_content') or event_data.get('content') or event_data.get('social_media_content') or event_data.get('video_content'):
-                                        complete_event_with_content = event
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Complete event with content already exists in SSE store (ID: {event.get('id')}), skipping basic status update")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Complete event with content already exists, skipping basic status update", file=sys.stdout, flush=True)
-                                        break
-                            
-                            if complete_event_with_content:
-                                # Don't send a basic status update - the complete event handler will send the full event
-                                last_status = job.status
-                            else:
-                                # No complete event with content yet, send basic status update
-                                event_data = {'type': event_type, 'job_id': job_id, 'status': job.status}
-                                event_id = sse_store.add_event(job_id, event_type, event_data)
-                                yield f"id: {event_id}\n"
-                                yield f"event: {event_type}\n"
-                                yield f"data: {json.dumps(event_data)}\n\n"
-                                flush_buffers()
-                                last_sent_event_id = max(last_sent_event_id, event_id)
-                                last_status = job.status
-                        else:
-                            # For other status changes, create standard event
-                            event_data = {'type': event_type, 'job_id': job_id, 'status': job.status}
-                            event_id = sse_store.add_event(job_id, event_type, event_data)
-                            
-                            yield f"id: {event_id}\n"
-                            yield f"event: {event_type}\n"
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            flush_buffers()  # Flush status change events immediately
-                            last_sent_event_id = max(last_sent_event_id, event_id)  # Update last sent event ID
-                            last_status = job.status
-                        
-                        # If completed or failed, send final event and exit
-                        if job.status in [JobStatus.COMPLETED.value, JobStatus.FAILED.value]:
-                            elapsed = time.time() - stream_start_time
-                            artifact_count = -1
-                            # Retry logic for final artifact count query
-                            for final_retry in range(2):  # 2 retries
-                                final_session = SessionLocal()
-                                try:
-                                    artifact_count = len(final_session.query(ContentArtifact).filter(ContentArtifact.job_id == job_id).all())
-                                    break  # Success
-                                except (OperationalError, DisconnectionError) as final_error:
-                                    logger.warning(f"[STREAM_RETRY] Job {job_id}: Final artifact count query failed on attempt {final_retry + 1}/2: {final_error}")
-                                    try:
-                                        final_session.close()
-                                    except:
-                                        pass
-                                    if final_retry < 1:
-                                        await asyncio.sleep(0.5)
-                                        continue
-                                    artifact_count = -1
-                                except Exception:
-                                    artifact_count = -1
-                                finally:
-                                    try:
-                                        final_session.close()
-                                    except:
-                                        pass
-                            logger.info(f"[STREAM_COMPLETE] Job {job_id}: Status changed to {job.status} after {elapsed:.1f}s, total polls={poll_count}, artifacts={artifact_count}")
-                            
-                            # CRITICAL FIX: Check SSE store FIRST for complete event before building from artifacts
-                            # The complete event from run_generation_async should already be in the SSE store with content
-                            if job.status == JobStatus.COMPLETED.value:
-                                complete_events_from_store = sse_store.get_events_since(job_id, 0)
-                                complete_event_from_store = None
-                                for event in complete_events_from_store:
-                                    if event.get('type') == 'complete':
-                                        complete_event_from_store = event
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Found complete event in SSE store (ID: {event.get('id')})")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Found complete event in SSE store (ID: {event.get('id')})", file=sys.stdout, flush=True)
-                                        break
-                                
-                                # If we found a complete event in SSE store with content, use it instead of building from artifacts
-                                if complete_event_from_store:
-                                    event_data = complete_event_from_store.get('data', {})
-                                    # Ensure event_data is a dict (it should be, but check to be safe)
-                                    if not isinstance(event_data, dict):
-                                        logger.warning(f"[STREAM_COMPLETE] Job {job_id}: event_data is not a dict, type={type(event_data)}")
-                                        event_data = {}
-                                    
-                                    has_content = bool(event_data.get('audio_content') or event_data.get('content') or event_data.get('social_media_content') or event_data.get('video_content'))
-                                    logger.info(f"[STREAM_COMPLETE] Job {job_id}: Checking complete event - has_content={has_content}, event_data keys={list(event_data.keys()) if isinstance(event_data, dict) else 'N/A'}")
-                                    print(f"[RAILWAY_DEBUG] Job {job_id}: Checking complete event - has_content={has_content}, has audio={bool(event_data.get('audio_content'))}, has content={bool(event_data.get('content'))}, has social={bool(event_data.get('social_media_content'))}, has video={bool(event_data.get('video_content'))}", file=sys.stdout, flush=True)
-                                    
-                                    # Log actual content lengths for debugging
-                                    if event_data.get('content'):
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: event_data['content'] length={len(event_data['content'])}")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: event_data['content'] length={len(event_data['content'])}", file=sys.stdout, flush=True)
-                                    
-                                    if has_content:
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Using complete event from SSE store (has content)")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Using complete event from SSE store with content", file=sys.stdout, flush=True)
-                                        try:
-                                            event_id = complete_event_from_store.get('id', 0)
-                                            content_preview = event_data.get('content', '')[:100] if event_data.get('content') else 'N/A'
-                                            logger.info(f"[STREAM_COMPLETE] Job {job_id}: About to yield complete event, event_id={event_id}, content_preview={content_preview}")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: About to yield complete event, event_id={event_id}, content_length={len(event_data.get('content', '')) if event_data.get('content') else 0}", file=sys.stdout, flush=True)
-                                            
-                                            # Yield the complete event
-                                            yield f"id: {event_id}\n"
-                                            yield f"event: complete\n"
-                                            yield f"data: {json.dumps(event_data)}\n\n"
-                                            flush_buffers()
-                                            
-                                            last_sent_event_id = max(last_sent_event_id, event_id)
-                                            logger.info(f"[STREAM_COMPLETE] Job {job_id}: ✓ Sent complete event from SSE store, event_id={event_id}, content_length={len(event_data.get('content', '')) if event_data.get('content') else 0}")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: ✓ Sent complete event from SSE store, event_id={event_id}", file=sys.stdout, flush=True)
-                                        except Exception as yield_error:
-                                            logger.error(f"[STREAM_COMPLETE] Job {job_id}: Error yielding complete event: {yield_error}", exc_info=True)
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: ERROR yielding complete event: {type(yield_error).__name__} - {str(yield_error)}", file=sys.stderr, flush=True)
-                                            raise
-                                        
-                                        # CRITICAL: Break out of polling loop after sending complete event
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Breaking out of polling loop after sending complete event")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Breaking out of polling loop", file=sys.stdout, flush=True)
-                                        break  # Exit polling loop
-                                    else:
-                                        logger.warning(f"[STREAM_COMPLETE] Job {job_id}: Complete event found but has no content, will build from artifacts")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Complete event found but has no content", file=sys.stdout, flush=True)
-                            
-                            # Send artifacts if completed (fallback if SSE store doesn't have complete event with content)
-                            if job.status == JobStatus.COMPLETED.value:
-                                artifacts = []
-                                # Retry logic for artifacts query
-                                for artifacts_retry in range(3):  # 3 retries for artifacts (more important)
-                                    artifacts_session = SessionLocal()
-                                    try:
-                                        artifacts = artifacts_session.query(ContentArtifact).filter(
-                                            ContentArtifact.job_id == job_id
-                                        ).all()
-                                        break  # Success
-                                    except (OperationalError, DisconnectionError) as artifacts_error:
-                                        logger.warning(f"[STREAM_RETRY] Job {job_id}: Artifacts query failed on attempt {artifacts_retry + 1}/3: {artifacts_error}")
-                                        try:
-                                            artifacts_session.close()
-                                        except:
-                                            pass
-                                        if artifacts_retry < 2:
-                                            await asyncio.sleep(0.5 * (artifacts_retry + 1))  # Increasing delay
-                                            continue
-                                        # If all retries fail, use empty list
-                                        artifacts = []
-                                    except Exception as artifacts_error:
-                                        logger.error(f"[STREAM_ERROR] Job {job_id}: Non-connection error querying artifacts: {artifacts_error}")
-                                        artifacts = []
-                                    finally:
-                                        try:
-                                            artifacts_session.close()
-                                        except:
-                                            pass
-                                
-                                # Build complete event with full content from all artifacts
-                                artifact_data = {
-                                    'type': 'complete',
-                                    'job_id': job_id,
-                                    'status': JobStatus.COMPLETED.value,
-                                    'message': 'Content generation completed successfully'
-                                }
-                                
-                                # Include full content from each artifact type
-                                content_found_in_artifacts = False
-                                if artifacts:
-                                    logger.info(f"[STREAM_COMPLETE] Job {job_id}: Found {len(artifacts)} artifacts, checking content...")
-                                    print(f"[RAILWAY_DEBUG] Job {job_id}: Found {len(artifacts)} artifacts, checking content...", file=sys.stdout, flush=True)
-                                    for artifact in artifacts:
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Artifact type={artifact.type}, has content_text={bool(artifact.content_text)}, content_length={len(artifact.content_text) if artifact.content_text else 0}")
-                                        print(f"[RAILWAY_DEBUG] Job {job_id}: Artifact type={artifact.type}, has content_text={bool(artifact.content_text)}, content_length={len(artifact.content_text) if artifact.content_text else 0}", file=sys.stdout, flush=True)
-                                        if artifact.content_text:
-                                            content_found_in_artifacts = True
-                                            if artifact.type == 'blog':
-                                                artifact_data['content'] = artifact.content_text
-                                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Added blog content to complete event, length={len(artifact.content_text)}")
-                                            elif artifact.type == 'social':
-                                                artifact_data['social_media_content'] = artifact.content_text
-                                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Added social content to complete event, length={len(artifact.content_text)}")
-                                            elif artifact.type == 'audio':
-                                                artifact_data['audio_content'] = artifact.content_text
-                                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Added audio content to complete event, length={len(artifact.content_text)}")
-                                                print(f"[RAILWAY_DEBUG] Job {job_id}: Added audio_content to artifact_data, length={len(artifact.content_text)}", file=sys.stdout, flush=True)
-                                            elif artifact.type == 'video':
-                                                artifact_data['video_content'] = artifact.content_text
-                                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Added video content to complete event, length={len(artifact.content_text)}")
-                                        else:
-                                            logger.warning(f"[STREAM_COMPLETE] Job {job_id}: Artifact type={artifact.type} has no content_text")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: WARNING - Artifact type={artifact.type} has no content_text", file=sys.stdout, flush=True)
-                                        
-                                        # Handle voiceover_audio artifacts (they have content_json, not content_text)
-                                        if artifact.type == 'voiceover_audio' and artifact.content_json:
-                                            logger.info(f"[STREAM_COMPLETE] Job {job_id}: Including voiceover_audio artifact in complete event")
-                                            print(f"[RAILWAY_DEBUG] Job {job_id}: Including voiceover_audio artifact (ID: {artifact.id}) in complete event", file=sys.stdout, flush=True)
-                                            artifact_data['voiceover_audio'] = {
-                                                'url': None,
-                                                'metadata': artifact.content_json
-                                            }
-                                            # Get URL from storage if storage_key is available
-                                            if artifact.content_json.get('storage_key'):
-                                                try:
-                                                    storage = get_storage_provider()
-                                                    artifact_data['voiceover_audio']['url'] = storage.get_url(artifact.content_json['storage_key'])
-                                                    logger.info(f"[STREAM_COMPLETE] Job {job_id}: Voiceover audio URL: {artifact_data['voiceover_audio']['url']}")
-                                                    print(f"[RAILWAY_DEBUG] Job {job_id}: Voiceover audio URL: {artifact_data['voiceover_audio']['url']}", file=sys.stdout, flush=True)
-                                                except Exception as url_error:
-                                                    logger.warning(f"[STREAM_COMPLETE] Job {job_id}: Failed to get voiceover URL: {url_error}")
-                                    if content_found_in_artifacts or any(a.type == 'voiceover_audio' for a in artifacts):
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Prepared complete event with content from {len(artifacts)} artifacts")
-                                
-                                # Fallback: Always try to get content from SSE store events (in case artifacts query failed or content wasn't saved)
-                                # This ensures we always include content in the complete event if it was generated
-                                try:
-                                    all_events = sse_store.get_events_since(job_id, 0)
-                                    content_events = [e for e in all_events if e.get('type') == 'content']
-                                    logger.info(f"[STREAM_FALLBACK] Job {job_id}: Checking SSE store - found {len(content_events)} content events")
-                                    
-                                    # Accumulate content from all content events (in case multiple events exist for same type)
-                                    # IMPORTANT: For chunked content (blog), accumulate all chunks
-                                    accumulated_chunks = {
-                                        'blog': [],
-                                        'social': [],
-                                        'audio': [],
-                                        'video': []
-                                    }
-                                    
-                                    for content_event in content_events:
-                                        event_data = content_event.get('data', {})
-                                        chunk = event_data.get('chunk', '')
-                                        artifact_type = event_data.get('artifact_type', '')
-                                        
-                                        if chunk and artifact_type:
-                                            logger.info(f"[STREAM_FALLBACK] Job {job_id}: Found content chunk in SSE store - type={artifact_type}, length={len(chunk)}, partial={event_data.get('partial', False)}")
-                                            
-                                            # Accumulate chunks for each artifact type
-                                            if artifact_type in accumulated_chunks:
-                                                accumulated_chunks[artifact_type].append(chunk)
-                                    
-                                    # Combine accumulated chunks for each artifact type
-                                    for artifact_type, chunks in accumulated_chunks.items():
-                                        if chunks:
-                                            combined_content = ''.join(chunks)
-                                            logger.info(f"[STREAM_FALLBACK] Job {job_id}: Combined {len(chunks)} chunks for {artifact_type}, total length={len(combined_content)}")
-                                            
-                                            # Only set if not already set from artifacts, or if artifacts didn't have content
-                                            if artifact_type == 'blog' and not artifact_data.get('content'):
-                                                artifact_data['content'] = combined_content
-                                            elif artifact_type == 'social' and not artifact_data.get('social_media_content'):
-                                                artifact_data['social_media_content'] = combined_content
-                                            elif artifact_type == 'audio' and not artifact_data.get('audio_content'):
-                                                artifact_data['audio_content'] = combined_content
-                                            elif artifact_type == 'video' and not artifact_data.get('video_content'):
-                                                artifact_data['video_content'] = combined_content
-                                    
-                                    # Log final content status
-                                    has_any_content = any(key in artifact_data for key in ['content', 'audio_content', 'social_media_content', 'video_content'])
-                                    if has_any_content:
-                                        content_sources = []
-                                        if artifact_data.get('content'):
-                                            content_sources.append(f"blog({len(artifact_data['content'])})")
-                                        if artifact_data.get('social_media_content'):
-                                            content_sources.append(f"social({len(artifact_data['social_media_content'])})")
-                                        if artifact_data.get('audio_content'):
-                                            content_sources.append(f"audio({len(artifact_data['audio_content'])})")
-                                        if artifact_data.get('video_content'):
-                                            content_sources.append(f"video({len(artifact_data['video_content'])})")
-                                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Complete event will include content from: {', '.join(content_sources)}")
-                                    else:
-                                        # CRITICAL FIX: Don't send complete event without content - wait a bit more or retry
-                                        logger.warning(f"[STREAM_WARN] Job {job_id}: No content found in artifacts or SSE store - retrying artifact query before sending complete event")
-                                        # Retry artifact query one more time with a short delay
-                                        try:
-                                            await asyncio.sleep(0.5)  # Give time for any pending commits
-                                            retry_artifacts_session = SessionLocal()
-                                            try:
-                                                retry_artifacts = retry_artifacts_session.query(ContentArtifact).filter(
-                                                    ContentArtifact.job_id == job_id
-                                                ).all()
-                                                # Try to get content from retry query
-                                                for retry_artifact in retry_artifacts:
-                                                    if retry_artifact.content_text:
-                                                        if retry_artifact.type == 'blog' and not artifact_data.get('content'):
-                                                            artifact_data['content'] = retry_artifact.content_text
-                                                        elif retry_artifact.type == 'social' and not artifact_data.get('social_media_content'):
-                                                            artifact_data['social_media_content'] = retry_artifact.content_text
-                                                        elif retry_artifact.type == 'audio' and not artifact_data.get('audio_content'):
-                                                            artifact_data['audio_content'] = retry_artifact.content_text
-                                                        elif retry_artifact.type == 'video' and not artifact_data.get('video_content'):
-                                                            artifact_data['video_content'] = retry_artifact.content_text
-                                                logger.info(f"[STREAM_RETRY] Job {job_id}: Retry query found {len(retry_artifacts)} artifacts")
-                                            finally:
-                                                retry_artifacts_session.close()
-                                        except Exception as retry_error:
-                                            logger.error(f"[STREAM_ERROR] Job {job_id}: Retry artifact query failed: {retry_error}")
-                                        
-                                        # Check again after retry
-                                        has_any_content_after_retry = any(key in artifact_data for key in ['content', 'audio_content', 'social_media_content', 'video_content'])
-                                        if not has_any_content_after_retry:
-                                            logger.error(f"[STREAM_ERROR] Job {job_id}: CRITICAL - No content found after all retries. Job may have failed silently or content was never generated.")
-                                            # Still send complete event but with a warning message
-                                            artifact_data['warning'] = 'Content was generated but could not be retrieved. Please check backend logs.'
-                                            artifact_data['message'] = 'Content generation completed but content retrieval failed'
-                                except Exception as sse_fallback_error:
-                                    logger.error(f"[STREAM_ERROR] Job {job_id}: Failed to get content from SSE store: {sse_fallback_error}", exc_info=True)
-                                    if not content_found_in_artifacts:
-                                        logger.warning(f"[STREAM_WARN] Job {job_id}: Sending complete event without artifact content")
-                                
-                                # Send complete event
-                                event_id = sse_store.add_event(job_id, 'complete', artifact_data)
-                                
-                                # Log what content is being sent in the complete event
-                                content_summary = {
-                                    'has_content': 'content' in artifact_data and bool(artifact_data.get('content')),
-                                    'content_length': len(artifact_data.get('content', '')),
-                                    'has_audio': 'audio_content' in artifact_data and bool(artifact_data.get('audio_content')),
-                                    'audio_length': len(artifact_data.get('audio_content', '')),
-                                    'has_social': 'social_media_content' in artifact_data and bool(artifact_data.get('social_media_content')),
-                                    'has_video': 'video_content' in artifact_data and bool(artifact_data.get('video_content')),
-                                }
-                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Sending complete event with content: {content_summary}")
-                                print(f"[RAILWAY_DEBUG] Job {job_id}: Complete event content summary: {content_summary}", file=sys.stdout, flush=True)
-                                
-                                yield f"id: {event_id}\n"
-                                yield f"event: complete\n"
-                                yield f"data: {json.dumps(artifact_data)}\n\n"
-                                flush_buffers()  # Flush completion event immediately
-                                last_sent_event_id = max(last_sent_event_id, event_id)  # Update last sent event ID
-                                logger.info(f"[STREAM_COMPLETE] Job {job_id}: Sent complete event with {len(artifact_data)} fields")
+                for event in pending_events:
+                    yield sse_frame(event['id'], event['type'], event.get('data', {}))
+                    flush_buffers()  # Flush each event immediately
+                    last_sent_event_id = max(last_sent_event_id, event['id'])
+                    events_sent += 1
+                    track(event)
+                
+                now = time.time()
+                if complete_sent:
+                    if linger_deadline is None:
+                        # Continue streaming for a short time to catch late events
+                        # (video rendering and voiceover events are added after completion)
+                        logger.info(f"[STREAM_COMPLETE] Job {job_id}: Sent complete event, waiting {late_event_timeout}s for late events")
+                        linger_deadline = now + late_event_timeout
+                    elif now >= linger_deadline:
+                        break
+                elif job_status == JobStatus.FAILED.value and error_sent:
+                    break
+                elif job_status == JobStatus.CANCELLED.value and cancelled_sent:
+                    break
+                elif job_status in terminal_statuses:
+                    if final_event_deadline is None:
+                        final_event_deadline = now + completion_grace_period
+                    elif now >= final_event_deadline:
+                        if job_status == JobStatus.CANCELLED.value or fallback_attempted:
                             break
-                    
-                    # OPTIMIZATION #4: Optimize database queries with joinedload
-                    # Check for new artifacts - use helper function with retry and connection invalidation
-                    current_artifacts = []
-                    artifacts_check_session = await get_poll_session_with_retry(max_retries=2, retry_delay=0.3)
-                    if artifacts_check_session:
-                        try:
-                            # OPTIMIZATION: Use joinedload to fetch job with artifacts in one query
-                            # This reduces database roundtrips from 2 to 1
-                            job_with_artifacts = artifacts_check_session.query(ContentJob)\
-                                .options(joinedload(ContentJob.artifacts))\
-                                .filter(ContentJob.id == job_id)\
-                                .first()
-                            
-                            if job_with_artifacts:
-                                current_artifacts = job_with_artifacts.artifacts  # Already loaded via relationship
-                            else:
-                                # Fallback to direct query if job not found
-                                current_artifacts = artifacts_check_session.query(ContentArtifact).filter(
-                                    ContentArtifact.job_id == job_id
-                                ).all()
-                        except (OperationalError, DisconnectionError) as check_error:
-                            logger.warning(f"[STREAM_RETRY] Job {job_id}: Artifact check query failed: {check_error}")
-                            try:
-                                if hasattr(artifacts_check_session, 'connection'):
-                                    artifacts_check_session.connection().invalidate()
-                            except:
-                                pass
-                            current_artifacts = []
-                        except Exception as check_error:
-                            logger.warning(f"[STREAM_WARN] Job {job_id}: Artifact check query error: {check_error}")
-                            current_artifacts = []
-                        finally:
-                            try:
-                                artifacts_check_session.close()
-                            except:
-                                pass
-                    else:
-                        logger.warning(f"[STREAM_WARN] Job {job_id}: Failed to get session for artifact check, skipping")
-                        current_artifacts = []
-                    
-                    # FIX 4: Check SSE store events FIRST and MORE FREQUENTLY to ensure immediate event delivery
-                    # This prevents database artifact_ready events from skipping earlier SSE store events
-                    # Also ensures tts_started and tts_progress events are delivered immediately
-                    try:
-                        sse_store_events = sse_store.get_events_since(job_id, last_sent_event_id)
-                        if sse_store_events:
-                            logger.info(f"[STREAM_EVENT_CHECK] Job {job_id}: Found {len(sse_store_events)} SSE store events before artifact check, last_sent_event_id={last_sent_event_id}")
-                            for event in sse_store_events:
-                                event_id = event.get('id', 0)
-                                event_type = event.get('type', 'unknown')
-                                if event_id > last_sent_event_id:
-                                    logger.info(f"[STREAM_EVENT] Job {job_id}: Sending SSE store event {event_type} (id: {event_id}, last_sent: {last_sent_event_id})")
-                                    yield f"id: {event_id}\n"
-                                    yield f"event: {event_type}\n"
-                                    yield f"data: {json.dumps(event.get('data', {}))}\n\n"
-                                    flush_buffers()
-                                    last_sent_event_id = event_id
-                                    logger.info(f"[STREAM_EVENT] Job {job_id}: Sent SSE store event {event_type} (id: {event_id})")
-                                else:
-                                    logger.debug(f"[STREAM_EVENT] Job {job_id}: Skipping SSE store event {event_type} (id: {event_id}) - already sent (last_sent: {last_sent_event_id})")
-                    except Exception as sse_event_error:
-                        logger.error(f"[STREAM_ERROR] Job {job_id}: Failed to check SSE store events before artifact check: {type(sse_event_error).__name__}: {str(sse_event_error)}", exc_info=True)
-                    
-                    if current_artifacts and len(current_artifacts) > last_artifact_count:
-                        # New artifacts created
-                        print(f"[RAILWAY_DEBUG] Job {job_id}: Detected {len(current_artifacts) - last_artifact_count} new artifact(s) in database", file=sys.stdout, flush=True)
-                        new_artifacts = current_artifacts[last_artifact_count:]
-                        
-                        # Check if artifact_ready events were already sent via SSE store (to avoid duplicates)
-                        # BUT: For voiceover_audio, always send even if already sent (frontend needs URL)
-                        artifact_types_already_sent = set()
-                        try:
-                            # Check a wider range of events (last 5000 events) to catch voiceover_audio events
-                            recent_sse_events = sse_store.get_events_since(job_id, max(0, last_sent_event_id - 5000))
-                            for event in recent_sse_events:
-                                if event.get('type') == 'artifact_ready':
-                                    artifact_type = event.get('data', {}).get('artifact_type')
-                                    if artifact_type and artifact_type != 'voiceover_audio':  # Don't skip voiceover_audio
-                                        artifact_types_already_sent.add(artifact_type)
-                        except Exception:
-                            pass  # If check fails, proceed with database artifacts
-                        
-                        for artifact in new_artifacts:
-                            # Skip if artifact_ready was already sent via SSE store
-                            if artifact.type in artifact_types_already_sent:
-                                logger.info(f"[STREAM_ARTIFACT] Job {job_id}: Skipping {artifact.type} artifact_ready - already sent via SSE store")
-                                # BUT: For voiceover_audio, still send the artifact_ready event even if it was already sent
-                                # because the frontend needs the URL and metadata
-                                if artifact.type != 'voiceover_audio':
-                                    continue
-                            
-                            print(f"[RAILWAY_DEBUG] Job {job_id}: Processing artifact type={artifact.type}, has_content={bool(artifact.content_text)}, has_json={bool(artifact.content_json)}", file=sys.stdout, flush=True)
-                            # Send artifact_ready event
-                            event_data = {'type': 'artifact_ready', 'job_id': job_id, 'artifact_type': artifact.type}
-                            
-                            # Include metadata for voiceover_audio artifacts
-                            if artifact.type == 'voiceover_audio' and artifact.content_json:
-                                event_data['metadata'] = artifact.content_json
-                                if artifact.content_json.get('storage_key'):
-                                    storage = get_storage_provider()
-                                    event_data['url'] = storage.get_url(artifact.content_json['storage_key'])
-                                logger.info(f"[STREAM_ARTIFACT] Job {job_id}: Sending voiceover_audio artifact_ready with URL: {event_data.get('url', 'N/A')}")
-                                print(f"[RAILWAY_DEBUG] Job {job_id}: Sending voiceover_audio artifact_ready with URL: {event_data.get('url', 'N/A')}", file=sys.stdout, flush=True)
-                            
-                            event_id = sse_store.add_event(job_id, 'artifact_ready', event_data)
-                            yield f"id: {event_id}\n"
-                            yield f"event: artifact_ready\n"
-                            yield f"data: {json.dumps(event_data)}\n\n"
-                            flush_buffers()  # Flush artifact events immediately
-                            last_sent_event_id = max(last_sent_event_id, event_id)  # Update last sent event ID
-                            
-                            # Send content event if artifact has text content (but NOT for voiceover_audio - it uses artifact_ready with URL)
-                            if artifact.content_text and artifact.type in ['blog', 'social', 'audio', 'video']:
-                                content_field = {
-                                    'blog': 'content',
-                                    'social': 'social_media_content',
-                                    'audio': 'audio_content',
-                                    'video': 'video_content'
-                                }.get(artifact.type, 'content')
-                                
-                                content_event_data = {
-                                    'type': 'content',
-                                    'job_id': job_id,
-                                    'chunk': artifact.content_text,  # Send full content
-                                    'progress': 100,  # Content is complete
-                                    'artifact_type': artifact.type,
-                                    'content_field': content_field
-                                }
-                                content_event_id = sse_store.add_event(job_id, 'content', content_event_data)
-                                print(f"[RAILWAY_DEBUG] Job {job_id}: Yielding content event for {artifact.type}, length={len(artifact.content_text)}", file=sys.stdout, flush=True)
-                                yield f"id: {content_event_id}\n"
-                                yield f"event: content\n"
-                                yield f"data: {json.dumps(content_event_data)}\n\n"
-                                flush_buffers()  # Flush content events immediately
-                                last_sent_event_id = max(last_sent_event_id, content_event_id)  # Update last sent event ID
-                                print(f"[RAILWAY_DEBUG] Job {job_id}: Content event yielded and flushed", file=sys.stdout, flush=True)
-                                logger.info(f"[STREAM_CONTENT] Job {job_id}: Sent content event for {artifact.type}, length={len(artifact.content_text)}")
-                        
-                        last_artifact_count = len(current_artifacts)
-                    
-                    # FIX 2 & 4: Check for new SSE events (like tts_completed, tts_started, tts_progress, etc.) that were added directly to store
-                    # This ensures voiceover progress events are delivered immediately
-                    # FIX #2: This check happens frequently (every poll cycle) to catch events as soon as they're added
-                    try:
-                        new_events = sse_store.get_events_since(job_id, last_sent_event_id)
-                        if new_events:
-                            event_types = [e.get('type', 'unknown') for e in new_events]
-                            logger.info(f"[STREAM_EVENT_CHECK] Job {job_id}: Found {len(new_events)} new SSE events (types: {event_types}), last_sent_event_id={last_sent_event_id}")
-                            # FIX #2: Log that we're immediately processing these events
-                            if any(e.get('type') in ['tts_completed', 'tts_started', 'tts_progress'] for e in new_events):
-                                logger.info(f"[STREAM_EVENT_CHECK] Job {job_id}: Voiceover events detected - processing immediately")
-                        for event in new_events:
-                            # Skip events we've already sent (shouldn't happen, but safety check)
-                            event_id = event.get('id', 0)
-                            event_type = event.get('type', 'unknown')
-                            if event_id > last_sent_event_id:
-                                logger.info(f"[STREAM_EVENT] Job {job_id}: Sending SSE store event {event_type} (id: {event_id}, last_sent: {last_sent_event_id})")
-                                yield f"id: {event_id}\n"
-                                yield f"event: {event_type}\n"
-                                yield f"data: {json.dumps(event.get('data', {}))}\n\n"
-                                flush_buffers()
-                                last_sent_event_id = event_id
-                                logger.info(f"[STREAM_EVENT] Job {job_id}: Sent SSE store event {event_type} (id: {event_id})")
-                            else:
-                                logger.debug(f"[STREAM_EVENT] Job {job_id}: Skipping event {event_type} (id: {event_id}) - already sent (last_sent: {last_sent_event_id})")
-                    except Exception as sse_event_error:
-                        logger.error(f"[STREAM_ERROR] Job {job_id}: Failed to check SSE events: {type(sse_event_error).__name__}: {str(sse_event_error)}", exc_info=True)
-                    
-                    # OPTIMIZATION #11: Adaptive polling interval based on job stage and content type
-                    # FIX #1 & #4: Reduced polling interval for completed jobs and added fast polling for voiceover jobs
-                    # OPTIMIZATION #11: Further optimize for blog content jobs
-                    def get_poll_interval(job_status: str, elapsed_time: float, has_voiceover: bool = False, is_blog_only: bool = False) -> float:
-                        """Get optimal polling interval based on job stage and content type"""
-                        # FIX #4: Use very fast polling for voiceover jobs to catch tts_completed events quickly
-                        if has_voiceover and job_status in ['running', 'completed']:
-                            return 0.2  # Very fast polling for voiceover jobs (200ms)
-                        
-                        # OPTIMIZATION #11: Use faster polling for blog-only jobs during extraction phase
-                        # Blog content extraction and validation are fast, so we can poll more frequently
-                        if is_blog_only and job_status == 'running' and elapsed_time > 60:
-                            # After 60 seconds, blog generation is likely in extraction/validation phase
-                            return 0.2  # Fast polling for blog extraction/validation (200ms)
-                        
-                        if job_status == 'pending':
-                            return 1.0  # Slower polling for pending jobs
-                        elif job_status == 'running':
-                            if elapsed_time < 30:
-                                return 0.3  # Fast polling during initial generation
-                            elif elapsed_time < 120:
-                                return 0.5  # Medium polling during mid-generation
-                            else:
-                                return 1.0  # Slower polling for long-running jobs
+                        fallback_attempted = True
+                        if job_status == JobStatus.COMPLETED.value:
+                            # The worker never published a complete event with content - build one
+                            logger.warning(f"[STREAM_COMPLETE] Job {job_id}: No complete event with content in SSE store, building from artifacts")
+                            artifacts = initial_artifacts if initial_status == JobStatus.COMPLETED.value else None
+                            complete_data = await _build_complete_event_data(job_id, sse_store, artifacts)
+                            sse_store.add_event(job_id, 'complete', complete_data)
                         else:
-                            # FIX #1: Use faster polling for completed/failed jobs to catch final events
-                            # Audio artifacts may be created just before job completion
-                            # Reduced from 2.0s to 0.5s to reduce timeout race conditions
-                            return 0.5  # Faster polling for completed/failed jobs (was 2.0)
-                    
-                    elapsed_time = time.time() - stream_start_time if 'stream_start_time' in locals() else 0
-                    job_status = job.status if job else 'unknown'
-                    
-                    # OPTIMIZATION #11: Detect blog-only jobs for optimized polling
-                    is_blog_only = False
-                    try:
-                        if job and job.formats_requested:
-                            # Check if only blog content is requested
-                            requested_types = job.formats_requested if isinstance(job.formats_requested, list) else [job.formats_requested]
-                            is_blog_only = len(requested_types) == 1 and requested_types[0] == 'blog'
-                    except Exception:
-                        pass  # If check fails, proceed without blog-only detection
-                    
-                    # FIX #4: Detect if this is a voiceover job by checking for voiceover_audio artifacts or SSE events
-                    has_voiceover = False
-                    try:
-                        # Check if job has voiceover_audio artifacts
-                        if current_artifacts:
-                            has_voiceover = any(a.type == 'voiceover_audio' for a in current_artifacts)
-                        
-                        # Also check SSE store for voiceover-related events (tts_started, tts_progress, tts_completed)
-                        # Use a wider range to catch events even if last_sent_event_id is high
-                        # Check last 500 events to ensure we catch voiceover events even if they were added earlier
-                        if not has_voiceover:
-                            recent_events = sse_store.get_events_since(job_id, max(0, last_sent_event_id - 500))
-                            has_voiceover = any(
-                                e.get('type') in ['tts_started', 'tts_progress', 'tts_completed', 'artifact_ready'] and
-                                e.get('data', {}).get('artifact_type') == 'voiceover_audio'
-                                for e in recent_events
-                            )
-                    except Exception:
-                        pass  # If check fails, proceed without voiceover detection
-                    
-                    poll_interval = get_poll_interval(job_status, elapsed_time, has_voiceover, is_blog_only)
-                    if has_voiceover:
-                        logger.debug(f"[STREAM_POLL] Job {job_id}: Using fast polling (0.2s) for voiceover job")
-                    elif is_blog_only and job_status == 'running' and elapsed_time > 60:
-                        logger.debug(f"[STREAM_POLL] Job {job_id}: Using fast polling (0.2s) for blog-only job in extraction phase")
-                    await asyncio.sleep(poll_interval)
-                except Exception as poll_error:
-                    # Handle errors during polling
-                    logger.error(f"[STREAM_ERROR] Job {job_id}: Error during poll #{poll_count}: {type(poll_error).__name__}: {str(poll_error)}", exc_info=True)
-                    # Send error event but continue polling (client can decide to reconnect)
-                    error_data = {'type': 'error', 'job_id': job_id, 'message': f'Polling error: {str(poll_error)}'}
-                    try:
-                        event_id = sse_store.add_event(job_id, 'error', error_data)
-                        yield f"id: {event_id}\n"
-                        yield f"event: error\n"
-                        yield f"data: {json.dumps(error_data)}\n\n"
-                        flush_buffers()  # Flush error events immediately
-                    except Exception as yield_error:
-                        logger.error(f"[STREAM_ERROR] Job {job_id}: Failed to yield error event: {type(yield_error).__name__}: {str(yield_error)}")
-                        # If we can't yield, the connection is likely broken - exit
-                        break
-                    # Wait before retrying
-                    await asyncio.sleep(0.5)
+                            logger.warning(f"[STREAM_GENERATOR] Job {job_id} failed but no error event found, sending generic error")
+                            sse_store.add_event(job_id, 'error', {
+                                'type': 'error',
+                                'job_id': job_id,
+                                'message': 'Job failed but no error details available. Check backend logs for details.',
+                                'status': 'failed'
+                            })
+                        pending_events = sse_store.get_events_since(job_id, last_sent_event_id)
+                        continue
+                
+                # Wait for the next notification instead of polling
+                timeout = keepalive_interval
+                for deadline in (linger_deadline, final_event_deadline):
+                    if deadline is not None and deadline > now:
+                        timeout = min(timeout, deadline - now)
+                notified = await subscription.wait(timeout=timeout)
+                if not notified and timeout >= keepalive_interval:
+                    # Send keep-alive comment (prevents undici body timeout)
+                    yield ": keep-alive\n\n"
+                    flush_buffers()
+                
+                pending_events = sse_store.get_events_since(job_id, last_sent_event_id)
             
-            # Before closing stream, check if job failed and send error if not already sent
-            try:
-                db.refresh(job)
-                if job.status == JobStatus.FAILED.value:
-                    # Check if we already sent an error event
-                    recent_events = sse_store.get_events_since(job_id, 0)
-                    error_events = [e for e in recent_events if e.get('type') == 'error']
-                    if error_events:
-                        # Error already sent, but make sure it's the latest
-                        latest_error = error_events[-1]
-                        error_data = latest_error.get('data', {})
-                        if error_data and error_data.get('message'):
-                            # Error already sent with message, we're good
-                            logger.info(f"[STREAM_END] Job {job_id}: Error event already sent, stream closing")
-                        else:
-                            # Error sent but no message, send it again with details
-                            error_data = {'type': 'error', 'job_id': job_id, 'status': job.status, 'message': 'Job failed. Check backend logs for details.'}
-                            event_id = sse_store.add_event(job_id, 'error', error_data)
-                            yield f"id: {event_id}\n"
-                            yield f"event: error\n"
-                            yield f"data: {json.dumps(error_data)}\n\n"
-                            flush_buffers()
-                    else:
-                        # No error event sent, send one now
-                        error_data = {'type': 'error', 'job_id': job_id, 'status': job.status, 'message': 'Job failed. Check backend logs for details.'}
-                        event_id = sse_store.add_event(job_id, 'error', error_data)
-                        yield f"id: {event_id}\n"
-                        yield f"event: error\n"
-                        yield f"data: {json.dumps(error_data)}\n\n"
-                        flush_buffers()
-                        logger.warning(f"[STREAM_END] Job {job_id}: Job failed but no error event was sent, sending now")
-            except Exception as final_check_error:
-                logger.error(f"[STREAM_ERROR] Job {job_id}: Error checking final job status: {type(final_check_error).__name__}: {str(final_check_error)}")
+            elapsed = time.time() - stream_start_time
+            logger.info(f"[STREAM_END] Job {job_id}: Stream finished after {elapsed:.1f}s, status={job_status}, events_sent={events_sent}")
         except (asyncio.CancelledError, ConnectionError, BrokenPipeError, OSError) as disconnect_error:
             # Client disconnected - this is normal, don't log as error
             error_msg = str(disconnect_error).lower()
@@ -2019,6 +953,8 @@ async def stream_job_progress(
                 except Exception:
                     # Can't send error - connection is broken
                     pass
+        finally:
+            subscription.close()
     
     return StreamingResponse(
         generate_stream(),
@@ -2032,6 +968,110 @@ async def stream_job_progress(
     )
 
 
+def _complete_event_has_content(event_data: Dict) -> bool:
+    """Check whether a complete event carries generated content"""
+    return bool(
+        event_data.get('audio_content') or
+        event_data.get('content') or
+        event_data.get('social_media_content') or
+        event_data.get('video_content')
+    )
+
+
+# Complete event field for each text artifact type
+_ARTIFACT_CONTENT_FIELDS = {
+    'blog': 'content',
+    'social': 'social_media_content',
+    'audio': 'audio_content',
+    'video': 'video_content',
+}
+
+
+async def _build_complete_event_data(job_id: int, sse_store, artifacts: Optional[List[ContentArtifact]] = None) -> Dict:
+    """
+    Build a complete event for a job whose worker never published one with content
+    
+    Uses the given artifacts, or queries them once if not provided, then fills any
+    gaps from streamed 'content' chunks in the SSE store.
+    
+    Args:
+        job_id: Job ID
+        sse_store: SSE event store
+        artifacts: Already-loaded artifacts (None to query the database)
+    
+    Returns:
+        Complete event data
+    """
+    if artifacts is None:
+        artifacts = []
+        for attempt in range(3):
+            try:
+                async with AsyncSessionLocal() as artifacts_session:
+                    result = await artifacts_session.execute(
+                        select(ContentArtifact).where(ContentArtifact.job_id == job_id)
+                    )
+                    artifacts = list(result.scalars().all())
+                break
+            except (OperationalError, DisconnectionError, InterfaceError) as artifacts_error:
+                logger.warning(f"[STREAM_RETRY] Job {job_id}: Artifacts query failed on attempt {attempt + 1}/3: {artifacts_error}")
+                if attempt < 2:
+                    await asyncio.sleep(0.5 * (attempt + 1))
+            except Exception as artifacts_error:
+                logger.error(f"[STREAM_ERROR] Job {job_id}: Non-connection error querying artifacts: {artifacts_error}")
+                break
+    
+    complete_data = {
+        'type': 'complete',
+        'job_id': job_id,
+        'status': JobStatus.COMPLETED.value,
+        'message': 'Content generation completed successfully'
+    }
+    
+    for artifact in artifacts:
+        field = _ARTIFACT_CONTENT_FIELDS.get(artifact.type)
+        if field and artifact.content_text:
+            complete_data[field] = artifact.content_text
+        
+        # voiceover_audio artifacts have content_json, not content_text
+        if artifact.type == 'voiceover_audio' and artifact.content_json:
+            complete_data['voiceover_audio'] = {
+                'url': None,
+                'metadata': artifact.content_json
+            }
+            if artifact.content_json.get('storage_key'):
+                try:
+                    storage = get_storage_provider()
+                    complete_data['voiceover_audio']['url'] = storage.get_url(artifact.content_json['storage_key'])
+                except Exception as url_error:
+                    logger.warning(f"[STREAM_COMPLETE] Job {job_id}: Failed to get voiceover URL: {url_error}")
+    
+    # Fall back to streamed content chunks for anything missing from the artifacts
+    try:
+        accumulated_chunks: Dict[str, List[str]] = {artifact_type: [] for artifact_type in _ARTIFACT_CONTENT_FIELDS}
+        for event in sse_store.get_events_since(job_id, 0):
+            if event.get('type') != 'content':
+                continue
+            event_data = event.get('data', {})
+            chunk = event_data.get('chunk', '')
+            artifact_type = event_data.get('artifact_type', '')
+            if chunk and artifact_type in accumulated_chunks:
+                accumulated_chunks[artifact_type].append(chunk)
+        
+        for artifact_type, chunks in accumulated_chunks.items():
+            field = _ARTIFACT_CONTENT_FIELDS[artifact_type]
+            if chunks and not complete_data.get(field):
+                complete_data[field] = ''.join(chunks)
+    except Exception as sse_fallback_error:
+        logger.error(f"[STREAM_ERROR] Job {job_id}: Failed to get content from SSE store: {sse_fallback_error}", exc_info=True)
+    
+    if not _complete_event_has_content(complete_data):
+        logger.error(f"[STREAM_ERROR] Job {job_id}: No content found in artifacts or SSE store")
+        complete_data['warning'] = 'Content was generated but could not be retrieved. Please check backend logs.'
+        complete_data['message'] = 'Content generation completed but content retrieval failed'
+    
+    return complete_data
+
+
 def _job_to_response(job: ContentJob) -> JobResponse:
     """Convert ContentJob to JobResponse"""
     artifacts = []
@@ -2076,6 +1116,44 @@ def _job_to_response(job: ContentJob) -> JobResponse:
     )
 
 
+async def _set_job_status(
+    job_id: int,
+    user_id: int,
+    status: str,
+    started_at: Optional[datetime] = None,
+    finished_at: Optional[datetime] = None,
+    max_retries: int = 3
+) -> bool:
+    """
+    Write a job status transition on the async engine, retrying connection errors
+    
+    The update is conditional on the status actually changing, so retries are safe.
+    
+    Returns:
+        True if the status changed; False if it was already set, the job is missing or the write failed
+    """
+    retry_delay = 0.5
+    for attempt in range(max_retries):
+        try:
+            async with AsyncSessionLocal() as db:
+                return await AsyncContentService(db, user_id).update_job_status(
+                    job_id,
+                    status,
+                    started_at=started_at,
+                    finished_at=finished_at
+                )
+        except (OperationalError, DisconnectionError, InterfaceError) as status_error:
+            logger.warning(f"[STATUS_RETRY] Job {job_id}: Status update to {status} failed on attempt {attempt + 1}/{max_retries}: {status_error}")
+            if attempt < max_retries - 1:
+                await asyncio.sleep(retry_delay)
+                retry_delay *= 2  # Exponential backoff
+        except Exception as status_error:
+            logger.error(f"Job {job_id}: Failed to update status to {status}: {status_error}", exc_info=True)
+            return False
+    logger.error(f"Job {job_id}: Failed to update status to {status} after {max_retries} attempts")
+    return False
+
+
 async def run_generation_async(
     job_id: int,
     topic: str,
@@ -2092,7 +1170,6 @@ async def run_generation_async(
     NOTE: Only a single content type should be passed. If multiple are provided,
     only the first one will be used.
     """
-    from content_creation_crew.crew import ContentCreationCrew
     from content_creation_crew.services.content_service import ContentService
     from content_creation_crew.services.plan_policy import PlanPolicy
     from content_creation_crew.content_validator import validate_and_repair_content
@@ -2100,16 +1177,14 @@ async def run_generation_async(
     from content_creation_crew.config import config
     from content_creation_crew.services.sse_store import get_sse_store
     
-    # Import extraction functions dynamically to avoid circular imports
-    import importlib
-    api_server_module = importlib.import_module('api_server')
+    from content_creation_crew import content_extraction
     
     session = None
     sse_store = get_sse_store()
     timeout_seconds = config.CREWAI_TIMEOUT
     
     # OPTIMIZATION #10: Track detailed timing metrics for each phase
-    from .services.metrics import record_histogram, increment_counter
+    from .services.metrics import record_histogram, increment_counter, ContentCacheMetrics
     generation_start_time = time.time()
     phase_timings = {
         'cache_lookup': None,
@@ -2150,6 +1225,7 @@ async def run_generation_async(
     sys.stderr.flush()
     
     session = None
+    cache_fill_leader = False  # True while this job holds the single-flight fill for its cache key
     try:
         # Get fresh database session with retry logic for connection errors
         user = None
@@ -2206,116 +1282,18 @@ async def run_generation_async(
         plan = policy.get_plan()
         org_id = policy._get_user_org_id()  # Get org_id for logging before session closure
         
-        # Update job status to running with retry logic
-        max_status_retries = 3
-        status_retry_delay = 0.5
-        for status_retry in range(max_status_retries):
-            try:
-                # update_job_status calls get_job() internally - add retry logic for get_job
-                # First verify job exists with retry logic
-                job = None
-                for get_job_retry in range(3):
-                    try:
-                        job = content_service.get_job(job_id)
-                        break  # Success
-                    except (OperationalError, DisconnectionError) as get_job_error:
-                        logger.warning(f"[STATUS_RETRY] Job {job_id}: get_job failed on attempt {get_job_retry + 1}/3: {get_job_error}")
-                        session.rollback()
-                        if get_job_retry < 2:
-                            await asyncio.sleep(0.3 * (get_job_retry + 1))
-                            continue
-                        raise  # Re-raise if all retries fail
-                
-                if not job:
-                    logger.error(f"Job {job_id} not found during RUNNING status update")
-                    break  # Continue anyway - generation will proceed
+        # Close the sync session before the long CrewAI run to prevent idle-in-transaction timeout
+        # (it is recreated when needed for artifact creation); status writes use the async engine
+        try:
+            session.close()
+            logger.info(f"[SESSION_MGMT] Job {job_id}: Session closed before CrewAI execution")
+        except Exception as close_error:
+            logger.warning(f"[SESSION_MGMT] Job {job_id}: Error closing session: {close_error}")
+        session = None
+        content_service = None
                 
-                # Job exists - update status
-                content_service.update_job_status(
-                    job_id,
-                    JobStatus.RUNNING.value,
-                    started_at=datetime.utcnow()
-                )
-                commit_start_time = time.time()
-                logger.info(f"[STATUS_COMMIT] Job {job_id}: Starting commit for status update to RUNNING")
-                print(f"[RAILWAY_DEBUG] Job {job_id}: Starting commit for status update to RUNNING at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(commit_start_time))}", file=sys.stdout, flush=True)
-                try:
-                    session.commit()
-                    commit_duration = time.time() - commit_start_time
-                    logger.info(f"[STATUS_COMMIT] Job {job_id}: Status update commit SUCCESSFUL in {commit_duration:.3f}s")
-                    print(f"[RAILWAY_DEBUG] Job {job_id}: Status update commit SUCCESSFUL in {commit_duration:.3f}s", file=sys.stdout, flush=True)
-                    
-                    # OPTIMIZATION: Close session immediately after commit to prevent idle-in-transaction timeout
-                    # Session will be recreated when needed for artifact creation
-                    # This prevents idle-in-transaction timeout during long CrewAI execution
-                    try:
-                        session.close()
-                        logger.info(f"[SESSION_MGMT] Job {job_id}: Session closed after status update commit (before CrewAI execution)")
-                        print(f"[RAILWAY_DEBUG] Job {job_id}: Session closed after status update commit", file=sys.stdout, flush=True)
-                    except Exception as close_error:
-                        logger.warning(f"[SESSION_MGMT] Job {job_id}: Error closing session: {close_error}")
-                    session = None  # Mark as closed
-                    content_service = None  # Will be recreated with new session
-                    # Note: policy, model_name, and plan are already retrieved above, so we don't need to recreate policy
-                    
-                except Exception as commit_error:
-                    commit_duration = time.time() - commit_start_time
-                    error_type = type(commit_error).__name__
-                    logger.error(f"[STATUS_COMMIT] Job {job_id}: Status update commit FAILED after {commit_duration:.3f}s: {error_type} - {commit_error}", exc_info=True)
-                    print(f"[RAILWAY_DEBUG] Job {job_id}: Status update commit FAILED after {commit_duration:.3f}s: {error_type}", file=sys.stderr, flush=True)
-                    raise
-                break  # Success - exit retry loop
-            except (OperationalError, DisconnectionError) as status_error:
-                logger.warning(f"[STATUS_RETRY] Job {job_id}: Status update failed on attempt {status_retry + 1}/{max_status_retries}: {status_error}")
-                try:
-                    session.rollback()
-                except:
-                    pass
-                if status_retry < max_status_retries - 1:
-                    await asyncio.sleep(status_retry_delay)
-                    status_retry_delay *= 2  # Exponential backoff
-                    # Refresh session and user for retry
-                    try:
-                        session.close()
-                    except:
-                        pass
-                    session = SessionLocal()
-                    # Retry user query with retry logic
-                    user = None
-                    for user_retry in range(2):  # 2 retries for user query
-                        try:
-                            user = session.query(User).filter(User.id == user_id).first()
-                            if user:
-                                break  # Success
-                        except (OperationalError, DisconnectionError) as user_error:
-                            logger.warning(f"[STATUS_RETRY] Job {job_id}: User query failed during status retry, attempt {user_retry + 1}/2: {user_error}")
-                            try:
-                                session.close()
-                            except:
-                                pass
-                            if user_retry < 1:
-                                await asyncio.sleep(0.5)
-                                session = SessionLocal()
-                                continue
-                            else:
-                                # User query failed - re-raise to be caught by outer handler
-                                raise
-                    if not user:
-                        logger.error(f"User {user_id} not found during status update retry")
-                        try:
-                            session.close()
-                        except:
-                            pass
-                        return
-                    content_service = ContentService(session, user)
-                    continue
-                else:
-                    # All retries exhausted - re-raise to be caught by outer handler
-                    raise
-            except Exception as status_error:
-                # Non-connection error - don't retry
-                session.rollback()
-                raise
+        # Update job status to running
+        await _set_job_status(job_id, user_id, JobStatus.RUNNING.value, started_at=datetime.utcnow())
         
         # Get the single content type being generated (enforced at function start)
         # Note: content_type, model_name, and plan are already retrieved above before session closure
@@ -2361,6 +1339,24 @@ async def run_generation_async(
         from .services.content_cache import get_cache
         cache = get_cache()
         cached_content = cache.get(topic, content_types, PROMPT_VERSION, model_name)
+        if not cached_content:
+            # Near-duplicate topics (e.g. "remote work" / "remote working") share cached content when enabled
+            cached_content = cache.get_similar(topic, content_types, PROMPT_VERSION, model_name)
+        if not cached_content:
+            # Single-flight: only one job generates a given key, identical jobs wait for its result
+            cache_fill_leader = cache.begin_fill(topic, content_types, PROMPT_VERSION, model_name)
+            if not cache_fill_leader:
+                logger.info(f"Job {job_id}: Identical generation in progress for topic: {topic}, waiting for its result")
+                sse_store.add_event(job_id, 'agent_progress', {
+                    'job_id': job_id,
+                    'message': 'Waiting for an identical generation in progress...',
+                    'step': 'cache_wait'
+                })
+                cached_content = await cache.wait_for_fill(topic, content_types, PROMPT_VERSION, model_name, timeout=timeout_seconds)
+                ContentCacheMetrics.record_coalesced(cached_content is not None)
+                if not cached_content:
+                    # The other job failed or timed out - generate ourselves
+                    cache_fill_leader = cache.begin_fill(topic, content_types, PROMPT_VERSION, model_name)
         phase_timings['cache_lookup'] = time.time() - cache_lookup_start
         record_histogram("content_generation_cache_lookup_seconds", phase_timings['cache_lookup'], 
                         labels={"content_type": content_type, "cache_hit": str(cached_content is not None)})
@@ -2376,6 +1372,14 @@ async def run_generation_async(
                 'step': 'cache_hit'
             })
             
+            # The init session was closed above - open a fresh one for the cached artifacts
+            if session is None or not session.is_active:
+                session = SessionLocal()
+                user = session.query(User).filter(User.id == user_id).first()
+                if not user:
+                    raise Exception(f"User {user_id} not found")
+                content_service = ContentService(session, user)
+            
             # Create artifacts from cache
             if 'blog' in content_types and cached_content.get('content'):
                 # Validate cached blog content
@@ -2494,6 +1498,11 @@ async def run_generation_async(
                         'cached': True
                     })
             
+            # Artifacts are committed; don't hold the session through any remaining generation
+            session.close()
+            session = None
+            content_service = None
+            
             # Verify all requested content types are present in cache
             missing_content_types = []
             cache_key_map = {
@@ -2531,11 +1540,7 @@ async def run_generation_async(
                     if cache_key and cached_content.get(cache_key):
                         complete_content[content_type] = cached_content[cache_key]
                 
-                content_service.update_job_status(
-                    job_id,
-                    JobStatus.COMPLETED.value,
-                    finished_at=datetime.utcnow()
-                )
+                await _set_job_status(job_id, user_id, JobStatus.COMPLETED.value, finished_at=datetime.utcnow())
                 sse_store.add_event(job_id, 'complete', {
                     'job_id': job_id,
                     'status': JobStatus.COMPLETED.value,
@@ -2563,11 +1568,7 @@ async def run_generation_async(
             logger.error(f"[CREW_INIT] Job {job_id}: {error_msg}")
             sys.stdout.flush()
             sys.stderr.flush()
-            content_service.update_job_status(
-                job_id,
-                JobStatus.FAILED.value,
-                finished_at=datetime.utcnow()
-            )
+            await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
             sse_store.add_event(job_id, 'error', {
                 'job_id': job_id,
                 'message': error_msg,
@@ -2583,11 +1584,7 @@ async def run_generation_async(
                 logger.error(f"[CREW_INIT] Job {job_id}: {error_msg}")
                 sys.stdout.flush()
                 sys.stderr.flush()
-                content_service.update_job_status(
-                    job_id,
-                    JobStatus.FAILED.value,
-                    finished_at=datetime.utcnow()
-                )
+                await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
                 sse_store.add_event(job_id, 'error', {
                     'job_id': job_id,
                     'message': error_msg,
@@ -2603,11 +1600,12 @@ async def run_generation_async(
         sys.stderr.flush()
         crew_init_start = time.time()
         try:
-            crew_instance = ContentCreationCrew(tier=plan, content_types=content_types)
-            crew_obj = crew_instance._build_crew(content_types=content_types)
+            # Per-job copy of a pooled crew template (built once per tier/content types/model)
+            from .services.crew_pool import get_crew_pool
+            crew_obj, crew_pooled = get_crew_pool().get_crew(plan, content_types)
             crew_init_duration = time.time() - crew_init_start
-            print(f"[RAILWAY_DEBUG] Job {job_id}: Crew initialization completed in {crew_init_duration:.2f}s", file=sys.stdout, flush=True)
-            logger.info(f"[CREW_INIT] Job {job_id}: Crew initialization completed in {crew_init_duration:.2f}s")
+            print(f"[RAILWAY_DEBUG] Job {job_id}: Crew initialization completed in {crew_init_duration:.2f}s (pooled={crew_pooled})", file=sys.stdout, flush=True)
+            logger.info(f"[CREW_INIT] Job {job_id}: Crew initialization completed in {crew_init_duration:.3f}s (pooled={crew_pooled})")
             sys.stdout.flush()
             sys.stderr.flush()
         except Exception as crew_init_error:
@@ -2632,11 +1630,7 @@ async def run_generation_async(
             sys.stderr.flush()
             
             # Update job status and send error event
-            content_service.update_job_status(
-                job_id,
-                JobStatus.FAILED.value,
-                finished_at=datetime.utcnow()
-            )
+            await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
             sse_store.add_event(job_id, 'error', {
                 'job_id': job_id,
                 'message': detailed_error,
@@ -2654,9 +1648,6 @@ async def run_generation_async(
         sys.stdout.flush()
         sys.stderr.flush()
         
-        # OPTIMIZATION #10: Track crew initialization time
-        crew_init_start = time.time()
-        
         # Run crew synchronously with timeout (we're already in async task)
         loop = asyncio.get_event_loop()
         
@@ -2665,10 +1656,10 @@ async def run_generation_async(
         llm_start_time = time.time()
         llm_success = False
         
-        # Record crew initialization time
-        phase_timings['crew_init'] = time.time() - crew_init_start
+        # Record crew initialization time (OPTIMIZATION #10)
+        phase_timings['crew_init'] = crew_init_duration
         record_histogram("content_generation_crew_init_seconds", phase_timings['crew_init'],
-                        labels={"content_type": content_type})
+                        labels={"content_type": content_type, "pooled": str(crew_pooled).lower()})
         
         # Progress tracking for streaming updates
         executor_done = False
@@ -2926,11 +1917,7 @@ async def run_generation_async(
                     event_id = sse_store.add_event(job_id, 'error', error_event_data)
                     print(f"[RAILWAY_DEBUG] Job {job_id}: Timeout error event added to SSE store with ID {event_id}", file=sys.stdout, flush=True)
                     # Update job status
-                    content_service.update_job_status(
-                        job_id,
-                        JobStatus.FAILED.value,
-                        finished_at=datetime.utcnow()
-                    )
+                    await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
                     return  # Don't raise, error already sent via SSE
                 else:
                     # Check for rate limit errors
@@ -2957,11 +1944,7 @@ async def run_generation_async(
                             'hint': 'Add a payment method to your OpenAI account to increase rate limits: https://platform.openai.com/account/billing'
                         })
                         # Update job status
-                        content_service.update_job_status(
-                            job_id,
-                            JobStatus.FAILED.value,
-                            finished_at=datetime.utcnow()
-                        )
+                        await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
                         return  # Don't raise, error already sent via SSE
                     
                     raise executor_error
@@ -2995,11 +1978,7 @@ async def run_generation_async(
                 'error_type': 'no_result',
                 'hint': 'Check backend logs for CrewAI execution details. The crew may have completed without returning a result.'
             })
-            content_service.update_job_status(
-                job_id,
-                JobStatus.FAILED.value,
-                finished_at=datetime.utcnow()
-            )
+            await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
             return
         
         sse_store.add_event(job_id, 'agent_progress', {
@@ -3018,7 +1997,7 @@ async def run_generation_async(
             print(f"[RAILWAY_DEBUG] Job {job_id}: Starting blog content extraction from CrewAI result, result type={type(result)}, result={str(result)[:200] if result else 'None'}", file=sys.stdout, flush=True)
             logger.info(f"[EXTRACTION] Job {job_id}: Starting blog content extraction from CrewAI result")
             extraction_start = time.time()
-            raw_content = await api_server_module.extract_content_async(result, topic, logger)
+            raw_content = await content_extraction.extract_content_async(result, topic, logger)
             extraction_duration = time.time() - extraction_start
             # OPTIMIZATION #10: Record extraction timing
             phase_timings['content_extraction'] = extraction_duration
@@ -3060,7 +2039,7 @@ async def run_generation_async(
             
             if not is_valid:
                 logger.warning(f"[VALIDATION] Job {job_id}: Blog content validation failed, using cleaned raw content")
-                content = api_server_module.clean_content(raw_content)
+                content = content_extraction.clean_content(raw_content)
                 logger.debug(f"[VALIDATION] Job {job_id}: Cleaned content length={len(content) if content else 0}")
             
             if content and len(content.strip()) > 10:
@@ -3213,9 +2192,9 @@ async def run_generation_async(
         # Extract remaining content types in parallel
         if remaining_content_types:
             extraction_map = {
-                'social': api_server_module.extract_social_media_content_async,
-                'audio': api_server_module.extract_audio_content_async,
-                'video': api_server_module.extract_video_content_async,
+                'social': content_extraction.extract_social_media_content_async,
+                'audio': content_extraction.extract_audio_content_async,
+                'video': content_extraction.extract_video_content_async,
             }
             
             # Send progress update for parallel extraction
@@ -3289,7 +2268,7 @@ async def run_generation_async(
                     # Ensure we have content to work with (use validated_content or fallback to raw_content)
                     if not validated_content or len(validated_content.strip()) < 10:
                         logger.warning(f"[VALIDATION] Job {job_id}: {content_type} content validation failed or empty, using cleaned raw content")
-                        validated_content = api_server_module.clean_content(raw_content)
+                        validated_content = content_extraction.clean_content(raw_content)
                         logger.debug(f"[VALIDATION] Job {job_id}: Cleaned {content_type} content length={len(validated_content) if validated_content else 0}")
                     
                     # Final check - ensure we have valid content before proceeding
@@ -3503,8 +2482,7 @@ async def run_generation_async(
                             "Audio content extraction failed. This may occur if: "
                             "1) The audio task didn't complete successfully, "
                             "2) The result format is unexpected, "
-                            "3) The audio_output.md file wasn't created, "
-                            "4) The audio_content_task or audio_content_standalone_task failed. "
+                            "3) The audio_content_task or audio_content_standalone_task failed. "
                             "Check backend logs for audio_content_task execution and extraction details."
                         )
                     else:
@@ -3518,242 +2496,49 @@ async def run_generation_async(
                         'hint': hint
                     })
         
-        # Update job status to completed - commit immediately with retry logic
-        # OPTIMIZATION: Recreate session and content_service if needed (they may have been closed earlier)
-        if session is None or not session.is_active or content_service is None:
-            logger.info(f"[SESSION_MGMT] Job {job_id}: Recreating session for completion status update")
-            if session:
-                try:
-                    session.close()
-                except:
-                    pass
-            session = SessionLocal()
-            user = session.query(User).filter(User.id == user_id).first()
-            if not user:
-                logger.error(f"User {user_id} not found when recreating session for completion update")
-                if session:
-                    session.close()
-                raise Exception(f"User {user_id} not found")
-            content_service = ContentService(session, user)
+        # Close the sync session (artifacts are saved) to prevent idle-in-transaction timeout
+        if session:
+            try:
+                session.close()
+                logger.info(f"[SESSION_MGMT] Job {job_id}: Session closed before completion status update")
+            except Exception as close_error:
+                logger.warning(f"[SESSION_MGMT] Job {job_id}: Error closing session: {close_error}")
+            session = None
+            content_service = None
         
-        max_completion_retries = 3
-        completion_retry_delay = 0.5
-        completion_updated = False
-        for completion_retry in range(max_completion_retries):
+        # Update job status to completed (async engine, retried on connection errors)
+        commit_start_time = time.time()
+        completion_updated = await _set_job_status(job_id, user_id, JobStatus.COMPLETED.value, finished_at=datetime.utcnow())
+        if completion_updated:
+            commit_duration = time.time() - commit_start_time
+            
+            # OPTIMIZATION #10: Record total generation time and all phase timings
+            phase_timings['total'] = time.time() - generation_start_time
             try:
-                # update_job_status calls get_job() internally - add retry logic for get_job
-                # First verify job exists with retry logic
-                job = None
-                for get_job_retry in range(3):
-                    try:
-                        # Ensure content_service exists
-                        if content_service is None:
-                            if session is None or not session.is_active:
-                                session = SessionLocal()
-                            user = session.query(User).filter(User.id == user_id).first()
-                            if user:
-                                content_service = ContentService(session, user)
-                            else:
-                                raise Exception(f"User {user_id} not found")
-                        job = content_service.get_job(job_id)
-                        break  # Success
-                    except (OperationalError, DisconnectionError) as get_job_error:
-                        logger.warning(f"[COMPLETION_RETRY] Job {job_id}: get_job failed on attempt {get_job_retry + 1}/3: {get_job_error}")
-                        if session:
-                            session.rollback()
-                        if get_job_retry < 2:
-                            await asyncio.sleep(0.3 * (get_job_retry + 1))
-                            continue
-                        raise  # Re-raise if all retries fail
-                
-                if not job:
-                    logger.error(f"Job {job_id} not found during completion update")
-                    break  # Continue anyway - we'll still send completion event
-                
-                # Ensure content_service exists and session is valid before updating status
-                if content_service is None or session is None or not session.is_active:
-                    logger.warning(f"[COMPLETION_RETRY] Job {job_id}: content_service or session invalid, recreating...")
-                    if session:
-                        try:
-                            session.close()
-                        except:
-                            pass
-                    session = SessionLocal()
-                    user = session.query(User).filter(User.id == user_id).first()
-                    if not user:
-                        logger.error(f"User {user_id} not found when recreating session for completion update")
-                        if session:
-                            session.close()
-                        break  # Continue anyway - we'll still send completion event
-                    content_service = ContentService(session, user)
-                    # Re-fetch job with new session
-                    try:
-                        job = content_service.get_job(job_id)
-                        if not job:
-                            logger.error(f"Job {job_id} not found after recreating session")
-                            break
-                    except Exception as refetch_error:
-                        logger.error(f"Failed to refetch job after recreating session: {refetch_error}")
-                        break
-                
-                # Job exists - update status
-                # Ensure content_service and session are valid before updating
-                if content_service is None:
-                    raise Exception(f"content_service is None for job {job_id}")
-                if session is None:
-                    raise Exception(f"session is None for job {job_id}")
-                if not hasattr(session, 'is_active') or not session.is_active:
-                    raise Exception(f"session is not active for job {job_id}")
-                
-                logger.info(f"[COMPLETION_UPDATE] Job {job_id}: Updating job status to COMPLETED")
-                try:
-                    content_service.update_job_status(
-                        job_id,
-                        JobStatus.COMPLETED.value,
-                        finished_at=datetime.utcnow()
-                    )
-                    logger.info(f"[COMPLETION_UPDATE] Job {job_id}: update_job_status completed successfully")
-                except Exception as update_error:
-                    error_type = type(update_error).__name__
-                    error_msg = str(update_error) if update_error else f"{error_type} occurred"
-                    logger.error(f"[COMPLETION_RETRY] Job {job_id}: update_job_status failed: {error_type} - {error_msg}", exc_info=True)
-                    print(f"[RAILWAY_DEBUG] Job {job_id}: update_job_status failed: {error_type} - {error_msg}", file=sys.stderr, flush=True)
-                    raise  # Re-raise to trigger retry logic
-                
-                commit_start_time = time.time()
-                logger.info(f"[COMPLETION_COMMIT] Job {job_id}: Starting commit for status update to COMPLETED")
-                print(f"[RAILWAY_DEBUG] Job {job_id}: Starting commit for status update to COMPLETED at {time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime(commit_start_time))}", file=sys.stdout, flush=True)
+                record_histogram("content_generation_total_seconds", phase_timings['total'],
+                                labels={"content_type": content_type, "model": model_name})
+            except Exception as metrics_error:
+                logger.warning(f"[METRICS] Job {job_id}: Failed to record metrics: {metrics_error}")
                 
-                # Ensure session is still valid before committing
-                if session is None:
-                    error_msg = f"session became None before commit for job {job_id}"
-                    logger.error(f"[COMPLETION_COMMIT] Job {job_id}: {error_msg}")
-                    raise Exception(error_msg)
+            # Log phase timings for monitoring
+            # Handle None values by converting to 0 before formatting
+            cache_time = phase_timings.get('cache_lookup') or 0
+            crew_init_time = phase_timings.get('crew_init') or 0
+            llm_time = phase_timings.get('llm_execution') or 0
+            extraction_time = phase_timings.get('content_extraction') or 0
+            validation_time = phase_timings.get('validation') or 0
+            artifact_time = phase_timings.get('artifact_creation') or 0
+            total_time = phase_timings.get('total') or 0
                 
-                # Check session state
-                session_state = "unknown"
-                try:
-                    if hasattr(session, 'is_active'):
-                        session_state = f"is_active={session.is_active}"
-                    if hasattr(session, 'in_transaction'):
-                        session_state += f", in_transaction={session.in_transaction()}"
-                    logger.info(f"[COMPLETION_COMMIT] Job {job_id}: Session state before commit: {session_state}")
-                except Exception as state_check_error:
-                    logger.warning(f"[COMPLETION_COMMIT] Job {job_id}: Could not check session state: {state_check_error}")
+            logger.info(f"[METRICS] Job {job_id}: Phase timings - Cache: {cache_time:.3f}s, "
+                      f"Crew Init: {crew_init_time:.3f}s, "
+                      f"LLM: {llm_time:.3f}s, "
+                      f"Extraction: {extraction_time:.3f}s, "
+                      f"Validation: {validation_time:.3f}s, "
+                      f"Artifact: {artifact_time:.3f}s, "
+                      f"Total: {total_time:.3f}s")
                 
-                try:
-                    # Verify job was actually updated before committing
-                    if not job:
-                        raise Exception(f"Job {job_id} object is None before commit")
-                    if job.status != JobStatus.COMPLETED.value:
-                        logger.warning(f"[COMPLETION_COMMIT] Job {job_id}: Job status is {job.status}, expected {JobStatus.COMPLETED.value}")
-                    
-                    session.commit()
-                    commit_duration = time.time() - commit_start_time
-                    completion_updated = True
-                    
-                    # OPTIMIZATION #10: Record total generation time and all phase timings
-                    phase_timings['total'] = time.time() - generation_start_time
-                    try:
-                        record_histogram("content_generation_total_seconds", phase_timings['total'],
-                                        labels={"content_type": content_type, "model": model_name})
-                    except Exception as metrics_error:
-                        logger.warning(f"[METRICS] Job {job_id}: Failed to record metrics: {metrics_error}")
-                    
-                    # Log phase timings for monitoring
-                    # Handle None values by converting to 0 before formatting
-                    cache_time = phase_timings.get('cache_lookup') or 0
-                    crew_init_time = phase_timings.get('crew_init') or 0
-                    llm_time = phase_timings.get('llm_execution') or 0
-                    extraction_time = phase_timings.get('content_extraction') or 0
-                    validation_time = phase_timings.get('validation') or 0
-                    artifact_time = phase_timings.get('artifact_creation') or 0
-                    total_time = phase_timings.get('total') or 0
-                    
-                    logger.info(f"[METRICS] Job {job_id}: Phase timings - Cache: {cache_time:.3f}s, "
-                              f"Crew Init: {crew_init_time:.3f}s, "
-                              f"LLM: {llm_time:.3f}s, "
-                              f"Extraction: {extraction_time:.3f}s, "
-                              f"Validation: {validation_time:.3f}s, "
-                              f"Artifact: {artifact_time:.3f}s, "
-                              f"Total: {total_time:.3f}s")
-                    
-                    logger.info(f"[COMPLETION_COMMIT] Job {job_id}: Completion status commit SUCCESSFUL in {commit_duration:.3f}s")
-                    print(f"[RAILWAY_DEBUG] Job {job_id}: Completion status commit SUCCESSFUL in {commit_duration:.3f}s", file=sys.stdout, flush=True)
-                    
-                    # OPTIMIZATION: Close session immediately after commit to prevent idle-in-transaction timeout
-                    try:
-                        session.close()
-                        logger.info(f"[SESSION_MGMT] Job {job_id}: Session closed after completion status commit")
-                    except Exception as close_error:
-                        logger.warning(f"[SESSION_MGMT] Job {job_id}: Error closing session: {close_error}")
-                    session = None  # Mark as closed
-                    content_service = None  # Will be recreated if needed
-                    
-                except Exception as commit_error:
-                    commit_duration = time.time() - commit_start_time
-                    error_type = type(commit_error).__name__
-                    error_msg = str(commit_error) if commit_error else f"{error_type} occurred"
-                    error_traceback = None
-                    try:
-                        import traceback
-                        error_traceback = traceback.format_exc()
-                    except:
-                        pass
-                    
-                    logger.error(f"[COMPLETION_COMMIT] Job {job_id}: Completion status commit FAILED after {commit_duration:.3f}s: {error_type} - {error_msg}", exc_info=True)
-                    print(f"[RAILWAY_DEBUG] Job {job_id}: Completion status commit FAILED after {commit_duration:.3f}s: {error_type} - {error_msg}", file=sys.stderr, flush=True)
-                    if error_traceback:
-                        print(f"[RAILWAY_DEBUG] Job {job_id}: Traceback:\n{error_traceback}", file=sys.stderr, flush=True)
-                    
-                    if session:
-                        try:
-                            session.rollback()
-                        except Exception as rollback_error:
-                            logger.warning(f"[COMPLETION_COMMIT] Job {job_id}: Failed to rollback: {rollback_error}")
-                    raise
-                break  # Success - exit retry loop
-            except (OperationalError, DisconnectionError) as commit_error:
-                logger.warning(f"[COMPLETION_RETRY] Job {job_id}: Failed to commit job completion on attempt {completion_retry + 1}/{max_completion_retries}: {commit_error}")
-                session.rollback()
-                if completion_retry < max_completion_retries - 1:
-                    await asyncio.sleep(completion_retry_delay)
-                    completion_retry_delay *= 2  # Exponential backoff
-                    # Refresh session and user for retry
-                    try:
-                        session.close()
-                    except:
-                        pass
-                    session = SessionLocal()
-                    # Retry user query with retry logic
-                    user = None
-                    for user_retry in range(3):
-                        try:
-                            user = session.query(User).filter(User.id == user_id).first()
-                            break  # Success
-                        except (OperationalError, DisconnectionError) as user_query_error:
-                            logger.warning(f"[COMPLETION_RETRY] Job {job_id}: User query failed on retry {user_retry + 1}/3: {user_query_error}")
-                            session.rollback()
-                            if user_retry < 2:
-                                await asyncio.sleep(0.3 * (user_retry + 1))
-                                continue
-                            raise  # Re-raise if all retries fail
-                    
-                    if not user:
-                        logger.error(f"User {user_id} not found during completion retry")
-                        session.close()
-                        break  # Continue anyway - we'll still send completion event
-                    content_service = ContentService(session, user)
-                    continue
-                else:
-                    # All retries exhausted - log but continue (we'll still send completion event)
-                    logger.error(f"Job {job_id}: Failed to update job status after {max_completion_retries} retries: {commit_error}", exc_info=True)
-                    break
-            except Exception as commit_error:
-                # Non-connection error - log but continue (we'll still send completion event)
-                logger.error(f"Job {job_id}: Failed to commit job completion: {commit_error}", exc_info=True)
-                session.rollback()
-                break
+            logger.info(f"[COMPLETION_COMMIT] Job {job_id}: Completion status commit SUCCESSFUL in {commit_duration:.3f}s")
         
         # Get all artifacts for completion event - use retry logic for connection errors
         # OPTIMIZATION: Recreate session if needed (it may have been closed or failed)
@@ -3879,6 +2664,15 @@ async def run_generation_async(
         }
         event_id = sse_store.add_event(job_id, 'complete', complete_event_data)
         logger.info(f"[COMPLETE_EVENT] Job {job_id}: Added complete event to SSE store (ID: {event_id}) with {len(artifact_content)} content fields")
+        
+        # Fill the content cache so repeat and coalesced requests skip generation
+        if cache_fill_leader:
+            cache_data = {field: artifact_content[field] for field in ('content', 'social_media_content', 'audio_content', 'video_content') if artifact_content.get(field)}
+            if cache_data:
+                try:
+                    cache.set(topic, cache_data, prompt_version=PROMPT_VERSION, model=model_name, content_types=content_types)
+                except Exception as cache_error:
+                    logger.warning(f"Job {job_id}: Failed to cache generated content: {cache_error}")
         print(f"[RAILWAY_DEBUG] Job {job_id}: Added complete event to SSE store (ID: {event_id}) with {len(artifact_content)} content fields", file=sys.stdout, flush=True)
         
         # Increment usage - recreate policy if needed (session was closed earlier)
@@ -3922,36 +2716,23 @@ async def run_generation_async(
             pass
         
     except (TimeoutError, asyncio.TimeoutError) as e:
-        error_msg = str(e) if str(e) else f"Content generation timed out after {timeout_seconds} seconds"
-        total_duration = time.time() - llm_start_time if 'llm_start_time' in locals() else 0
-        logger.error(f"[JOB_FAILED] Job {job_id}: TIMEOUT after {total_duration:.2f}s (limit: {timeout_seconds}s): {error_msg}", exc_info=True)
-        logger.error(f"[JOB_FAILED] Job {job_id}: Timeout details - model={model_name if 'model_name' in locals() else 'unknown'}, topic='{topic if 'topic' in locals() else 'unknown'}'")
-        if session:
-            try:
-                # Refresh session if needed
-                session.rollback()
-                user = session.query(User).filter(User.id == user_id).first()
-                if user:
-                    content_service = ContentService(session, user)
-                    content_service.update_job_status(
-                        job_id,
-                        JobStatus.FAILED.value,
-                        finished_at=datetime.utcnow()
-                    )
-                    sse_store.add_event(job_id, 'error', {
-                        'job_id': job_id,
-                        'message': error_msg,
-                        'error_type': 'timeout'
-                    })
+        error_msg = str(e) if str(e) else f"Content generation timed out after {timeout_seconds} seconds"
+        total_duration = time.time() - llm_start_time if 'llm_start_time' in locals() else 0
+        logger.error(f"[JOB_FAILED] Job {job_id}: TIMEOUT after {total_duration:.2f}s (limit: {timeout_seconds}s): {error_msg}", exc_info=True)
+        logger.error(f"[JOB_FAILED] Job {job_id}: Timeout details - model={model_name if 'model_name' in locals() else 'unknown'}, topic='{topic if 'topic' in locals() else 'unknown'}'")
+        await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
+        sse_store.add_event(job_id, 'error', {
+            'job_id': job_id,
+            'message': error_msg,
+            'error_type': 'timeout'
+        })
                     
-                    # Track job failure metric
-                    try:
-                        from .services.metrics import increment_counter
-                        increment_counter("job_failures_total", labels={"error_type": "timeout", "plan": plan})
-                    except ImportError:
-                        pass
-            except Exception as update_error:
-                logger.error(f"Failed to update job status after timeout: {update_error}")
+        # Track job failure metric
+        try:
+            from .services.metrics import increment_counter
+            increment_counter("job_failures_total", labels={"error_type": "timeout", "plan": plan})
+        except ImportError:
+            pass
     except Exception as e:
         error_type = type(e).__name__
         error_msg_raw = str(e) if str(e) else f"{error_type} occurred"
@@ -3991,219 +2772,21 @@ async def run_generation_async(
         logger.error(f"[JOB_FAILED] Job {job_id}: Error details - model={model_name if 'model_name' in locals() else 'unknown'}, topic='{topic if 'topic' in locals() else 'unknown'}', error_type={error_type}")
         logger.error(f"[JOB_FAILED] Job {job_id}: Hint for user: {hint}")
         
-        # Try to update job status with error handling for database connection issues
-        # Use retry logic for database connection errors
-        max_error_update_retries = 3
-        error_update_retry_delay = 0.5
-        error_update_success = False
-        
-        for error_update_retry in range(max_error_update_retries):
+        # Mark the job failed (async engine, retried on connection errors); the error event is sent either way
+        if session:
             try:
-                if session:
-                    # Try to refresh session - if connection is broken, this will fail
-                    session.rollback()
-                    # Test if session is still valid by querying user with retry
-                    user = None
-                    for user_retry in range(3):
-                        try:
-                            user = session.query(User).filter(User.id == user_id).first()
-                            break  # Success
-                        except (OperationalError, DisconnectionError) as user_query_error:
-                            logger.warning(f"Job {job_id}: User query failed on attempt {user_retry + 1}/3: {user_query_error}")
-                            session.rollback()
-                            if user_retry < 2:
-                                await asyncio.sleep(0.3 * (user_retry + 1))
-                                continue
-                            raise  # Re-raise if all retries fail
-                    
-                    if user:
-                        content_service = ContentService(session, user)
-                        # update_job_status calls get_job() which can fail - wrap in try/except with retry
-                        try:
-                            # Verify job exists before updating (get_job can fail with connection error)
-                            # Add retry logic for get_job call
-                            job = None
-                            for get_job_retry in range(3):
-                                try:
-                                    job = content_service.get_job(job_id)
-                                    break  # Success
-                                except (OperationalError, DisconnectionError) as get_job_error:
-                                    logger.warning(f"Job {job_id}: get_job failed on attempt {get_job_retry + 1}/3: {get_job_error}")
-                                    session.rollback()
-                                    if get_job_retry < 2:
-                                        await asyncio.sleep(0.3 * (get_job_retry + 1))
-                                        continue
-                                    raise  # Re-raise if all retries fail
-                            
-                            if not job:
-                                logger.warning(f"Job {job_id}: Job not found during error status update")
-                                error_update_success = False
-                                break  # Exit retry loop, will send error event below
-                            
-                            # Job exists - update status
-                            content_service.update_job_status(
-                                job_id,
-                                JobStatus.FAILED.value,
-                                finished_at=datetime.utcnow()
-                            )
-                            session.commit()
-                            error_update_success = True
-                            break  # Success - exit retry loop
-                        except (OperationalError, DisconnectionError) as update_inner_error:
-                            # get_job() or update_job_status() failed - this will be caught by outer retry loop
-                            logger.warning(f"Job {job_id}: get_job or update_job_status failed with connection error: {update_inner_error}")
-                            raise
-                        except Exception as update_inner_error:
-                            # Non-connection error from update_job_status (e.g., job not found)
-                            logger.warning(f"Job {job_id}: update_job_status failed with non-connection error: {update_inner_error}")
-                            # Still send error event even if we can't update DB
-                            error_update_success = False
-                            break  # Exit retry loop, will send error event below
-                    else:
-                        # User not found - session might be stale, create new session
-                        raise Exception("Session stale - user not found")
-                else:
-                    # No session - create new one
-                    raise Exception("No session available")
-            except (OperationalError, DisconnectionError) as update_error:
-                logger.warning(f"Job {job_id}: Database connection error updating job status on attempt {error_update_retry + 1}/{max_error_update_retries}: {update_error}")
-                if session:
-                    try:
-                        session.rollback()
-                        session.close()
-                    except:
-                        pass
-                    session = None
-                
-                if error_update_retry < max_error_update_retries - 1:
-                    await asyncio.sleep(error_update_retry_delay)
-                    error_update_retry_delay *= 2  # Exponential backoff
-                    # Create new session for retry
-                    session = SessionLocal()
-                    continue
-                else:
-                    # All retries exhausted - try one more time with fresh session
-                    logger.error(f"Job {job_id}: All retries exhausted for error status update, trying final attempt...")
-                    if session:
-                        try:
-                            session.close()
-                        except:
-                            pass
-                    error_session = SessionLocal()
-                    try:
-                        # Query user with retry logic
-                        error_user = None
-                        for user_retry in range(3):
-                            try:
-                                error_user = error_session.query(User).filter(User.id == user_id).first()
-                                break  # Success
-                            except (OperationalError, DisconnectionError) as user_query_error:
-                                logger.warning(f"Job {job_id}: User query failed in final attempt, retry {user_retry + 1}/3: {user_query_error}")
-                                error_session.rollback()
-                                if user_retry < 2:
-                                    await asyncio.sleep(0.3 * (user_retry + 1))
-                                    continue
-                                raise  # Re-raise if all retries fail
-                        
-                        if error_user:
-                            error_content_service = ContentService(error_session, error_user)
-                            # update_job_status calls get_job() which can fail - wrap in try/except with retry
-                            try:
-                                # Verify job exists before updating (get_job can fail with connection error)
-                                # Add retry logic for get_job call
-                                error_job = None
-                                for get_job_retry in range(3):
-                                    try:
-                                        error_job = error_content_service.get_job(job_id)
-                                        break  # Success
-                                    except (OperationalError, DisconnectionError) as get_job_error:
-                                        logger.warning(f"Job {job_id}: get_job failed in final attempt, retry {get_job_retry + 1}/3: {get_job_error}")
-                                        error_session.rollback()
-                                        if get_job_retry < 2:
-                                            await asyncio.sleep(0.3 * (get_job_retry + 1))
-                                            continue
-                                        raise  # Re-raise if all retries fail
-                                
-                                if not error_job:
-                                    logger.warning(f"Job {job_id}: Job not found during final error status update")
-                                    error_update_success = False
-                                else:
-                                    # Job exists - update status
-                                    error_content_service.update_job_status(
-                                        job_id,
-                                        JobStatus.FAILED.value,
-                                        finished_at=datetime.utcnow()
-                                    )
-                                    error_session.commit()
-                                    error_update_success = True
-                                    logger.info(f"Job {job_id}: Successfully updated job status with new session")
-                            except (OperationalError, DisconnectionError) as final_update_error:
-                                # get_job() or update_job_status() failed even in final attempt - log and continue
-                                logger.error(f"Job {job_id}: Final update_job_status attempt failed with connection error: {final_update_error}")
-                                error_update_success = False
-                            except Exception as final_update_error:
-                                # Non-connection error (e.g., job not found)
-                                logger.warning(f"Job {job_id}: Final update_job_status failed with non-connection error: {final_update_error}")
-                                error_update_success = False
-                            
-                            # Always send error event, even if DB update failed
-                            sse_store.add_event(job_id, 'error', {
-                                'job_id': job_id,
-                                'message': error_msg,
-                                'error_type': error_type,
-                                'hint': hint
-                            })
-                        else:
-                            logger.error(f"Job {job_id}: User {user_id} not found even with new session")
-                            # Still send error event even if we can't update DB
-                            sse_store.add_event(job_id, 'error', {
-                                'job_id': job_id,
-                                'message': error_msg,
-                                'error_type': error_type,
-                                'hint': hint
-                            })
-                            error_update_success = True
-                    except Exception as new_session_error:
-                        logger.error(f"Job {job_id}: Failed to update job status even with new session: {new_session_error}", exc_info=True)
-                        # Last resort - just send error event without DB update
-                        sse_store.add_event(job_id, 'error', {
-                            'job_id': job_id,
-                            'message': error_msg,
-                            'error_type': error_type,
-                            'hint': hint
-                        })
-                    finally:
-                        try:
-                            error_session.close()
-                        except:
-                            pass
-            except Exception as update_error:
-                # Non-connection error - log and send error event
-                if not isinstance(update_error, (OperationalError, DisconnectionError)):
-                    logger.error(f"Job {job_id}: Non-connection error updating job status: {update_error}")
-                    sse_store.add_event(job_id, 'error', {
-                        'job_id': job_id,
-                        'message': error_msg,
-                        'error_type': error_type,
-                        'hint': hint
-                    })
-        
-        # If we couldn't update the database, still send error event
-        if not error_update_success:
-            sse_store.add_event(job_id, 'error', {
-                'job_id': job_id,
-                'message': error_msg,
-                'error_type': error_type,
-                'hint': hint
-            })
-        else:
-            # No session available - just send error event
-            sse_store.add_event(job_id, 'error', {
-                'job_id': job_id,
-                'message': error_msg,
-                'error_type': error_type,
-                'hint': hint
-            })
+                session.rollback()
+                session.close()
+            except Exception:
+                pass
+            session = None
+        await _set_job_status(job_id, user_id, JobStatus.FAILED.value, finished_at=datetime.utcnow())
+        sse_store.add_event(job_id, 'error', {
+            'job_id': job_id,
+            'message': error_msg,
+            'error_type': error_type,
+            'hint': hint
+        })
         
         # Track job failure metric (regardless of session status)
         try:
@@ -4212,6 +2795,12 @@ async def run_generation_async(
         except ImportError:
             pass
     finally:
+        if cache_fill_leader:
+            # Wake jobs waiting on this fill (they re-check the cache, or generate themselves on failure)
+            try:
+                cache.end_fill(topic, content_types, PROMPT_VERSION, model_name)
+            except Exception as fill_error:
+                logger.warning(f"Job {job_id}: Failed to release content cache fill: {fill_error}")
         if session:
             try:
                 session.close()
@@ -4636,320 +3225,285 @@ async def _generate_voiceover_async(
         print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Starting TTS synthesis with provider: {provider_name}", file=sys.stdout, flush=True)
         sys.stdout.flush()
         
-        tts_start_time = time.time()
-        tts_success = False
-        
-        # Estimate text length for progress updates
-        text_length = len(narration_text)
+        # Content-addressed TTS cache: the same script, voice, speed and format reuse stored audio
+        from .services.tts_cache import get_tts_cache
+        storage = get_storage_provider()
+        loop = asyncio.get_event_loop()
+        tts_cache = get_tts_cache()
+        tts_cache_key = None
+        cached_audio = None
+        if tts_cache is not None:
+            tts_cache_key = tts_cache.make_key(narration_text, voice_id, speed, format, provider_name)
+            try:
+                cached_audio = await run_storage_io(tts_cache.restore, tts_cache_key, storage)
+            except Exception as cache_error:
+                logger.warning(f"[VOICEOVER_ASYNC] TTS cache lookup failed (non-fatal): {cache_error}")
+            TTSMetrics.record_cache_lookup(provider_name, cached_audio is not None)
         
-        # Send intermediate progress updates during synthesis (if text is long)
-        # FIX: Use a flag to cancel background progress updates when synthesis completes
-        synthesis_complete = asyncio.Event()
-        if text_length > 500:
-            # Send progress at 40% and 55% for longer texts
-            async def send_intermediate_progress():
-                try:
-                    await asyncio.sleep(2)  # Wait 2 seconds
-                    # Check if synthesis completed before sending progress
-                    if synthesis_complete.is_set():
-                        logger.info(f"[VOICEOVER_ASYNC] Skipping 40% progress - synthesis already completed")
-                        return
-                    elapsed = time.time() - tts_start_time
-                    if elapsed < 30:  # Only if still synthesizing (within 30s)
-                        sse_store.add_event(
-                            job_id,
-                            'tts_progress',
-                            {
-                                'type': 'tts_progress',
-                                'job_id': job_id,
-                                'message': 'Synthesizing speech...',
-                                'progress': 40
-                            }
-                        )
-                    
-                    await asyncio.sleep(2)  # Wait another 2 seconds
-                    # Check if synthesis completed before sending progress
-                    if synthesis_complete.is_set():
-                        logger.info(f"[VOICEOVER_ASYNC] Skipping 55% progress - synthesis already completed")
-                        return
-                    elapsed = time.time() - tts_start_time
-                    if elapsed < 30:  # Only if still synthesizing (within 30s)
-                        sse_store.add_event(
-                            job_id,
-                            'tts_progress',
-                            {
-                                'type': 'tts_progress',
-                                'job_id': job_id,
-                                'message': 'Synthesizing speech...',
-                                'progress': 55
-                            }
-                        )
-                except asyncio.CancelledError:
-                    logger.info(f"[VOICEOVER_ASYNC] Background progress task cancelled")
-                except Exception as progress_error:
-                    logger.warning(f"[VOICEOVER_ASYNC] Background progress task error: {progress_error}")
+        if cached_audio is None:
+            tts_start_time = time.time()
+            tts_success = False
             
-            # Start intermediate progress updates in background
-            progress_task = asyncio.create_task(send_intermediate_progress())
-        
-        try:
-            logger.info(f"[VOICEOVER_ASYNC] About to call synthesize for job {job_id}, voice_id: {voice_id}, format: {format}, speed: {speed}")
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] About to call synthesize for job {job_id}", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Parameters - voice_id: {voice_id}, format: {format}, speed: {speed}, text_length: {len(narration_text)}", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] TTS provider type: {type(tts_provider).__name__}", file=sys.stdout, flush=True)
-            sys.stdout.flush()
+            # Progress comes from completed sentence chunks (reported from the executor thread),
+            # mapped onto 25-70%; 70% is sent once synthesis finishes
+            last_progress = [25]
+            
+            def report_synthesis_progress(chunks_done: int, total_chunks: int):
+                progress = 25 + int(45 * chunks_done / max(total_chunks, 1))
+                if progress <= last_progress[0] or progress >= 70:
+                    return
+                last_progress[0] = progress
+                sse_store.add_event(
+                    job_id,
+                    'tts_progress',
+                    {
+                        'type': 'tts_progress',
+                        'job_id': job_id,
+                        'message': 'Synthesizing speech...',
+                        'progress': progress,
+                        'chunks_done': chunks_done,
+                        'total_chunks': total_chunks
+                    }
+                )
+            
+            # Audio is written chunk by chunk to a temp file instead of held in memory
+            import tempfile
+            import os
+            audio_fd, audio_path = tempfile.mkstemp(suffix=f'.{format}')
+            os.close(audio_fd)
+            
+            try:
+                logger.info(f"[VOICEOVER_ASYNC] About to call synthesize for job {job_id}, voice_id: {voice_id}, format: {format}, speed: {speed}")
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] About to call synthesize for job {job_id}", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Parameters - voice_id: {voice_id}, format: {format}, speed: {speed}, text_length: {len(narration_text)}", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] TTS provider type: {type(tts_provider).__name__}", file=sys.stdout, flush=True)
+                sys.stdout.flush()
+                
+                logger.info(f"[VOICEOVER_ASYNC] Calling tts_provider.synthesize_to_file()...")
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Calling tts_provider.synthesize_to_file()...", file=sys.stdout, flush=True)
+                sys.stdout.flush()
+                
+                # Synthesize in executor so the event loop keeps serving other requests
+                metadata = await loop.run_in_executor(
+                    None,
+                    lambda: tts_provider.synthesize_to_file(
+                        text=narration_text,
+                        output_path=audio_path,
+                        voice_id=voice_id,
+                        speed=speed,
+                        format=format,
+                        progress_callback=report_synthesis_progress
+                    )
+                )
+                audio_size = os.path.getsize(audio_path)
+                
+                tts_success = True
+                tts_duration = time.time() - tts_start_time
+                
+                logger.info(f"[VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}")
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Synthesis took {tts_duration:.2f}s", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio size: {audio_size} bytes", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio duration: {metadata.get('duration_sec', 'N/A')}s", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio format: {metadata.get('format', 'N/A')}", file=sys.stdout, flush=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Sample rate: {metadata.get('sample_rate', 'N/A')}", file=sys.stdout, flush=True)
+                sys.stdout.flush()
+                
+                logger.info(f"[VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}, duration: {metadata.get('duration_sec')}s, audio size: {audio_size} bytes, synthesis_time: {tts_duration:.2f}s")
+            except FileNotFoundError as e:
+                tts_success = False
+                error_msg = f"TTS model file not found: {str(e)}. Please ensure Piper TTS models are installed or downloadable."
+                logger.error(f"[VOICEOVER_ASYNC] FileNotFoundError during synthesis: {error_msg}", exc_info=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] FileNotFoundError: {error_msg}", file=sys.stderr, flush=True)
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail=error_msg
+                )
+            except Exception as synth_error:
+                tts_success = False
+                error_type = type(synth_error).__name__
+                error_msg = f"TTS synthesis failed: {error_type}: {str(synth_error)}"
+                logger.error(f"[VOICEOVER_ASYNC] Exception during synthesis: {error_msg}", exc_info=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Exception traceback:", file=sys.stderr, flush=True)
+                import traceback
+                traceback.print_exc(file=sys.stderr)
+                sys.stderr.flush()
+                raise HTTPException(
+                    status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                    detail=error_msg
+                )
+            finally:
+                tts_duration = time.time() - tts_start_time
+                TTSMetrics.record_synthesis(provider_name, tts_duration, success=tts_success)
+                if not tts_success:
+                    try:
+                        os.unlink(audio_path)
+                    except OSError:
+                        pass
             
-            logger.info(f"[VOICEOVER_ASYNC] Calling tts_provider.synthesize()...")
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Calling tts_provider.synthesize()...", file=sys.stdout, flush=True)
+            # Send progress event after synthesis completes
+            logger.info(f"[VOICEOVER_ASYNC] Sending tts_progress event (70%) - Processing audio...")
+            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Sending tts_progress event (70%) - Processing audio...", file=sys.stdout, flush=True)
             sys.stdout.flush()
             
-            audio_bytes, metadata = tts_provider.synthesize(
-                text=narration_text,
-                voice_id=voice_id,
-                speed=speed,
-                format=format
+            sse_store.add_event(
+                job_id,
+                'tts_progress',
+                {
+                    'type': 'tts_progress',
+                    'job_id': job_id,
+                    'message': 'Processing audio...',
+                    'progress': 70
+                }
             )
             
-            tts_success = True
-            tts_duration = time.time() - tts_start_time
+            # OPTIMIZATION: Store audio file synchronously to ensure it exists before sending URL
+            # This prevents 404 errors when frontend tries to access the file
+            logger.info(f"[VOICEOVER_ASYNC] Getting storage provider...")
+            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Getting storage provider...", file=sys.stdout, flush=True)
+            sys.stdout.flush()
             
-            # FIX: Signal that synthesis is complete to cancel background progress updates
-            if 'synthesis_complete' in locals():
-                synthesis_complete.set()
-            if 'progress_task' in locals():
-                try:
-                    progress_task.cancel()
-                except:
-                    pass
+            storage_key = storage.generate_key('voiceovers', f'.{format}')
             
-            logger.info(f"[VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}")
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Synthesis took {tts_duration:.2f}s", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio size: {len(audio_bytes)} bytes", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio duration: {metadata.get('duration_sec', 'N/A')}s", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio format: {metadata.get('format', 'N/A')}", file=sys.stdout, flush=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Sample rate: {metadata.get('sample_rate', 'N/A')}", file=sys.stdout, flush=True)
+            logger.info(f"[VOICEOVER_ASYNC] Generated storage key: {storage_key}")
+            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Generated storage key: {storage_key}", file=sys.stdout, flush=True)
             sys.stdout.flush()
             
-            logger.info(f"[VOICEOVER_ASYNC] TTS synthesis complete for job {job_id}, duration: {metadata.get('duration_sec')}s, audio size: {len(audio_bytes)} bytes, synthesis_time: {tts_duration:.2f}s")
-        except FileNotFoundError as e:
-            tts_success = False
-            error_msg = f"TTS model file not found: {str(e)}. Please ensure Piper TTS models are installed or downloadable."
-            logger.error(f"[VOICEOVER_ASYNC] FileNotFoundError during synthesis: {error_msg}", exc_info=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] FileNotFoundError: {error_msg}", file=sys.stderr, flush=True)
-            raise HTTPException(
-                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-                detail=error_msg
-            )
-        except Exception as synth_error:
-            tts_success = False
-            error_type = type(synth_error).__name__
-            error_msg = f"TTS synthesis failed: {error_type}: {str(synth_error)}"
-            logger.error(f"[VOICEOVER_ASYNC] Exception during synthesis: {error_msg}", exc_info=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Exception traceback:", file=sys.stderr, flush=True)
-            import traceback
-            traceback.print_exc(file=sys.stderr)
-            sys.stderr.flush()
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail=error_msg
+            # Send progress event before storage
+            sse_store.add_event(
+                job_id,
+                'tts_progress',
+                {
+                    'type': 'tts_progress',
+                    'job_id': job_id,
+                    'message': 'Saving audio file...',
+                    'progress': 80
+                }
             )
-        finally:
-            tts_duration = time.time() - tts_start_time
-            TTSMetrics.record_synthesis(provider_name, tts_duration, success=tts_success)
-        
-        # FIX: Signal synthesis complete before sending progress events
-        if 'synthesis_complete' in locals():
-            synthesis_complete.set()
-        if 'progress_task' in locals():
-            try:
-                progress_task.cancel()
-            except:
-                pass
-        
-        # Send progress event after synthesis completes
-        logger.info(f"[VOICEOVER_ASYNC] Sending tts_progress event (70%) - Processing audio...")
-        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Sending tts_progress event (70%) - Processing audio...", file=sys.stdout, flush=True)
-        sys.stdout.flush()
-        
-        sse_store.add_event(
-            job_id,
-            'tts_progress',
-            {
-                'type': 'tts_progress',
-                'job_id': job_id,
-                'message': 'Processing audio...',
-                'progress': 70
-            }
-        )
-        
-        # OPTIMIZATION: Store audio file synchronously to ensure it exists before sending URL
-        # This prevents 404 errors when frontend tries to access the file
-        logger.info(f"[VOICEOVER_ASYNC] Getting storage provider...")
-        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Getting storage provider...", file=sys.stdout, flush=True)
-        sys.stdout.flush()
-        
-        storage = get_storage_provider()
-        storage_key = storage.generate_key('voiceovers', f'.{format}')
-        
-        logger.info(f"[VOICEOVER_ASYNC] Generated storage key: {storage_key}")
-        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Generated storage key: {storage_key}", file=sys.stdout, flush=True)
-        sys.stdout.flush()
-        
-        # Send progress event before storage
-        sse_store.add_event(
-            job_id,
-            'tts_progress',
-            {
-                'type': 'tts_progress',
-                'job_id': job_id,
-                'message': 'Saving audio file...',
-                'progress': 80
-            }
-        )
-        
-        # Store audio file synchronously to ensure it exists before sending URL
-        # This prevents frontend from getting 404 errors
-        from .services.metrics import StorageMetrics
-        storage_start_time = time.time()
-        
-        # MP3 conversion for browser compatibility (fallback format)
-        mp3_bytes = None
-        mp3_storage_key = None
-        mp3_storage_url = None
-        
-        try:
-            logger.info(f"[VOICEOVER_ASYNC] Storing audio file synchronously: {storage_key} ({len(audio_bytes)} bytes)")
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Storing audio file: {storage_key} ({len(audio_bytes)} bytes)", file=sys.stdout, flush=True)
-            sys.stdout.flush()
             
-            # Store in executor to avoid blocking event loop, but wait for completion
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: storage.put(storage_key, audio_bytes, content_type=f'audio/{format}')
-            )
+            # Store audio file synchronously to ensure it exists before sending URL
+            # This prevents frontend from getting 404 errors
+            from .services.metrics import StorageMetrics
+            storage_start_time = time.time()
             
-            storage_duration = time.time() - storage_start_time
-            StorageMetrics.record_put("voiceover", len(audio_bytes), success=True)
-            logger.info(f"[VOICEOVER_ASYNC] Audio file stored successfully in {storage_duration:.3f}s: {storage_key}")
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio file stored successfully in {storage_duration:.3f}s", file=sys.stdout, flush=True)
-            sys.stdout.flush()
+            # Browser renditions of WAV audio (MP3 fallback format, optionally Opus/AAC)
+            from .services import audio_transcoder
+            rendition_paths = {}
+            renditions = {}
+            mp3_storage_key = None
+            mp3_storage_url = None
             
-            # Convert WAV to MP3 for better browser compatibility (if format is wav)
-            if format == 'wav':
-                try:
-                    logger.info(f"[VOICEOVER_ASYNC] Converting WAV to MP3 for browser compatibility...")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Converting WAV to MP3...", file=sys.stdout, flush=True)
-                    
-                    # Convert WAV to MP3 using pydub (requires ffmpeg)
-                    from pydub import AudioSegment
-                    import io
-                    
-                    # Load WAV from bytes
-                    wav_audio = AudioSegment.from_wav(io.BytesIO(audio_bytes))
-                    
-                    # Export to MP3
-                    mp3_buffer = io.BytesIO()
-                    wav_audio.export(mp3_buffer, format="mp3", bitrate="128k")
-                    mp3_bytes = mp3_buffer.getvalue()
-                    
-                    logger.info(f"[VOICEOVER_ASYNC] MP3 conversion successful: {len(mp3_bytes)} bytes (original WAV: {len(audio_bytes)} bytes)")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] MP3 conversion successful: {len(mp3_bytes)} bytes", file=sys.stdout, flush=True)
-                    
-                    # Store MP3 version
-                    mp3_storage_key = storage.generate_key('voiceovers', '.mp3')
-                    await loop.run_in_executor(
-                        None,
-                        lambda: storage.put(mp3_storage_key, mp3_bytes, content_type='audio/mpeg')
-                    )
-                    
-                    mp3_storage_url = storage.get_url(mp3_storage_key)
-                    StorageMetrics.record_put("voiceover_mp3", len(mp3_bytes), success=True)
-                    
-                    logger.info(f"[VOICEOVER_ASYNC] MP3 file stored: {mp3_storage_key}")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] MP3 file stored: {mp3_storage_key}", file=sys.stdout, flush=True)
-                    sys.stdout.flush()
-                    
-                except ImportError:
-                    logger.warning(f"[VOICEOVER_ASYNC] pydub not available, skipping MP3 conversion")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: pydub not available, skipping MP3 conversion", file=sys.stderr, flush=True)
-                except Exception as mp3_error:
-                    # Don't fail the whole process if MP3 conversion fails
-                    logger.warning(f"[VOICEOVER_ASYNC] MP3 conversion failed (non-fatal): {str(mp3_error)}", exc_info=True)
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: MP3 conversion failed (non-fatal): {str(mp3_error)}", file=sys.stderr, flush=True)
-                    mp3_bytes = None  # Clear on error
+            try:
+                # Encode every rendition in one ffmpeg pass before the WAV is moved into storage
+                if format == 'wav':
+                    try:
+                        logger.info(f"[VOICEOVER_ASYNC] Encoding browser renditions ({', '.join(audio_transcoder.AUDIO_RENDITIONS)})...")
+                        rendition_paths = await audio_transcoder.transcode_voiceover(audio_path, provider_name)
+                    except audio_transcoder.TranscoderUnavailable:
+                        logger.warning(f"[VOICEOVER_ASYNC] ffmpeg not available, skipping MP3 conversion")
+                        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: ffmpeg not available, skipping MP3 conversion", file=sys.stderr, flush=True)
+                    except Exception as transcode_error:
+                        # Don't fail the whole process if encoding fails
+                        logger.warning(f"[VOICEOVER_ASYNC] Audio encoding failed (non-fatal): {str(transcode_error)}", exc_info=True)
+                        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: Audio encoding failed (non-fatal): {str(transcode_error)}", file=sys.stderr, flush=True)
+                
+                logger.info(f"[VOICEOVER_ASYNC] Storing audio file synchronously: {storage_key} ({audio_size} bytes)")
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Storing audio file: {storage_key} ({audio_size} bytes)", file=sys.stdout, flush=True)
+                sys.stdout.flush()
+                
+                # Store on the storage I/O pool to avoid blocking event loop, but wait for completion
+                await storage.aput_file(storage_key, audio_path, content_type=f'audio/{format}', move=True)
+                
+                storage_duration = time.time() - storage_start_time
+                StorageMetrics.record_put("voiceover", audio_size, success=True)
+                logger.info(f"[VOICEOVER_ASYNC] Audio file stored successfully in {storage_duration:.3f}s: {storage_key}")
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Audio file stored successfully in {storage_duration:.3f}s", file=sys.stdout, flush=True)
+                sys.stdout.flush()
+                
+                for rendition, rendition_path in rendition_paths.items():
+                    try:
+                        rendition_size = os.path.getsize(rendition_path)
+                        rendition_format = audio_transcoder.RENDITIONS[rendition]
+                        rendition_key = storage.generate_key('voiceovers', rendition_format['extension'])
+                        await storage.aput_file(rendition_key, rendition_path, content_type=rendition_format['content_type'], move=True)
+                        StorageMetrics.record_put(f"voiceover_{rendition}", rendition_size, success=True)
+                        renditions[rendition] = {
+                            'storage_key': rendition_key,
+                            'storage_url': storage.get_url(rendition_key),
+                            'size': rendition_size
+                        }
+                        logger.info(f"[VOICEOVER_ASYNC] {rendition.upper()} file stored: {rendition_key} ({rendition_size} bytes, original WAV: {audio_size} bytes)")
+                    except Exception as rendition_error:
+                        # A missing rendition only loses the fallback format
+                        StorageMetrics.record_put(f"voiceover_{rendition}", 0, success=False)
+                        logger.warning(f"[VOICEOVER_ASYNC] Failed to store {rendition} rendition (non-fatal): {rendition_error}")
+                
+                if 'mp3' in renditions:
+                    mp3_storage_key = renditions['mp3']['storage_key']
+                    mp3_storage_url = renditions['mp3']['storage_url']
+                
+                # Verify file exists (for local storage) - use same path logic as LocalDiskStorageProvider
+                if hasattr(storage, 'base_path'):
+                    from pathlib import Path
+                    # Use same sanitization logic as LocalDiskStorageProvider.put()
+                    # storage_key format: "voiceovers/20240112_123456_abc123.wav"
+                    safe_key = storage_key.lstrip('/').replace('..', '')
+                    # Path.joinpath handles forward slashes correctly on all platforms
+                    file_path = Path(storage.base_path) / safe_key
+                    if file_path.exists():
+                        file_size = file_path.stat().st_size
+                        logger.info(f"[VOICEOVER_ASYNC] Storage verification: File exists at {file_path} ({file_size} bytes)")
+                        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Storage verification: File exists ({file_size} bytes)", file=sys.stdout, flush=True)
+                    else:
+                        logger.warning(f"[VOICEOVER_ASYNC] Storage verification: File not found at {file_path}")
+                        print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: Storage verification failed - file not found", file=sys.stderr, flush=True)
+                
+            except Exception as storage_error:
+                storage_duration = time.time() - storage_start_time
+                StorageMetrics.record_put("voiceover", audio_size, success=False)
+                error_msg = f"Failed to store audio file after {storage_duration:.3f}s: {str(storage_error)}"
+                logger.error(f"[VOICEOVER_ASYNC] {error_msg}", exc_info=True)
+                print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] ERROR: {error_msg}", file=sys.stderr, flush=True)
+                sys.stderr.flush()
+                raise RuntimeError(error_msg)
+            finally:
+                # Already gone if it was moved into storage
+                for leftover_path in (audio_path, *rendition_paths.values()):
+                    try:
+                        os.unlink(leftover_path)
+                    except OSError:
+                        pass
             
-            # Convert WAV to MP3 for better browser compatibility (if format is wav)
-            if format == 'wav':
+            # Add the new audio to the TTS cache (non-fatal; the artifact keeps its own copy)
+            if tts_cache is not None:
                 try:
-                    logger.info(f"[VOICEOVER_ASYNC] Converting WAV to MP3 for browser compatibility...")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Converting WAV to MP3...", file=sys.stdout, flush=True)
-                    
-                    # Convert WAV to MP3 using pydub (requires ffmpeg)
-                    from pydub import AudioSegment
-                    import io
-                    
-                    # Load WAV from bytes
-                    wav_audio = AudioSegment.from_wav(io.BytesIO(audio_bytes))
-                    
-                    # Export to MP3
-                    mp3_buffer = io.BytesIO()
-                    wav_audio.export(mp3_buffer, format="mp3", bitrate="128k")
-                    mp3_bytes = mp3_buffer.getvalue()
-                    
-                    logger.info(f"[VOICEOVER_ASYNC] MP3 conversion successful: {len(mp3_bytes)} bytes (original WAV: {len(audio_bytes)} bytes)")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] MP3 conversion successful: {len(mp3_bytes)} bytes", file=sys.stdout, flush=True)
-                    
-                    # Store MP3 version
-                    mp3_storage_key = storage.generate_key('voiceovers', '.mp3')
-                    await loop.run_in_executor(
-                        None,
-                        lambda: storage.put(mp3_storage_key, mp3_bytes, content_type='audio/mpeg')
+                    await run_storage_io(
+                        tts_cache.save,
+                        tts_cache_key, storage, storage_key, metadata, audio_size, mp3_storage_key=mp3_storage_key
                     )
-                    
-                    mp3_storage_url = storage.get_url(mp3_storage_key)
-                    StorageMetrics.record_put("voiceover_mp3", len(mp3_bytes), success=True)
-                    
-                    logger.info(f"[VOICEOVER_ASYNC] MP3 file stored: {mp3_storage_key}")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] MP3 file stored: {mp3_storage_key}", file=sys.stdout, flush=True)
-                    sys.stdout.flush()
-                    
-                except ImportError:
-                    logger.warning(f"[VOICEOVER_ASYNC] pydub not available, skipping MP3 conversion")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: pydub not available, skipping MP3 conversion", file=sys.stderr, flush=True)
-                except Exception as mp3_error:
-                    # Don't fail the whole process if MP3 conversion fails
-                    logger.warning(f"[VOICEOVER_ASYNC] MP3 conversion failed (non-fatal): {str(mp3_error)}", exc_info=True)
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: MP3 conversion failed (non-fatal): {str(mp3_error)}", file=sys.stderr, flush=True)
-                    mp3_bytes = None  # Clear on error
-                    mp3_storage_key = None
-                    mp3_storage_url = None
-            
-            # Verify file exists (for local storage) - use same path logic as LocalDiskStorageProvider
-            if hasattr(storage, 'base_path'):
-                from pathlib import Path
-                # Use same sanitization logic as LocalDiskStorageProvider.put()
-                # storage_key format: "voiceovers/20240112_123456_abc123.wav"
-                safe_key = storage_key.lstrip('/').replace('..', '')
-                # Path.joinpath handles forward slashes correctly on all platforms
-                file_path = Path(storage.base_path) / safe_key
-                if file_path.exists():
-                    file_size = file_path.stat().st_size
-                    logger.info(f"[VOICEOVER_ASYNC] Storage verification: File exists at {file_path} ({file_size} bytes)")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Storage verification: File exists ({file_size} bytes)", file=sys.stdout, flush=True)
-                else:
-                    logger.warning(f"[VOICEOVER_ASYNC] Storage verification: File not found at {file_path}")
-                    print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] WARNING: Storage verification failed - file not found", file=sys.stderr, flush=True)
+                except Exception as cache_error:
+                    logger.warning(f"[VOICEOVER_ASYNC] Failed to add voiceover to TTS cache (non-fatal): {cache_error}")
+        else:
+            storage_key = cached_audio['storage_key']
+            mp3_storage_key = cached_audio['mp3_storage_key']
+            mp3_storage_url = storage.get_url(mp3_storage_key) if mp3_storage_key else None
+            renditions = {}
+            if mp3_storage_key:
+                renditions['mp3'] = {'storage_key': mp3_storage_key, 'storage_url': mp3_storage_url}
+            metadata = cached_audio['metadata']
+            audio_size = cached_audio['size']
+            logger.info(f"[VOICEOVER_ASYNC] Reused cached voiceover audio for job {job_id}: {storage_key} ({audio_size} bytes)")
             
-        except Exception as storage_error:
-            storage_duration = time.time() - storage_start_time
-            StorageMetrics.record_put("voiceover", len(audio_bytes), success=False)
-            error_msg = f"Failed to store audio file after {storage_duration:.3f}s: {str(storage_error)}"
-            logger.error(f"[VOICEOVER_ASYNC] {error_msg}", exc_info=True)
-            print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] ERROR: {error_msg}", file=sys.stderr, flush=True)
-            sys.stderr.flush()
-            raise RuntimeError(error_msg)
+            sse_store.add_event(
+                job_id,
+                'tts_progress',
+                {
+                    'type': 'tts_progress',
+                    'job_id': job_id,
+                    'message': 'Reusing previously generated audio...',
+                    'progress': 80
+                }
+            )
         
         # Generate URL after storage completes (ensures file exists)
         storage_url = storage.get_url(storage_key)
@@ -5035,8 +3589,13 @@ async def _generate_voiceover_async(
             artifact_metadata['mp3_storage_key'] = mp3_storage_key
             artifact_metadata['mp3_storage_url'] = mp3_storage_url
             artifact_metadata['mp3_url'] = mp3_storage_url  # Alias for frontend compatibility
+        if renditions:
+            artifact_metadata['renditions'] = renditions
             logger.info(f"[VOICEOVER_ASYNC] Added MP3 URLs to artifact metadata for job {job_id}")
             print(f"[RAILWAY_DEBUG] [VOICEOVER_ASYNC] Added MP3 URLs to artifact metadata", file=sys.stdout, flush=True)
+        if tts_cache_key:
+            # Lets GDPR deletion erase the cache entry made from this user's script
+            artifact_metadata['tts_cache_key'] = tts_cache_key
         
         artifact = content_service.create_artifact(
             job_id=job_id,
@@ -5320,6 +3879,7 @@ async def render_video(
     
     # Find voiceover_audio artifact if include_narration is True
     narration_audio_path = None
+    narration_storage_key = None
     if request.include_narration:
         for artifact in job.artifacts:
             if artifact.type == 'voiceover_audio' and artifact.content_json:
@@ -5327,8 +3887,10 @@ async def render_video(
                 if storage_key:
                     from .services.storage_provider import get_storage_provider
                     storage = get_storage_provider()
-                    # Get full path to audio file
+                    # Get full path to audio file; remote storage is streamed down by the render task
                     narration_audio_path = storage.base_path / storage_key if hasattr(storage, 'base_path') else None
+                    if narration_audio_path is None:
+                        narration_storage_key = storage_key
                     break
     
     # Start video rendering asynchronously
@@ -5342,6 +3904,7 @@ async def render_video(
             background_color=request.background_color,
             background_image_path=request.background_image_path,
             narration_audio_path=str(narration_audio_path) if narration_audio_path and narration_audio_path.exists() else None,
+            narration_storage_key=narration_storage_key,
             include_narration=request.include_narration,
             renderer=request.renderer,
             user_id=current_user.id
@@ -5366,7 +3929,8 @@ async def _render_video_async(
     narration_audio_path: Optional[str],
     include_narration: bool,
     renderer: str,
-    user_id: int
+    user_id: int,
+    narration_storage_key: Optional[str] = None
 ):
     """
     Render video asynchronously
@@ -5383,10 +3947,15 @@ async def _render_video_async(
         include_narration: Whether to include narration
         renderer: Renderer name
         user_id: User ID for database session
+        narration_storage_key: Storage key of narration audio without a local path (e.g. S3)
     """
     from .database import get_db, User
     from .services.video_provider import get_video_provider
+    from .services.metrics import StorageMetrics
     from typing import Tuple
+    import os
+    import shutil
+    import tempfile
     
     # Get database session - use SessionLocal directly for async tasks
     from .database import SessionLocal
@@ -5398,6 +3967,9 @@ async def _render_video_async(
         raise
     
     sse_store = get_sse_store()
+    storage = get_storage_provider()
+    narration_temp_path = None
+    work_dir = None
     
     try:
         # Send video render started event
@@ -5422,6 +3994,17 @@ async def _render_video_async(
         if not video_provider.is_available():
             raise RuntimeError(f"Video provider '{renderer}' is not available")
         
+        # Stream remote narration audio to a local file for ffmpeg
+        if include_narration and not narration_audio_path and narration_storage_key:
+            narration_stream = await run_storage_io(storage.open_read, narration_storage_key)
+            if narration_stream is not None:
+                fd, narration_temp_path = tempfile.mkstemp(suffix=os.path.splitext(narration_storage_key)[1])
+                with narration_stream, os.fdopen(fd, 'wb') as narration_file:
+                    await run_storage_io(shutil.copyfileobj, narration_stream, narration_file, 1024 * 1024)
+                narration_audio_path = narration_temp_path
+            else:
+                logger.warning(f"Narration audio {narration_storage_key} not found for video render job {job_id}")
+        
         # Prepare render options
         render_options = {
             "resolution": resolution,
@@ -5448,6 +4031,7 @@ async def _render_video_async(
             )
         
         result = video_provider.render(video_script_json, render_options)
+        work_dir = result.get('work_dir')
         
         # Process scene completion events
         for idx, scene in enumerate(scenes):
@@ -5465,20 +4049,17 @@ async def _render_video_async(
         # Store assets
         user = db.query(User).filter(User.id == user_id).first()
         content_service = ContentService(db, user)
-        storage = get_storage_provider()
         
-        # Store storyboard images if any
+        # Store storyboard images if any (asset files are moved into storage, not read into memory)
         for asset in result.get('assets', []):
             if asset['type'] == 'storyboard_image':
-                # Read image file
-                with open(asset['file_path'], 'rb') as f:
-                    image_bytes = f.read()
+                image_size = os.path.getsize(asset['file_path'])
                 
                 # Store image
                 storage_key = storage.generate_key('storyboard_images', '.png')
                 # Store with metrics (M7)
-                StorageMetrics.record_put("storyboard_image", len(image_bytes), success=True)
-                storage.put(storage_key, image_bytes, content_type='image/png')
+                StorageMetrics.record_put("storyboard_image", image_size, success=True)
+                await storage.aput_file(storage_key, asset['file_path'], content_type='image/png', move=True)
                 
                 # Create artifact
                 content_service.create_artifact(
@@ -5504,15 +4085,13 @@ async def _render_video_async(
                 )
             
             elif asset['type'] == 'video_clip':
-                # Read clip file
-                with open(asset['file_path'], 'rb') as f:
-                    clip_bytes = f.read()
+                clip_size = os.path.getsize(asset['file_path'])
                 
                 # Store clip
                 storage_key = storage.generate_key('video_clips', '.mp4')
                 # Store with metrics (M7)
-                StorageMetrics.record_put("video_clip", len(clip_bytes), success=True)
-                storage.put(storage_key, clip_bytes, content_type='video/mp4')
+                StorageMetrics.record_put("video_clip", clip_size, success=True)
+                await storage.aput_file(storage_key, asset['file_path'], content_type='video/mp4', move=True)
                 
                 # Create artifact
                 content_service.create_artifact(
@@ -5537,9 +4116,10 @@ async def _render_video_async(
                 )
         
         # Store final video
-        video_bytes = result['video_file']
+        video_size = os.path.getsize(result['video_path'])
         storage_key = storage.generate_key('videos', '.mp4')
-        storage_url = storage.put(storage_key, video_bytes, content_type='video/mp4')
+        storage_url = await storage.aput_file(storage_key, result['video_path'], content_type='video/mp4', move=True)
+        StorageMetrics.record_put("final_video", video_size, success=True)
         
         metadata = result['metadata']
         artifact_metadata = {
@@ -5622,6 +4202,14 @@ async def _render_video_async(
             }
         )
     finally:
+        # Render output not moved into storage (or left by a failed store) is removed here
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+        if narration_temp_path:
+            try:
+                os.unlink(narration_temp_path)
+            except OSError:
+                pass
         if db:
             try:
                 db.rollback()  # Rollback any uncommitted transactions before closing
@@ -10,11 +10,107 @@ if sys.platform == 'win32':
 from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
 from crewai.agents.agent_builder.base_agent import BaseAgent
-from typing import List
+from typing import Dict, List, Optional
 from crewai import LLM
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
+
+# Process-wide caches shared by all ContentCreationCrew instances (see services/crew_pool.py)
+_cache_lock = threading.Lock()
+_tier_config_cache: Optional[Dict] = None
+_llm_cache: Dict[tuple, LLM] = {}
+_litellm_timeout_configured: Optional[int] = None
+
+
+def load_tier_config() -> Dict:
+    """Load and cache tier configuration from config/tiers.yaml (parsed once per process)"""
+    global _tier_config_cache
+    if _tier_config_cache is None:
+        import yaml
+        from pathlib import Path
+        tiers = {}
+        try:
+            config_path = Path(__file__).parent / "config" / "tiers.yaml"
+            if config_path.exists():
+                with open(config_path, 'r') as f:
+                    tiers = yaml.safe_load(f).get('tiers', {})
+        except Exception:
+            pass
+        _tier_config_cache = tiers
+    return _tier_config_cache
+
+
+def get_model_for_tier(tier: str) -> str:
+    """
+    Get appropriate LLM model for subscription tier
+    Defaults to gpt-4o-mini for all tiers (can be overridden in tiers.yaml)
+    """
+    tier_config = load_tier_config().get(tier, {})
+    
+    # Default model map - using gpt-4o-mini for all tiers
+    # Can be overridden in tiers.yaml for tier-specific models
+    model_map = {
+        'free': 'gpt-4o-mini',      # Fast, cost-effective model for free tier
+        'basic': 'gpt-4o-mini',     # Fast, cost-effective model for basic tier
+        'pro': 'gpt-4o-mini',       # Fast, cost-effective model for pro tier
+        'enterprise': 'gpt-4o-mini' # Fast, cost-effective model for enterprise tier
+        # Note: Can use 'gpt-4o' for enterprise tier if better quality is needed
+    }
+    
+    # Check tier config first, then fall back to model_map, then default
+    return tier_config.get('model') or model_map.get(tier, 'gpt-4o-mini')
+
+
+def _configure_litellm_timeouts(llm_timeout: int):
+    """Set LiteLLM timeouts (environment and module settings) once per timeout value"""
+    global _litellm_timeout_configured
+    if _litellm_timeout_configured == llm_timeout:
+        return
+    import os
+    
+    # These must be set before importing/using LiteLLM
+    os.environ['LITELLM_REQUEST_TIMEOUT'] = str(llm_timeout)
+    os.environ['LITELLM_TIMEOUT'] = str(llm_timeout)
+    os.environ['LITELLM_CONNECTION_TIMEOUT'] = '60'  # Connection timeout
+    
+    # Also try setting via litellm if available
+    try:
+        import litellm
+        # Set timeout in litellm settings
+        litellm.request_timeout = llm_timeout
+        litellm.timeout = llm_timeout
+        litellm.drop_params = True  # Don't drop timeout params
+        
+        # Configure httpx timeout for Ollama connections
+        try:
+            import httpx
+            # Set environment variable for httpx default timeout
+            os.environ['HTTPX_DEFAULT_TIMEOUT'] = str(llm_timeout)
+        except (ImportError, AttributeError):
+            pass
+    except ImportError:
+        pass
+    _litellm_timeout_configured = llm_timeout
+
+
+def _get_shared_llm(llm_kwargs: Dict) -> LLM:
+    """
+    Get a cached LLM client for these settings, creating it on first use
+    
+    Sharing is safe: agents take a shallow copy of their LLM (Crew.copy/Agent.copy),
+    and the only per-run mutation (stop words) happens on those copies.
+    """
+    key = tuple(sorted(llm_kwargs.items()))
+    llm = _llm_cache.get(key)
+    if llm is None:
+        with _cache_lock:
+            llm = _llm_cache.get(key)
+            if llm is None:
+                llm = LLM(**llm_kwargs)
+                _llm_cache[key] = llm
+    return llm
 # If you want to run a snippet of code before or after the crew starts,
 # you can use the @before_kickoff and @after_kickoff decorators
 # https://docs.crewai.com/concepts/crews#example-crew-class-with-decorators
@@ -27,39 +123,13 @@ class ContentCreationCrew():
     tasks_config = 'config/tasks.yaml'
 
     def __init__(self, tier: str = 'free', content_types: List[str] = None) -> None:
-        import os
-        import yaml
-        from pathlib import Path
-        
         # Set LiteLLM timeout to match CREWAI_TIMEOUT (default 300 seconds / 5 minutes)
         # This ensures LLM calls don't timeout before the overall job timeout
         from .config import config
         timeout_value = config.CREWAI_TIMEOUT
         # Add buffer for LLM calls (timeout + 60 seconds buffer)
         llm_timeout = timeout_value + 60
-        
-        # These must be set before importing/using LiteLLM
-        os.environ['LITELLM_REQUEST_TIMEOUT'] = str(llm_timeout)
-        os.environ['LITELLM_TIMEOUT'] = str(llm_timeout)
-        os.environ['LITELLM_CONNECTION_TIMEOUT'] = '60'  # Connection timeout
-        
-        # Also try setting via litellm if available
-        try:
-            import litellm
-            # Set timeout in litellm settings
-            litellm.request_timeout = llm_timeout
-            litellm.timeout = llm_timeout
-            litellm.drop_params = True  # Don't drop timeout params
-            
-            # Configure httpx timeout for Ollama connections
-            try:
-                import httpx
-                # Set environment variable for httpx default timeout
-                os.environ['HTTPX_DEFAULT_TIMEOUT'] = str(llm_timeout)
-            except (ImportError, AttributeError):
-                pass
-        except ImportError:
-            pass
+        _configure_litellm_timeouts(llm_timeout)
         
         # Load tier configuration and select model based on tier
         self.tier = tier
@@ -146,7 +216,7 @@ class ContentCreationCrew():
         try:
             # Use print() for Railway visibility
             print(f"[RAILWAY_DEBUG] Initializing LLM with kwargs: model={model}, temperature={temperature}, max_tokens={max_tokens}", file=sys.stdout, flush=True)
-            self.llm = LLM(**llm_kwargs)
+            self.llm = _get_shared_llm(llm_kwargs)
             print(f"[RAILWAY_DEBUG] LLM instance created successfully", file=sys.stdout, flush=True)
             logger.info(f"[LLM_INIT] LLM instance created successfully for model '{model}' using {'OpenAI' if use_openai else 'Ollama'}")
         except Exception as llm_error:
@@ -170,39 +240,12 @@ class ContentCreationCrew():
                     raise ValueError(f"Ollama LLM initialization failed: {error_msg}") from llm_error
     
     def _load_tier_config(self) -> dict:
-        """Load tier configuration from YAML file"""
-        import yaml
-        from pathlib import Path
-        try:
-            config_path = Path(__file__).parent / "config" / "tiers.yaml"
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    config = yaml.safe_load(f)
-                    return config.get('tiers', {})
-        except Exception:
-            pass
-        return {}
+        """Load tier configuration from YAML file (cached per process)"""
+        return load_tier_config()
     
     def _get_model_for_tier(self, tier: str) -> str:
-        """
-        Get appropriate LLM model for subscription tier
-        Defaults to gpt-4o-mini for all tiers (can be overridden in tiers.yaml)
-        """
-        tier_config = self.tier_config.get(tier, {})
-        
-        # Default model map - using gpt-4o-mini for all tiers
-        # Can be overridden in tiers.yaml for tier-specific models
-        model_map = {
-            'free': 'gpt-4o-mini',      # Fast, cost-effective model for free tier
-            'basic': 'gpt-4o-mini',     # Fast, cost-effective model for basic tier
-            'pro': 'gpt-4o-mini',       # Fast, cost-effective model for pro tier
-            'enterprise': 'gpt-4o-mini' # Fast, cost-effective model for enterprise tier
-            # Note: Can use 'gpt-4o' for enterprise tier if better quality is needed
-        }
-        
-        # Check tier config first, then fall back to model_map, then default
-        model = tier_config.get('model') or model_map.get(tier, 'gpt-4o-mini')
-        return model
+        """Get appropriate LLM model for subscription tier"""
+        return get_model_for_tier(tier)
     
     def _get_max_parallel_tasks(self) -> int:
         """Get maximum parallel tasks for current tier"""
@@ -284,6 +327,10 @@ class ContentCreationCrew():
     # To learn more about structured task outputs,
     # task dependencies, and task callbacks, check out the documentation:
     # https://docs.crewai.com/concepts/tasks#overview-of-a-task
+    #
+    # Tasks deliberately set no output_file: outputs stay in memory on the
+    # job's CrewOutput.tasks_output (matched by task name during extraction),
+    # so concurrent jobs never share or overwrite files in the working directory.
     @task
     def research_task(self) -> Task:
         return Task(
@@ -304,8 +351,7 @@ class ContentCreationCrew():
         return Task(
             config=self.tasks_config['editing_task'],
             agent=self.editor(),
-            context=[self.writing_task()],
-            output_file='content_output.md'  # Save final output to markdown file
+            context=[self.writing_task()]
         )
 
     @task
@@ -313,8 +359,7 @@ class ContentCreationCrew():
         return Task(
             config=self.tasks_config['social_media_task'],
             agent=self.social_media_specialist(),
-            context=[self.editing_task()],  # Branch from editing task
-            output_file='social_media_output.md'  # Save social media content to separate file
+            context=[self.editing_task()]  # Branch from editing task
         )
     
     @task
@@ -324,7 +369,6 @@ class ContentCreationCrew():
             config=self.tasks_config['social_media_standalone_task'],
             agent=self.social_media_specialist(),
             # No context dependency - generates directly from topic
-            output_file='social_media_output.md'
         )
 
     @task
@@ -332,8 +376,7 @@ class ContentCreationCrew():
         return Task(
             config=self.tasks_config['audio_content_task'],
             agent=self.audio_content_specialist(),
-            context=[self.editing_task()],  # Branch from editing task
-            output_file='audio_output.md'  # Save audio content to separate file
+            context=[self.editing_task()]  # Branch from editing task
         )
     
     @task
@@ -343,7 +386,6 @@ class ContentCreationCrew():
             config=self.tasks_config['audio_content_standalone_task'],
             agent=self.audio_content_specialist(),
             # No context dependency - generates directly from topic
-            output_file='audio_output.md'
         )
 
     @task
@@ -351,8 +393,7 @@ class ContentCreationCrew():
         return Task(
             config=self.tasks_config['video_content_task'],
             agent=self.video_content_specialist(),
-            context=[self.editing_task()],  # Branch from editing task
-            output_file='video_output.md'  # Save video content to separate file
+            context=[self.editing_task()]  # Branch from editing task
         )
 
     def _build_crew(self, content_types: List[str] = None) -> Crew:
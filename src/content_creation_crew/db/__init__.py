@@ -3,6 +3,7 @@ Database module for Content Creation Crew
 PostgreSQL-only database layer
 """
 from .engine import engine, SessionLocal, get_db
+from .async_engine import AsyncSessionLocal, get_async_db
 from .base import Base
 from .models import (
     User,
@@ -21,6 +22,8 @@ __all__ = [
     "engine",
     "SessionLocal",
     "get_db",
+    "AsyncSessionLocal",
+    "get_async_db",
     "Base",
     "User",
     "Session",
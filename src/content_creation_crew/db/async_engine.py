@@ -0,0 +1,118 @@
+"""
+Async database engine and session management
+SQLAlchemy asyncio (asyncpg) path for hot read endpoints and job status writes,
+so queries in async handlers do not block the event loop. Admin, billing and
+other sync code keep using engine.py.
+"""
+import logging
+import threading
+from typing import AsyncGenerator, Optional
+
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from ..config import config
+
+logger = logging.getLogger(__name__)
+
+# Global async engine and session factory (created on first use)
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+_async_engine_lock = threading.Lock()
+
+
+def to_async_url(database_url: str) -> str:
+    """
+    Convert a sync PostgreSQL URL to its asyncpg equivalent
+    
+    libpq-only query parameters (e.g. sslmode) are dropped; SSL is configured
+    through connect arguments instead.
+    
+    Args:
+        database_url: postgresql:// or postgresql+psycopg2:// URL
+    
+    Returns:
+        postgresql+asyncpg:// URL
+    """
+    url = make_url(database_url)
+    if url.get_backend_name() != "postgresql":
+        return database_url
+    return url.set(drivername="postgresql+asyncpg").difference_update_query(["sslmode"]).render_as_string(hide_password=False)
+
+
+def _postgres_connect_args(database_url: str) -> dict:
+    """asyncpg connect arguments matching the sync engine's connection settings"""
+    sslmode = make_url(database_url).query.get("sslmode", "require")
+    return {
+        "timeout": 10,  # Connection timeout (matches connect_timeout of the sync engine)
+        "ssl": sslmode,
+        "server_settings": {
+            "application_name": "content_creation_crew",
+            "statement_timeout": str(config.DB_STATEMENT_TIMEOUT),
+            "idle_in_transaction_session_timeout": "20000",
+        },
+    }
+
+
+def get_async_engine() -> AsyncEngine:
+    """Get the global async engine"""
+    global _async_engine, _async_session_factory
+    if _async_engine is None:
+        with _async_engine_lock:
+            if _async_engine is None:
+                if config.ASYNC_DATABASE_URL:
+                    # Explicit URL, e.g. sqlite+aiosqlite:// in tests
+                    database_url = config.ASYNC_DATABASE_URL
+                    engine_kwargs = {}
+                else:
+                    database_url = to_async_url(config.DATABASE_URL)
+                    engine_kwargs = {
+                        "pool_size": config.DB_ASYNC_POOL_SIZE,
+                        "max_overflow": config.DB_ASYNC_MAX_OVERFLOW,
+                        "pool_recycle": config.DB_POOL_RECYCLE,
+                        "pool_timeout": config.DB_POOL_TIMEOUT,
+                        "pool_pre_ping": config.DB_LIVENESS_STRATEGY != "optimistic",
+                        "connect_args": _postgres_connect_args(config.DATABASE_URL),
+                    }
+                _async_engine = create_async_engine(database_url, echo=False, **engine_kwargs)
+                _async_session_factory = async_sessionmaker(
+                    _async_engine,
+                    expire_on_commit=False,  # Loaded objects stay readable after commit (no lazy refresh on the loop)
+                    autoflush=False
+                )
+                logger.info(f"✓ Async database engine created ({_async_engine.dialect.name}+{_async_engine.dialect.driver})")
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:
+    """Create a new async session (use as `async with AsyncSessionLocal() as db:`)"""
+    get_async_engine()
+    return _async_session_factory()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session.
+    Use as FastAPI dependency: db: AsyncSession = Depends(get_async_db)
+    """
+    async with AsyncSessionLocal() as db:
+        try:
+            yield db
+            await db.commit()
+        except Exception as e:
+            try:
+                await db.rollback()
+            except Exception:
+                pass  # Ignore rollback errors
+            logger.error(f"Async database session error: {e}", exc_info=True)
+            raise
+
+
+async def dispose_async_engine():
+    """Close all pooled async connections (called on application shutdown)"""
+    global _async_engine, _async_session_factory
+    engine = _async_engine
+    _async_engine = None
+    _async_session_factory = None
+    if engine is not None:
+        await engine.dispose()
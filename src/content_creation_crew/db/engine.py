@@ -3,14 +3,15 @@ Database engine and session management
 PostgreSQL-only implementation
 """
 import logging
+import select
 import sys
 import threading
 import time
 import psycopg2
 from sqlalchemy import create_engine, event, text
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import Pool
-from sqlalchemy.exc import OperationalError, DisconnectionError
+from sqlalchemy.exc import DBAPIError, DisconnectionError
 from typing import Generator
 
 from ..config import config
@@ -93,11 +94,24 @@ def validate_database_url(url: str) -> None:
 # Validate DATABASE_URL format
 validate_database_url(config.DATABASE_URL)
 
+# Connection liveness strategy - exactly one check per checkout:
+# - pre_ping: the pool pings each connection as it is checked out (one round trip)
+# - optimistic: no ping; connections the server has already closed are detected locally
+#   at checkout and replaced, and a disconnect mid-request invalidates the pool so the
+#   next checkout reconnects. A proxy (PgBouncer, a cloud load balancer) can drop a
+#   connection without anything reaching the socket, so the first statement of a
+#   session is retried once on a disconnect (see DisconnectRetrySession)
+LIVENESS_STRATEGIES = ("pre_ping", "optimistic")
+liveness_strategy = config.DB_LIVENESS_STRATEGY
+if liveness_strategy not in LIVENESS_STRATEGIES:
+    logger.warning(f"Unknown DB_LIVENESS_STRATEGY '{liveness_strategy}', using 'pre_ping'")
+    liveness_strategy = "pre_ping"
+
 # Create PostgreSQL engine with production-ready pool settings
 try:
     engine = create_engine(
         config.DATABASE_URL,
-        pool_pre_ping=True,  # Verify connections before using (health check) - CRITICAL for detecting dead connections
+        pool_pre_ping=liveness_strategy == "pre_ping",  # Ping connections at checkout (see DB_LIVENESS_STRATEGY)
         pool_size=config.DB_POOL_SIZE,  # Base pool size (default: 20)
         max_overflow=config.DB_MAX_OVERFLOW,  # Additional connections (default: 10, total: 30)
         pool_recycle=config.DB_POOL_RECYCLE,  # Recycle connections after 15 minutes (900s) - prevents stale SSL connections
@@ -168,6 +182,7 @@ logger.info(f"  - Max overflow: {config.DB_MAX_OVERFLOW}")
 logger.info(f"  - Total max connections: {config.DB_POOL_SIZE + config.DB_MAX_OVERFLOW}")
 logger.info(f"  - Pool timeout: {config.DB_POOL_TIMEOUT}s")
 logger.info(f"  - Pool recycle: {config.DB_POOL_RECYCLE}s ({config.DB_POOL_RECYCLE // 60} minutes)")
+logger.info(f"  - Liveness strategy: {liveness_strategy}")
 logger.info(f"  - Statement timeout: {config.DB_STATEMENT_TIMEOUT}ms")
 logger.info(f"  - Idle transaction timeout: 20s")
 logger.info(f"  - SSL mode: require")
@@ -181,29 +196,41 @@ _invalidation_lock = threading.Lock()
 @event.listens_for(Pool, "checkout")
 def receive_checkout(dbapi_conn, connection_record, connection_proxy):
     """Called when a connection is retrieved from the pool"""
-    # Enhanced connection health check before use
-    try:
-        # Test connection with a simple query (pool_pre_ping does this, but we add explicit check)
-        cursor = dbapi_conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.close()
-    except Exception as e:
-        # Connection is dead, invalidate it
-        error_msg = str(e)
-        is_ssl_error = (
-            'SSL' in error_msg or
-            'connection has been closed' in error_msg.lower() or
-            isinstance(e, (psycopg2.OperationalError, psycopg2.InterfaceError))
-        )
-        
-        logger.warning(f"Connection health check failed during checkout, invalidating: {error_msg}")
-        connection_record.invalidate(e)
-        raise
-    
-    # Track pool statistics
-    pool_status = engine.pool.status()
+    # Liveness is checked once per checkout by the configured strategy, not here
     if logger.isEnabledFor(logging.DEBUG):
-        logger.debug(f"Connection checked out from pool | Pool status: {pool_status}")
+        logger.debug(f"Connection checked out from pool | Pool status: {engine.pool.status()}")
+
+def check_connection_alive(dbapi_conn, connection_record, connection_proxy):
+    """
+    Optimistic liveness check at checkout, without a round trip to the server
+    
+    An idle connection has nothing to read, so anything the server has sent is its
+    FATAL notice and/or EOF from closing the connection (restart, terminated backend,
+    idle timeout). Such connections fail here and the pool replaces them with a new
+    one before the request sees them.
+    
+    Raises:
+        DisconnectionError: If the connection is closed
+    """
+    if dbapi_conn.closed:
+        raise DisconnectionError("Connection closed while idle in pool")
+    polled = False
+    try:
+        # The FATAL notice and EOF can take one read each
+        for _ in range(2):
+            if not select.select([dbapi_conn.fileno()], [], [], 0)[0]:
+                break
+            dbapi_conn.poll()
+            polled = True
+    except (psycopg2.OperationalError, psycopg2.InterfaceError) as e:
+        logger.warning(f"[POOL] Idle connection closed by server, reconnecting: {e}")
+        raise DisconnectionError(str(e)) from e
+    if polled and dbapi_conn.notices and dbapi_conn.notices[-1].startswith("FATAL"):
+        logger.warning(f"[POOL] Idle connection closed by server, reconnecting: {dbapi_conn.notices[-1].strip()}")
+        raise DisconnectionError(dbapi_conn.notices[-1].strip())
+
+if liveness_strategy == "optimistic":
+    event.listen(engine, "checkout", check_connection_alive)
 
 @event.listens_for(Pool, "checkin")
 def receive_checkin(dbapi_conn, connection_record):
@@ -254,8 +281,44 @@ def receive_close(dbapi_conn, connection_record):
 
 logger.info("✓ PostgreSQL engine created successfully")
 
+class DisconnectRetrySession(Session):
+    """
+    Session that re-runs its first statement once when it hits a disconnect
+    
+    Used with DB_LIVENESS_STRATEGY=optimistic, where a connection dropped silently
+    (e.g. by a proxy) is only found out by the first statement. Nothing has been
+    sent in the transaction yet, so rolling back and re-running on a new connection
+    is safe. Later statements, and sessions with pending changes, are not retried.
+    """
+    
+    def execute(self, statement, *args, **kwargs):
+        first_statement = not self.info.get('statement_executed') and not (self.new or self.dirty or self.deleted)
+        try:
+            result = super().execute(statement, *args, **kwargs)
+        except DBAPIError as e:
+            if not (first_statement and e.connection_invalidated):
+                raise
+            logger.warning(f"[POOL] Connection lost before the first statement, retrying on a new connection: {e.orig}")
+            self.rollback()
+            result = super().execute(statement, *args, **kwargs)
+        self.info['statement_executed'] = True
+        return result
+
+
+@event.listens_for(DisconnectRetrySession, "after_transaction_end")
+def reset_first_statement(session, transaction):
+    """A new transaction starts with its first statement retryable again"""
+    if transaction.parent is None:
+        session.info.pop('statement_executed', None)
+
+
 # Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=engine,
+    class_=DisconnectRetrySession if liveness_strategy == "optimistic" else Session
+)
 
 
 def get_db() -> Generator:
@@ -274,39 +337,12 @@ def get_db() -> Generator:
         try:
             db = SessionLocal()
             
-            # Immediate connection health check
-            try:
-                db.execute(text("SELECT 1"))
-            except (OperationalError, DisconnectionError) as health_error:
-                # Connection is dead, invalidate and retry
-                error_msg = str(health_error)
-                is_ssl_error = (
-                    'SSL' in error_msg or
-                    'connection has been closed' in error_msg.lower() or
-                    'connection reset' in error_msg.lower() or
-                    'EOF' in error_msg or
-                    (hasattr(health_error, 'orig') and isinstance(health_error.orig, (psycopg2.OperationalError, psycopg2.InterfaceError)))
-                )
-                
-                try:
-                    if hasattr(db, 'connection'):
-                        db.connection().invalidate()
-                    db.close()
-                except:
-                    pass
-                db = None
-                
-                if attempt < max_retries - 1 and is_ssl_error:
-                    logger.warning(
-                        f"[DB_HEALTH] Connection health check failed (attempt {attempt + 1}/{max_retries}): {error_msg}. "
-                        f"Invalidating connection and retrying..."
-                    )
-                    time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-                    continue
-                else:
-                    raise
+            # Check out the connection now so pool errors are retried here; liveness is
+            # verified once by the pool (DB_LIVENESS_STRATEGY) and psycopg2 defers BEGIN
+            # to the first statement, so this costs no extra round trip
+            db.connection()
             
-            break  # Successfully got healthy connection
+            break  # Successfully got connection
             
         except Exception as e:
             # Check if it's a pool-related error
@@ -387,40 +423,10 @@ def get_db_with_retry(max_retries: int = 3, retry_delay: float = 0.1) -> Generat
         try:
             db = SessionLocal()
             
-            # Test connection immediately
-            try:
-                db.execute(text("SELECT 1"))
-            except (OperationalError, DisconnectionError) as health_error:
-                # Connection is dead, invalidate and retry
-                error_msg = str(health_error)
-                is_connection_error = (
-                    'connection' in error_msg.lower() or
-                    'SSL' in error_msg or
-                    'closed' in error_msg.lower() or
-                    'reset' in error_msg.lower() or
-                    'EOF' in error_msg or
-                    (hasattr(health_error, 'orig') and isinstance(health_error.orig, (psycopg2.OperationalError, psycopg2.InterfaceError)))
-                )
-                
-                try:
-                    if hasattr(db, 'connection'):
-                        db.connection().invalidate()
-                    db.close()
-                except:
-                    pass
-                db = None
-                
-                if attempt < max_retries - 1 and is_connection_error:
-                    logger.warning(
-                        f"[DB_RETRY] Database connection health check failed (attempt {attempt + 1}/{max_retries}): {error_msg}. "
-                        f"Invalidating connection and retrying..."
-                    )
-                    time.sleep(retry_delay * (attempt + 1))  # Exponential backoff
-                    continue
-                else:
-                    raise
+            # Check out the connection now (liveness is verified by the pool)
+            db.connection()
             
-            break  # Successfully got healthy connection
+            break  # Successfully got connection
             
         except Exception as e:
             error_msg = str(e).lower()
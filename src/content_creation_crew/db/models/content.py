@@ -42,6 +42,14 @@ class ContentJob(Base):
     started_at = Column(DateTime, nullable=True)
     finished_at = Column(DateTime, nullable=True)
     
+    # Worker queue (set only for jobs enqueued in JOB_EXECUTION_MODE=queue)
+    queued_at = Column(DateTime, nullable=True)
+    attempts = Column(Integer, nullable=False, default=0, server_default="0")
+    lease_owner = Column(String, nullable=True)  # Worker ID holding the job
+    lease_expires_at = Column(DateTime, nullable=True)  # Extended by worker heartbeats
+    queue_priority = Column(Integer, nullable=False, default=1, server_default="1")  # 0 = priority_processing tier, 1 = standard
+    available_at = Column(DateTime, nullable=True)  # Not claimed before this (retry backoff after a worker hands the job back)
+    
     # Relationships
     organization = relationship("Organization", back_populates="content_jobs")
     artifacts = relationship("ContentArtifact", back_populates="job", cascade="all, delete-orphan")
@@ -11,7 +11,8 @@ from decimal import Decimal
 import logging
 
 from .database import User, get_db, Organization
-from .auth import get_current_user
+from .auth import get_current_principal, get_current_user
+from .services.principal_cache import AuthPrincipal
 from .services.invoice_service import InvoiceService
 from .db.models.invoice import Invoice, InvoiceStatus
 
@@ -140,7 +141,7 @@ async def list_invoices(
     status_filter: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -181,7 +182,7 @@ async def list_invoices(
 @router.get("/{invoice_id}", response_model=InvoiceResponse)
 async def get_invoice(
     invoice_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get invoice by ID"""
@@ -208,7 +209,7 @@ async def get_invoice(
 @router.get("/{invoice_id}/pdf")
 async def download_invoice_pdf(
     invoice_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Download invoice PDF"""
@@ -360,7 +361,7 @@ async def void_invoice(
 # Billing Address Routes
 @router.get("/billing-address", response_model=dict)
 async def get_billing_address(
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get billing address for user's organization"""
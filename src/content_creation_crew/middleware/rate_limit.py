@@ -4,7 +4,7 @@ Falls back to in-memory rate limiting if Redis not available
 """
 import time
 import logging
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from fastapi import Request, HTTPException, status
 from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -14,6 +14,49 @@ from ..config import config
 
 logger = logging.getLogger(__name__)
 
+# Atomic token bucket (registered once per client and run with EVALSHA)
+TOKEN_BUCKET_SCRIPT = """
+local key = KEYS[1]
+local limit = tonumber(ARGV[1])
+local bucket_size = tonumber(ARGV[2])
+local refill_rate = tonumber(ARGV[3])
+local now = tonumber(ARGV[4])
+
+local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or bucket_size
+local last_refill = tonumber(bucket[2]) or now
+
+-- Refill tokens
+local time_passed = now - last_refill
+if time_passed >= refill_rate then
+    tokens = bucket_size
+    last_refill = now
+else
+    local tokens_to_add = math.floor((time_passed / refill_rate) * limit)
+    tokens = math.min(tokens + tokens_to_add, bucket_size)
+    last_refill = now
+end
+
+-- Consume token if available
+local allowed = 0
+if tokens > 0 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+-- Update bucket
+redis.call('HMSET', key, 'tokens', tokens, 'last_refill', last_refill)
+redis.call('EXPIRE', key, refill_rate * 2)
+
+-- Calculate reset time
+local reset_after = refill_rate - (now - last_refill)
+if reset_after < 0 then
+    reset_after = 0
+end
+
+return {allowed, tokens, reset_after}
+"""
+
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     """
@@ -22,6 +65,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
     Rate limits are applied per user/organization based on their subscription tier
     """
     
+    MAX_PLAN_CACHE_ENTRIES = 10000
+    
     def __init__(self, app, redis_client=None):
         """
         Initialize rate limit middleware
@@ -34,9 +79,16 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         self.redis_client = redis_client or get_redis_client()
         self.use_redis = self.redis_client is not None
         
+        # Script object sends EVALSHA (and loads the script only if Redis lost it)
+        self.token_bucket_script = self.redis_client.register_script(TOKEN_BUCKET_SCRIPT) if self.use_redis else None
+        
         # In-memory fallback for rate limiting
         self.memory_buckets: dict = {}
         
+        # user_id -> (plan, expires_at); keeps plan lookups off the database
+        self.plan_cache: Dict[int, Tuple[str, float]] = {}
+        self.plan_cache_ttl = config.RATE_LIMIT_PLAN_CACHE_TTL
+        
         # Rate limits per tier (requests per minute)
         # Can be overridden by RATE_LIMIT_RPM env var (applies to all tiers)
         base_rpm = config.RATE_LIMIT_RPM
@@ -134,58 +186,11 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             key = self._get_rate_limit_key(identifier)
             bucket_size = limit * self.bucket_size_multiplier
             
-            # Use Redis Lua script for atomic token bucket operations
-            lua_script = """
-            local key = KEYS[1]
-            local limit = tonumber(ARGV[1])
-            local bucket_size = tonumber(ARGV[2])
-            local refill_rate = tonumber(ARGV[3])
-            local now = tonumber(ARGV[4])
-            
-            local bucket = redis.call('HMGET', key, 'tokens', 'last_refill')
-            local tokens = tonumber(bucket[1]) or bucket_size
-            local last_refill = tonumber(bucket[2]) or now
-            
-            -- Refill tokens
-            local time_passed = now - last_refill
-            if time_passed >= refill_rate then
-                tokens = bucket_size
-                last_refill = now
-            else
-                local tokens_to_add = math.floor((time_passed / refill_rate) * limit)
-                tokens = math.min(tokens + tokens_to_add, bucket_size)
-                last_refill = now
-            end
-            
-            -- Consume token if available
-            local allowed = 0
-            if tokens > 0 then
-                tokens = tokens - 1
-                allowed = 1
-            end
-            
-            -- Update bucket
-            redis.call('HMSET', key, 'tokens', tokens, 'last_refill', last_refill)
-            redis.call('EXPIRE', key, refill_rate * 2)
-            
-            -- Calculate reset time
-            local reset_after = refill_rate - (now - last_refill)
-            if reset_after < 0 then
-                reset_after = 0
-            end
-            
-            return {allowed, tokens, reset_after}
-            """
-            
+            # One round trip: the bucket is read, refilled and updated inside the script
             current_time = int(time.time())
-            result = self.redis_client.eval(
-                lua_script,
-                1,
-                key,
-                limit,
-                bucket_size,
-                self.refill_rate,
-                current_time
+            result = self.token_bucket_script(
+                keys=[key],
+                args=[limit, bucket_size, self.refill_rate, current_time]
             )
             
             allowed = bool(result[0])
@@ -213,6 +218,72 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         
         return allowed, bucket['tokens'], int(reset_after)
     
+    def _get_token_identity(self, request: Request) -> Optional[Tuple[int, int]]:
+        """
+        Identify the caller from a validly signed access token (no database or revocation check)
+        
+        Returns:
+            Tuple of (user_id, issued_at), or None for anonymous or invalid tokens
+        """
+        authorization = request.headers.get("authorization", "")
+        if authorization[:7].lower() == "bearer ":
+            token = authorization[7:].strip()
+        else:
+            token = request.cookies.get("auth_token")
+        if not token:
+            return None
+        
+        from jose import JWTError, jwt
+        from ..auth import ALGORITHM, get_secret_key
+        try:
+            payload = jwt.decode(token, get_secret_key(), algorithms=[ALGORITHM])
+            return int(payload["sub"]), int(payload.get("iat") or 0)
+        except (JWTError, KeyError, ValueError, TypeError):
+            return None
+    
+    async def _get_user_plan(self, user_id: int, issued_at: Optional[int], user=None) -> str:
+        """
+        Get a user's plan from the plan cache, the auth principal cache, or one async query
+        
+        Args:
+            user_id: User ID
+            issued_at: Token iat (principal cache key), None if unknown
+            user: Principal already resolved for this request, if any
+        
+        Returns:
+            Plan name
+        """
+        now = time.monotonic()
+        cached = self.plan_cache.get(user_id)
+        if cached is not None and cached[1] > now:
+            return cached[0]
+        
+        principal = user if hasattr(user, 'plan') else None
+        if principal is None:
+            from ..services.principal_cache import get_principal_cache, load_principal
+            principal_cache = get_principal_cache()
+            if principal_cache and issued_at is not None:
+                principal = principal_cache.get(user_id, issued_at)
+            if principal is None:
+                # Cached for the auth dependency too, so the request still costs one query at most
+                from ..db.async_engine import AsyncSessionLocal
+                async with AsyncSessionLocal() as db:
+                    principal = await load_principal(db, user_id)
+                if principal is not None and principal_cache and issued_at is not None:
+                    principal_cache.set(principal, issued_at)
+        
+        if principal is None:
+            plan = 'free'
+        elif principal.is_admin:
+            plan = 'pro'  # Same as PlanPolicy.get_plan
+        else:
+            plan = principal.plan or 'free'
+        
+        if len(self.plan_cache) >= self.MAX_PLAN_CACHE_ENTRIES:
+            self.plan_cache.clear()
+        self.plan_cache[user_id] = (plan, now + self.plan_cache_ttl)
+        return plan
+    
     async def dispatch(self, request: Request, call_next):
         """
         Process request and apply rate limiting
@@ -238,30 +309,20 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             '/api/generate/stream'
         ]
         
-        # Try to get user from request state (set by auth middleware)
-        # Note: Auth middleware may not have run yet, so we check after response
-        user = None
-        identifier = None
+        # Identify the user from request state (if an earlier middleware set it) or the access token.
+        # Rate limiting runs before auth dependencies, so the token is only signature-checked here.
+        user = getattr(request.state, 'user', None)
+        identity = (user.id, None) if user else self._get_token_identity(request)
         
-        # Check if user is authenticated (from auth dependency)
-        # This is a best-effort check - rate limiting happens before auth in middleware order
-        if hasattr(request.state, 'user') and request.state.user:
-            user = request.state.user
-            identifier = f"user:{user.id}"
+        if identity:
+            user_id, issued_at = identity
+            identifier = f"user:{user_id}"
             
             # Get user's tier/plan for rate limit (unless generation endpoint)
             if not is_generation_endpoint:
                 try:
-                    from ..database import get_db
-                    from ..services.plan_policy import PlanPolicy
-                    db_gen = get_db()
-                    db = next(db_gen)
-                    try:
-                        policy = PlanPolicy(db, user)
-                        plan = policy.get_plan()
-                        limit = self.tier_limits.get(plan, self.tier_limits['free'])
-                    finally:
-                        db.close()
+                    plan = await self._get_user_plan(user_id, issued_at, user)
+                    limit = self.tier_limits.get(plan, self.tier_limits['free'])
                 except Exception as e:
                     logger.debug(f"Failed to get user plan for rate limiting: {e}, using free tier limit")
                     limit = self.tier_limits['free']
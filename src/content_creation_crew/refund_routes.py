@@ -9,7 +9,8 @@ from decimal import Decimal
 import logging
 
 from .database import User, get_db, Organization
-from .auth import get_current_user
+from .auth import get_current_principal, get_current_user
+from .services.principal_cache import AuthPrincipal
 from .services.refund_service import RefundService, get_refund_service
 from .db.models.dunning import Refund
 
@@ -122,7 +123,7 @@ async def list_refunds(
     status_filter: Optional[str] = None,
     limit: int = 50,
     offset: int = 0,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """
@@ -163,7 +164,7 @@ async def list_refunds(
 @router.get("/{refund_id}", response_model=RefundResponse)
 async def get_refund(
     refund_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: AuthPrincipal = Depends(get_current_principal),
     db: Session = Depends(get_db)
 ):
     """Get refund details by ID"""
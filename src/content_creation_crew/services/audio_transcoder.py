@@ -0,0 +1,167 @@
+"""
+Audio Transcoder - Browser renditions of synthesized voiceovers
+
+Encodes a voiceover WAV to MP3 (and optionally Opus/AAC) in a single ffmpeg run
+that reads the PCM straight from the file, instead of decoding it into memory
+with pydub once per output. At most AUDIO_TRANSCODE_WORKERS encoder processes
+run at a time, so a burst of voiceovers cannot saturate the API host's CPU.
+"""
+import asyncio
+import logging
+import os
+import shutil
+import subprocess
+import threading
+import time
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Concurrent ffmpeg encoder processes
+AUDIO_TRANSCODE_WORKERS = int(os.getenv("AUDIO_TRANSCODE_WORKERS", "2"))
+# Renditions encoded for WAV voiceovers, comma separated ("mp3", "opus", "aac")
+AUDIO_RENDITIONS = [name.strip().lower() for name in os.getenv("AUDIO_RENDITIONS", "mp3").split(",") if name.strip()]
+# Seconds before an encoder run is abandoned
+AUDIO_TRANSCODE_TIMEOUT = int(os.getenv("AUDIO_TRANSCODE_TIMEOUT", "300"))
+
+# Encoder settings per rendition (speech-oriented bitrates)
+RENDITIONS = {
+    "mp3": {
+        "extension": ".mp3",
+        "content_type": "audio/mpeg",
+        "codec_args": ["-c:a", "libmp3lame", "-b:a", "128k"]
+    },
+    "opus": {
+        "extension": ".opus",
+        "content_type": "audio/ogg",
+        "codec_args": ["-c:a", "libopus", "-b:a", "48k"]
+    },
+    "aac": {
+        "extension": ".m4a",
+        "content_type": "audio/mp4",
+        "codec_args": ["-c:a", "aac", "-b:a", "96k", "-movflags", "+faststart"]
+    },
+}
+
+
+class TranscoderUnavailable(RuntimeError):
+    """ffmpeg is not installed"""
+    pass
+
+
+def build_transcode_command(wav_path: str, outputs: Dict[str, str]) -> List[str]:
+    """
+    ffmpeg command encoding one input to every requested rendition
+    
+    Args:
+        wav_path: Source WAV file
+        outputs: Rendition name -> output path
+    
+    Returns:
+        Command argument list
+    """
+    cmd = ["ffmpeg", "-y", "-hide_banner", "-loglevel", "error", "-i", wav_path]
+    for name, output_path in outputs.items():
+        cmd += ["-map", "0:a", *RENDITIONS[name]["codec_args"], output_path]
+    return cmd
+
+
+def transcode_wav(wav_path: str, renditions: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Encode a WAV file to browser renditions next to it
+    
+    Args:
+        wav_path: Source WAV file
+        renditions: Rendition names (default AUDIO_RENDITIONS)
+    
+    Returns:
+        Rendition name -> output path
+    
+    Raises:
+        TranscoderUnavailable: If ffmpeg is not installed
+        RuntimeError: If ffmpeg fails
+    """
+    renditions = [name for name in (renditions or AUDIO_RENDITIONS) if name in RENDITIONS]
+    if not renditions:
+        return {}
+    if shutil.which("ffmpeg") is None:
+        raise TranscoderUnavailable("ffmpeg not found on PATH")
+    
+    base_path = os.path.splitext(wav_path)[0]
+    outputs = {name: base_path + RENDITIONS[name]["extension"] for name in renditions}
+    
+    try:
+        result = subprocess.run(
+            build_transcode_command(wav_path, outputs),
+            capture_output=True,
+            timeout=AUDIO_TRANSCODE_TIMEOUT
+        )
+    except subprocess.TimeoutExpired:
+        _remove_outputs(outputs)
+        raise RuntimeError(f"ffmpeg transcode timed out after {AUDIO_TRANSCODE_TIMEOUT}s")
+    if result.returncode != 0:
+        _remove_outputs(outputs)
+        raise RuntimeError(f"ffmpeg transcode failed: {result.stderr.decode(errors='replace')[-2000:]}")
+    return outputs
+
+
+def _remove_outputs(outputs: Dict[str, str]):
+    """Delete partial encoder output"""
+    for output_path in outputs.values():
+        try:
+            os.unlink(output_path)
+        except OSError:
+            pass
+
+
+# Global transcode executor
+_transcode_executor = None
+_transcode_executor_lock = threading.Lock()
+
+
+def get_transcode_executor():
+    """Get global transcode pool; each thread waits on one ffmpeg encoder process"""
+    global _transcode_executor
+    if _transcode_executor is None:
+        with _transcode_executor_lock:
+            if _transcode_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _transcode_executor = ThreadPoolExecutor(
+                    max_workers=max(1, AUDIO_TRANSCODE_WORKERS),
+                    thread_name_prefix="audio-transcode"
+                )
+    return _transcode_executor
+
+
+def shutdown_transcode_executor():
+    """Stop the global transcode pool (called on application shutdown)"""
+    global _transcode_executor
+    with _transcode_executor_lock:
+        if _transcode_executor is not None:
+            _transcode_executor.shutdown(wait=False, cancel_futures=True)
+            _transcode_executor = None
+
+
+async def transcode_voiceover(wav_path: str, provider: str, renditions: Optional[List[str]] = None) -> Dict[str, str]:
+    """
+    Encode a voiceover's renditions on the transcode pool and record its duration
+    
+    Args:
+        wav_path: Synthesized WAV file
+        provider: TTS provider (metrics label)
+        renditions: Rendition names (default AUDIO_RENDITIONS)
+    
+    Returns:
+        Rendition name -> output path
+    """
+    from .metrics import TTSMetrics
+    
+    loop = asyncio.get_running_loop()
+    start_time = time.time()
+    success = False
+    try:
+        outputs = await loop.run_in_executor(get_transcode_executor(), transcode_wav, wav_path, renditions)
+        success = True
+        return outputs
+    finally:
+        TTSMetrics.record_transcode(provider, time.time() - start_time, success=success)
@@ -65,6 +65,15 @@ class CacheInvalidationService:
             if self.user_cache is None:
                 self._init_caches()
             
+            # Drop cached auth principals too (role, active flag and plan may have changed)
+            try:
+                from .principal_cache import get_principal_cache
+                principal_cache = get_principal_cache()
+                if principal_cache:
+                    principal_cache.invalidate(user_id)
+            except Exception as e:
+                logger.warning(f"Failed to invalidate auth principal for user_id={user_id}: {e}")
+            
             if self.user_cache:
                 self.user_cache.invalidate(user_id)
                 logger.info(f"Invalidated user cache for user_id={user_id}, reason={reason}")
@@ -154,21 +163,23 @@ class CacheInvalidationService:
             # since their subscription/tier info is cached
             try:
                 from ..db.engine import SessionLocal
-                from ..db.models.organization import OrganizationMember
+                from ..db.models.organization import Membership
                 
                 db = SessionLocal()
                 try:
-                    members = db.query(OrganizationMember).filter(
-                        OrganizationMember.organization_id == org_id
-                    ).all()
+                    member_ids = [
+                        user_id for (user_id,) in db.query(Membership.user_id).filter(
+                            Membership.org_id == org_id
+                        ).all()
+                    ]
                     
-                    for member in members:
+                    for user_id in member_ids:
                         self.invalidate_user(
-                            member.user_id,
+                            user_id,
                             reason=f"org_plan_change_{reason}"
                         )
                     
-                    logger.info(f"Invalidated {len(members)} user caches for org_id={org_id}")
+                    logger.info(f"Invalidated {len(member_ids)} user caches for org_id={org_id}")
                 
                 finally:
                     db.close()
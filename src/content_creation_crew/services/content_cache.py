@@ -1,26 +1,56 @@
 """
 Content caching service for faster content generation
+
+The in-memory cache is bounded by a byte budget with LRU eviction, and expired
+entries are swept periodically. Concurrent misses on the same key are coalesced
+(single-flight): the first job claims the fill and the others wait for its result
+instead of each paying for a CrewAI run.
 """
+import asyncio
 import hashlib
 import json
+import logging
+import threading
 import time
-from typing import Optional, Dict
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from typing import Optional, Dict, Tuple
+from datetime import datetime
+
+from .metrics import ContentCacheMetrics
+
+logger = logging.getLogger(__name__)
 
 
 class ContentCache:
-    """In-memory cache for generated content"""
+    """In-memory LRU cache for generated content"""
+    
+    # How often expired entries are swept (also run by the background scheduler)
+    SWEEP_INTERVAL_SECONDS = 60
+    
+    # How often waiters check whether a coalesced fill has finished
+    FILL_POLL_INTERVAL_SECONDS = 0.25
     
-    def __init__(self, default_ttl: int = 3600):
+    def __init__(self, default_ttl: int = 3600, max_bytes: Optional[int] = None, fill_timeout: Optional[int] = None):
         """
         Initialize content cache
         
         Args:
             default_ttl: Default time-to-live in seconds (default: 1 hour)
+            max_bytes: Budget for serialized entry bytes (default: CONTENT_CACHE_MAX_BYTES)
+            fill_timeout: Seconds before an unfinished fill claim expires (default: CREWAI_TIMEOUT + 60)
         """
-        self.cache: Dict[str, Dict] = {}
+        from ..config import config
+        
+        # Entries in least-recently-used order (oldest first)
+        self.cache: "OrderedDict[str, Dict]" = OrderedDict()
         self.default_ttl = default_ttl
-        self.access_count: Dict[str, int] = {}  # Track access frequency for cache warming
+        self.max_bytes = max_bytes if max_bytes is not None else config.CONTENT_CACHE_MAX_BYTES
+        self.fill_timeout = fill_timeout if fill_timeout is not None else config.CREWAI_TIMEOUT + 60
+        self._bytes = 0
+        self._next_sweep = 0.0
+        self._lock = threading.Lock()
+        # key -> (event set when the fill finishes, claim expiry)
+        self._fills: Dict[str, Tuple[threading.Event, float]] = {}
     
     def get_cache_key(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None, moderation_version: str = None) -> str:
         """
@@ -32,7 +62,7 @@ class ContentCache:
             prompt_version: Prompt version (e.g., "1.0.0")
             model: LLM model name (e.g., "ollama/llama3.2:1b")
             moderation_version: Moderation rules version (NEW - M6)
-            
+        
         Returns:
             MD5 hash of normalized topic, content types, prompt version, model, and moderation version
         """
@@ -66,7 +96,7 @@ class ContentCache:
         Args:
             topic: Content topic
             content_types: List of content types requested
-            
+        
         Returns:
             Cached content dict with 'content', 'social_media_content', etc.
             or None if not found or expired
@@ -79,17 +109,19 @@ class ContentCache:
         
         key = self.get_cache_key(topic, content_types, prompt_version, model)
         
-        if key not in self.cache:
-            if increment_counter:
-                increment_counter("cache_misses_total")
-            return None
-        
-        cached_item = self.cache[key]
+        with self._lock:
+            cached_item = self.cache.get(key)
+            if cached_item is not None and time.time() > cached_item['expires_at']:
+                # Remove expired entry
+                self._remove(key)
+                cached_item = None
+            
+            if cached_item is not None:
+                self.cache.move_to_end(key)
+                # OPTIMIZATION: Track access frequency for cache warming (dropped with the entry)
+                cached_item['hits'] += 1
         
-        # Check if expired
-        if time.time() > cached_item['expires_at']:
-            # Remove expired entry
-            del self.cache[key]
+        if cached_item is None:
             if increment_counter:
                 increment_counter("cache_misses_total")
             return None
@@ -98,9 +130,6 @@ class ContentCache:
         if increment_counter:
             increment_counter("cache_hits_total")
         
-        # OPTIMIZATION: Track access frequency for cache warming
-        self.access_count[key] = self.access_count.get(key, 0) + 1
-        
         # Return cached content (without expiration metadata)
         return {
             'content': cached_item.get('content', ''),
@@ -112,7 +141,7 @@ class ContentCache:
             'cached': True
         }
     
-    def set(self, topic: str, content_data: Dict, ttl: int = None, prompt_version: str = None, model: str = None):
+    def set(self, topic: str, content_data: Dict, ttl: int = None, prompt_version: str = None, model: str = None, content_types: list = None):
         """
         Cache content for topic
         
@@ -120,35 +149,130 @@ class ContentCache:
             topic: Content topic
             content_data: Dict with 'content', 'social_media_content', etc.
             ttl: Time-to-live in seconds (uses default if None)
+            content_types: Content types the entry answers (derived from content_data if None)
         """
         # Determine content types from content_data
-        content_types = []
-        if content_data.get('social_media_content'):
-            content_types.append('social')
-        if content_data.get('audio_content'):
-            content_types.append('audio')
-        if content_data.get('video_content'):
-            content_types.append('video')
         if not content_types:
-            content_types = ['blog']
+            content_types = get_content_types(content_data)
         
         key = self.get_cache_key(topic, content_types, prompt_version, model)
         
         # Calculate expiration time
         ttl = ttl or self.default_ttl
-        expires_at = time.time() + ttl
+        now = time.time()
         
-        # Store in cache
-        self.cache[key] = {
+        entry = {
             'content': content_data.get('content', ''),
             'social_media_content': content_data.get('social_media_content', ''),
             'audio_content': content_data.get('audio_content', ''),
             'video_content': content_data.get('video_content', ''),
             'topic': topic,
             'generated_at': content_data.get('generated_at', datetime.now().isoformat()),
-            'expires_at': expires_at,
-            'ttl': ttl
+            'expires_at': now + ttl,
+            'ttl': ttl,
+            'hits': 0
         }
+        size = len(json.dumps(entry, default=str))
+        if size > self.max_bytes:
+            logger.warning(f"Content for topic '{topic}' ({size} bytes) exceeds cache budget ({self.max_bytes} bytes), not caching")
+            return
+        entry['size'] = size
+        
+        with self._lock:
+            self._remove(key)
+            self.cache[key] = entry
+            self._bytes += size
+            self._enforce_limits(now)
+            occupancy = (len(self.cache), self._bytes)
+        
+        ContentCacheMetrics.record_occupancy(*occupancy)
+        index_similar_topic(self, topic, content_types, prompt_version, model)
+    
+    def get_similar(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> Optional[Dict]:
+        """
+        Get cached content for a near-duplicate topic (see services/topic_index.py)
+        
+        Returns:
+            Cached content dict with 'similar_topic' and 'similarity', or None
+        """
+        return get_similar_cached(self, topic, content_types, prompt_version, model)
+    
+    def _remove(self, key: str) -> Optional[Dict]:
+        """Remove an entry and its bytes (caller holds the lock)"""
+        entry = self.cache.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry['size']
+        return entry
+    
+    def _enforce_limits(self, now: float):
+        """Sweep expired entries when due, then evict LRU entries over budget (caller holds the lock)"""
+        if now >= self._next_sweep:
+            self._sweep(now)
+        
+        evicted = 0
+        while self._bytes > self.max_bytes and self.cache:
+            self._remove(next(iter(self.cache)))
+            evicted += 1
+        if evicted:
+            ContentCacheMetrics.record_eviction('lru', evicted)
+    
+    def _sweep(self, now: float) -> int:
+        """Remove expired entries and stale fill claims (caller holds the lock)"""
+        self._next_sweep = now + self.SWEEP_INTERVAL_SECONDS
+        expired_keys = [key for key, value in self.cache.items() if now > value['expires_at']]
+        for key in expired_keys:
+            self._remove(key)
+        for key in [k for k, (_, expires_at) in self._fills.items() if now > expires_at]:
+            self._fills.pop(key)[0].set()
+        if expired_keys:
+            ContentCacheMetrics.record_eviction('ttl', len(expired_keys))
+        return len(expired_keys)
+    
+    def begin_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> bool:
+        """
+        Claim the fill for a missed key (single-flight)
+        
+        Returns:
+            True if the caller should generate the content and call end_fill(),
+            False if another job is already generating it (use wait_for_fill())
+        """
+        key = self.get_cache_key(topic, content_types, prompt_version, model)
+        now = time.time()
+        with self._lock:
+            claim = self._fills.get(key)
+            if claim is not None and now <= claim[1]:
+                return False
+            if claim is not None:
+                # Stale claim from a job that never finished - release its waiters and take over
+                claim[0].set()
+            self._fills[key] = (threading.Event(), now + self.fill_timeout)
+            return True
+    
+    def end_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None):
+        """Release a fill claimed with begin_fill(), waking any waiters"""
+        key = self.get_cache_key(topic, content_types, prompt_version, model)
+        with self._lock:
+            claim = self._fills.pop(key, None)
+        if claim is not None:
+            claim[0].set()
+    
+    async def wait_for_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None, timeout: float = None) -> Optional[Dict]:
+        """
+        Wait for another job's fill to finish and return its cached content
+        
+        Returns:
+            Cached content, or None if the fill failed or did not finish within timeout
+        """
+        key = self.get_cache_key(topic, content_types, prompt_version, model)
+        with self._lock:
+            claim = self._fills.get(key)
+        
+        if claim is not None:
+            deadline = time.time() + (timeout if timeout is not None else self.fill_timeout)
+            while not claim[0].is_set() and time.time() < deadline:
+                await asyncio.sleep(self.FILL_POLL_INTERVAL_SECONDS)
+        
+        return self.get(topic, content_types, prompt_version, model)
     
     def clear(self, topic: str = None, content_types: list = None, prompt_version: str = None, model: str = None):
         """
@@ -158,30 +282,41 @@ class ContentCache:
             topic: Topic to clear (clears all if None)
             content_types: Content types to clear (clears all if None)
         """
-        if topic is None:
-            self.cache.clear()
-        else:
-            key = self.get_cache_key(topic, content_types, prompt_version, model)
-            if key in self.cache:
-                del self.cache[key]
-    
-    def cleanup_expired(self):
-        """Remove all expired entries from cache"""
-        current_time = time.time()
-        expired_keys = [
-            key for key, value in self.cache.items()
-            if current_time > value['expires_at']
-        ]
-        for key in expired_keys:
-            del self.cache[key]
+        with self._lock:
+            if topic is None:
+                self.cache.clear()
+                self._bytes = 0
+            else:
+                self._remove(self.get_cache_key(topic, content_types, prompt_version, model))
+            occupancy = (len(self.cache), self._bytes)
+        
+        ContentCacheMetrics.record_occupancy(*occupancy)
+    
+    def cleanup_expired(self) -> int:
+        """
+        Remove all expired entries from cache
+        
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            removed = self._sweep(time.time())
+            occupancy = (len(self.cache), self._bytes)
+        
+        ContentCacheMetrics.record_occupancy(*occupancy)
+        return removed
     
     def get_stats(self) -> Dict:
         """Get cache statistics"""
         self.cleanup_expired()
-        return {
-            'total_entries': len(self.cache),
-            'default_ttl': self.default_ttl
-        }
+        with self._lock:
+            return {
+                'total_entries': len(self.cache),
+                'default_ttl': self.default_ttl,
+                'bytes': self._bytes,
+                'max_bytes': self.max_bytes,
+                'fills_in_progress': len(self._fills)
+            }
     
     def get_popular_topics(self, limit: int = 10) -> list:
         """
@@ -189,19 +324,78 @@ class ContentCache:
         
         Args:
             limit: Maximum number of popular topics to return
-            
+        
         Returns:
             List of cache keys sorted by access frequency
         """
-        # Sort by access count (descending) and return top N keys
-        sorted_keys = sorted(
-            self.access_count.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )[:limit]
+        # Sort live entries by access count (descending) and return top N keys
+        with self._lock:
+            accessed = [(key, entry['hits']) for key, entry in self.cache.items() if entry['hits']]
+        sorted_keys = sorted(accessed, key=lambda x: x[1], reverse=True)[:limit]
         return [key for key, _ in sorted_keys]
 
 
+def get_content_types(content_data: Dict) -> list:
+    """Derive the content types a cache entry answers from its non-empty content fields"""
+    content_types = []
+    if content_data.get('social_media_content'):
+        content_types.append('social')
+    if content_data.get('audio_content'):
+        content_types.append('audio')
+    if content_data.get('video_content'):
+        content_types.append('video')
+    return content_types or ['blog']
+
+
+def _get_topic_scope(cache, content_types: list = None, prompt_version: str = None, model: str = None) -> str:
+    """Scope near-duplicate matches to the same content types, prompt version, model and moderation version"""
+    return cache.get_cache_key("", content_types, prompt_version, model)
+
+
+def index_similar_topic(cache, topic: str, content_types: list = None, prompt_version: str = None, model: str = None):
+    """Add a cached topic to the near-duplicate index (no-op unless CONTENT_CACHE_SIMILAR_TOPICS)"""
+    from ..config import config
+    if not config.CONTENT_CACHE_SIMILAR_TOPICS:
+        return
+    from .topic_index import get_topic_index
+    get_topic_index().add(_get_topic_scope(cache, content_types, prompt_version, model), topic)
+
+
+def get_similar_cached(cache, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> Optional[Dict]:
+    """
+    Look up cached content for a near-duplicate topic in any cache backend
+    
+    The index resolves the topic to a previously cached topic, which is then read
+    with the backend's exact get(). The index is per process (see topic_index.py),
+    so only topics cached by this process can match. Returns None when the feature
+    is disabled.
+    """
+    from ..config import config
+    if not config.CONTENT_CACHE_SIMILAR_TOPICS:
+        return None
+    from .topic_index import get_topic_index
+    
+    index = get_topic_index()
+    scope = _get_topic_scope(cache, content_types, prompt_version, model)
+    similar_topic, similarity, rejected = index.find_similar(scope, topic)
+    
+    cached_content = None
+    if similar_topic is not None:
+        cached_content = cache.get(similar_topic, content_types, prompt_version, model)
+        if cached_content is None:
+            # Entry expired or was evicted since it was indexed
+            index.remove(scope, similar_topic)
+    
+    ContentCacheMetrics.record_similar_lookup(cached_content is not None, similarity, rejected)
+    if cached_content is None:
+        return None
+    
+    logger.info(f"Near-duplicate cache hit: '{topic}' matched cached topic '{similar_topic}' (similarity {similarity:.2f})")
+    cached_content['similar_topic'] = similar_topic
+    cached_content['similarity'] = similarity
+    return cached_content
+
+
 # Global cache instance
 _cache_instance: Optional[ContentCache] = None
 
@@ -223,9 +417,6 @@ def get_cache() -> ContentCache:
             else:
                 _cache_instance = ContentCache()
         except Exception as e:
-            import logging
-            logger = logging.getLogger(__name__)
             logger.warning(f"Failed to initialize Redis cache: {e}, using in-memory cache")
             _cache_instance = ContentCache()
     return _cache_instance
-
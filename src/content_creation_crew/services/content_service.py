@@ -3,7 +3,9 @@ Content Service - Manages ContentJob and ContentArtifact persistence
 """
 import logging
 import hashlib
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload, selectinload
 from datetime import datetime
 from typing import Optional, List, Dict
 from fastapi import HTTPException, status
@@ -18,6 +20,7 @@ from ..database import (
     MembershipRole,
 )
 from .plan_policy import PlanPolicy
+from .sse_store import get_sse_store
 
 logger = logging.getLogger(__name__)
 
@@ -188,6 +191,7 @@ class ContentService:
                 detail="Job not found"
             )
         
+        previous_status = job.status
         job.status = status
         if started_at:
             job.started_at = started_at
@@ -196,6 +200,17 @@ class ContentService:
         
         self.db.commit()
         self.db.refresh(job)
+        
+        # Push the transition to SSE streams (they no longer poll the database for it)
+        if previous_status != status:
+            try:
+                get_sse_store().add_event(job_id, 'status_update', {
+                    'type': 'status_update',
+                    'job_id': job_id,
+                    'status': status
+                })
+            except Exception as e:
+                logger.warning(f"Failed to publish status update for job {job_id}: {e}")
         return job
     
     def create_artifact(
@@ -265,3 +280,112 @@ class ContentService:
         logger.info(f"Created artifact {artifact.id} for job {job_id}, type: {artifact_type}")
         return artifact
 
+
+
+class AsyncContentService:
+    """
+    Async subset of ContentService (job reads and status writes) for handlers on the event loop
+    
+    Scoped to a user ID rather than a User so background jobs do not need to load the user.
+    """
+    
+    def __init__(self, db: AsyncSession, user_id: int):
+        """
+        Initialize AsyncContentService
+        
+        Args:
+            db: Async database session
+            user_id: ID of the user whose jobs are accessed
+        """
+        self.db = db
+        self.user_id = user_id
+    
+    async def get_job(self, job_id: int, load_artifacts: bool = False) -> Optional[ContentJob]:
+        """
+        Get job by ID (only if user has access)
+        
+        Args:
+            job_id: Job ID
+            load_artifacts: If True, load artifacts with the job (lazy loading is not available on async sessions)
+        """
+        query = select(ContentJob).where(
+            ContentJob.id == job_id,
+            ContentJob.user_id == self.user_id
+        )
+        if load_artifacts:
+            query = query.options(selectinload(ContentJob.artifacts))
+        
+        result = await self.db.execute(query)
+        return result.scalars().first()
+    
+    async def list_jobs(
+        self,
+        status: Optional[str] = None,
+        limit: int = 50,
+        offset: int = 0,
+        load_artifacts: bool = False
+    ) -> List[ContentJob]:
+        """List user's jobs with optional filtering (artifacts for the whole page in one extra query)"""
+        query = select(ContentJob).where(ContentJob.user_id == self.user_id)
+        if status:
+            query = query.where(ContentJob.status == status)
+        query = query.order_by(ContentJob.created_at.desc()).offset(offset).limit(limit)
+        if load_artifacts:
+            query = query.options(selectinload(ContentJob.artifacts))
+        
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+    
+    async def count_jobs(self) -> int:
+        """Count all of the user's jobs"""
+        result = await self.db.execute(
+            select(func.count()).select_from(ContentJob).where(ContentJob.user_id == self.user_id)
+        )
+        return result.scalar_one()
+    
+    async def update_job_status(
+        self,
+        job_id: int,
+        status: str,
+        started_at: Optional[datetime] = None,
+        finished_at: Optional[datetime] = None
+    ) -> bool:
+        """
+        Move a job to a new status in a single UPDATE and commit
+        
+        Jobs already in the target status are left untouched (timestamps included).
+        
+        Returns:
+            True if the job's status changed
+        """
+        values = {"status": status}
+        if started_at:
+            values["started_at"] = started_at
+        if finished_at:
+            values["finished_at"] = finished_at
+        
+        result = await self.db.execute(
+            update(ContentJob)
+            .where(
+                ContentJob.id == job_id,
+                ContentJob.user_id == self.user_id,
+                ContentJob.status != status
+            )
+            .values(**values)
+            .returning(ContentJob.id)
+        )
+        changed = result.first() is not None
+        await self.db.commit()
+        if not changed:
+            return False
+        
+        # Push the transition to SSE streams (they no longer poll the database for it)
+        try:
+            get_sse_store().add_event(job_id, 'status_update', {
+                'type': 'status_update',
+                'job_id': job_id,
+                'status': status
+            })
+        except Exception as e:
+            logger.warning(f"Failed to publish status update for job {job_id}: {e}")
+        return True
@@ -0,0 +1,96 @@
+"""
+Crew Pool - Reusable crew templates for content generation
+Building a ContentCreationCrew loads the agent/task YAML, creates agents and
+tasks and wires the LLM. The result only depends on (tier, content types, model),
+so one template is built per key and each job gets a Crew.copy() of it: fresh
+agents and tasks (safe to mutate and run concurrently) with shallow-copied LLMs.
+"""
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Optional, Tuple
+
+from .metrics import increment_counter
+
+logger = logging.getLogger(__name__)
+
+
+class CrewPool:
+    """LRU cache of built crew templates keyed by (tier, content types, model)"""
+
+    def __init__(self, max_templates: int = 32):
+        """
+        Initialize crew pool
+
+        Args:
+            max_templates: Maximum cached crew templates
+        """
+        self.max_templates = max_templates
+        self._templates: "OrderedDict[tuple, object]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _get_key(tier: str, content_types: List[str], model: str) -> tuple:
+        """Generate template key"""
+        return (tier, tuple(content_types or ()), model)
+
+    def get_crew(self, tier: str, content_types: Optional[List[str]]) -> Tuple[object, bool]:
+        """
+        Get a per-job crew for a tier and content types
+
+        Args:
+            tier: Subscription tier
+            content_types: Requested content types (None/empty uses tier defaults)
+
+        Returns:
+            Tuple of (Crew ready for kickoff, True if served from a cached template)
+        """
+        from ..crew import get_model_for_tier
+
+        key = self._get_key(tier, content_types, get_model_for_tier(tier))
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+
+        hit = template is not None
+        if not hit:
+            template = self._build_template(tier, content_types)
+            with self._lock:
+                # Another thread may have built the same template meanwhile - keep the first one
+                template = self._templates.setdefault(key, template)
+                self._templates.move_to_end(key)
+                while len(self._templates) > self.max_templates:
+                    self._templates.popitem(last=False)
+            logger.info(f"[CREW_POOL] Built crew template for tier='{tier}', content_types={content_types}, model='{key[2]}'")
+
+        increment_counter("crew_pool_requests_total", labels={"result": "hit" if hit else "miss"})
+        return template.copy(), hit
+
+    def _build_template(self, tier: str, content_types: Optional[List[str]]):
+        """Build a crew template (raises on LLM/configuration errors)"""
+        from ..crew import ContentCreationCrew
+
+        crew_instance = ContentCreationCrew(tier=tier, content_types=content_types)
+        return crew_instance._build_crew(content_types=content_types or None)
+
+    def clear(self):
+        """Drop all cached templates (e.g. after configuration changes)"""
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._templates)
+
+
+# Global crew pool instance
+_crew_pool_instance: Optional[CrewPool] = None
+
+
+def get_crew_pool() -> CrewPool:
+    """Get global crew pool instance"""
+    global _crew_pool_instance
+    if _crew_pool_instance is None:
+        _crew_pool_instance = CrewPool()
+    return _crew_pool_instance
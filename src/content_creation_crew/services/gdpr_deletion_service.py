@@ -236,6 +236,13 @@ class GDPRDeletionService:
         for session in sessions:
             self.db.delete(session)
         
+        # Access tokens already issued stay valid until expiry unless revoked
+        try:
+            from .token_blacklist import get_token_blacklist
+            get_token_blacklist().revoke_all_user_tokens(user_id)
+        except Exception as e:
+            logger.warning(f"Failed to revoke access tokens for user {user_id}: {e}")
+        
         logger.debug(f"Purged {count} sessions for user {user_id}")
         return count
     
@@ -278,32 +285,65 @@ class GDPRDeletionService:
         files_deleted = 0
         files_failed = 0
         
+        # Delete storage files in one batch (S3 deletes up to 1000 keys per request)
+        storage_keys = []
         for artifact in artifacts:
-            # Delete storage file if it exists
-            if artifact.content_json and artifact.content_json.get('storage_key'):
-                try:
-                    storage_key = artifact.content_json['storage_key']
-                    if storage.delete(storage_key):
-                        files_deleted += 1
-                        logger.debug(f"Deleted storage file: {storage_key}")
-                    else:
-                        files_failed += 1
-                        logger.warning(f"Storage file not found: {storage_key}")
-                except Exception as e:
+            for storage_key in self._artifact_storage_keys(artifact):
+                if storage_key not in storage_keys:
+                    storage_keys.append(storage_key)
+        if storage_keys:
+            try:
+                results = storage.delete_many(storage_keys)
+            except Exception as e:
+                logger.warning(f"Failed to delete storage files: {e}")
+                results = {}
+            for storage_key in storage_keys:
+                if results.get(storage_key):
+                    files_deleted += 1
+                    logger.debug(f"Deleted storage file: {storage_key}")
+                else:
                     files_failed += 1
-                    logger.warning(f"Failed to delete storage file: {e}")
-            
+                    logger.warning(f"Storage file not deleted: {storage_key}")
+        
+        # TTS cache entries synthesized from the user's scripts (shared cache, not artifact copies)
+        tts_cache_keys = [
+            artifact.content_json['tts_cache_key']
+            for artifact in artifacts
+            if artifact.content_json and artifact.content_json.get('tts_cache_key')
+        ]
+        tts_cache_entries_erased = 0
+        if tts_cache_keys:
+            from .tts_cache import TTSOutputCache, get_tts_cache
+            try:
+                # Erase even when the cache has since been disabled
+                tts_cache = get_tts_cache() or TTSOutputCache()
+                tts_cache_entries_erased = tts_cache.erase(tts_cache_keys, storage)
+            except Exception as e:
+                logger.warning(f"Failed to erase TTS cache entries: {e}")
+        
+        for artifact in artifacts:
             # Delete artifact record
             self.db.delete(artifact)
         
-        logger.info(f"Deleted {len(artifacts)} artifacts and {files_deleted} storage files for user {self.user.id} ({files_failed} failed)")
+        logger.info(f"Deleted {len(artifacts)} artifacts and {files_deleted} storage files for user {self.user.id} ({files_failed} failed, {tts_cache_entries_erased} TTS cache entries erased)")
         
         return {
             "artifacts_deleted": len(artifacts),
             "files_deleted": files_deleted,
-            "files_failed": files_failed
+            "files_failed": files_failed,
+            "tts_cache_entries_erased": tts_cache_entries_erased
         }
     
+    @staticmethod
+    def _artifact_storage_keys(artifact: ContentArtifact) -> List[str]:
+        """Storage keys of an artifact's files (voiceovers also record MP3/Opus/AAC renditions)"""
+        content_json = artifact.content_json or {}
+        keys = [content_json.get('storage_key'), content_json.get('mp3_storage_key')]
+        for rendition in (content_json.get('renditions') or {}).values():
+            if isinstance(rendition, dict):
+                keys.append(rendition.get('storage_key'))
+        return [key for key in keys if key]
+    
     def _delete_content_jobs(self):
         """Delete content generation jobs"""
         jobs = self.db.query(ContentJob).filter(
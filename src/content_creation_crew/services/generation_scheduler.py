@@ -0,0 +1,215 @@
+"""
+Generation Scheduler - Tier-aware admission control for content generation jobs
+Sits in front of run_generation_async: jobs wait here (still PENDING) until a
+slot is free, then run. Admission honors the tier settings in config/tiers.yaml:
+
+- priority_processing tiers are admitted before standard tiers
+- at most max_parallel_tasks jobs run concurrently per organization
+- at most GENERATION_MAX_CONCURRENT_JOBS jobs run concurrently per process
+
+Standard-tier jobs that have waited longer than GENERATION_SCHEDULER_AGING_SECONDS
+are promoted so a steady stream of priority jobs cannot starve them.
+
+The scheduler is per process and per event loop (API process or queue worker).
+All state is touched only from the event loop, so no locking is needed. The
+per-organization cap is therefore per process: an organization can run up to
+max_parallel_tasks jobs in each API process or worker. In queue mode the tier
+order across the fleet comes from JobQueue.claim.
+"""
+import asyncio
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from ..config import config
+from .metrics import SchedulerMetrics
+from .subscription_service import SubscriptionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _Waiter:
+    """A job waiting for a generation slot"""
+    job_id: int
+    org_key: str
+    plan: str
+    priority: bool
+    org_limit: int
+    seq: int
+    enqueued_at: float = field(default_factory=time.monotonic)
+    future: Optional[asyncio.Future] = None
+
+
+class GenerationScheduler:
+    """
+    Priority scheduler for generation jobs
+
+    Usage:
+        async with get_generation_scheduler().slot(job_id, plan, org_id=org_id):
+            await run_generation_async(...)
+    """
+
+    def __init__(self, max_concurrent_jobs: Optional[int] = None, aging_seconds: Optional[float] = None):
+        """
+        Initialize generation scheduler
+
+        Args:
+            max_concurrent_jobs: Process-wide in-flight job bound (default: GENERATION_MAX_CONCURRENT_JOBS)
+            aging_seconds: Wait after which a standard job is promoted (default: GENERATION_SCHEDULER_AGING_SECONDS)
+        """
+        self.max_concurrent_jobs = max(1, max_concurrent_jobs or config.GENERATION_MAX_CONCURRENT_JOBS)
+        self.aging_seconds = aging_seconds if aging_seconds is not None else config.GENERATION_SCHEDULER_AGING_SECONDS
+
+        self._waiters: List[_Waiter] = []
+        self._running_total = 0
+        self._running_by_org: Dict[str, int] = {}
+        self._seq = itertools.count()
+        self._tier_settings: Dict[str, tuple] = {}
+
+    def _get_tier_settings(self, plan: str) -> tuple:
+        """
+        Get (priority_processing, max_parallel_tasks) for a plan
+
+        Reads the same tiers.yaml entry as PlanPolicy.get_parallel_limit.
+        Unknown plans get the most conservative settings.
+        """
+        settings = self._tier_settings.get(plan)
+        if settings is None:
+            tier_config = SubscriptionService(None).get_tier_config(plan) or {}
+            settings = (
+                bool(tier_config.get('priority_processing', False)),
+                max(1, int(tier_config.get('max_parallel_tasks', 1)))
+            )
+            self._tier_settings[plan] = settings
+        return settings
+
+    @asynccontextmanager
+    async def slot(self, job_id: int, plan: str, org_id: Optional[int] = None, user_id: Optional[int] = None):
+        """
+        Wait for and hold a generation slot
+
+        Args:
+            job_id: Job ID
+            plan: Job owner's plan tier
+            org_id: Job's organization ID (per-org parallel limit key)
+            user_id: Job owner's user ID (limit key if org_id is unknown)
+        """
+        await self.acquire(job_id, plan, org_id=org_id, user_id=user_id)
+        org_key = self._org_key(org_id, user_id)
+        try:
+            yield
+        finally:
+            self.release(org_key)
+
+    @staticmethod
+    def _org_key(org_id: Optional[int], user_id: Optional[int]) -> str:
+        """Key for the per-organization parallel limit"""
+        return f"org:{org_id}" if org_id is not None else f"user:{user_id}"
+
+    async def acquire(self, job_id: int, plan: str, org_id: Optional[int] = None, user_id: Optional[int] = None):
+        """
+        Wait until the job may run
+
+        Cancelling the waiting task removes the job from the queue.
+
+        Args:
+            job_id: Job ID
+            plan: Job owner's plan tier
+            org_id: Job's organization ID
+            user_id: Job owner's user ID
+        """
+        priority, org_limit = self._get_tier_settings(plan)
+        waiter = _Waiter(
+            job_id=job_id,
+            org_key=self._org_key(org_id, user_id),
+            plan=plan,
+            priority=priority,
+            org_limit=org_limit,
+            seq=next(self._seq),
+            future=asyncio.get_running_loop().create_future()
+        )
+        self._waiters.append(waiter)
+        self._dispatch()
+
+        if not waiter.future.done():
+            logger.info(
+                f"[SCHEDULER] Job {job_id} ({plan}) waiting for a slot: "
+                f"{len(self._waiters)} queued, {self._running_total}/{self.max_concurrent_jobs} running"
+            )
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted in the same tick the task was cancelled - give the slot back
+                self.release(waiter.org_key)
+            else:
+                self._remove_waiter(waiter)
+            raise
+
+    def release(self, org_key: str):
+        """Free a slot and admit waiting jobs"""
+        self._running_total = max(0, self._running_total - 1)
+        remaining = self._running_by_org.get(org_key, 0) - 1
+        if remaining > 0:
+            self._running_by_org[org_key] = remaining
+        else:
+            self._running_by_org.pop(org_key, None)
+        self._dispatch()
+
+    def _remove_waiter(self, waiter: _Waiter):
+        """Drop a cancelled waiter from the queue"""
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+        SchedulerMetrics.record_state(len(self._waiters), self._running_total)
+
+    def _is_promoted(self, waiter: _Waiter, now: float) -> bool:
+        """True if a standard-tier job has waited long enough to be treated as priority"""
+        return not waiter.priority and now - waiter.enqueued_at >= self.aging_seconds
+
+    def _dispatch(self):
+        """Admit the best eligible waiters while process slots are free"""
+        while self._running_total < self.max_concurrent_jobs and self._waiters:
+            now = time.monotonic()
+            best = None
+            best_key = None
+            for waiter in self._waiters:
+                if self._running_by_org.get(waiter.org_key, 0) >= waiter.org_limit:
+                    continue
+                key = (0 if waiter.priority or self._is_promoted(waiter, now) else 1, waiter.seq)
+                if best_key is None or key < best_key:
+                    best, best_key = waiter, key
+            if best is None:
+                break  # Every waiting org is at its parallel limit
+
+            self._waiters.remove(best)
+            self._running_total += 1
+            self._running_by_org[best.org_key] = self._running_by_org.get(best.org_key, 0) + 1
+            best.future.set_result(None)
+            SchedulerMetrics.record_admission(best.plan, now - best.enqueued_at, promoted=self._is_promoted(best, now))
+
+        SchedulerMetrics.record_state(len(self._waiters), self._running_total)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Current queue depth and running job count"""
+        return {
+            'queued': len(self._waiters),
+            'running': self._running_total,
+        }
+
+
+# Global generation scheduler instance
+_generation_scheduler_instance: Optional[GenerationScheduler] = None
+
+
+def get_generation_scheduler() -> GenerationScheduler:
+    """Get global generation scheduler instance"""
+    global _generation_scheduler_instance
+    if _generation_scheduler_instance is None:
+        _generation_scheduler_instance = GenerationScheduler()
+    return _generation_scheduler_instance
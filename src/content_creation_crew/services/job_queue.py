@@ -0,0 +1,349 @@
+"""
+Job Queue - Durable Postgres queue for content generation jobs
+Workers claim queued jobs with SELECT ... FOR UPDATE SKIP LOCKED and hold a
+lease that they renew by heartbeat. Jobs whose lease expires (worker crash,
+deploy) are reclaimed by another worker until JOB_MAX_ATTEMPTS is reached.
+Jobs a worker hands back are only claimable again after an exponential
+per-attempt backoff (JOB_RETRY_BACKOFF_SECONDS).
+
+Claims follow the same order as the in-process GenerationScheduler:
+priority_processing tiers first, standard jobs promoted after waiting
+GENERATION_SCHEDULER_AGING_SECONDS, then oldest first. The per-organization
+max_parallel_tasks cap is enforced by each worker's scheduler, so it holds per
+worker process, not across the fleet.
+"""
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, List, Optional
+
+from sqlalchemy import and_, case, or_
+from sqlalchemy.orm import Session
+
+from ..config import config
+from ..database import ContentJob, JobStatus, SessionLocal
+from .sse_store import get_sse_store
+
+logger = logging.getLogger(__name__)
+
+# Statuses a queued job can be (re)claimed in
+ACTIVE_STATUSES = [JobStatus.PENDING.value, JobStatus.RUNNING.value]
+
+# ContentJob.queue_priority classes
+PRIORITY = 0
+STANDARD = 1
+
+
+def _has_priority_processing(plan: str) -> bool:
+    """Whether a plan's tier has priority_processing (config/tiers.yaml)"""
+    from .subscription_service import SubscriptionService
+    tier_config = SubscriptionService(None).get_tier_config(plan) or {}
+    return bool(tier_config.get('priority_processing', False))
+
+
+@dataclass
+class ClaimedJob:
+    """A job leased to a worker"""
+    job_id: int
+    user_id: int
+    org_id: int
+    topic: str
+    content_types: List[str]
+    attempt: int
+    recovered: bool  # True if the job was orphaned by another worker
+
+
+@dataclass
+class HeartbeatResult:
+    """Jobs a worker must stop after renewing its leases"""
+    cancelled: List[int] = field(default_factory=list)  # Cancelled through the API
+    lost: List[int] = field(default_factory=list)  # Leased to another worker; stop without touching status
+
+
+class JobQueue:
+    """
+    Postgres-backed generation job queue
+
+    The content_jobs table is the queue: enqueue() stamps queued_at on a PENDING
+    job, and workers lease rows with lease_owner/lease_expires_at.
+    """
+
+    def __init__(
+        self,
+        lease_seconds: Optional[int] = None,
+        max_attempts: Optional[int] = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        aging_seconds: Optional[float] = None,
+        retry_backoff_seconds: Optional[float] = None,
+        retry_backoff_max_seconds: Optional[float] = None
+    ):
+        """
+        Initialize job queue
+
+        Args:
+            lease_seconds: Lease duration renewed by heartbeat (default: WORKER_LEASE_SECONDS)
+            max_attempts: Attempts before an orphaned job is failed (default: JOB_MAX_ATTEMPTS)
+            session_factory: Session factory (default: SessionLocal)
+            aging_seconds: Wait after which a standard job is claimed like a priority one
+                (default: GENERATION_SCHEDULER_AGING_SECONDS)
+            retry_backoff_seconds: Delay before an abandoned job's first retry, doubled
+                per attempt (default: JOB_RETRY_BACKOFF_SECONDS)
+            retry_backoff_max_seconds: Cap on the retry delay (default: JOB_RETRY_BACKOFF_MAX_SECONDS)
+        """
+        self.lease_seconds = lease_seconds or config.WORKER_LEASE_SECONDS
+        self.max_attempts = max_attempts or config.JOB_MAX_ATTEMPTS
+        self.aging_seconds = aging_seconds if aging_seconds is not None else config.GENERATION_SCHEDULER_AGING_SECONDS
+        self.retry_backoff_seconds = retry_backoff_seconds if retry_backoff_seconds is not None else config.JOB_RETRY_BACKOFF_SECONDS
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds if retry_backoff_max_seconds is not None else config.JOB_RETRY_BACKOFF_MAX_SECONDS
+        self.session_factory = session_factory
+
+    def enqueue(self, db: Session, job_id: int, plan: Optional[str] = None):
+        """
+        Put a PENDING job on the queue
+
+        Args:
+            db: Database session (committed by this call)
+            job_id: Job ID
+            plan: Job owner's plan tier (priority_processing tiers are claimed first)
+        """
+        job = db.query(ContentJob).filter(ContentJob.id == job_id).first()
+        if not job:
+            raise ValueError(f"Job {job_id} not found")
+        job.queue_priority = PRIORITY if plan and _has_priority_processing(plan) else STANDARD
+        job.queued_at = datetime.utcnow()
+        job.attempts = 0
+        job.lease_owner = None
+        job.lease_expires_at = None
+        job.available_at = None
+        db.commit()
+        logger.info(f"[JOB_QUEUE] Enqueued job {job_id}")
+
+    def claim(self, worker_id: str, limit: int) -> List[ClaimedJob]:
+        """
+        Lease up to `limit` queued jobs, priority tiers (and aged standard jobs) first
+
+        Claims unleased PENDING jobs and jobs whose lease has expired
+        (orphaned by a crashed or stopped worker); abandoned jobs are skipped
+        until their retry backoff has passed. Workers only claim as many
+        jobs as they have free slots, so the tier order has to be applied here
+        rather than left to the worker's in-process scheduler.
+
+        Args:
+            worker_id: Claiming worker ID
+            limit: Maximum jobs to claim
+
+        Returns:
+            Claimed jobs
+        """
+        if limit <= 0:
+            return []
+
+        now = datetime.utcnow()
+        # Standard jobs waiting past the aging threshold compete with priority jobs (as in GenerationScheduler)
+        aged_before = now - timedelta(seconds=self.aging_seconds)
+        priority_class = case(
+            (or_(ContentJob.queue_priority == PRIORITY, ContentJob.queued_at < aged_before), PRIORITY),
+            else_=STANDARD
+        )
+        db = self.session_factory()
+        try:
+            jobs = db.query(ContentJob).filter(
+                ContentJob.queued_at.isnot(None),
+                ContentJob.status.in_(ACTIVE_STATUSES),
+                ContentJob.attempts < self.max_attempts,
+                or_(
+                    ContentJob.lease_owner.is_(None),
+                    and_(ContentJob.lease_expires_at.isnot(None), ContentJob.lease_expires_at < now)
+                ),
+                or_(ContentJob.available_at.is_(None), ContentJob.available_at <= now)
+            ).order_by(
+                priority_class,
+                ContentJob.queued_at
+            ).with_for_update(skip_locked=True).limit(limit).all()
+
+            claimed = []
+            for job in jobs:
+                recovered = job.lease_owner is not None or job.status == JobStatus.RUNNING.value
+                if recovered:
+                    logger.warning(f"[JOB_QUEUE] Recovering orphaned job {job.id} (previous owner: {job.lease_owner}, attempts: {job.attempts})")
+                job.lease_owner = worker_id
+                job.lease_expires_at = now + timedelta(seconds=self.lease_seconds)
+                job.attempts = (job.attempts or 0) + 1
+                claimed.append(ClaimedJob(
+                    job_id=job.id,
+                    user_id=job.user_id,
+                    org_id=job.org_id,
+                    topic=job.topic,
+                    content_types=list(job.formats_requested or []),
+                    attempt=job.attempts,
+                    recovered=recovered
+                ))
+            db.commit()
+            return claimed
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def heartbeat(self, worker_id: str, job_ids: List[int]) -> HeartbeatResult:
+        """
+        Renew leases for running jobs
+
+        Args:
+            worker_id: Worker ID
+            job_ids: Jobs the worker is running
+
+        Returns:
+            HeartbeatResult with jobs cancelled through the API and jobs whose
+            lease was lost to another worker (which may already be running them)
+        """
+        result = HeartbeatResult()
+        if not job_ids:
+            return result
+
+        lease_expires_at = datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+        db = self.session_factory()
+        try:
+            jobs = db.query(ContentJob).filter(ContentJob.id.in_(job_ids)).all()
+            for job in jobs:
+                if job.lease_owner != worker_id:
+                    result.lost.append(job.id)
+                elif job.status == JobStatus.CANCELLED.value:
+                    result.cancelled.append(job.id)
+                else:
+                    job.lease_expires_at = lease_expires_at
+            db.commit()
+            return result
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def release(self, worker_id: str, job_id: int):
+        """
+        Remove a finished job from the queue
+
+        Args:
+            worker_id: Worker ID (only its own lease is released)
+            job_id: Job ID
+        """
+        self._clear_lease(worker_id, job_id, dequeue=True)
+
+    def abandon(self, worker_id: str, job_id: int):
+        """
+        Give a job back to the queue without finishing it (e.g. on shutdown)
+
+        The job is not claimed again until a backoff that doubles with each
+        attempt has passed, so a job that keeps getting handed back does not
+        cycle straight between workers.
+
+        Args:
+            worker_id: Worker ID
+            job_id: Job ID
+        """
+        self._clear_lease(worker_id, job_id, dequeue=False)
+
+    def _clear_lease(self, worker_id: str, job_id: int, dequeue: bool):
+        """Clear a job's lease if still held by worker_id"""
+        db = self.session_factory()
+        try:
+            job = db.query(ContentJob).filter(
+                ContentJob.id == job_id,
+                ContentJob.lease_owner == worker_id
+            ).first()
+            if job:
+                job.lease_owner = None
+                job.lease_expires_at = None
+                if dequeue:
+                    job.queued_at = None
+                else:
+                    job.available_at = datetime.utcnow() + timedelta(seconds=self._retry_delay(job.attempts))
+                db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _retry_delay(self, attempts: Optional[int]) -> float:
+        """Backoff before an abandoned job is claimable again, doubling per attempt"""
+        exponent = max((attempts or 1) - 1, 0)
+        return min(self.retry_backoff_seconds * (2 ** exponent), self.retry_backoff_max_seconds)
+
+    def fail_exhausted(self) -> List[int]:
+        """
+        Fail orphaned jobs that have used all their attempts
+
+        Returns:
+            Job IDs marked FAILED
+        """
+        now = datetime.utcnow()
+        db = self.session_factory()
+        try:
+            jobs = db.query(ContentJob).filter(
+                ContentJob.queued_at.isnot(None),
+                ContentJob.status.in_(ACTIVE_STATUSES),
+                ContentJob.attempts >= self.max_attempts,
+                or_(
+                    ContentJob.lease_owner.is_(None),
+                    ContentJob.lease_expires_at < now
+                )
+            ).with_for_update(skip_locked=True).all()
+
+            failed_ids = []
+            for job in jobs:
+                job.status = JobStatus.FAILED.value
+                job.finished_at = now
+                job.queued_at = None
+                job.lease_owner = None
+                job.lease_expires_at = None
+                failed_ids.append(job.id)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+        sse_store = get_sse_store()
+        for job_id in failed_ids:
+            logger.error(f"[JOB_QUEUE] Job {job_id} failed after {self.max_attempts} attempts")
+            sse_store.add_event(job_id, 'status_update', {
+                'type': 'status_update',
+                'job_id': job_id,
+                'status': JobStatus.FAILED.value
+            })
+            sse_store.add_event(job_id, 'error', {
+                'type': 'error',
+                'job_id': job_id,
+                'message': f'Job was interrupted {self.max_attempts} times and has been abandoned.',
+                'error_type': 'WorkerLost',
+                'hint': 'Please try generating the content again.'
+            })
+        return failed_ids
+
+    def get_depth(self) -> int:
+        """Number of queued jobs waiting for a worker"""
+        db = self.session_factory()
+        try:
+            return db.query(ContentJob).filter(
+                ContentJob.queued_at.isnot(None),
+                ContentJob.status == JobStatus.PENDING.value,
+                ContentJob.lease_owner.is_(None)
+            ).count()
+        finally:
+            db.close()
+
+
+# Global job queue instance
+_job_queue_instance: Optional[JobQueue] = None
+
+
+def get_job_queue() -> JobQueue:
+    """Get global job queue instance"""
+    global _job_queue_instance
+    if _job_queue_instance is None:
+        _job_queue_instance = JobQueue()
+    return _job_queue_instance
@@ -1,6 +1,6 @@
 """
 Prometheus metrics collection service
-Provides counters and histograms for monitoring
+Provides counters, gauges and histograms for monitoring
 """
 import time
 from typing import Dict, Optional
@@ -29,6 +29,9 @@ class MetricsCollector:
         
         # Labels support: counter_name{label1="value1",label2="value2"} = value
         self._labeled_counters: Dict[str, Dict[tuple, float]] = defaultdict(lambda: defaultdict(float))
+        
+        # Gauges (point-in-time values, keyed by label tuple like labeled counters)
+        self._gauges: Dict[str, Dict[tuple, float]] = defaultdict(dict)
     
     def increment_counter(self, name: str, value: float = 1.0, labels: Optional[Dict[str, str]] = None):
         """
@@ -47,6 +50,19 @@ class MetricsCollector:
             else:
                 self._counters[name] += value
     
+    def set_gauge(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
+        """
+        Set a gauge metric to its current value
+        
+        Args:
+            name: Metric name (e.g., "sse_memory_store_bytes")
+            value: Current value
+            labels: Optional labels dict
+        """
+        with self._lock:
+            label_tuple = tuple(sorted(labels.items())) if labels else ()
+            self._gauges[name][label_tuple] = value
+    
     def record_histogram(self, name: str, value: float, labels: Optional[Dict[str, str]] = None):
         """
         Record a histogram value (for timing metrics)
@@ -77,6 +93,12 @@ class MetricsCollector:
                 return self._labeled_counters[name].get(label_tuple, 0.0)
             return self._counters.get(name, 0.0)
     
+    def get_gauge(self, name: str, labels: Optional[Dict[str, str]] = None) -> float:
+        """Get current gauge value"""
+        with self._lock:
+            label_tuple = tuple(sorted(labels.items())) if labels else ()
+            return self._gauges.get(name, {}).get(label_tuple, 0.0)
+    
     def get_histogram_stats(self, name: str, labels: Optional[Dict[str, str]] = None) -> Dict[str, float]:
         """
         Get histogram statistics (count, sum, min, max, avg)
@@ -125,6 +147,16 @@ class MetricsCollector:
                     else:
                         lines.append(f"{name} {value}")
             
+            # Format gauges
+            for name, label_dict in sorted(self._gauges.items()):
+                lines.append(f"# TYPE {name} gauge")
+                for label_tuple, value in sorted(label_dict.items()):
+                    if label_tuple:
+                        label_str = ",".join(f'{k}="{v}"' for k, v in label_tuple)
+                        lines.append(f"{name}{{{label_str}}} {value}")
+                    else:
+                        lines.append(f"{name} {value}")
+            
             # Format histograms as summaries (lightweight alternative)
             for key, values in sorted(self._histograms.items()):
                 if values:
@@ -177,6 +209,11 @@ def record_histogram(name: str, value: float, labels: Optional[Dict[str, str]] =
     get_metrics_collector().record_histogram(name, value, labels)
 
 
+def set_gauge(name: str, value: float, labels: Optional[Dict[str, str]] = None):
+    """Convenience function to set gauge"""
+    get_metrics_collector().set_gauge(name, value, labels)
+
+
 class RequestTimer:
     """Context manager for timing requests"""
     
@@ -347,6 +384,48 @@ class TTSMetrics:
     def timer(provider: str):
         """Context manager for timing TTS operations"""
         return RequestTimer("tts_seconds", {"provider": provider})
+    
+    @staticmethod
+    def record_cache_lookup(provider: str, hit: bool):
+        """
+        Record a TTS output cache lookup
+        
+        Args:
+            provider: TTS provider (e.g., "gtts", "piper")
+            hit: True if stored audio was reused (synthesis and MP3 encoding skipped)
+        """
+        increment_counter("tts_cache_lookups_total", 1.0, {"provider": provider, "result": "hit" if hit else "miss"})
+    
+    @staticmethod
+    def record_cache_eviction(reason: str, entries: int):
+        """
+        Record TTS output cache entries removed from storage
+        
+        Args:
+            reason: "expired" (older than TTS_CACHE_MAX_AGE), "size" (over TTS_CACHE_MAX_BYTES) or "erased" (GDPR deletion)
+            entries: Number of entries removed
+        """
+        if entries:
+            increment_counter("tts_cache_evictions_total", float(entries), {"reason": reason})
+    
+    @staticmethod
+    def record_transcode(provider: str, duration: float, success: bool = True):
+        """
+        Record encoding a voiceover's browser renditions (MP3, Opus, AAC)
+        
+        Args:
+            provider: TTS provider (e.g., "gtts", "piper")
+            duration: Encoder run duration in seconds
+            success: Whether encoding succeeded
+        """
+        labels = {"provider": provider}
+        
+        increment_counter("tts_transcodes_total", 1.0, labels)
+        
+        if not success:
+            increment_counter("tts_transcode_failures_total", 1.0, labels)
+        
+        record_histogram("tts_transcode_seconds", duration, labels)
 
 
 class RetentionMetrics:
@@ -382,3 +461,197 @@ class RetentionMetrics:
         increment_counter("retention_cleanup_bytes_total", float(total_bytes))
         record_histogram("retention_cleanup_seconds", duration)
 
+
+
+class SSEStoreMetrics:
+    """Metrics for the in-memory SSE event store fallback"""
+    
+    @staticmethod
+    def record_occupancy(jobs: int, events: int, bytes_used: int):
+        """
+        Record current in-memory SSE store occupancy
+        
+        Args:
+            jobs: Number of jobs with stored events
+            events: Total stored events
+            bytes_used: Approximate serialized size of stored events
+        """
+        set_gauge("sse_memory_store_jobs", float(jobs))
+        set_gauge("sse_memory_store_events", float(events))
+        set_gauge("sse_memory_store_bytes", float(bytes_used))
+    
+    @staticmethod
+    def record_eviction(reason: str, events: int):
+        """
+        Record jobs evicted from the in-memory SSE store
+        
+        Args:
+            reason: Eviction reason ("ttl", "lru_finished", "lru_active")
+            events: Number of events dropped with the job
+        """
+        labels = {"reason": reason}
+        increment_counter("sse_memory_store_evictions_total", 1.0, labels)
+        increment_counter("sse_memory_store_evicted_events_total", float(events), labels)
+
+
+class ContentCacheMetrics:
+    """Metrics for the in-memory content cache"""
+    
+    @staticmethod
+    def record_occupancy(entries: int, bytes_used: int):
+        """
+        Record current in-memory content cache occupancy
+        
+        Args:
+            entries: Number of cached entries
+            bytes_used: Approximate serialized size of cached entries
+        """
+        set_gauge("content_cache_entries", float(entries))
+        set_gauge("content_cache_bytes", float(bytes_used))
+    
+    @staticmethod
+    def record_eviction(reason: str, entries: int):
+        """
+        Record entries evicted from the in-memory content cache
+        
+        Args:
+            reason: Eviction reason ("ttl", "lru")
+            entries: Number of entries dropped
+        """
+        increment_counter("content_cache_evictions_total", float(entries), {"reason": reason})
+    
+    @staticmethod
+    def record_coalesced(hit: bool):
+        """
+        Record a cache miss that waited for an identical in-flight generation
+        
+        Args:
+            hit: True if the waiting job was served from the filled cache
+        """
+        increment_counter("content_cache_coalesced_total", 1.0, {"result": "hit" if hit else "miss"})
+    
+    @staticmethod
+    def record_similar_lookup(hit: bool, similarity: float, jaccard_rejections: int):
+        """
+        Record a near-duplicate topic lookup after an exact cache miss
+        
+        Args:
+            hit: True if cached content for a similar topic was served (an LLM run saved)
+            similarity: Similarity of the best match (0 if none)
+            jaccard_rejections: LSH candidates whose exact Jaccard similarity was below the threshold
+        """
+        increment_counter("content_cache_similar_lookups_total", 1.0, {"result": "hit" if hit else "miss"})
+        if hit:
+            record_histogram("content_cache_similar_similarity", similarity)
+        if jaccard_rejections:
+            increment_counter("content_cache_similar_lsh_candidates_jaccard_rejected_total", float(jaccard_rejections))
+
+
+class SchedulerMetrics:
+    """Metrics for the generation job scheduler"""
+    
+    @staticmethod
+    def record_state(queued: int, running: int):
+        """
+        Record current scheduler occupancy
+        
+        Args:
+            queued: Jobs waiting for a slot
+            running: Jobs holding a slot
+        """
+        set_gauge("generation_scheduler_queue_depth", float(queued))
+        set_gauge("generation_scheduler_running_jobs", float(running))
+    
+    @staticmethod
+    def record_admission(plan: str, wait_seconds: float, promoted: bool = False):
+        """
+        Record a job admitted to run
+        
+        Args:
+            plan: Subscription plan of the job owner
+            wait_seconds: Time spent waiting for a slot
+            promoted: True if the job was admitted early due to aging
+        """
+        labels = {"plan": plan}
+        increment_counter("generation_scheduler_admitted_total", 1.0, labels)
+        record_histogram("generation_scheduler_wait_seconds", wait_seconds, labels)
+        if promoted:
+            increment_counter("generation_scheduler_promoted_total", 1.0, labels)
+
+
+class PasswordHashMetrics:
+    """Metrics for the password hashing pool"""
+    
+    @staticmethod
+    def record_pending(pending: int):
+        """
+        Record hashing operations queued or running on the pool
+        
+        Args:
+            pending: Operations submitted and not yet finished
+        """
+        set_gauge("password_hash_pending", float(pending))
+    
+    @staticmethod
+    def record_operation(operation: str, duration: float, wait: float):
+        """
+        Record a completed hashing operation
+        
+        Args:
+            operation: "hash" or "verify"
+            duration: Total time including the queue wait, in seconds
+            wait: Time spent waiting for a pool thread, in seconds
+        """
+        labels = {"operation": operation}
+        increment_counter("password_hash_operations_total", 1.0, labels)
+        record_histogram("password_hash_seconds", duration, labels)
+        record_histogram("password_hash_wait_seconds", wait, labels)
+    
+    @staticmethod
+    def record_rejected(operation: str):
+        """
+        Record an operation refused because the pool was saturated (503)
+        
+        Args:
+            operation: "hash" or "verify"
+        """
+        increment_counter("password_hash_rejected_total", 1.0, {"operation": operation})
+    
+    @staticmethod
+    def record_rehash():
+        """Record a stored hash upgraded to the configured bcrypt cost at login"""
+        increment_counter("password_rehash_total", 1.0)
+
+
+class TokenRevocationMetrics:
+    """Metrics for the access token blacklist"""
+    
+    @staticmethod
+    def record_revocation(scope: str):
+        """
+        Record a revocation
+        
+        Args:
+            scope: "token" (single jti) or "user" (all of a user's tokens)
+        """
+        increment_counter("token_blacklist_revocations_total", 1.0, {"scope": scope})
+    
+    @staticmethod
+    def record_lookup(result: str):
+        """
+        Record a revocation check
+        
+        Args:
+            result: "filter_miss" (answered locally), "revoked" or "false_positive" (Bloom filter hit not in Redis)
+        """
+        increment_counter("token_blacklist_lookups_total", 1.0, {"result": result})
+    
+    @staticmethod
+    def record_filter_size(entries: int):
+        """
+        Record the number of revoked tokens in the local Bloom filter after a rebuild
+        
+        Args:
+            entries: Unexpired revoked tokens
+        """
+        set_gauge("token_blacklist_filter_entries", float(entries))
@@ -0,0 +1,177 @@
+"""
+Password Hasher - bcrypt off the event loop
+
+Login and signup are async handlers; running bcrypt (~250ms at cost 12) inline
+stalls every other request and SSE stream on the worker. Hashes and
+verifications run on a small dedicated thread pool instead (bcrypt releases the
+GIL while it works). At most PASSWORD_HASH_MAX_PENDING operations may be queued
+or running; beyond that callers get a 503 rather than an ever-growing queue.
+
+Verification also reports whether the stored hash was made with a different
+bcrypt cost than BCRYPT_ROUNDS, returning a fresh hash so login can upgrade it.
+"""
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, Tuple
+
+from fastapi import HTTPException, status
+
+from .metrics import PasswordHashMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def bcrypt_cost(hashed_password: str) -> Optional[int]:
+    """Cost factor of a bcrypt hash ($2b$12$...), or None if it is not bcrypt"""
+    parts = (hashed_password or "").split("$")
+    if len(parts) < 4 or not parts[1].startswith("2"):
+        return None
+    try:
+        return int(parts[2])
+    except ValueError:
+        return None
+
+
+def needs_rehash(hashed_password: str) -> bool:
+    """True if a stored hash was not made with the configured bcrypt cost"""
+    from ..auth import BCRYPT_ROUNDS
+    return bcrypt_cost(hashed_password) != BCRYPT_ROUNDS
+
+
+def verify_and_rehash(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and rehash it if its stored cost is outdated (blocking)
+    
+    Returns:
+        (valid, new_hash) - new_hash is None unless the password is valid and
+        the stored hash should be replaced
+    """
+    from ..auth import get_password_hash, verify_password
+    
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+    if needs_rehash(hashed_password):
+        return True, get_password_hash(plain_password)
+    return True, None
+
+
+class PasswordHasher:
+    """Bounded thread pool for bcrypt operations"""
+    
+    def __init__(self, workers: int = 2, max_pending: int = 32):
+        """
+        Initialize password hasher
+        
+        Args:
+            workers: Threads running bcrypt
+            max_pending: Queued + running operations before new ones are refused
+        """
+        self.workers = max(1, workers)
+        self.max_pending = max(self.workers, max_pending)
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        self._pending = 0
+        self._lock = threading.Lock()
+    
+    @property
+    def pending(self) -> int:
+        """Operations queued or running"""
+        return self._pending
+    
+    def _acquire(self, operation: str):
+        """Reserve a pending slot or refuse with 503"""
+        with self._lock:
+            if self._pending >= self.max_pending:
+                PasswordHashMetrics.record_rejected(operation)
+                logger.warning(f"Password hashing pool saturated ({self._pending} pending), refusing {operation}")
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="Too many sign-in requests right now. Please try again in a moment.",
+                    headers={"Retry-After": "1"}
+                )
+            self._pending += 1
+            pending = self._pending
+        PasswordHashMetrics.record_pending(pending)
+    
+    def _release(self):
+        """Free a pending slot"""
+        with self._lock:
+            self._pending -= 1
+            pending = self._pending
+        PasswordHashMetrics.record_pending(pending)
+    
+    async def run(self, operation: str, func: Callable, *args):
+        """
+        Run a blocking hashing function on the pool
+        
+        Args:
+            operation: Metrics label ("hash" or "verify")
+            func: Blocking function
+            *args: Function arguments
+        
+        Raises:
+            HTTPException: 503 if the pool is saturated
+        """
+        self._acquire(operation)
+        submitted_at = time.perf_counter()
+        
+        def timed():
+            started_at = time.perf_counter()
+            return started_at - submitted_at, func(*args)
+        
+        try:
+            wait, result = await asyncio.get_running_loop().run_in_executor(self._executor, timed)
+        finally:
+            self._release()
+        PasswordHashMetrics.record_operation(operation, time.perf_counter() - submitted_at, wait)
+        return result
+    
+    def shutdown(self):
+        """Stop the pool"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Global password hasher
+_password_hasher: Optional[PasswordHasher] = None
+_password_hasher_lock = threading.Lock()
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get global password hasher"""
+    global _password_hasher
+    if _password_hasher is None:
+        with _password_hasher_lock:
+            if _password_hasher is None:
+                from ..config import config
+                _password_hasher = PasswordHasher(
+                    workers=config.PASSWORD_HASH_WORKERS,
+                    max_pending=config.PASSWORD_HASH_MAX_PENDING
+                )
+    return _password_hasher
+
+
+def shutdown_password_hasher():
+    """Stop the global password hasher (called on application shutdown)"""
+    global _password_hasher
+    with _password_hasher_lock:
+        if _password_hasher is not None:
+            _password_hasher.shutdown()
+            _password_hasher = None
+
+
+async def hash_password(password: str) -> str:
+    """Hash a password on the hashing pool (see auth.get_password_hash)"""
+    from ..auth import get_password_hash
+    return await get_password_hasher().run("hash", get_password_hash, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password on the hashing pool
+    
+    Returns:
+        (valid, new_hash) - store new_hash when it is not None (bcrypt cost changed)
+    """
+    return await get_password_hasher().run("verify", verify_and_rehash, plain_password, hashed_password)
@@ -0,0 +1,216 @@
+"""
+Authenticated principal cache - Skip the user lookup on authenticated requests
+
+A principal is a small snapshot of the fields authorization needs (id, email,
+is_active, is_admin, org_id, plan), keyed by user ID and the token's iat. It is
+served from an in-process L1 and a shared Redis L2, and dropped through
+CacheInvalidationService.invalidate_user. Other processes' L1 entries expire
+after AUTH_PRINCIPAL_L1_TTL, which bounds how long they can serve a stale snapshot.
+
+Token signature, expiry and revocation are still checked on every request.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import Membership, Subscription, SubscriptionStatus, User
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class AuthPrincipal:
+    """Authorization snapshot of a user"""
+    id: int
+    email: str
+    is_active: bool
+    is_admin: bool
+    org_id: Optional[int] = None
+    plan: Optional[str] = None  # Active subscription plan (None if the org has none yet)
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AuthPrincipal":
+        return cls(**data)
+
+
+async def load_principal(db: AsyncSession, user_id: int) -> Optional[AuthPrincipal]:
+    """
+    Load a user's principal in one query (user, membership and active subscription)
+    
+    Args:
+        db: Async database session
+        user_id: User ID
+    
+    Returns:
+        AuthPrincipal, or None if the user does not exist
+    """
+    result = await db.execute(
+        select(User.id, User.email, User.is_active, User.is_admin, Membership.org_id, Subscription.plan)
+        .outerjoin(Membership, Membership.user_id == User.id)
+        .outerjoin(Subscription, and_(
+            Subscription.org_id == Membership.org_id,
+            Subscription.status == SubscriptionStatus.ACTIVE.value
+        ))
+        .where(User.id == user_id)
+        # Users in several orgs resolve to the same membership (and subscription) on every load
+        .order_by(Membership.org_id, Subscription.id)
+        .limit(1)
+    )
+    row = result.first()
+    if row is None:
+        return None
+    return AuthPrincipal(
+        id=row.id,
+        email=row.email,
+        is_active=bool(row.is_active),
+        is_admin=bool(row.is_admin),
+        org_id=row.org_id,
+        plan=row.plan
+    )
+
+
+class PrincipalCache:
+    """Two-level (process memory, then Redis) cache of AuthPrincipal snapshots"""
+    
+    KEY_PREFIX = "auth_principal"
+    
+    def __init__(self, redis_client: Optional[Any] = None, ttl: int = 300, l1_ttl: int = 30, max_l1_entries: int = 10000):
+        """
+        Initialize principal cache
+        
+        Args:
+            redis_client: Optional Redis client for the shared L2
+            ttl: Redis L2 TTL in seconds
+            l1_ttl: In-process L1 TTL in seconds (bounds staleness across processes)
+            max_l1_entries: Maximum principals kept in the L1
+        """
+        self.redis_client = redis_client
+        self.ttl = ttl
+        self.l1_ttl = l1_ttl
+        self.max_l1_entries = max(1, max_l1_entries)
+        self._l1: "OrderedDict[Tuple[int, int], Tuple[float, AuthPrincipal]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def _redis_key(self, user_id: int) -> str:
+        """Redis hash holding a user's principals by token iat"""
+        return f"{self.KEY_PREFIX}:{user_id}"
+    
+    def _l1_put(self, user_id: int, issued_at: int, principal: AuthPrincipal):
+        """Add a principal to the L1"""
+        with self._lock:
+            self._l1[(user_id, issued_at)] = (time.monotonic() + self.l1_ttl, principal)
+            self._l1.move_to_end((user_id, issued_at))
+            while len(self._l1) > self.max_l1_entries:
+                self._l1.popitem(last=False)
+    
+    def get(self, user_id: int, issued_at: int) -> Optional[AuthPrincipal]:
+        """
+        Get a cached principal
+        
+        Args:
+            user_id: User ID (token sub)
+            issued_at: Token iat
+        
+        Returns:
+            AuthPrincipal or None on a miss
+        """
+        key = (user_id, issued_at)
+        with self._lock:
+            entry = self._l1.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self._l1.move_to_end(key)
+                    return entry[1]
+                del self._l1[key]
+        
+        if self.redis_client is not None:
+            try:
+                data = self.redis_client.hget(self._redis_key(user_id), str(issued_at))
+                if data:
+                    principal = AuthPrincipal.from_dict(json.loads(data))
+                    self._l1_put(user_id, issued_at, principal)
+                    return principal
+            except Exception as e:
+                logger.warning(f"Principal cache lookup failed: {e}")
+        return None
+    
+    def set(self, principal: AuthPrincipal, issued_at: int):
+        """
+        Cache a principal for a token
+        
+        Args:
+            principal: Loaded principal
+            issued_at: Token iat
+        """
+        self._l1_put(principal.id, issued_at, principal)
+        if self.redis_client is not None:
+            try:
+                key = self._redis_key(principal.id)
+                pipe = self.redis_client.pipeline()
+                pipe.hset(key, str(issued_at), json.dumps(principal.to_dict()))
+                pipe.expire(key, self.ttl)
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Principal cache update failed: {e}")
+    
+    def invalidate(self, user_id: int):
+        """Drop every cached principal of a user"""
+        with self._lock:
+            for key in [key for key in self._l1 if key[0] == user_id]:
+                del self._l1[key]
+        if self.redis_client is not None:
+            try:
+                self.redis_client.delete(self._redis_key(user_id))
+            except Exception as e:
+                logger.warning(f"Principal cache invalidate failed: {e}")
+    
+    def clear(self):
+        """Clear the L1 (Redis entries expire on their own)"""
+        with self._lock:
+            self._l1.clear()
+    
+    def get_stats(self) -> Dict:
+        """Get cache statistics"""
+        with self._lock:
+            l1_entries = len(self._l1)
+        return {
+            'l1_entries': l1_entries,
+            'ttl': self.ttl,
+            'l1_ttl': self.l1_ttl,
+            'backend': 'redis' if self.redis_client is not None else 'memory'
+        }
+
+
+# Global principal cache instance
+_principal_cache_instance: Optional[PrincipalCache] = None
+_principal_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> Optional[PrincipalCache]:
+    """Get global principal cache (None when AUTH_PRINCIPAL_CACHE_ENABLED is off)"""
+    global _principal_cache_instance
+    from ..config import config
+    
+    if not config.AUTH_PRINCIPAL_CACHE_ENABLED:
+        return None
+    if _principal_cache_instance is None:
+        with _principal_cache_lock:
+            if _principal_cache_instance is None:
+                from .redis_cache import get_redis_client
+                _principal_cache_instance = PrincipalCache(
+                    redis_client=get_redis_client(),
+                    ttl=config.AUTH_PRINCIPAL_CACHE_TTL,
+                    l1_ttl=config.AUTH_PRINCIPAL_L1_TTL,
+                    max_l1_entries=config.AUTH_PRINCIPAL_L1_MAX_ENTRIES
+                )
+    return _principal_cache_instance
@@ -122,23 +122,16 @@ class RedisContentCache:
                 return self.fallback_cache.get(topic, content_types, prompt_version, model)
             return None
     
-    def set(self, topic: str, content_data: Dict, ttl: int = None, prompt_version: str = None, model: str = None):
+    def set(self, topic: str, content_data: Dict, ttl: int = None, prompt_version: str = None, model: str = None, content_types: list = None):
         """Cache content"""
         if not self.use_redis:
-            return self.fallback_cache.set(topic, content_data, ttl, prompt_version, model)
+            return self.fallback_cache.set(topic, content_data, ttl, prompt_version, model, content_types)
         
         try:
-            key = self.get_cache_key(topic, content_types=None, prompt_version=prompt_version, model=model)
             # Determine content types from content_data
-            content_types = []
-            if content_data.get('social_media_content'):
-                content_types.append('social')
-            if content_data.get('audio_content'):
-                content_types.append('audio')
-            if content_data.get('video_content'):
-                content_types.append('video')
             if not content_types:
-                content_types = ['blog']
+                from .content_cache import get_content_types
+                content_types = get_content_types(content_data)
             
             key = self.get_cache_key(topic, content_types, prompt_version, model)
             ttl = ttl or self.default_ttl
@@ -152,7 +145,68 @@ class RedisContentCache:
         except Exception as e:
             logger.warning(f"Redis set failed: {e}, falling back to in-memory")
             if self.fallback_cache:
-                self.fallback_cache.set(topic, content_data, ttl, prompt_version, model)
+                self.fallback_cache.set(topic, content_data, ttl, prompt_version, model, content_types)
+            return
+        
+        from .content_cache import index_similar_topic
+        index_similar_topic(self, topic, content_types, prompt_version, model)
+    
+    def get_similar(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> Optional[Dict]:
+        """Get cached content for a near-duplicate topic (see ContentCache.get_similar)"""
+        if not self.use_redis:
+            return self.fallback_cache.get_similar(topic, content_types, prompt_version, model)
+        
+        from .content_cache import get_similar_cached
+        return get_similar_cached(self, topic, content_types, prompt_version, model)
+    
+    def _get_fill_key(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> str:
+        """Generate Redis key for a single-flight fill claim"""
+        return self.get_cache_key(topic, content_types, prompt_version, model).replace("content:", "content_fill:", 1)
+    
+    def begin_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None) -> bool:
+        """Claim the fill for a missed key across processes (see ContentCache.begin_fill)"""
+        if not self.use_redis:
+            return self.fallback_cache.begin_fill(topic, content_types, prompt_version, model)
+        
+        from ..config import config
+        try:
+            # SET NX with expiry: a crashed leader's claim lapses on its own
+            claimed = self.redis_client.set(
+                self._get_fill_key(topic, content_types, prompt_version, model),
+                "1",
+                nx=True,
+                ex=config.CREWAI_TIMEOUT + 60
+            )
+            return bool(claimed)
+        except Exception as e:
+            logger.warning(f"Redis fill claim failed: {e}, generating without coalescing")
+            return True
+    
+    def end_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None):
+        """Release a fill claimed with begin_fill()"""
+        if not self.use_redis:
+            return self.fallback_cache.end_fill(topic, content_types, prompt_version, model)
+        
+        try:
+            self.redis_client.delete(self._get_fill_key(topic, content_types, prompt_version, model))
+        except Exception as e:
+            logger.warning(f"Redis fill release failed: {e}")
+    
+    async def wait_for_fill(self, topic: str, content_types: list = None, prompt_version: str = None, model: str = None, timeout: float = None) -> Optional[Dict]:
+        """Wait for another job's fill to finish and return its cached content"""
+        if not self.use_redis:
+            return await self.fallback_cache.wait_for_fill(topic, content_types, prompt_version, model, timeout)
+        
+        import asyncio
+        from ..config import config
+        fill_key = self._get_fill_key(topic, content_types, prompt_version, model)
+        deadline = time.time() + (timeout if timeout is not None else config.CREWAI_TIMEOUT + 60)
+        try:
+            while self.redis_client.exists(fill_key) and time.time() < deadline:
+                await asyncio.sleep(0.5)
+        except Exception as e:
+            logger.warning(f"Redis fill wait failed: {e}")
+        return self.get(topic, content_types, prompt_version, model)
     
     def clear(self, topic: str = None, content_types: list = None, prompt_version: str = None, model: str = None):
         """Clear cache entry"""
@@ -173,6 +227,12 @@ class RedisContentCache:
             if self.fallback_cache:
                 self.fallback_cache.clear(topic, content_types, prompt_version, model)
     
+    def cleanup_expired(self) -> int:
+        """Remove expired entries (Redis expires keys itself)"""
+        if not self.use_redis:
+            return self.fallback_cache.cleanup_expired()
+        return 0
+    
     def get_stats(self) -> Dict:
         """Get cache statistics"""
         if not self.use_redis:
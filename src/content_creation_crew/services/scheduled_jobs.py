@@ -7,6 +7,7 @@ from datetime import datetime, timedelta
 from typing import Optional
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 
 from ..config import config
 
@@ -94,6 +95,26 @@ def start_scheduler():
         )
         logger.info("Registered artifact retention cleanup job (daily at 4 AM)")
         
+        # Register content cache expiry sweep
+        scheduler.add_job(
+            func=run_content_cache_sweep_job,
+            trigger=IntervalTrigger(seconds=60),  # Every minute
+            id='content_cache_sweep',
+            name='Content Cache Expiry Sweep',
+            replace_existing=True
+        )
+        logger.info("Registered content cache sweep job (every minute)")
+        
+        # Register TTS output cache sweep
+        scheduler.add_job(
+            func=run_tts_cache_sweep_job,
+            trigger=CronTrigger(minute=30),  # Every hour at minute 30
+            id='tts_cache_sweep',
+            name='TTS Cache Eviction Sweep',
+            replace_existing=True
+        )
+        logger.info("Registered TTS cache sweep job (hourly)")
+        
         # Start scheduler
         scheduler.start()
         logger.info("Background scheduler started")
@@ -112,6 +133,40 @@ def stop_scheduler():
         logger.info("Background scheduler stopped")
 
 
+def run_content_cache_sweep_job():
+    """
+    Content cache sweep job - drops expired in-memory entries so they stop counting against the budget
+    """
+    from .content_cache import get_cache
+    
+    try:
+        removed = get_cache().cleanup_expired()
+        if removed:
+            logger.info(f"Content cache sweep removed {removed} expired entries")
+    except Exception as e:
+        logger.error(f"Content cache sweep failed: {e}", exc_info=True)
+
+
+def run_tts_cache_sweep_job():
+    """
+    TTS cache sweep job - evicts stored voiceover audio past TTS_CACHE_MAX_AGE or over TTS_CACHE_MAX_BYTES
+    """
+    from .storage_provider import get_storage_provider
+    from .tts_cache import get_tts_cache
+    
+    tts_cache = get_tts_cache()
+    if tts_cache is None:
+        return
+    try:
+        evicted = tts_cache.sweep(get_storage_provider())
+        if evicted:
+            logger.info(f"TTS cache sweep evicted {evicted} entries")
+    except NotImplementedError as e:
+        logger.warning(f"TTS cache sweep skipped: {e}")
+    except Exception as e:
+        logger.error(f"TTS cache sweep failed: {e}", exc_info=True)
+
+
 def run_gdpr_cleanup_job():
     """
     GDPR cleanup job - runs daily to hard delete accounts past grace period
@@ -540,6 +595,8 @@ __all__ = [
     'stop_scheduler',
     'run_gdpr_cleanup_job',
     'run_session_cleanup_job',
+    'run_content_cache_sweep_job',
+    'run_tts_cache_sweep_job',
     'run_retention_cleanup_job',
     'run_retention_notification_job'
 ]
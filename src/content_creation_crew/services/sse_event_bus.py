@@ -0,0 +1,235 @@
+"""
+SSE Event Bus - Push notifications for new SSE events
+Uses Redis pub/sub so every API instance wakes its streams, with an in-process
+asyncio fan-out that is always used for subscribers in this process
+"""
+import asyncio
+import json
+import logging
+import threading
+import uuid
+from typing import Dict, Optional, Set
+
+from .redis_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class SSESubscription:
+    """
+    A single stream's subscription to notifications for one job
+
+    Notifications are edge-triggered: any number of publishes between two
+    wait() calls collapse into a single wake-up, and the stream then reads
+    all new events from the event store in one go.
+    """
+
+    def __init__(self, bus: "SSEEventBus", job_id: int, loop: asyncio.AbstractEventLoop):
+        self.bus = bus
+        self.job_id = job_id
+        self.loop = loop
+        self._event = asyncio.Event()
+        self.closed = False
+
+    def notify(self):
+        """Wake the waiting stream (safe to call from any thread)"""
+        try:
+            if self.loop.is_closed():
+                return
+            self.loop.call_soon_threadsafe(self._event.set)
+        except RuntimeError:
+            # Loop shut down between the check and the call
+            pass
+
+    async def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for the next notification
+
+        Args:
+            timeout: Maximum seconds to wait (None waits forever)
+
+        Returns:
+            True if notified, False on timeout
+        """
+        try:
+            await asyncio.wait_for(self._event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False
+        self._event.clear()
+        return True
+
+    def close(self):
+        """Unsubscribe from the bus"""
+        if not self.closed:
+            self.closed = True
+            self.bus._unsubscribe(self)
+
+
+class SSEEventBus:
+    """
+    Fans out "job has new events" notifications to SSE streams
+
+    Local subscribers are always notified directly. When Redis is available
+    the notification is also published on sse:notify:{job_id} and a background
+    listener thread delivers notifications published by other instances.
+    """
+
+    CHANNEL_PREFIX = "sse:notify:"
+    RECONNECT_DELAY = 1.0  # Seconds between listener reconnect attempts
+
+    def __init__(self, redis_client=None):
+        """
+        Initialize SSE event bus
+
+        Args:
+            redis_client: Optional Redis client (auto-created if not provided)
+        """
+        self.redis_client = redis_client or get_redis_client()
+        self.use_redis = self.redis_client is not None
+        self.instance_id = uuid.uuid4().hex
+
+        self._subscribers: Dict[int, Set[SSESubscription]] = {}
+        self._lock = threading.Lock()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+
+        if not self.use_redis:
+            logger.info("Using in-process SSE event bus (Redis not available)")
+        else:
+            logger.info("Using Redis pub/sub SSE event bus")
+
+    def _get_channel(self, job_id: int) -> str:
+        """Generate Redis channel for job notifications"""
+        return f"{self.CHANNEL_PREFIX}{job_id}"
+
+    def subscribe(self, job_id: int) -> SSESubscription:
+        """
+        Subscribe to notifications for a job
+
+        Must be called from the event loop that will await the subscription.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            SSESubscription (call close() when the stream ends)
+        """
+        subscription = SSESubscription(self, job_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(job_id, set()).add(subscription)
+        if self.use_redis:
+            self._ensure_listener()
+        return subscription
+
+    def _unsubscribe(self, subscription: SSESubscription):
+        """Remove a subscription"""
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.job_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.job_id]
+
+    def subscriber_count(self, job_id: int) -> int:
+        """Number of local subscribers for a job"""
+        with self._lock:
+            return len(self._subscribers.get(job_id, ()))
+
+    def publish(self, job_id: int, event_id: Optional[int] = None):
+        """
+        Notify subscribers that a job has new events
+
+        Safe to call from worker threads (e.g. CrewAI executor callbacks).
+
+        Args:
+            job_id: Job ID
+            event_id: ID of the event that was just stored (informational)
+        """
+        self._notify_local(job_id)
+
+        if not self.use_redis:
+            return
+
+        try:
+            message = json.dumps({'source': self.instance_id, 'event_id': event_id})
+            self.redis_client.publish(self._get_channel(job_id), message)
+        except Exception as e:
+            logger.warning(f"Redis SSE publish failed: {e}, local subscribers only")
+
+    def _notify_local(self, job_id: int):
+        """Wake all local subscribers for a job"""
+        with self._lock:
+            subscribers = list(self._subscribers.get(job_id, ()))
+        for subscription in subscribers:
+            subscription.notify()
+
+    def _ensure_listener(self):
+        """Start the Redis listener thread if it is not running"""
+        with self._lock:
+            if self._listener_thread is not None and self._listener_thread.is_alive():
+                return
+            self._listener_thread = threading.Thread(
+                target=self._listen,
+                name="sse-event-bus-listener",
+                daemon=True
+            )
+            self._listener_thread.start()
+
+    def _listen(self):
+        """
+        Deliver notifications published by other instances to local subscribers
+
+        Polls with get_message(timeout=1.0) rather than blocking in listen():
+        the shared client has a socket timeout, so an idle blocking read would
+        end the thread. Connection errors reconnect after a short pause.
+        """
+        while not self._stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{self.CHANNEL_PREFIX}*")
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message:
+                        self._handle_message(message)
+            except Exception as e:
+                # Streams still work meanwhile: they fall back to keep-alive
+                # timeouts and re-read the event store.
+                logger.warning(f"Redis SSE listener error: {e}, reconnecting")
+                self._stopped.wait(self.RECONNECT_DELAY)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+
+    def _handle_message(self, message: dict):
+        """Wake local subscribers for a notification from another instance"""
+        if message.get('type') != 'pmessage':
+            return
+        try:
+            payload = json.loads(message['data'])
+            if payload.get('source') == self.instance_id:
+                return  # Already delivered locally in publish()
+            channel = message['channel']
+            job_id = int(channel[len(self.CHANNEL_PREFIX):])
+        except (ValueError, TypeError, KeyError):
+            return
+        self._notify_local(job_id)
+
+    def shutdown(self):
+        """Stop the listener thread"""
+        self._stopped.set()
+
+
+# Global SSE event bus instance
+_sse_event_bus_instance: Optional[SSEEventBus] = None
+
+
+def get_sse_event_bus() -> SSEEventBus:
+    """Get global SSE event bus instance"""
+    global _sse_event_bus_instance
+    if _sse_event_bus_instance is None:
+        _sse_event_bus_instance = SSEEventBus()
+    return _sse_event_bus_instance
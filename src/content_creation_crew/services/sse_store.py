@@ -1,39 +1,96 @@
 """
 SSE Event Store - Stores last N SSE events in Redis for replay support
 Falls back to in-memory storage if Redis not available
+
+Event IDs are per-job sequence numbers (1, 2, 3, ...) from an atomic counter,
+and events are indexed by ID so Last-Event-ID replay reads only the missed range.
+
+The in-memory fallback is bounded: a global event/byte budget, the same 24h
+per-job TTL as Redis, and LRU eviction that drops finished jobs first.
 """
+import bisect
 import json
 import logging
+import threading
 import time
-from typing import List, Optional, Dict
+from collections import OrderedDict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
+from ..config import config
+from .metrics import SSEStoreMetrics
 from .redis_cache import get_redis_client
+from .sse_event_bus import get_sse_event_bus
 
 logger = logging.getLogger(__name__)
 
 
+# Events after which a job produces no more events (eligible for LRU eviction first)
+FINAL_EVENT_TYPES = {'complete', 'cancelled', 'tts_completed', 'tts_failed'}
+TERMINAL_JOB_STATUSES = {'completed', 'failed', 'cancelled'}
+
+
+class _MemoryJobLog:
+    """Events for one job in the in-memory store, with size and expiry bookkeeping"""
+    
+    __slots__ = ('ids', 'events', 'sizes', 'bytes', 'expires_at', 'finished')
+    
+    def __init__(self):
+        self.ids: List[int] = []
+        self.events: List[Dict] = []
+        self.sizes: List[int] = []
+        self.bytes = 0
+        self.expires_at = 0.0
+        self.finished = False
+
+
 class SSEEventStore:
     """
     Stores SSE events for job streaming with replay support
     
     Stores last N events per job so clients can reconnect using Last-Event-ID header
+    
+    Redis layout per job:
+    - sse:seq:{job_id}: INCR counter issuing event IDs
+    - sse:eventlog:{job_id}: sorted set of event JSON scored by event ID
     """
     
-    def __init__(self, max_events_per_job: int = 100, redis_client=None):
+    # Per-job expiry (24 hours), for Redis keys and in-memory jobs alike
+    EVENT_TTL_SECONDS = 86400
+    
+    # How often the in-memory store sweeps expired jobs
+    MEMORY_SWEEP_INTERVAL_SECONDS = 60
+    
+    def __init__(
+        self,
+        max_events_per_job: int = 100,
+        redis_client=None,
+        max_memory_events: Optional[int] = None,
+        max_memory_bytes: Optional[int] = None
+    ):
         """
         Initialize SSE event store
         
         Args:
             max_events_per_job: Maximum number of events to store per job (default: 100)
             redis_client: Optional Redis client (auto-created if not provided)
+            max_memory_events: In-memory budget for events across all jobs (default: SSE_MEMORY_MAX_EVENTS)
+            max_memory_bytes: In-memory budget for serialized event bytes (default: SSE_MEMORY_MAX_BYTES)
         """
         self.max_events_per_job = max_events_per_job
         self.redis_client = redis_client or get_redis_client()
         self.use_redis = self.redis_client is not None
         
-        # In-memory fallback
-        self.memory_store: Dict[int, List[Dict]] = {}
+        # In-memory fallback, in least-recently-used order (oldest first)
+        self.max_memory_events = max_memory_events if max_memory_events is not None else config.SSE_MEMORY_MAX_EVENTS
+        self.max_memory_bytes = max_memory_bytes if max_memory_bytes is not None else config.SSE_MEMORY_MAX_BYTES
+        self.memory_store: "OrderedDict[int, _MemoryJobLog]" = OrderedDict()
+        # job_id -> (last issued event ID, expires_at); outlives evicted logs so IDs never repeat
+        self.memory_sequences: Dict[int, Tuple[int, float]] = {}
+        self._memory_events = 0
+        self._memory_bytes = 0
+        self._next_memory_sweep = 0.0
+        self._memory_lock = threading.Lock()
         
         if not self.use_redis:
             logger.info("Using in-memory SSE event store (Redis not available)")
@@ -41,12 +98,12 @@ class SSEEventStore:
             logger.info("Using Redis SSE event store")
     
     def _get_event_key(self, job_id: int) -> str:
-        """Generate Redis key for job events"""
-        return f"sse:events:{job_id}"
+        """Generate Redis key for job events (sorted set scored by event ID)"""
+        return f"sse:eventlog:{job_id}"
     
-    def _get_event_id_key(self, job_id: int, event_id: int) -> str:
-        """Generate Redis key for specific event"""
-        return f"sse:event:{job_id}:{event_id}"
+    def _get_sequence_key(self, job_id: int) -> str:
+        """Generate Redis key for job event ID counter"""
+        return f"sse:seq:{job_id}"
     
     def add_event(self, job_id: int, event_type: str, data: Dict, event_id: Optional[int] = None) -> int:
         """
@@ -56,55 +113,159 @@ class SSEEventStore:
             job_id: Job ID
             event_type: Event type (e.g., 'job_started', 'artifact_ready', 'complete')
             data: Event data dictionary
-            event_id: Optional event ID (auto-generated if not provided)
+            event_id: Optional event ID (next sequence number if not provided)
         
         Returns:
             Event ID
         """
-        if event_id is None:
-            event_id = int(time.time() * 1000)  # Use timestamp as event ID
+        event_id = self._store_event(job_id, event_type, data, event_id)
         
-        event = {
+        # Wake any streams waiting on this job
+        try:
+            get_sse_event_bus().publish(job_id, event_id)
+        except Exception as e:
+            logger.warning(f"SSE event bus publish failed: {e}")
+        
+        return event_id
+    
+    def _build_event(self, event_id: int, event_type: str, data: Dict) -> Dict:
+        """Build stored event dictionary"""
+        return {
             'id': event_id,
             'type': event_type,
             'data': data,
             'timestamp': datetime.utcnow().isoformat()
         }
-        
+    
+    def _store_event(self, job_id: int, event_type: str, data: Dict, event_id: Optional[int]) -> int:
+        """Persist event to Redis (or in-memory fallback)"""
         if not self.use_redis:
-            return self._add_event_memory(job_id, event)
+            return self._add_event_memory(job_id, event_type, data, event_id)
         
         try:
-            # Store event in Redis list (FIFO)
+            if event_id is None:
+                event_id = int(self.redis_client.incr(self._get_sequence_key(job_id)))
+            event = self._build_event(event_id, event_type, data)
             key = self._get_event_key(job_id)
-            event_json = json.dumps(event, default=str)
-            
-            # Add to list
-            self.redis_client.lpush(key, event_json)
             
-            # Trim list to max_events_per_job
-            self.redis_client.ltrim(key, 0, self.max_events_per_job - 1)
-            
-            # Set expiration (24 hours)
-            self.redis_client.expire(key, 86400)
+            pipe = self.redis_client.pipeline(transaction=False)
+            pipe.zadd(key, {json.dumps(event, default=str): event_id})
+            # Keep only the newest max_events_per_job events
+            pipe.zremrangebyrank(key, 0, -(self.max_events_per_job + 1))
+            pipe.expire(key, self.EVENT_TTL_SECONDS)
+            pipe.expire(self._get_sequence_key(job_id), self.EVENT_TTL_SECONDS)
+            pipe.execute()
             
             return event_id
         except Exception as e:
             logger.warning(f"Redis event store failed: {e}, falling back to in-memory")
-            return self._add_event_memory(job_id, event)
+            return self._add_event_memory(job_id, event_type, data, event_id)
     
-    def _add_event_memory(self, job_id: int, event: Dict) -> int:
+    def _add_event_memory(self, job_id: int, event_type: str, data: Dict, event_id: Optional[int] = None) -> int:
         """Add event to in-memory store"""
-        if job_id not in self.memory_store:
-            self.memory_store[job_id] = []
+        now = time.time()
+        expires_at = now + self.EVENT_TTL_SECONDS
+        
+        with self._memory_lock:
+            last_id = self.memory_sequences.get(job_id, (0, 0.0))[0]
+            if event_id is None:
+                event_id = last_id + 1
+            self.memory_sequences[job_id] = (max(last_id, event_id), expires_at)
+            
+            event = self._build_event(event_id, event_type, data)
+            size = len(json.dumps(event, default=str))
+            
+            log = self.memory_store.get(job_id)
+            if log is None:
+                log = _MemoryJobLog()
+                self.memory_store[job_id] = log
+            else:
+                self.memory_store.move_to_end(job_id)
+            
+            # Keep events sorted by ID (explicit IDs may arrive out of order)
+            index = bisect.bisect_right(log.ids, event_id)
+            log.ids.insert(index, event_id)
+            log.events.insert(index, event)
+            log.sizes.insert(index, size)
+            log.bytes += size
+            log.expires_at = expires_at
+            self._memory_events += 1
+            self._memory_bytes += size
+            
+            if event_type in FINAL_EVENT_TYPES or (
+                event_type == 'status_update' and isinstance(data, dict) and data.get('status') in TERMINAL_JOB_STATUSES
+            ):
+                log.finished = True
+            
+            # Trim to max_events_per_job
+            excess = len(log.ids) - self.max_events_per_job
+            if excess > 0:
+                dropped_bytes = sum(log.sizes[:excess])
+                del log.ids[:excess]
+                del log.events[:excess]
+                del log.sizes[:excess]
+                log.bytes -= dropped_bytes
+                self._memory_events -= excess
+                self._memory_bytes -= dropped_bytes
+            
+            self._enforce_memory_limits(now, keep_job_id=job_id)
+            occupancy = (len(self.memory_store), self._memory_events, self._memory_bytes)
+        
+        SSEStoreMetrics.record_occupancy(*occupancy)
+        return event_id
+    
+    def _memory_within_budget(self) -> bool:
+        """Check in-memory occupancy against the global budget"""
+        return self._memory_events <= self.max_memory_events and self._memory_bytes <= self.max_memory_bytes
+    
+    def _evict_job_memory(self, job_id: int, reason: str):
+        """Drop a job's in-memory events (caller holds the lock)"""
+        log = self.memory_store.pop(job_id, None)
+        if log is None:
+            return
+        self._memory_events -= len(log.ids)
+        self._memory_bytes -= log.bytes
+        SSEStoreMetrics.record_eviction(reason, len(log.ids))
+    
+    def _enforce_memory_limits(self, now: float, keep_job_id: Optional[int] = None):
+        """
+        Expire and evict in-memory jobs (caller holds the lock)
         
-        self.memory_store[job_id].append(event)
+        Expired jobs are swept periodically. If the store is still over budget,
+        finished jobs are evicted in LRU order, then active jobs as a last resort.
+        The job currently being written is never evicted.
+        """
+        if now >= self._next_memory_sweep:
+            self._next_memory_sweep = now + self.MEMORY_SWEEP_INTERVAL_SECONDS
+            for job_id in [j for j, log in self.memory_store.items() if log.expires_at <= now]:
+                self._evict_job_memory(job_id, 'ttl')
+            for job_id in [j for j, (_, expires_at) in self.memory_sequences.items() if expires_at <= now]:
+                del self.memory_sequences[job_id]
+        
+        if self._memory_within_budget():
+            return
         
-        # Trim to max_events_per_job
-        if len(self.memory_store[job_id]) > self.max_events_per_job:
-            self.memory_store[job_id] = self.memory_store[job_id][-self.max_events_per_job:]
+        for job_id in [j for j, log in self.memory_store.items() if log.finished and j != keep_job_id]:
+            self._evict_job_memory(job_id, 'lru_finished')
+            if self._memory_within_budget():
+                return
         
-        return event['id']
+        for job_id in [j for j in self.memory_store if j != keep_job_id]:
+            logger.warning(f"In-memory SSE store over budget, evicting events of active job {job_id}")
+            self._evict_job_memory(job_id, 'lru_active')
+            if self._memory_within_budget():
+                return
+    
+    def get_memory_stats(self) -> Dict[str, int]:
+        """Get in-memory store occupancy"""
+        with self._memory_lock:
+            return {
+                'jobs': len(self.memory_store),
+                'events': self._memory_events,
+                'bytes': self._memory_bytes,
+                'max_events': self.max_memory_events,
+                'max_bytes': self.max_memory_bytes,
+            }
     
     def get_events_since(self, job_id: int, last_event_id: Optional[int] = None) -> List[Dict]:
         """
@@ -115,53 +276,52 @@ class SSEEventStore:
             last_event_id: Last event ID received (None for all events)
         
         Returns:
-            List of events since last_event_id
+            List of events since last_event_id, in ID order
         """
         if not self.use_redis:
             return self._get_events_memory(job_id, last_event_id)
         
         try:
             key = self._get_event_key(job_id)
-            events_json = self.redis_client.lrange(key, 0, -1)
-            
-            events = []
-            for event_json in reversed(events_json):  # Reverse to get chronological order
-                event = json.loads(event_json)
-                if last_event_id is None or event['id'] > last_event_id:
-                    events.append(event)
-            
-            return events
+            min_score = f"({last_event_id}" if last_event_id is not None else "-inf"
+            events_json = self.redis_client.zrangebyscore(key, min_score, "+inf")
+            return [json.loads(event_json) for event_json in events_json]
         except Exception as e:
             logger.warning(f"Redis event retrieval failed: {e}, falling back to in-memory")
             return self._get_events_memory(job_id, last_event_id)
     
     def _get_events_memory(self, job_id: int, last_event_id: Optional[int]) -> List[Dict]:
         """Get events from in-memory store"""
-        if job_id not in self.memory_store:
-            return []
-        
-        events = self.memory_store[job_id]
-        
-        if last_event_id is None:
-            return events
-        
-        # Filter events after last_event_id
-        return [e for e in events if e['id'] > last_event_id]
+        with self._memory_lock:
+            log = self.memory_store.get(job_id)
+            if log is None:
+                return []
+            
+            if log.expires_at <= time.time():
+                self._evict_job_memory(job_id, 'ttl')
+                return []
+            self.memory_store.move_to_end(job_id)
+            
+            if last_event_id is None:
+                return list(log.events)
+            
+            # Events are sorted by ID - binary search for the first missed event
+            start = bisect.bisect_right(log.ids, last_event_id)
+            return log.events[start:]
     
     def get_latest_event_id(self, job_id: int) -> Optional[int]:
         """Get the latest event ID for a job"""
         if not self.use_redis:
-            if job_id in self.memory_store and self.memory_store[job_id]:
-                return self.memory_store[job_id][-1]['id']
-            return None
+            with self._memory_lock:
+                log = self.memory_store.get(job_id)
+                return log.ids[-1] if log and log.ids else None
         
         try:
             key = self._get_event_key(job_id)
-            events_json = self.redis_client.lrange(key, 0, 0)  # Get most recent
+            latest = self.redis_client.zrevrange(key, 0, 0, withscores=True)  # Get most recent
             
-            if events_json:
-                event = json.loads(events_json[0])
-                return event['id']
+            if latest:
+                return int(latest[0][1])
             return None
         except Exception as e:
             logger.warning(f"Redis latest event ID failed: {e}")
@@ -170,13 +330,16 @@ class SSEEventStore:
     def clear_events(self, job_id: int):
         """Clear all events for a job"""
         if not self.use_redis:
-            if job_id in self.memory_store:
-                del self.memory_store[job_id]
+            with self._memory_lock:
+                log = self.memory_store.pop(job_id, None)
+                if log is not None:
+                    self._memory_events -= len(log.ids)
+                    self._memory_bytes -= log.bytes
+                self.memory_sequences.pop(job_id, None)
             return
         
         try:
-            key = self._get_event_key(job_id)
-            self.redis_client.delete(key)
+            self.redis_client.delete(self._get_event_key(job_id), self._get_sequence_key(job_id))
         except Exception as e:
             logger.warning(f"Redis clear events failed: {e}")
 
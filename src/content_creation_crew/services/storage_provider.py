@@ -3,17 +3,149 @@ Storage Provider Interface and Implementations
 Abstraction for storing generated files (local filesystem, S3, etc.)
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, BinaryIO, List
+import io
 import logging
 import os
 import shutil
 import asyncio
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
 import hashlib
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Lifetime of presigned S3 URLs, and how long before expiry a cached URL is replaced
+S3_PRESIGNED_URL_TTL = int(os.getenv("S3_PRESIGNED_URL_TTL", "3600"))
+S3_PRESIGNED_URL_REFRESH_MARGIN = int(os.getenv("S3_PRESIGNED_URL_REFRESH_MARGIN", "300"))
+# S3 connection pool size, and multipart upload settings (part uploads run concurrently)
+S3_MAX_POOL_CONNECTIONS = int(os.getenv("S3_MAX_POOL_CONNECTIONS", "50"))
+S3_MULTIPART_THRESHOLD_MB = int(os.getenv("S3_MULTIPART_THRESHOLD_MB", "8"))
+S3_MULTIPART_CHUNKSIZE_MB = int(os.getenv("S3_MULTIPART_CHUNKSIZE_MB", "8"))
+S3_MAX_CONCURRENCY = int(os.getenv("S3_MAX_CONCURRENCY", "10"))
+# Threads for storage I/O awaited by async code (kept off the default executor)
+STORAGE_IO_WORKERS = int(os.getenv("STORAGE_IO_WORKERS", "16"))
+# Maximum keys per S3 DeleteObjects request
+S3_DELETE_BATCH_SIZE = 1000
+
+
+class PresignedURLCache:
+    """Bounded cache of presigned URLs, reused until shortly before they expire"""
+    
+    def __init__(self, max_entries: int = 10000, refresh_margin: int = S3_PRESIGNED_URL_REFRESH_MARGIN):
+        """
+        Initialize presigned URL cache
+        
+        Args:
+            max_entries: Maximum cached URLs (least recently used are dropped)
+            refresh_margin: Seconds before expiry at which a cached URL is no longer served
+        """
+        self.max_entries = max(1, max_entries)
+        self.refresh_margin = refresh_margin
+        self._urls: "OrderedDict[Tuple[str, str], Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, bucket: str, key: str) -> Optional[Tuple[str, float]]:
+        """Get a cached (url, expires_at) that is still fresh, or None"""
+        with self._lock:
+            entry = self._urls.get((bucket, key))
+            if entry is None:
+                return None
+            if entry[1] - time.time() <= self.refresh_margin:
+                del self._urls[(bucket, key)]
+                return None
+            self._urls.move_to_end((bucket, key))
+            return entry
+    
+    def put(self, bucket: str, key: str, url: str, expires_at: float):
+        """Cache a presigned URL until expires_at (epoch seconds)"""
+        with self._lock:
+            self._urls[(bucket, key)] = (url, expires_at)
+            self._urls.move_to_end((bucket, key))
+            while len(self._urls) > self.max_entries:
+                self._urls.popitem(last=False)
+    
+    def discard(self, bucket: str, key: str):
+        """Drop a cached URL (e.g. after the object is deleted)"""
+        with self._lock:
+            self._urls.pop((bucket, key), None)
+
+
+# Shared across provider instances, since get_storage_provider() builds a new one per call
+_presigned_url_cache = PresignedURLCache()
+
+
+# Global storage I/O executor
+_storage_executor = None
+_storage_executor_lock = threading.Lock()
+
+
+def get_storage_executor():
+    """Get global storage I/O thread pool (STORAGE_IO_WORKERS threads)"""
+    global _storage_executor
+    if _storage_executor is None:
+        with _storage_executor_lock:
+            if _storage_executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+                _storage_executor = ThreadPoolExecutor(
+                    max_workers=max(1, STORAGE_IO_WORKERS),
+                    thread_name_prefix="storage-io"
+                )
+    return _storage_executor
+
+
+async def run_storage_io(func, *args, **kwargs):
+    """
+    Run a blocking storage call on the storage I/O pool
+    
+    Uploads and downloads can take seconds; running them here keeps them from
+    starving the default executor used for everything else.
+    """
+    import functools
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_storage_executor(), functools.partial(func, *args, **kwargs))
+
+
+def shutdown_storage_executor():
+    """Stop the global storage I/O pool (called on application shutdown)"""
+    global _storage_executor
+    with _storage_executor_lock:
+        if _storage_executor is not None:
+            _storage_executor.shutdown(wait=False)
+            _storage_executor = None
+
+
+# boto3 clients are thread-safe and hold the connection pool, so they are shared
+_s3_clients: Dict[Tuple, Any] = {}
+_s3_clients_lock = threading.Lock()
+
+
+def _get_s3_client(aws_access_key_id: Optional[str], aws_secret_access_key: Optional[str], endpoint_url: Optional[str], region: str):
+    """Get a shared boto3 S3 client with a tuned connection pool"""
+    client_key = (aws_access_key_id, aws_secret_access_key, endpoint_url, region)
+    with _s3_clients_lock:
+        client = _s3_clients.get(client_key)
+        if client is None:
+            import boto3
+            from botocore.config import Config
+            client = boto3.client(
+                's3',
+                aws_access_key_id=aws_access_key_id,
+                aws_secret_access_key=aws_secret_access_key,
+                endpoint_url=endpoint_url,
+                region_name=region,
+                config=Config(
+                    max_pool_connections=S3_MAX_POOL_CONNECTIONS,
+                    retries={'max_attempts': 5, 'mode': 'adaptive'},
+                    tcp_keepalive=True
+                )
+            )
+            _s3_clients[client_key] = client
+        return client
+
 
 class StorageProvider(ABC):
     """Abstract base class for storage providers"""
@@ -33,6 +165,87 @@ class StorageProvider(ABC):
         """
         pass
     
+    def put_file(
+        self,
+        key: str,
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        move: bool = False
+    ) -> str:
+        """
+        Store a local file and return storage URL/path
+        
+        Args:
+            key: Storage key/path
+            file_path: Path of the local file to store
+            content_type: MIME type
+            move: Hand the file over to storage; it may be renamed into place
+                instead of copied, and is removed afterwards either way
+        
+        Returns:
+            Storage URL or path
+        """
+        with open(file_path, 'rb') as f:
+            result = self.put_stream(key, f, content_type=content_type)
+        if move:
+            os.unlink(file_path)
+        return result
+    
+    def put_stream(self, key: str, stream: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        """
+        Store the contents of a readable binary stream and return storage URL/path
+        
+        Providers override this to write or upload the stream in chunks; the
+        default reads it fully and calls put().
+        
+        Args:
+            key: Storage key/path
+            stream: File-like object opened for binary reading
+            content_type: MIME type
+        
+        Returns:
+            Storage URL or path
+        """
+        return self.put(key, stream.read(), content_type=content_type)
+    
+    def open_read(self, key: str) -> Optional[BinaryIO]:
+        """
+        Open a stored object for streaming reads
+        
+        Providers override this to avoid loading the object into memory; the
+        default wraps get(). Callers must close the returned stream.
+        
+        Args:
+            key: Storage key/path
+        
+        Returns:
+            Binary file-like object or None if not found
+        """
+        data = self.get(key)
+        if data is None:
+            return None
+        return io.BytesIO(data)
+    
+    def copy(self, source_key: str, dest_key: str, content_type: str = "application/octet-stream") -> str:
+        """
+        Copy a stored object to a new key
+        
+        Args:
+            source_key: Existing storage key
+            dest_key: Storage key to copy to
+            content_type: MIME type
+        
+        Returns:
+            Storage URL or path of the copy
+        
+        Raises:
+            FileNotFoundError: If source_key does not exist
+        """
+        data = self.get(source_key)
+        if data is None:
+            raise FileNotFoundError(f"Storage object not found: {source_key}")
+        return self.put(dest_key, data, content_type=content_type)
+    
     @abstractmethod
     def get(self, key: str) -> Optional[bytes]:
         """
@@ -59,6 +272,43 @@ class StorageProvider(ABC):
         """
         pass
     
+    def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Delete several objects
+        
+        Providers with a batch delete API override this; the default deletes
+        one key at a time.
+        
+        Args:
+            keys: Storage keys/paths
+        
+        Returns:
+            Dict of key -> True if deleted, False if not found or failed
+        """
+        results = {}
+        for key in keys:
+            try:
+                results[key] = self.delete(key)
+            except Exception as e:
+                logger.warning(f"Failed to delete {key}: {e}")
+                results[key] = False
+        return results
+    
+    def list_objects(self, prefix: str) -> List[Dict[str, Any]]:
+        """
+        List stored objects under a key prefix
+        
+        Args:
+            prefix: Key prefix (e.g., 'tts_cache/')
+        
+        Returns:
+            List of dicts with key, size (bytes) and last_modified (Unix timestamp)
+        
+        Raises:
+            NotImplementedError: If the provider cannot list objects
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support listing objects")
+    
     @abstractmethod
     def get_url(self, key: str) -> str:
         """
@@ -72,6 +322,40 @@ class StorageProvider(ABC):
         """
         pass
     
+    async def aput(self, key: str, data: bytes, content_type: str = "application/octet-stream") -> str:
+        """Async put() on the storage I/O pool"""
+        return await run_storage_io(self.put, key, data, content_type=content_type)
+    
+    async def aput_file(
+        self,
+        key: str,
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        move: bool = False
+    ) -> str:
+        """Async put_file() on the storage I/O pool"""
+        return await run_storage_io(self.put_file, key, file_path, content_type=content_type, move=move)
+    
+    async def aget(self, key: str) -> Optional[bytes]:
+        """Async get() on the storage I/O pool"""
+        return await run_storage_io(self.get, key)
+    
+    async def adelete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Async delete_many() on the storage I/O pool"""
+        return await run_storage_io(self.delete_many, keys)
+    
+    def local_path(self, key: str) -> Optional[Path]:
+        """
+        Filesystem path of a stored object, for serving it without reading it into memory
+        
+        Args:
+            key: Storage key/path
+        
+        Returns:
+            Path of an existing local file, or None (missing, or storage is not local)
+        """
+        return None
+    
     async def check_health(self, write_test: bool = True, min_free_space_mb: int = 1024) -> Dict[str, Any]:
         """
         Check storage health (M5)
@@ -99,9 +383,17 @@ class StorageProvider(ABC):
         }
 
 
+# Process umask, read once at import (os.umask can only be read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
 class LocalDiskStorageProvider(StorageProvider):
     """Local filesystem storage provider (default for dev)"""
     
+    # Buffer size for chunked stream writes
+    STREAM_CHUNK_SIZE = 1024 * 1024
+    
     def __init__(self, base_path: Optional[str] = None):
         """
         Initialize local disk storage
@@ -134,6 +426,84 @@ class LocalDiskStorageProvider(StorageProvider):
         logger.debug(f"Stored {len(data)} bytes to {file_path}")
         return str(file_path.relative_to(self.base_path))
     
+    def _path_for_key(self, key: str) -> Path:
+        """Filesystem path of a storage key (same sanitization as put())"""
+        safe_key = key.lstrip('/').replace('..', '').replace('/', os.sep)
+        return self.base_path / safe_key
+    
+    @staticmethod
+    def _set_default_mode(path: Path) -> None:
+        """Give a file the mode put() would create it with (mkstemp and moved temp files are 0600)"""
+        os.chmod(path, 0o666 & ~_UMASK)
+    
+    def put_file(
+        self,
+        key: str,
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        move: bool = False
+    ) -> str:
+        """Store a local file without loading it into memory (renamed into place when move=True)"""
+        target_path = self._path_for_key(key)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        if move:
+            # A rename on the same filesystem, copy and delete across filesystems
+            shutil.move(file_path, target_path)
+            self._set_default_mode(target_path)
+        else:
+            shutil.copyfile(file_path, target_path)
+        
+        logger.debug(f"Stored {target_path.stat().st_size} bytes to {target_path}")
+        return str(target_path.relative_to(self.base_path))
+    
+    def put_stream(self, key: str, stream: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        """Write a stream to local filesystem in chunks"""
+        import tempfile
+        
+        target_path = self._path_for_key(key)
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write next to the target and rename, so readers never see a partial file
+        fd, temp_path = tempfile.mkstemp(dir=target_path.parent, prefix=f".{target_path.name}.")
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                shutil.copyfileobj(stream, f, self.STREAM_CHUNK_SIZE)
+            self._set_default_mode(Path(temp_path))
+            os.replace(temp_path, target_path)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+        
+        logger.debug(f"Stored {target_path.stat().st_size} bytes to {target_path}")
+        return str(target_path.relative_to(self.base_path))
+    
+    def local_path(self, key: str) -> Optional[Path]:
+        """Filesystem path of a stored file inside the storage directory"""
+        file_path = self._path_for_key(key).resolve()
+        if not file_path.is_relative_to(self.base_path.resolve()) or not file_path.is_file():
+            return None
+        return file_path
+    
+    def open_read(self, key: str) -> Optional[BinaryIO]:
+        """Open a local file for streaming reads"""
+        file_path = self._path_for_key(key)
+        try:
+            return open(file_path, 'rb')
+        except FileNotFoundError:
+            return None
+    
+    def copy(self, source_key: str, dest_key: str, content_type: str = "application/octet-stream") -> str:
+        """Copy a stored file to a new key"""
+        safe_key = source_key.lstrip('/').replace('..', '').replace('/', os.sep)
+        source_path = self.base_path / safe_key
+        if not source_path.exists():
+            raise FileNotFoundError(f"Storage object not found: {source_key}")
+        return self.put_file(dest_key, str(source_path), content_type=content_type)
+    
     def get(self, key: str) -> Optional[bytes]:
         """Retrieve data from local filesystem"""
         safe_key = key.lstrip('/').replace('..', '').replace('/', os.sep)
@@ -165,6 +535,22 @@ class LocalDiskStorageProvider(StorageProvider):
             logger.error(f"Error deleting file {file_path}: {e}")
             return False
     
+    def list_objects(self, prefix: str) -> List[Dict[str, Any]]:
+        """List files under a key prefix"""
+        directory = self._path_for_key(prefix.rsplit('/', 1)[0]) if '/' in prefix else self.base_path
+        if not directory.is_dir():
+            return []
+        
+        objects = []
+        for file_path in directory.rglob('*'):
+            key = file_path.relative_to(self.base_path).as_posix()
+            # Skip partial writes from put_stream()
+            if not file_path.is_file() or file_path.name.startswith('.') or not key.startswith(prefix):
+                continue
+            stat = file_path.stat()
+            objects.append({'key': key, 'size': stat.st_size, 'last_modified': stat.st_mtime})
+        return objects
+    
     def get_url(self, key: str) -> str:
         """Get local file URL (returns path that matches Next.js API proxy route)"""
         # Use Next.js API proxy route /api/storage/* which proxies to backend /v1/storage/*
@@ -296,16 +682,23 @@ class S3StorageProvider(StorageProvider):
         """
         self.bucket_name = bucket_name
         self.region = region
+        self._transfer_config = None
         
         # Import boto3 (optional dependency)
         try:
-            import boto3
-            self.s3_client = boto3.client(
-                's3',
-                aws_access_key_id=aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
-                aws_secret_access_key=aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
-                endpoint_url=endpoint_url or os.getenv("S3_ENDPOINT_URL"),
-                region_name=region
+            from boto3.s3.transfer import TransferConfig
+            self.s3_client = _get_s3_client(
+                aws_access_key_id or os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key or os.getenv("AWS_SECRET_ACCESS_KEY"),
+                endpoint_url or os.getenv("S3_ENDPOINT_URL"),
+                region
+            )
+            # Multipart above the threshold, with parts uploaded concurrently
+            self._transfer_config = TransferConfig(
+                multipart_threshold=S3_MULTIPART_THRESHOLD_MB * 1024 * 1024,
+                multipart_chunksize=S3_MULTIPART_CHUNKSIZE_MB * 1024 * 1024,
+                max_concurrency=S3_MAX_CONCURRENCY,
+                use_threads=True
             )
             self._available = True
         except ImportError:
@@ -320,6 +713,10 @@ class S3StorageProvider(StorageProvider):
         if not self._available:
             raise RuntimeError("S3StorageProvider not available")
         
+        if len(data) >= S3_MULTIPART_THRESHOLD_MB * 1024 * 1024:
+            # Large payloads go through the transfer manager for concurrent multipart upload
+            return self.put_stream(key, io.BytesIO(data), content_type=content_type)
+        
         self.s3_client.put_object(
             Bucket=self.bucket_name,
             Key=key,
@@ -329,6 +726,62 @@ class S3StorageProvider(StorageProvider):
         
         return key
     
+    def put_file(
+        self,
+        key: str,
+        file_path: str,
+        content_type: str = "application/octet-stream",
+        move: bool = False
+    ) -> str:
+        """Upload a local file to S3 (streamed, concurrent multipart upload above S3_MULTIPART_THRESHOLD_MB)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        self.s3_client.upload_file(
+            file_path,
+            self.bucket_name,
+            key,
+            ExtraArgs={'ContentType': content_type},
+            Config=self._transfer_config
+        )
+        
+        if move:
+            os.unlink(file_path)
+        return key
+    
+    def put_stream(self, key: str, stream: BinaryIO, content_type: str = "application/octet-stream") -> str:
+        """Upload a stream to S3 in parts (concurrent multipart upload above S3_MULTIPART_THRESHOLD_MB)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        self.s3_client.upload_fileobj(
+            stream,
+            self.bucket_name,
+            key,
+            ExtraArgs={'ContentType': content_type},
+            Config=self._transfer_config
+        )
+        
+        return key
+    
+    def copy(self, source_key: str, dest_key: str, content_type: str = "application/octet-stream") -> str:
+        """Copy an object within the bucket (server-side, no download)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        try:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                Key=dest_key,
+                CopySource={'Bucket': self.bucket_name, 'Key': source_key},
+                ContentType=content_type,
+                MetadataDirective='REPLACE'
+            )
+        except self.s3_client.exceptions.NoSuchKey:
+            raise FileNotFoundError(f"Storage object not found: {source_key}")
+        
+        return dest_key
+    
     def get(self, key: str) -> Optional[bytes]:
         """Retrieve data from S3"""
         if not self._available:
@@ -340,27 +793,115 @@ class S3StorageProvider(StorageProvider):
         except self.s3_client.exceptions.NoSuchKey:
             return None
     
+    def open_read(self, key: str) -> Optional[BinaryIO]:
+        """Open an S3 object for streaming reads (the response body is read on demand)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        try:
+            response = self.s3_client.get_object(Bucket=self.bucket_name, Key=key)
+            return response['Body']
+        except self.s3_client.exceptions.NoSuchKey:
+            return None
+    
     def delete(self, key: str) -> bool:
         """Delete object from S3"""
         if not self._available:
             raise RuntimeError("S3StorageProvider not available")
         
+        _presigned_url_cache.discard(self.bucket_name, key)
         try:
             self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
             return True
         except Exception:
             return False
     
+    def delete_many(self, keys: List[str]) -> Dict[str, bool]:
+        """Delete objects with batched DeleteObjects requests (up to 1000 keys each)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        results = {}
+        for start in range(0, len(keys), S3_DELETE_BATCH_SIZE):
+            batch = keys[start:start + S3_DELETE_BATCH_SIZE]
+            for key in batch:
+                _presigned_url_cache.discard(self.bucket_name, key)
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            except Exception as e:
+                logger.warning(f"S3 batch delete of {len(batch)} objects failed: {e}")
+                results.update((key, False) for key in batch)
+                continue
+            
+            # Quiet mode only reports failures
+            failed = {error['Key'] for error in response.get('Errors', [])}
+            for error in response.get('Errors', []):
+                logger.warning(f"Failed to delete {error['Key']}: {error.get('Code')} {error.get('Message')}")
+            results.update((key, key not in failed) for key in batch)
+        return results
+    
+    def list_objects(self, prefix: str) -> List[Dict[str, Any]]:
+        """List objects under a key prefix (paginated ListObjectsV2)"""
+        if not self._available:
+            raise RuntimeError("S3StorageProvider not available")
+        
+        objects = []
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for item in page.get('Contents', []):
+                objects.append({
+                    'key': item['Key'],
+                    'size': item['Size'],
+                    'last_modified': item['LastModified'].timestamp()
+                })
+        return objects
+    
     def get_url(self, key: str) -> str:
         """Get public S3 URL"""
+        return self.get_presigned_url(key)[0]
+    
+    def get_presigned_url(self, key: str, require_exists: bool = False) -> Tuple[str, float]:
+        """
+        Get a presigned GET URL, reusing a cached one until shortly before it expires
+        
+        Args:
+            key: Storage key/path
+            require_exists: Check the object exists (HEAD) before signing a new URL;
+                cached URLs are dropped when the object is deleted through this provider
+        
+        Returns:
+            Tuple of (url, expires_at epoch seconds)
+        
+        Raises:
+            FileNotFoundError: If require_exists and the object does not exist
+        """
         if not self._available:
             raise RuntimeError("S3StorageProvider not available")
         
-        return self.s3_client.generate_presigned_url(
+        cached = _presigned_url_cache.get(self.bucket_name, key)
+        if cached is not None:
+            return cached
+        
+        if require_exists:
+            from botocore.exceptions import ClientError
+            try:
+                self.s3_client.head_object(Bucket=self.bucket_name, Key=key)
+            except ClientError as e:
+                if e.response.get('Error', {}).get('Code') in ('404', 'NoSuchKey', 'NotFound'):
+                    raise FileNotFoundError(f"Storage object not found: {key}")
+                raise
+        
+        expires_at = time.time() + S3_PRESIGNED_URL_TTL
+        url = self.s3_client.generate_presigned_url(
             'get_object',
             Params={'Bucket': self.bucket_name, 'Key': key},
-            ExpiresIn=3600  # 1 hour
+            ExpiresIn=S3_PRESIGNED_URL_TTL
         )
+        _presigned_url_cache.put(self.bucket_name, key, url, expires_at)
+        return url, expires_at
     
     async def check_health(self, write_test: bool = True, min_free_space_mb: int = 1024) -> Dict[str, Any]:
         """
@@ -0,0 +1,382 @@
+"""
+Token Blacklist - Revocation of access tokens
+
+Revoked token IDs (jti) live in Redis as blacklist:token:{jti} with a TTL equal
+to the token's remaining lifetime, and user-wide revocations (everything issued
+before a timestamp) as blacklist:user:{user_id}.
+
+Almost every token checked on a request is not revoked, so each process keeps a
+Bloom filter of revoked jtis: a negative answer needs no network round trip and
+only filter hits are confirmed in Redis. The filter is updated through pub/sub
+when any instance revokes a token and rebuilt from the blacklist:tokens sorted
+set every TOKEN_REVOCATION_REFRESH_SECONDS (dropping expired entries and
+covering messages missed while disconnected). User revoke-before timestamps are
+cached for TOKEN_REVOCATION_USER_CACHE_TTL and pushed over the same channel.
+
+Without Redis, revocations are kept in process memory.
+"""
+import calendar
+import hashlib
+import json
+import logging
+import math
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Dict, Optional, Tuple, Union
+
+from .metrics import TokenRevocationMetrics
+from .redis_cache import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter of strings (false positives possible, false negatives not)"""
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        """
+        Initialize Bloom filter
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false positive rate at capacity
+        """
+        self.capacity = max(1, capacity)
+        self.num_bits = max(64, int(math.ceil(-self.capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / self.capacity * math.log(2))))
+        self.count = 0
+        self._bits = bytearray((self.num_bits + 7) // 8)
+    
+    def _positions(self, item: str):
+        """Bit positions of an item (double hashing over one digest)"""
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, item: str):
+        """Add an item"""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenBlacklist:
+    """Revoked access tokens with a local Bloom filter in front of Redis"""
+    
+    TOKEN_KEY_PREFIX = "blacklist:token:"
+    USER_KEY_PREFIX = "blacklist:user:"
+    REVOKED_SET_KEY = "blacklist:tokens"  # Sorted set jti -> expiry, used to rebuild filters
+    CHANNEL = "blacklist:events"
+    MAX_USER_CACHE_ENTRIES = 100000
+    
+    def __init__(
+        self,
+        redis_client=None,
+        bloom_capacity: int = 100000,
+        bloom_error_rate: float = 0.001,
+        refresh_seconds: int = 60,
+        user_cache_ttl: int = 30
+    ):
+        """
+        Initialize token blacklist
+        
+        Args:
+            redis_client: Optional Redis client (auto-created if not provided)
+            bloom_capacity: Revoked tokens the filter is sized for (grows on rebuild)
+            bloom_error_rate: Filter false positive rate at capacity
+            refresh_seconds: Interval between full filter rebuilds from Redis
+            user_cache_ttl: Seconds a user's revoke-before timestamp is cached
+        """
+        self.redis_client = redis_client or get_redis_client()
+        self.use_redis = self.redis_client is not None
+        self.bloom_capacity = bloom_capacity
+        self.bloom_error_rate = bloom_error_rate
+        self.refresh_seconds = refresh_seconds
+        self.user_cache_ttl = user_cache_ttl
+        self.instance_id = uuid.uuid4().hex
+        
+        self._bloom = BloomFilter(bloom_capacity, bloom_error_rate)
+        self._memory_tokens: Dict[str, float] = {}  # jti -> expires_at (without Redis, or if a Redis write failed)
+        self._memory_users: Dict[int, Tuple[int, float]] = {}  # user_id -> (revoked_before, expires_at) without Redis
+        self._user_cache: Dict[int, Tuple[Optional[int], float]] = {}  # user_id -> (revoked_before, cached_until)
+        self._lock = threading.Lock()
+        self._listener_thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        
+        if self.use_redis:
+            self.reload()
+            self._ensure_listener()
+            logger.info("Using Redis token blacklist with local Bloom filter")
+        else:
+            logger.info("Using in-memory token blacklist (Redis not available)")
+    
+    # ------------------------------------------------------------------
+    # Individual tokens
+    # ------------------------------------------------------------------
+    
+    def revoke(self, jti: str, expires_in: int):
+        """
+        Revoke a single token
+        
+        Args:
+            jti: Token ID (jti claim)
+            expires_in: Seconds until the token expires (the entry is kept that long)
+        """
+        if not jti:
+            return
+        expires_in = max(1, int(expires_in))
+        expires_at = time.time() + expires_in
+        self._bloom.add(jti)
+        
+        if self.use_redis:
+            try:
+                pipe = self.redis_client.pipeline()
+                pipe.setex(f"{self.TOKEN_KEY_PREFIX}{jti}", expires_in, "1")
+                pipe.zadd(self.REVOKED_SET_KEY, {jti: expires_at})
+                pipe.publish(self.CHANNEL, json.dumps({'type': 'token', 'jti': jti, 'source': self.instance_id}))
+                pipe.execute()
+                TokenRevocationMetrics.record_revocation("token")
+                return
+            except Exception as e:
+                logger.warning(f"Redis token revocation failed: {e}, revoking on this instance only")
+        
+        with self._lock:
+            self._memory_tokens[jti] = expires_at
+        if not self.use_redis and self._bloom.count > self._bloom.capacity:
+            self.reload()
+        TokenRevocationMetrics.record_revocation("token")
+    
+    def is_revoked(self, jti: str) -> bool:
+        """
+        Check whether a token has been revoked
+        
+        Filter misses (the common case) are answered locally; hits are
+        confirmed in Redis since they may be false positives.
+        """
+        if not jti or jti not in self._bloom:
+            TokenRevocationMetrics.record_lookup("filter_miss")
+            return False
+        
+        with self._lock:
+            expires_at = self._memory_tokens.get(jti)
+        if expires_at is not None and expires_at > time.time():
+            TokenRevocationMetrics.record_lookup("revoked")
+            return True
+        
+        if not self.use_redis:
+            TokenRevocationMetrics.record_lookup("false_positive")
+            return False
+        
+        try:
+            revoked = bool(self.redis_client.exists(f"{self.TOKEN_KEY_PREFIX}{jti}"))
+        except Exception as e:
+            # A filter hit is almost always a real revocation; fail closed
+            logger.warning(f"Redis token revocation lookup failed: {e}, treating filter hit as revoked")
+            return True
+        TokenRevocationMetrics.record_lookup("revoked" if revoked else "false_positive")
+        return revoked
+    
+    # ------------------------------------------------------------------
+    # User-wide revocation (password change, account deletion)
+    # ------------------------------------------------------------------
+    
+    def revoke_all_user_tokens(self, user_id: int, ttl: Optional[int] = None):
+        """
+        Revoke every token issued to a user up to now
+        
+        Args:
+            user_id: User ID
+            ttl: Seconds to keep the revocation (default: access token lifetime)
+        """
+        if ttl is None:
+            from ..auth import ACCESS_TOKEN_EXPIRE_MINUTES
+            ttl = ACCESS_TOKEN_EXPIRE_MINUTES * 60
+        revoked_before = int(time.time())
+        self._cache_user(user_id, revoked_before)
+        
+        if self.use_redis:
+            try:
+                pipe = self.redis_client.pipeline()
+                pipe.setex(f"{self.USER_KEY_PREFIX}{user_id}", ttl, str(revoked_before))
+                pipe.publish(self.CHANNEL, json.dumps({
+                    'type': 'user',
+                    'user_id': user_id,
+                    'revoked_before': revoked_before,
+                    'source': self.instance_id
+                }))
+                pipe.execute()
+            except Exception as e:
+                logger.warning(f"Redis user token revocation failed: {e}")
+        else:
+            with self._lock:
+                self._memory_users[user_id] = (revoked_before, time.time() + ttl)
+        TokenRevocationMetrics.record_revocation("user")
+    
+    def is_user_revoked(self, user_id: int, issued_at: Union[datetime, int, float]) -> bool:
+        """
+        Check whether a token was issued before its user's last revocation
+        
+        Args:
+            user_id: User ID
+            issued_at: Token iat (epoch seconds, or a naive UTC datetime)
+        """
+        if isinstance(issued_at, datetime):
+            issued_at = calendar.timegm(issued_at.utctimetuple())
+        revoked_before = self._get_user_revoked_before(user_id)
+        return revoked_before is not None and issued_at < revoked_before
+    
+    def _cache_user(self, user_id: int, revoked_before: Optional[int]):
+        """Cache a user's revoke-before timestamp (None = not revoked)"""
+        now = time.monotonic()
+        with self._lock:
+            if len(self._user_cache) >= self.MAX_USER_CACHE_ENTRIES:
+                self._user_cache = {key: value for key, value in self._user_cache.items() if value[1] > now}
+                if len(self._user_cache) >= self.MAX_USER_CACHE_ENTRIES:
+                    self._user_cache.clear()
+            self._user_cache[user_id] = (revoked_before, now + self.user_cache_ttl)
+    
+    def _get_user_revoked_before(self, user_id: int) -> Optional[int]:
+        """User's revoke-before timestamp (cached, then Redis or memory)"""
+        with self._lock:
+            cached = self._user_cache.get(user_id)
+        if cached is not None and cached[1] > time.monotonic():
+            return cached[0]
+        
+        revoked_before = None
+        if self.use_redis:
+            try:
+                value = self.redis_client.get(f"{self.USER_KEY_PREFIX}{user_id}")
+                revoked_before = int(value) if value else None
+            except Exception as e:
+                logger.warning(f"Redis user revocation lookup failed: {e}")
+                return None
+        else:
+            with self._lock:
+                entry = self._memory_users.get(user_id)
+            if entry is not None and entry[1] > time.time():
+                revoked_before = entry[0]
+        
+        self._cache_user(user_id, revoked_before)
+        return revoked_before
+    
+    # ------------------------------------------------------------------
+    # Filter maintenance
+    # ------------------------------------------------------------------
+    
+    def reload(self):
+        """Rebuild the Bloom filter from unexpired revocations (Redis and memory)"""
+        now = time.time()
+        jtis = []
+        if self.use_redis:
+            try:
+                pipe = self.redis_client.pipeline()
+                pipe.zremrangebyscore(self.REVOKED_SET_KEY, "-inf", now)
+                pipe.zrangebyscore(self.REVOKED_SET_KEY, now, "+inf")
+                jtis = pipe.execute()[1]
+            except Exception as e:
+                logger.warning(f"Failed to load revoked tokens from Redis: {e}, keeping current filter")
+                return
+        
+        with self._lock:
+            self._memory_tokens = {jti: expires_at for jti, expires_at in self._memory_tokens.items() if expires_at > now}
+            jtis = list(jtis) + list(self._memory_tokens)
+        
+        bloom = BloomFilter(max(self.bloom_capacity, 2 * len(jtis)), self.bloom_error_rate)
+        for jti in jtis:
+            bloom.add(jti)
+        self._bloom = bloom
+        TokenRevocationMetrics.record_filter_size(bloom.count)
+    
+    def _apply_event(self, data: str):
+        """Apply a revocation published by any instance"""
+        try:
+            event = json.loads(data)
+            if event.get('type') == 'token' and event.get('jti'):
+                self._bloom.add(event['jti'])
+            elif event.get('type') == 'user':
+                self._cache_user(int(event['user_id']), int(event['revoked_before']))
+        except (ValueError, TypeError, KeyError) as e:
+            logger.debug(f"Ignoring malformed revocation event: {e}")
+    
+    def _ensure_listener(self):
+        """Start the pub/sub listener thread if it is not running"""
+        with self._lock:
+            if self._listener_thread is not None and self._listener_thread.is_alive():
+                return
+            self._listener_thread = threading.Thread(
+                target=self._listen,
+                name="token-blacklist-listener",
+                daemon=True
+            )
+            self._listener_thread.start()
+    
+    def _listen(self):
+        """Apply revocation events and rebuild the filter periodically, reconnecting on errors"""
+        while not self._stopped.is_set():
+            pubsub = None
+            try:
+                pubsub = self.redis_client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.CHANNEL)
+                # Catch up on revocations published before (re)subscribing
+                self.reload()
+                next_reload = time.monotonic() + self.refresh_seconds
+                while not self._stopped.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get('type') == 'message':
+                        self._apply_event(message['data'])
+                    if time.monotonic() >= next_reload:
+                        self.reload()
+                        next_reload = time.monotonic() + self.refresh_seconds
+            except Exception as e:
+                logger.warning(f"Token blacklist listener error: {e}, reconnecting")
+                self._stopped.wait(5)
+            finally:
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+    
+    def shutdown(self):
+        """Stop the listener thread"""
+        self._stopped.set()
+
+
+# Global token blacklist instance
+_token_blacklist_instance: Optional[TokenBlacklist] = None
+_token_blacklist_lock = threading.Lock()
+
+
+def get_token_blacklist() -> TokenBlacklist:
+    """Get global token blacklist instance"""
+    global _token_blacklist_instance
+    if _token_blacklist_instance is None:
+        with _token_blacklist_lock:
+            if _token_blacklist_instance is None:
+                from ..config import config
+                _token_blacklist_instance = TokenBlacklist(
+                    bloom_capacity=config.TOKEN_REVOCATION_BLOOM_CAPACITY,
+                    bloom_error_rate=config.TOKEN_REVOCATION_BLOOM_ERROR_RATE,
+                    refresh_seconds=config.TOKEN_REVOCATION_REFRESH_SECONDS,
+                    user_cache_ttl=config.TOKEN_REVOCATION_USER_CACHE_TTL
+                )
+    return _token_blacklist_instance
+
+
+# Alias used by the security regression tests
+get_token_blacklist_service = get_token_blacklist
+
+
+def shutdown_token_blacklist():
+    """Stop the global blacklist's listener (called on application shutdown)"""
+    global _token_blacklist_instance
+    with _token_blacklist_lock:
+        if _token_blacklist_instance is not None:
+            _token_blacklist_instance.shutdown()
+            _token_blacklist_instance = None
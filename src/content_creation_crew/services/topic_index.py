@@ -0,0 +1,238 @@
+"""
+Topic Index - Near-duplicate topic lookup for the content cache
+
+Cache keys only lowercase and strip the topic, so "Benefits of remote work" and
+"the benefits of remote working" miss each other. This index normalizes topics
+(punctuation, stopwords, light stemming) into word shingles, finds candidates with
+MinHash LSH, and confirms them by exact Jaccard similarity against a threshold.
+Matches resolve to the original cached topic, so any cache backend can serve them.
+
+The index itself is per process, even with the Redis cache backend: a process only
+matches topics it cached since it started, so near-duplicate hits across workers are
+best effort and the index starts empty after a restart.
+"""
+import hashlib
+import logging
+import random
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+STOPWORDS = frozenset("""
+a an and are as at be by for from how in into is it its of on or that the this
+to what when where which who why will with about your you our we vs versus
+""".split())
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def stem(word: str) -> str:
+    """
+    Light suffix stemmer (plurals, -ing/-ed, -ly, trailing e)
+    
+    Not a full Porter stemmer, but enough for topic variants like
+    "work"/"working"/"works" and "make"/"making" to share a stem.
+    """
+    if word.endswith('sses'):
+        word = word[:-2]
+    elif word.endswith('ies') and len(word) > 4:
+        word = word[:-3] + 'y'
+    elif word.endswith('s') and not word.endswith(('ss', 'us', 'is')) and len(word) > 3:
+        word = word[:-1]
+    
+    for suffix in ('ing', 'ed', 'ly'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            word = word[:-len(suffix)]
+            # "running" -> "runn" -> "run"
+            if word[-1] == word[-2] and word[-1] not in 'aeiolsz':
+                word = word[:-1]
+            break
+    
+    if word.endswith('e') and len(word) > 3:
+        word = word[:-1]
+    return word
+
+
+def normalize_topic(topic: str) -> List[str]:
+    """
+    Normalize a topic into stemmed content words
+    
+    Args:
+        topic: Raw topic text
+    
+    Returns:
+        Stemmed tokens in order, without punctuation or stopwords
+    """
+    tokens = _TOKEN_PATTERN.findall(topic.lower())
+    words = [stem(token) for token in tokens if token not in STOPWORDS]
+    # A topic made only of stopwords still needs a fingerprint
+    return words or tokens
+
+
+def topic_shingles(topic: str) -> FrozenSet[str]:
+    """Word unigrams and bigrams of the normalized topic"""
+    words = normalize_topic(topic)
+    shingles = set(words)
+    shingles.update(f"{first} {second}" for first, second in zip(words, words[1:]))
+    return frozenset(shingles)
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """Exact Jaccard similarity of two shingle sets"""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+class _MinHasher:
+    """MinHash signatures from fixed, seeded universal hash functions"""
+    
+    _PRIME = (1 << 61) - 1
+    
+    def __init__(self, num_perm: int, seed: int = 1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, self._PRIME), rng.randrange(0, self._PRIME)) for _ in range(num_perm)]
+    
+    def signature(self, shingles: FrozenSet[str]) -> Tuple[int, ...]:
+        """Compute the MinHash signature of a shingle set"""
+        hashes = [
+            int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big')
+            for shingle in shingles
+        ] or [0]
+        return tuple(min((a * h + b) % self._PRIME for h in hashes) for a, b in self._params)
+
+
+class TopicIndex:
+    """
+    Bounded LSH index from topic fingerprints to cached topics
+    
+    Entries are scoped (content types, prompt version, model, moderation version),
+    so only topics cached for the same request shape can match.
+    """
+    
+    def __init__(self, threshold: float = 0.8, max_entries: int = 10000, bands: int = 16, rows: int = 4):
+        """
+        Initialize topic index
+        
+        Args:
+            threshold: Minimum Jaccard similarity of normalized shingles for a match
+            max_entries: Maximum indexed topics (least recently indexed are dropped)
+            bands: LSH bands (more bands find lower-similarity candidates)
+            rows: Signature rows per band
+        """
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.bands = bands
+        self.rows = rows
+        self._hasher = _MinHasher(bands * rows)
+        # (scope, topic) -> (shingles, band hashes), oldest first
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[FrozenSet[str], Tuple[int, ...]]]" = OrderedDict()
+        # (scope, band index, band hash) -> topics
+        self._buckets: Dict[Tuple[str, int, int], Set[str]] = {}
+        self._lock = threading.Lock()
+    
+    def _band_hashes(self, shingles: FrozenSet[str]) -> Tuple[int, ...]:
+        """Hash each band of the MinHash signature"""
+        signature = self._hasher.signature(shingles)
+        return tuple(
+            hash(signature[band * self.rows:(band + 1) * self.rows])
+            for band in range(self.bands)
+        )
+    
+    def add(self, scope: str, topic: str):
+        """
+        Index a cached topic
+        
+        Args:
+            scope: Cache scope the topic was cached under
+            topic: Original topic text
+        """
+        shingles = topic_shingles(topic)
+        band_hashes = self._band_hashes(shingles)
+        with self._lock:
+            self._remove((scope, topic))
+            self._entries[(scope, topic)] = (shingles, band_hashes)
+            for band, band_hash in enumerate(band_hashes):
+                self._buckets.setdefault((scope, band, band_hash), set()).add(topic)
+            while len(self._entries) > self.max_entries:
+                self._remove(next(iter(self._entries)))
+    
+    def remove(self, scope: str, topic: str):
+        """Drop a topic from the index"""
+        with self._lock:
+            self._remove((scope, topic))
+    
+    def _remove(self, entry_key: Tuple[str, str]):
+        """Drop an entry and its bucket memberships (caller holds the lock)"""
+        entry = self._entries.pop(entry_key, None)
+        if entry is None:
+            return
+        scope, topic = entry_key
+        for band, band_hash in enumerate(entry[1]):
+            bucket_key = (scope, band, band_hash)
+            bucket = self._buckets.get(bucket_key)
+            if bucket is not None:
+                bucket.discard(topic)
+                if not bucket:
+                    del self._buckets[bucket_key]
+    
+    def find_similar(self, scope: str, topic: str, exclude_exact: bool = True) -> Tuple[Optional[str], float, int]:
+        """
+        Find the most similar indexed topic
+        
+        Args:
+            scope: Cache scope to search
+            topic: Topic being requested
+            exclude_exact: Skip the identical topic string (already checked by exact lookup)
+        
+        Returns:
+            Tuple of (matched topic or None, its similarity, LSH candidates rejected by exact check)
+        """
+        shingles = topic_shingles(topic)
+        band_hashes = self._band_hashes(shingles)
+        with self._lock:
+            candidates = set()
+            for band, band_hash in enumerate(band_hashes):
+                candidates.update(self._buckets.get((scope, band, band_hash), ()))
+            scored = [
+                (jaccard(shingles, self._entries[(scope, candidate)][0]), candidate)
+                for candidate in candidates
+                if not (exclude_exact and candidate.lower().strip() == topic.lower().strip())
+            ]
+        
+        matches = [(score, candidate) for score, candidate in scored if score >= self.threshold]
+        rejected = len(scored) - len(matches)
+        if not matches:
+            return None, 0.0, rejected
+        score, candidate = max(matches)
+        return candidate, score, rejected
+    
+    def clear(self):
+        """Drop all indexed topics"""
+        with self._lock:
+            self._entries.clear()
+            self._buckets.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Global topic index instance
+_topic_index_instance: Optional[TopicIndex] = None
+
+
+def get_topic_index() -> TopicIndex:
+    """Get global topic index instance"""
+    global _topic_index_instance
+    if _topic_index_instance is None:
+        from ..config import config
+        _topic_index_instance = TopicIndex(
+            threshold=config.CONTENT_CACHE_SIMILARITY_THRESHOLD,
+            max_entries=config.CONTENT_CACHE_SIMILAR_MAX_TOPICS
+        )
+    return _topic_index_instance
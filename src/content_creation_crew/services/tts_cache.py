@@ -0,0 +1,345 @@
+"""
+TTS Output Cache - Content-addressed reuse of synthesized voiceovers
+
+Audio is keyed by a hash of the full narration text, voice, speed, format and
+provider, so regenerating a voiceover for the same script skips synthesis and MP3
+encoding. Cached audio lives in the StorageProvider under tts_cache/ next to a
+small JSON record; a hot index in Redis (and process memory) saves reading it.
+
+Artifacts get their own copy of the cached objects rather than sharing them,
+because retention cleanup and GDPR deletion remove an artifact's storage keys.
+Entries expire after TTS_CACHE_MAX_AGE and the oldest are evicted above
+TTS_CACHE_MAX_BYTES by a scheduled sweep; voiceover artifacts record their cache
+key so GDPR deletion can erase the entries made from a user's scripts.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional
+
+from .storage_provider import StorageProvider
+
+logger = logging.getLogger(__name__)
+
+
+class TTSOutputCache:
+    """Content-addressed cache of synthesized audio backed by the storage provider"""
+    
+    KEY_PREFIX = "tts_cache"
+    
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        max_index_entries: int = 1024,
+        index_ttl: int = 7 * 24 * 3600,
+        max_age: int = 30 * 24 * 3600,
+        max_bytes: int = 0
+    ):
+        """
+        Initialize TTS output cache
+        
+        Args:
+            redis_client: Optional Redis client for the shared hot index
+            max_index_entries: Maximum records kept in the in-process hot index
+            index_ttl: Redis hot index TTL in seconds (stored records outlive it)
+            max_age: Seconds a stored entry is reused before it expires (0 = never)
+            max_bytes: Stored audio budget enforced by sweep() (0 = unlimited)
+        """
+        self.redis_client = redis_client
+        self.max_index_entries = max(1, max_index_entries)
+        self.index_ttl = index_ttl
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._index: "OrderedDict[str, Dict]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(text: str, voice_id: str, speed: float, format: str, provider: str) -> str:
+        """
+        Content address of a synthesis request
+        
+        Args:
+            text: Full narration text
+            voice_id: Voice identifier
+            speed: Speech speed multiplier
+            format: Output format
+            provider: TTS provider name
+        
+        Returns:
+            SHA-256 hex digest
+        """
+        digest = hashlib.sha256()
+        for part in (text, voice_id or "default", f"{float(speed):.3f}", format, provider):
+            digest.update(part.encode())
+            digest.update(b"\0")
+        return digest.hexdigest()
+    
+    def _record_key(self, key: str) -> str:
+        """Storage key of the JSON record for a cache key"""
+        return f"{self.KEY_PREFIX}/{key}.json"
+    
+    def _redis_key(self, key: str) -> str:
+        """Redis hot index key for a cache key"""
+        return f"{self.KEY_PREFIX}:{key}"
+    
+    def _index_get(self, key: str) -> Optional[Dict]:
+        """Look up a record in the hot index (memory, then Redis)"""
+        with self._lock:
+            record = self._index.get(key)
+            if record is not None:
+                self._index.move_to_end(key)
+                return record
+        
+        if self.redis_client is not None:
+            try:
+                data = self.redis_client.get(self._redis_key(key))
+                if data:
+                    record = json.loads(data)
+                    self._index_put_local(key, record)
+                    return record
+            except Exception as e:
+                logger.warning(f"TTS cache index lookup failed: {e}")
+        return None
+    
+    def _index_put_local(self, key: str, record: Dict):
+        """Add a record to the in-process hot index"""
+        with self._lock:
+            self._index[key] = record
+            self._index.move_to_end(key)
+            while len(self._index) > self.max_index_entries:
+                self._index.popitem(last=False)
+    
+    def _index_delete(self, key: str):
+        """Drop a record from the hot index (memory and Redis)"""
+        with self._lock:
+            self._index.pop(key, None)
+        if self.redis_client is not None:
+            try:
+                self.redis_client.delete(self._redis_key(key))
+            except Exception as e:
+                logger.warning(f"TTS cache index delete failed: {e}")
+    
+    def _is_expired(self, record: Dict) -> bool:
+        """Whether a record is older than max_age (records without created_at are left to sweep())"""
+        created_at = record.get('created_at')
+        return bool(self.max_age) and created_at is not None and time.time() - created_at > self.max_age
+    
+    def _index_put(self, key: str, record: Dict):
+        """Add a record to the hot index (memory and Redis)"""
+        self._index_put_local(key, record)
+        if self.redis_client is not None:
+            try:
+                self.redis_client.setex(self._redis_key(key), self.index_ttl, json.dumps(record))
+            except Exception as e:
+                logger.warning(f"TTS cache index update failed: {e}")
+    
+    def lookup(self, key: str, storage: StorageProvider) -> Optional[Dict]:
+        """
+        Get the cache record for a key
+        
+        Args:
+            key: Cache key from make_key()
+            storage: Storage provider holding cached audio
+        
+        Returns:
+            Record with storage_key, mp3_storage_key, size and metadata, or None
+        """
+        record = self._index_get(key)
+        if record is None:
+            # Hot index miss (restart or expiry): the stored record is the source of truth
+            data = storage.get(self._record_key(key))
+            if data is None:
+                return None
+            record = json.loads(data)
+            self._index_put(key, record)
+        
+        if self._is_expired(record):
+            self.invalidate(key, storage)
+            return None
+        return record
+    
+    def restore(self, key: str, storage: StorageProvider) -> Optional[Dict]:
+        """
+        Copy cached audio to fresh artifact storage keys
+        
+        Args:
+            key: Cache key from make_key()
+            storage: Storage provider holding cached audio
+        
+        Returns:
+            Dict with storage_key, mp3_storage_key (or None), size and metadata,
+            or None on a miss
+        """
+        record = self.lookup(key, storage)
+        if record is None:
+            return None
+        
+        audio_format = record['metadata'].get('format', 'wav')
+        try:
+            storage_key = storage.generate_key('voiceovers', f".{audio_format}")
+            storage.copy(record['storage_key'], storage_key, content_type=f"audio/{audio_format}")
+            mp3_storage_key = None
+            if record.get('mp3_storage_key'):
+                mp3_storage_key = storage.generate_key('voiceovers', '.mp3')
+                storage.copy(record['mp3_storage_key'], mp3_storage_key, content_type='audio/mpeg')
+        except FileNotFoundError as e:
+            # Cached objects were removed underneath the record
+            logger.warning(f"TTS cache entry {key[:16]} is missing audio, dropping it: {e}")
+            self.invalidate(key, storage)
+            return None
+        
+        return {
+            'storage_key': storage_key,
+            'mp3_storage_key': mp3_storage_key,
+            'size': record.get('size', 0),
+            'metadata': dict(record['metadata'])
+        }
+    
+    def save(
+        self,
+        key: str,
+        storage: StorageProvider,
+        storage_key: str,
+        metadata: Dict[str, Any],
+        size: int,
+        mp3_storage_key: Optional[str] = None
+    ):
+        """
+        Add freshly stored audio to the cache
+        
+        Args:
+            key: Cache key from make_key()
+            storage: Storage provider the audio was stored in
+            storage_key: Artifact storage key of the synthesized audio
+            metadata: Synthesis metadata (duration_sec, format, sample_rate, ...)
+            size: Audio size in bytes
+            mp3_storage_key: Artifact storage key of the MP3 version, if any
+        """
+        audio_format = metadata.get('format', 'wav')
+        record = {
+            'storage_key': f"{self.KEY_PREFIX}/{key}.{audio_format}",
+            'mp3_storage_key': None,
+            'size': size,
+            'metadata': metadata,
+            'created_at': time.time()
+        }
+        storage.copy(storage_key, record['storage_key'], content_type=f"audio/{audio_format}")
+        if mp3_storage_key:
+            record['mp3_storage_key'] = f"{self.KEY_PREFIX}/{key}.mp3"
+            storage.copy(mp3_storage_key, record['mp3_storage_key'], content_type='audio/mpeg')
+        
+        # Record last, so a stored record always points at complete audio
+        storage.put(self._record_key(key), json.dumps(record).encode(), content_type='application/json')
+        self._index_put(key, record)
+    
+    def invalidate(self, key: str, storage: StorageProvider):
+        """Drop a cache entry: its stored audio, record and index entries"""
+        storage_keys = [self._record_key(key)]
+        try:
+            record = self._index_get(key)
+            if record is None:
+                data = storage.get(self._record_key(key))
+                record = json.loads(data) if data else None
+            if record is not None:
+                storage_keys.extend(
+                    record[field] for field in ('storage_key', 'mp3_storage_key') if record.get(field)
+                )
+        except Exception as e:
+            logger.warning(f"TTS cache record read failed, deleting record only: {e}")
+        
+        self._index_delete(key)
+        # Audio first, so a record never points at audio that was half deleted
+        try:
+            storage.delete_many(storage_keys[1:] + storage_keys[:1])
+        except Exception as e:
+            logger.warning(f"TTS cache entry delete failed: {e}")
+    
+    def erase(self, keys: Iterable[str], storage: StorageProvider) -> int:
+        """
+        Erase cache entries (GDPR deletion of the scripts they were made from)
+        
+        Args:
+            keys: Cache keys recorded in artifact metadata
+            storage: Storage provider holding cached audio
+        
+        Returns:
+            Number of entries erased
+        """
+        from .metrics import TTSMetrics
+        erased = 0
+        for key in set(keys):
+            self.invalidate(key, storage)
+            erased += 1
+        TTSMetrics.record_cache_eviction("erased", erased)
+        return erased
+    
+    def sweep(self, storage: StorageProvider) -> int:
+        """
+        Evict expired entries, then the oldest entries while over max_bytes
+        
+        Lists the tts_cache/ prefix, so it also removes audio left behind by
+        interrupted saves.
+        
+        Args:
+            storage: Storage provider holding cached audio
+        
+        Returns:
+            Number of entries evicted
+        """
+        # cache key -> {'keys': [...], 'size': bytes, 'last_modified': newest object time}
+        entries: Dict[str, Dict[str, Any]] = {}
+        for item in storage.list_objects(f"{self.KEY_PREFIX}/"):
+            key = item['key'][len(self.KEY_PREFIX) + 1:].split('.', 1)[0]
+            entry = entries.setdefault(key, {'keys': [], 'size': 0, 'last_modified': 0.0})
+            entry['keys'].append(item['key'])
+            entry['size'] += item['size']
+            entry['last_modified'] = max(entry['last_modified'], item['last_modified'])
+        
+        now = time.time()
+        expired = {key for key, entry in entries.items() if self.max_age and now - entry['last_modified'] > self.max_age}
+        over_budget: List[str] = []
+        if self.max_bytes:
+            total = sum(entry['size'] for key, entry in entries.items() if key not in expired)
+            for key in sorted(set(entries) - expired, key=lambda key: entries[key]['last_modified']):
+                if total <= self.max_bytes:
+                    break
+                over_budget.append(key)
+                total -= entries[key]['size']
+        
+        from .metrics import TTSMetrics
+        TTSMetrics.record_cache_eviction("expired", len(expired))
+        TTSMetrics.record_cache_eviction("size", len(over_budget))
+        evicted = list(expired) + over_budget
+        if not evicted:
+            return 0
+        
+        for key in evicted:
+            self._index_delete(key)
+        storage.delete_many([object_key for key in evicted for object_key in entries[key]['keys']])
+        return len(evicted)
+
+
+# Global TTS output cache instance
+_tts_cache_instance: Optional[TTSOutputCache] = None
+
+
+def get_tts_cache() -> Optional[TTSOutputCache]:
+    """Get global TTS output cache (None when TTS_CACHE_ENABLED is off)"""
+    global _tts_cache_instance
+    from ..config import config
+    
+    if not config.TTS_CACHE_ENABLED:
+        return None
+    if _tts_cache_instance is None:
+        from .redis_cache import get_redis_client
+        _tts_cache_instance = TTSOutputCache(
+            redis_client=get_redis_client(),
+            max_index_entries=config.TTS_CACHE_INDEX_ENTRIES,
+            index_ttl=config.TTS_CACHE_INDEX_TTL,
+            max_age=config.TTS_CACHE_MAX_AGE,
+            max_bytes=config.TTS_CACHE_MAX_BYTES
+        )
+    return _tts_cache_instance
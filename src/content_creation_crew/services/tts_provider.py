@@ -3,13 +3,125 @@ Text-to-Speech (TTS) Provider Interface and Implementations
 Adapter pattern for supporting multiple TTS engines
 """
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, Tuple
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple, Callable, Iterable, Iterator, List
 import logging
 import os
+import re
 import sys
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
+# Maximum characters per synthesis chunk (sentences are packed up to this size)
+TTS_CHUNK_MAX_CHARS = int(os.getenv("TTS_CHUNK_MAX_CHARS", "400"))
+# Worker processes for parallel synthesis of long narration (0 = synthesize serially)
+TTS_SYNTHESIS_WORKERS = int(os.getenv("TTS_SYNTHESIS_WORKERS", "0"))
+# Minimum sentence chunks before narration is sharded across workers
+TTS_PARALLEL_MIN_CHUNKS = int(os.getenv("TTS_PARALLEL_MIN_CHUNKS", "4"))
+
+_SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+|\n\s*\n')
+
+
+def split_sentences(text: str, max_chars: int = TTS_CHUNK_MAX_CHARS) -> List[str]:
+    """
+    Split text into synthesis chunks at sentence boundaries
+    
+    Short sentences are packed together up to max_chars; a single sentence longer
+    than max_chars is split at the last space before the limit.
+    
+    Args:
+        text: Text to synthesize
+        max_chars: Maximum characters per chunk
+    
+    Returns:
+        Non-empty text chunks in order
+    """
+    chunks: List[str] = []
+    current = ""
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = " ".join(sentence.split())
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(" ", 0, max_chars + 1)
+            if cut <= 0:
+                cut = max_chars
+            if current:
+                chunks.append(current)
+                current = ""
+            chunks.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if not sentence:
+            continue
+        if current and len(current) + 1 + len(sentence) > max_chars:
+            chunks.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class PCMChunk:
+    """Raw PCM audio synthesized for one text chunk"""
+    
+    __slots__ = ('audio', 'sample_rate', 'sample_width', 'channels', 'index', 'total')
+    
+    def __init__(self, audio: bytes, sample_rate: int, sample_width: int, channels: int, index: int, total: int):
+        self.audio = audio
+        self.sample_rate = sample_rate
+        self.sample_width = sample_width
+        self.channels = channels
+        # Position of this chunk in the text (index of total chunks)
+        self.index = index
+        self.total = total
+
+
+def write_wav_stream(
+    chunks: Iterable[PCMChunk],
+    output,
+    progress_callback: Optional[Callable[[int, int], None]] = None
+) -> Tuple[float, int]:
+    """
+    Write PCM chunks to a WAV file as they are synthesized
+    
+    The header sizes are patched when the file is closed, so only the current
+    chunk is held in memory.
+    
+    Args:
+        chunks: PCM chunks in order
+        output: File path or seekable binary file object
+        progress_callback: Called with (chunks_done, total_chunks) after each chunk is written
+    
+    Returns:
+        Tuple of (duration_sec, sample_rate)
+    """
+    import wave
+    
+    wav_file = None
+    frames = 0
+    sample_rate = 0
+    try:
+        for chunk in chunks:
+            if wav_file is None:
+                wav_file = wave.open(output, 'wb')
+                wav_file.setnchannels(chunk.channels)
+                wav_file.setsampwidth(chunk.sample_width)
+                wav_file.setframerate(chunk.sample_rate)
+                sample_rate = chunk.sample_rate
+            wav_file.writeframesraw(chunk.audio)
+            frames += len(chunk.audio) // (chunk.sample_width * chunk.channels)
+            if progress_callback:
+                progress_callback(chunk.index + 1, chunk.total)
+    finally:
+        if wav_file is not None:
+            wav_file.close()
+    
+    if wav_file is None:
+        raise RuntimeError("TTS synthesis produced no audio")
+    return frames / float(sample_rate), sample_rate
+
 
 class TTSProvider(ABC):
     """Abstract base class for TTS providers"""
@@ -51,6 +163,136 @@ class TTSProvider(ABC):
     def is_available(self) -> bool:
         """Check if TTS provider is available/configured"""
         pass
+    
+    def warm_up(self):
+        """Load models ahead of the first request (no-op by default)"""
+        pass
+    
+    def synthesize_to_file(
+        self,
+        text: str,
+        output_path: str,
+        voice_id: str = "default",
+        speed: float = 1.0,
+        format: str = "wav",
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize speech into a file
+        
+        Providers that synthesize incrementally override this to write audio chunk by
+        chunk; the default synthesizes the whole text and writes it in one piece.
+        
+        Args:
+            text: Text to synthesize
+            output_path: File to write the audio to
+            voice_id: Voice identifier (provider-specific)
+            speed: Speech speed multiplier (0.5-2.0, default 1.0)
+            format: Output format ('wav', 'mp3', etc.)
+            progress_callback: Called with (chunks_done, total_chunks) as synthesis progresses
+        
+        Returns:
+            metadata_dict (same fields as synthesize())
+        """
+        audio_bytes, metadata = self.synthesize(text, voice_id=voice_id, speed=speed, format=format)
+        with open(output_path, 'wb') as f:
+            f.write(audio_bytes)
+        if progress_callback:
+            progress_callback(1, 1)
+        return metadata
+
+
+class LoadedVoice:
+    """A loaded Piper voice shared across requests"""
+    
+    __slots__ = ('voice', 'lock')
+    
+    def __init__(self, voice):
+        self.voice = voice
+        # Serializes synthesis on this voice; different voices synthesize in parallel
+        self.lock = threading.Lock()
+
+
+class PiperVoiceRegistry:
+    """
+    Process-wide LRU registry of loaded Piper voices
+    
+    Loading a voice reads and initializes its ONNX model, so voices are loaded once
+    and reused by every request and executor thread. Concurrent first requests for
+    the same voice wait for a single load.
+    """
+    
+    def __init__(self, max_voices: int = 2):
+        """
+        Initialize voice registry
+        
+        Args:
+            max_voices: Maximum loaded voices (least recently used are unloaded)
+        """
+        self.max_voices = max(1, max_voices)
+        self._voices: "OrderedDict[tuple, LoadedVoice]" = OrderedDict()
+        self._load_locks: Dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key: tuple, loader: Callable[[], Any]) -> LoadedVoice:
+        """
+        Get a loaded voice, loading it with loader() on first use
+        
+        Args:
+            key: Voice key (model directory, voice ID)
+            loader: Loads the voice; called at most once at a time per key
+        
+        Returns:
+            LoadedVoice (loader errors propagate and nothing is cached)
+        """
+        with self._lock:
+            loaded = self._voices.get(key)
+            if loaded is not None:
+                self._voices.move_to_end(key)
+                return loaded
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        
+        with load_lock:
+            with self._lock:
+                loaded = self._voices.get(key)
+            if loaded is not None:
+                return loaded
+            
+            start_time = time.time()
+            loaded = LoadedVoice(loader())
+            logger.info(f"[TTS_VOICE_REGISTRY] Loaded voice {key[1]} in {time.time() - start_time:.2f}s")
+            
+            with self._lock:
+                self._voices[key] = loaded
+                self._load_locks.pop(key, None)
+                while len(self._voices) > self.max_voices:
+                    evicted_key, _ = self._voices.popitem(last=False)
+                    logger.info(f"[TTS_VOICE_REGISTRY] Unloaded least recently used voice {evicted_key[1]}")
+            return loaded
+    
+    def clear(self):
+        """Unload all voices"""
+        with self._lock:
+            self._voices.clear()
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._voices)
+
+
+# Global voice registry instance
+_voice_registry: Optional[PiperVoiceRegistry] = None
+_voice_registry_lock = threading.Lock()
+
+
+def get_voice_registry() -> PiperVoiceRegistry:
+    """Get global Piper voice registry (PIPER_MAX_LOADED_VOICES caps loaded voices)"""
+    global _voice_registry
+    if _voice_registry is None:
+        with _voice_registry_lock:
+            if _voice_registry is None:
+                _voice_registry = PiperVoiceRegistry(int(os.getenv("PIPER_MAX_LOADED_VOICES", "2")))
+    return _voice_registry
 
 
 class PiperTTSProvider(TTSProvider):
@@ -141,132 +383,14 @@ class PiperTTSProvider(TTSProvider):
         
         # Try Python API first
         try:
-            from piper import PiperVoice
-            
-            # Resolve "default" to actual voice ID first
-            actual_voice_id = voice_id
-            if voice_id == "default":
-                available_voices = self.get_available_voices()
-                if available_voices:
-                    actual_voice_id = available_voices[0]
-                    logger.info(f"[TTS_SYNTHESIS] Resolved 'default' to voice_id: {actual_voice_id}")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolved 'default' to voice_id: {actual_voice_id}", file=sys.stdout, flush=True)
-                else:
-                    logger.error("[TTS_SYNTHESIS] No available voices found")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] ERROR: No available voices found", file=sys.stderr, flush=True)
-                    raise RuntimeError("No Piper voices available. Check piper-tts installation.")
-            
-            # Resolve voice model path (will download if needed)
-            logger.info(f"[TTS_SYNTHESIS] Resolving voice model for voice_id: {actual_voice_id}")
-            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolving voice model for voice_id: {actual_voice_id}", file=sys.stdout, flush=True)
+            import piper  # noqa: F401
             
-            voice_model = None
-            try:
-                voice_model = self._resolve_voice_model(actual_voice_id)
-                logger.info(f"[TTS_SYNTHESIS] Resolved voice model path: {voice_model}")
-                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolved voice model path: {voice_model}", file=sys.stdout, flush=True)
-                
-                # Verify file exists
-                if voice_model and os.path.exists(voice_model):
-                    file_size = os.path.getsize(voice_model)
-                    logger.info(f"[TTS_SYNTHESIS] Voice model file exists, size: {file_size} bytes")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model file exists, size: {file_size} bytes", file=sys.stdout, flush=True)
-                else:
-                    logger.warning(f"[TTS_SYNTHESIS] Voice model file not found at resolved path: {voice_model}")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model file not found at resolved path: {voice_model}", file=sys.stderr, flush=True)
-                    # Don't raise error yet - try loading by voice_id directly (PiperVoice might auto-download)
-                    logger.info(f"[TTS_SYNTHESIS] Will try loading by voice_id directly (PiperVoice may auto-download)")
-                    voice_model = None  # Signal to try direct loading
-            except FileNotFoundError as resolve_error:
-                logger.warning(f"[TTS_SYNTHESIS] Voice model not found, will try direct loading: {resolve_error}")
-                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model not found, will try direct loading: {resolve_error}", file=sys.stderr, flush=True)
-                voice_model = None  # Signal to try direct loading
-            except Exception as resolve_error:
-                logger.warning(f"[TTS_SYNTHESIS] Failed to resolve voice model, will try direct loading: {resolve_error}")
-                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to resolve voice model, will try direct loading: {resolve_error}", file=sys.stderr, flush=True)
-                voice_model = None  # Try direct loading as fallback
-            
-            # Load voice - PiperVoice.load can also accept voice_id directly
-            # Try loading by path first, then by voice_id (which may auto-download)
-            voice = None
-            
-            if voice_model and os.path.exists(voice_model):
-                logger.info(f"[TTS_SYNTHESIS] Loading PiperVoice from path: {voice_model}")
-                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Loading PiperVoice from path: {voice_model}", file=sys.stdout, flush=True)
-                
-                try:
-                    voice = PiperVoice.load(voice_model, config_path=None)
-                    logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice from file")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice from file", file=sys.stdout, flush=True)
-                except Exception as load_error:
-                    logger.warning(f"[TTS_SYNTHESIS] Failed to load voice from path {voice_model}: {load_error}")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to load from path, will try voice_id: {load_error}", file=sys.stderr, flush=True)
-                    voice = None  # Will try voice_id next
-            
-            # If path loading failed or no path, try loading by actual_voice_id directly
-            # PiperVoice.load(voice_id) may auto-download the model
-            if voice is None:
-                logger.info(f"[TTS_SYNTHESIS] Loading PiperVoice by voice_id (may auto-download): {actual_voice_id}")
-                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Loading PiperVoice by voice_id (may auto-download): {actual_voice_id}", file=sys.stdout, flush=True)
-                try:
-                    voice = PiperVoice.load(actual_voice_id)
-                    logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice by voice_id (auto-download may have occurred)")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice by voice_id", file=sys.stdout, flush=True)
-                except Exception as voice_id_error:
-                    logger.warning(f"[TTS_SYNTHESIS] Failed to load by voice_id {actual_voice_id}, trying hyphen version: {voice_id_error}")
-                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to load by voice_id {actual_voice_id}, trying hyphen version: {voice_id_error}", file=sys.stderr, flush=True)
-                    # Try with hyphen version as fallback
-                    try:
-                        voice_id_hyphen = actual_voice_id.replace('_', '-')
-                        logger.info(f"[TTS_SYNTHESIS] Trying hyphen version: {voice_id_hyphen}")
-                        print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Trying hyphen version: {voice_id_hyphen}", file=sys.stdout, flush=True)
-                        voice = PiperVoice.load(voice_id_hyphen)
-                        logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice with hyphen version")
-                        print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice with hyphen version", file=sys.stdout, flush=True)
-                    except Exception as hyphen_error:
-                        logger.error(f"[TTS_SYNTHESIS] All loading methods failed for voice_id {actual_voice_id}", exc_info=True)
-                        print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] All loading methods failed. Original: {voice_id_error}, Hyphen: {hyphen_error}", file=sys.stderr, flush=True)
-                        # Don't raise error here - let it be caught by the outer exception handler
-                        raise FileNotFoundError(
-                            f"Piper model not found and could not be auto-downloaded. "
-                            f"Voice ID: {actual_voice_id} (resolved from '{voice_id}'). "
-                            f"Tried paths: {voice_model if voice_model else 'N/A'}. "
-                            f"Set PIPER_MODEL_PATH or install piper models. "
-                            f"To download models automatically, ensure piper-tts package is installed with download support."
-                        )
-            
-            if voice is None:
-                raise FileNotFoundError(f"Failed to load Piper voice model for {actual_voice_id} (resolved from '{voice_id}')")
-            
-            # Synthesize (PiperVoice.synthesize returns generator of AudioChunk objects)
-            # Speed control may not be available in Python API, synthesize as-is
-            # Note: Speed parameter is ignored for Python API (would need SynthesisConfig)
-            audio_generator = voice.synthesize(text)
-            # Extract audio data from chunks (AudioChunk has audio_int16_bytes attribute)
-            audio_chunks = []
-            sample_rate = None
-            sample_width = None
-            sample_channels = None
-            for chunk in audio_generator:
-                # AudioChunk has audio_int16_bytes attribute (raw PCM data)
-                audio_chunks.append(chunk.audio_int16_bytes)
-                if sample_rate is None:
-                    sample_rate = chunk.sample_rate
-                    sample_width = chunk.sample_width
-                    sample_channels = chunk.sample_channels
-            
-            # Convert raw PCM to WAV format
-            raw_audio = b''.join(audio_chunks)
-            num_frames = len(raw_audio) // (sample_width * sample_channels)
-            duration_sec = num_frames / float(sample_rate)
-            
-            # Create WAV file in memory
+            # Synthesize sentence chunks into an in-memory WAV file
             wav_buffer = io.BytesIO()
-            with wave.open(wav_buffer, 'wb') as wav_file:
-                wav_file.setnchannels(sample_channels)
-                wav_file.setsampwidth(sample_width)
-                wav_file.setframerate(sample_rate)
-                wav_file.writeframes(raw_audio)
+            duration_sec, sample_rate = write_wav_stream(
+                self.synthesize_stream(text, voice_id=voice_id, speed=speed),
+                wav_buffer
+            )
             audio_bytes = wav_buffer.getvalue()
             
             metadata = {
@@ -346,6 +470,251 @@ class PiperTTSProvider(TTSProvider):
                 except Exception:
                     pass
     
+    def synthesize_stream(
+        self,
+        text: str,
+        voice_id: str = "default",
+        speed: float = 1.0
+    ) -> Iterator[PCMChunk]:
+        """
+        Synthesize speech one sentence chunk at a time (Python API only)
+        
+        The voice lock is held per chunk rather than per script, so concurrent
+        voiceovers on the same voice interleave instead of queueing.
+        
+        Args:
+            text: Text to synthesize
+            voice_id: Voice identifier (defaults to first available voice)
+            speed: Speech speed (ignored by the Python API)
+        
+        Yields:
+            PCMChunk per text chunk, in order
+        """
+        text_chunks = split_sentences(text, TTS_CHUNK_MAX_CHARS)
+        
+        # Long narration is sharded across worker processes (see SynthesisPool)
+        pool = get_synthesis_pool(self.model_path)
+        if pool is not None and len(text_chunks) >= TTS_PARALLEL_MIN_CHUNKS:
+            yield from pool.synthesize(voice_id, text_chunks)
+            return
+        
+        yield from self._synthesize_chunks(voice_id, text_chunks, 0, len(text_chunks))
+    
+    def _synthesize_chunks(
+        self,
+        voice_id: str,
+        text_chunks: List[str],
+        start_index: int,
+        total: int
+    ) -> Iterator[PCMChunk]:
+        """
+        Synthesize a contiguous run of text chunks in this process
+        
+        Args:
+            voice_id: Voice identifier
+            text_chunks: Text chunks to synthesize, in order
+            start_index: Index of the first chunk within the whole text
+            total: Total chunks in the whole text
+        
+        Yields:
+            PCMChunk per text chunk, in order
+        """
+        # Reuse the process-wide loaded voice (loaded from disk once, see PiperVoiceRegistry)
+        loaded_voice = self._get_loaded_voice(voice_id)
+        
+        for offset, text_chunk in enumerate(text_chunks):
+            # One synthesis per loaded voice at a time (the phonemizer is not thread-safe)
+            # PiperVoice.synthesize yields AudioChunk objects with raw int16 PCM
+            with loaded_voice.lock:
+                audio_chunks = list(loaded_voice.voice.synthesize(text_chunk))
+            if not audio_chunks:
+                continue
+            
+            first = audio_chunks[0]
+            yield PCMChunk(
+                b''.join(chunk.audio_int16_bytes for chunk in audio_chunks),
+                first.sample_rate,
+                first.sample_width,
+                first.sample_channels,
+                start_index + offset,
+                total
+            )
+    
+    def synthesize_to_file(
+        self,
+        text: str,
+        output_path: str,
+        voice_id: str = "default",
+        speed: float = 1.0,
+        format: str = "wav",
+        progress_callback: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Synthesize speech into a WAV file chunk by chunk
+        
+        Each sentence chunk is written as soon as it is synthesized, so peak memory
+        stays at one chunk and progress reflects completed chunks. Falls back to
+        whole-text synthesis when only the piper binary is available.
+        """
+        try:
+            import piper  # noqa: F401
+        except ImportError:
+            return super().synthesize_to_file(text, output_path, voice_id, speed, format, progress_callback)
+        
+        if not self._available:
+            raise RuntimeError("Piper TTS is not available. Install piper-tts or set PIPER_BINARY.")
+        
+        if format != "wav":
+            raise ValueError(f"Piper only supports 'wav' format, got '{format}'")
+        
+        import hashlib
+        
+        duration_sec, sample_rate = write_wav_stream(
+            self.synthesize_stream(text, voice_id=voice_id, speed=speed),
+            output_path,
+            progress_callback
+        )
+        
+        return {
+            "duration_sec": duration_sec,
+            "format": "wav",
+            "sample_rate": sample_rate,
+            "voice_id": voice_id,
+            "text_hash": hashlib.sha256(text.encode()).hexdigest()[:16],
+            "provider": "piper"
+        }
+    
+    def _resolve_voice_id(self, voice_id: str) -> str:
+        """Resolve "default" to the first available voice ID"""
+        actual_voice_id = voice_id
+        if voice_id == "default":
+            available_voices = self.get_available_voices()
+            if available_voices:
+                actual_voice_id = available_voices[0]
+                logger.info(f"[TTS_SYNTHESIS] Resolved 'default' to voice_id: {actual_voice_id}")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolved 'default' to voice_id: {actual_voice_id}", file=sys.stdout, flush=True)
+            else:
+                logger.error("[TTS_SYNTHESIS] No available voices found")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] ERROR: No available voices found", file=sys.stderr, flush=True)
+                raise RuntimeError("No Piper voices available. Check piper-tts installation.")
+        return actual_voice_id
+    
+    def _get_loaded_voice(self, voice_id: str) -> "LoadedVoice":
+        """Get a voice from the process-wide registry, loading it on first use"""
+        # Resolve "default" to actual voice ID first
+        actual_voice_id = self._resolve_voice_id(voice_id)
+        return get_voice_registry().get(
+            (self.model_path, actual_voice_id),
+            lambda: self._load_voice(actual_voice_id, voice_id)
+        )
+    
+    def _load_voice(self, actual_voice_id: str, voice_id: str):
+        """
+        Load a Piper voice from disk (downloading it if needed)
+        
+        Called by the voice registry only when the voice is not already loaded.
+        """
+        from piper import PiperVoice
+        
+        # Resolve voice model path (will download if needed)
+        logger.info(f"[TTS_SYNTHESIS] Resolving voice model for voice_id: {actual_voice_id}")
+        print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolving voice model for voice_id: {actual_voice_id}", file=sys.stdout, flush=True)
+        
+        voice_model = None
+        try:
+            voice_model = self._resolve_voice_model(actual_voice_id)
+            logger.info(f"[TTS_SYNTHESIS] Resolved voice model path: {voice_model}")
+            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Resolved voice model path: {voice_model}", file=sys.stdout, flush=True)
+            
+            # Verify file exists
+            if voice_model and os.path.exists(voice_model):
+                file_size = os.path.getsize(voice_model)
+                logger.info(f"[TTS_SYNTHESIS] Voice model file exists, size: {file_size} bytes")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model file exists, size: {file_size} bytes", file=sys.stdout, flush=True)
+            else:
+                logger.warning(f"[TTS_SYNTHESIS] Voice model file not found at resolved path: {voice_model}")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model file not found at resolved path: {voice_model}", file=sys.stderr, flush=True)
+                # Don't raise error yet - try loading by voice_id directly (PiperVoice might auto-download)
+                logger.info(f"[TTS_SYNTHESIS] Will try loading by voice_id directly (PiperVoice may auto-download)")
+                voice_model = None  # Signal to try direct loading
+        except FileNotFoundError as resolve_error:
+            logger.warning(f"[TTS_SYNTHESIS] Voice model not found, will try direct loading: {resolve_error}")
+            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Voice model not found, will try direct loading: {resolve_error}", file=sys.stderr, flush=True)
+            voice_model = None  # Signal to try direct loading
+        except Exception as resolve_error:
+            logger.warning(f"[TTS_SYNTHESIS] Failed to resolve voice model, will try direct loading: {resolve_error}")
+            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to resolve voice model, will try direct loading: {resolve_error}", file=sys.stderr, flush=True)
+            voice_model = None  # Try direct loading as fallback
+        
+        # Load voice - PiperVoice.load can also accept voice_id directly
+        # Try loading by path first, then by voice_id (which may auto-download)
+        voice = None
+        
+        if voice_model and os.path.exists(voice_model):
+            logger.info(f"[TTS_SYNTHESIS] Loading PiperVoice from path: {voice_model}")
+            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Loading PiperVoice from path: {voice_model}", file=sys.stdout, flush=True)
+            
+            try:
+                voice = PiperVoice.load(voice_model, config_path=None)
+                logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice from file")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice from file", file=sys.stdout, flush=True)
+            except Exception as load_error:
+                logger.warning(f"[TTS_SYNTHESIS] Failed to load voice from path {voice_model}: {load_error}")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to load from path, will try voice_id: {load_error}", file=sys.stderr, flush=True)
+                voice = None  # Will try voice_id next
+        
+        # If path loading failed or no path, try loading by actual_voice_id directly
+        # PiperVoice.load(voice_id) may auto-download the model
+        if voice is None:
+            logger.info(f"[TTS_SYNTHESIS] Loading PiperVoice by voice_id (may auto-download): {actual_voice_id}")
+            print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Loading PiperVoice by voice_id (may auto-download): {actual_voice_id}", file=sys.stdout, flush=True)
+            try:
+                voice = PiperVoice.load(actual_voice_id)
+                logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice by voice_id (auto-download may have occurred)")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice by voice_id", file=sys.stdout, flush=True)
+            except Exception as voice_id_error:
+                logger.warning(f"[TTS_SYNTHESIS] Failed to load by voice_id {actual_voice_id}, trying hyphen version: {voice_id_error}")
+                print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Failed to load by voice_id {actual_voice_id}, trying hyphen version: {voice_id_error}", file=sys.stderr, flush=True)
+                # Try with hyphen version as fallback
+                try:
+                    voice_id_hyphen = actual_voice_id.replace('_', '-')
+                    logger.info(f"[TTS_SYNTHESIS] Trying hyphen version: {voice_id_hyphen}")
+                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Trying hyphen version: {voice_id_hyphen}", file=sys.stdout, flush=True)
+                    voice = PiperVoice.load(voice_id_hyphen)
+                    logger.info(f"[TTS_SYNTHESIS] Successfully loaded PiperVoice with hyphen version")
+                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] Successfully loaded PiperVoice with hyphen version", file=sys.stdout, flush=True)
+                except Exception as hyphen_error:
+                    logger.error(f"[TTS_SYNTHESIS] All loading methods failed for voice_id {actual_voice_id}", exc_info=True)
+                    print(f"[RAILWAY_DEBUG] [TTS_SYNTHESIS] All loading methods failed. Original: {voice_id_error}, Hyphen: {hyphen_error}", file=sys.stderr, flush=True)
+                    # Don't raise error here - let it be caught by the outer exception handler
+                    raise FileNotFoundError(
+                        f"Piper model not found and could not be auto-downloaded. "
+                        f"Voice ID: {actual_voice_id} (resolved from '{voice_id}'). "
+                        f"Tried paths: {voice_model if voice_model else 'N/A'}. "
+                        f"Set PIPER_MODEL_PATH or install piper models. "
+                        f"To download models automatically, ensure piper-tts package is installed with download support."
+                    )
+        
+        if voice is None:
+            raise FileNotFoundError(f"Failed to load Piper voice model for {actual_voice_id} (resolved from '{voice_id}')")
+        
+        return voice
+    
+    def warm_up(self):
+        """Load the default voice into the voice registry so the first voiceover skips model loading"""
+        if not self._available:
+            return
+        try:
+            import piper  # noqa: F401
+        except ImportError:
+            return  # Binary fallback loads the model per process run
+        
+        self._get_loaded_voice("default")
+        
+        pool = get_synthesis_pool(self.model_path)
+        if pool is not None:
+            pool.warm_up()
+    
     def _download_model_if_needed(self, voice_id: str) -> str:
         """Download Piper model if not present from HuggingFace"""
         import urllib.request
@@ -626,6 +995,153 @@ class PiperTTSProvider(TTSProvider):
         return model_file
 
 
+class SynthesisPool:
+    """
+    Process pool that synthesizes long narration across CPU cores
+    
+    Synthesis is CPU-bound and each loaded voice synthesizes one text at a time, so a
+    single process uses about one core. Each worker process loads its own voices
+    (the default voice at start-up) and synthesizes a contiguous batch of sentence
+    chunks. Batches are yielded in text order, and since they are the same chunks the
+    serial path synthesizes, the stitched audio matches serial output.
+    """
+    
+    def __init__(self, workers: int, model_path: str, preload_voice_ids: Tuple[str, ...] = ("default",)):
+        """
+        Initialize synthesis pool
+        
+        Args:
+            workers: Number of worker processes
+            model_path: Piper model directory used by the workers
+            preload_voice_ids: Voices each worker loads when it starts
+        """
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        
+        self.workers = workers
+        self.broken = False
+        # Spawn rather than fork: forking the threaded API server is unsafe
+        self._executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_synthesis_worker,
+            initargs=(model_path, tuple(preload_voice_ids))
+        )
+    
+    def synthesize(self, voice_id: str, text_chunks: List[str]) -> Iterator[PCMChunk]:
+        """
+        Synthesize text chunks on the worker processes
+        
+        Args:
+            voice_id: Voice identifier
+            text_chunks: Sentence chunks of the whole text
+        
+        Yields:
+            PCMChunk per text chunk, in text order
+        """
+        from concurrent.futures.process import BrokenProcessPool
+        
+        total = len(text_chunks)
+        # A few batches per worker keeps every core busy when batches finish unevenly
+        batch_size = max(1, -(-total // (self.workers * 2)))
+        futures = [
+            self._executor.submit(_synthesize_batch, voice_id, text_chunks[start:start + batch_size], start, total)
+            for start in range(0, total, batch_size)
+        ]
+        
+        sample_format = None
+        try:
+            for future in futures:
+                for chunk in future.result():
+                    chunk_format = (chunk.sample_rate, chunk.sample_width, chunk.channels)
+                    if sample_format is None:
+                        sample_format = chunk_format
+                    elif chunk_format != sample_format:
+                        raise RuntimeError(
+                            f"Synthesis workers returned mismatched audio formats: {chunk_format} != {sample_format}"
+                        )
+                    yield chunk
+        except BrokenProcessPool:
+            # A worker died (e.g. out of memory); the next request gets a fresh pool
+            self.broken = True
+            raise
+        finally:
+            for future in futures:
+                future.cancel()
+    
+    def warm_up(self):
+        """Start every worker so their voices are loaded before the first request"""
+        futures = [self._executor.submit(_synthesis_worker_ready) for _ in range(self.workers)]
+        for future in futures:
+            future.result()
+    
+    def shutdown(self):
+        """Stop the worker processes"""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Provider used by a synthesis worker process (set by the pool initializer)
+_worker_provider: Optional[PiperTTSProvider] = None
+
+
+def _init_synthesis_worker(model_path: str, preload_voice_ids: Tuple[str, ...]):
+    """Synthesis worker initializer: create the provider and preload voices"""
+    global _worker_provider
+    _worker_provider = PiperTTSProvider(model_path=model_path)
+    for voice_id in preload_voice_ids:
+        try:
+            _worker_provider._get_loaded_voice(voice_id)
+        except Exception as e:
+            logger.warning(f"[TTS_SYNTHESIS_POOL] Failed to preload voice {voice_id}: {e}")
+
+
+def _synthesis_worker_ready() -> bool:
+    """Synthesis worker no-op used to start workers ahead of time"""
+    return _worker_provider is not None
+
+
+def _synthesize_batch(voice_id: str, text_chunks: List[str], start_index: int, total: int) -> List[PCMChunk]:
+    """Synthesis worker task: synthesize a contiguous batch of sentence chunks"""
+    return list(_worker_provider._synthesize_chunks(voice_id, text_chunks, start_index, total))
+
+
+# Global synthesis pool instance
+_synthesis_pool: Optional[SynthesisPool] = None
+_synthesis_pool_lock = threading.Lock()
+
+
+def get_synthesis_pool(model_path: str) -> Optional[SynthesisPool]:
+    """
+    Get global synthesis pool
+    
+    Args:
+        model_path: Piper model directory (used when the pool is created)
+    
+    Returns:
+        SynthesisPool, or None when TTS_SYNTHESIS_WORKERS is 0
+    """
+    global _synthesis_pool
+    if TTS_SYNTHESIS_WORKERS <= 0:
+        return None
+    if _synthesis_pool is None or _synthesis_pool.broken:
+        with _synthesis_pool_lock:
+            if _synthesis_pool is None or _synthesis_pool.broken:
+                if _synthesis_pool is not None:
+                    _synthesis_pool.shutdown()
+                _synthesis_pool = SynthesisPool(TTS_SYNTHESIS_WORKERS, model_path)
+                logger.info(f"[TTS_SYNTHESIS_POOL] Started synthesis pool with {TTS_SYNTHESIS_WORKERS} workers")
+    return _synthesis_pool
+
+
+def shutdown_synthesis_pool():
+    """Stop the global synthesis pool (called on application shutdown)"""
+    global _synthesis_pool
+    with _synthesis_pool_lock:
+        if _synthesis_pool is not None:
+            _synthesis_pool.shutdown()
+            _synthesis_pool = None
+
+
 class CoquiXTTSProvider(TTSProvider):
     """Coqui XTTS v2 provider (optional, behind config flag)"""
     
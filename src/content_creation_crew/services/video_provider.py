@@ -3,14 +3,201 @@ Video Rendering Provider Interface and Implementations
 Adapter pattern for supporting multiple video rendering engines
 """
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Optional, Dict, Any, List, Tuple
 import logging
 import os
 import json
+import threading
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Baseline render pipeline: "ffmpeg" encodes all scenes and narration in one ffmpeg pass,
+# "moviepy" encodes each scene, re-encodes the concatenation and again to add audio
+VIDEO_RENDER_PIPELINE = os.getenv("VIDEO_RENDER_PIPELINE", "ffmpeg").lower()
+# x264 preset for the single-pass pipeline (moviepy's default is "medium")
+VIDEO_X264_PRESET = os.getenv("VIDEO_X264_PRESET", "medium")
+# Worker processes for rendering scene frames (1 = render in-process)
+VIDEO_FRAME_WORKERS = int(os.getenv("VIDEO_FRAME_WORKERS", str(min(4, os.cpu_count() or 1))))
+
+# Title and body fonts, tried in order (arial.ttf resolves on Windows/macOS)
+_FONT_CANDIDATES = (
+    ("arial.ttf", "arial.ttf"),
+    ("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"),
+)
+
+
+@lru_cache(maxsize=None)
+def _get_fonts(title_size: int = 72, text_size: int = 48):
+    """Load the title and body fonts once per process"""
+    from PIL import ImageFont
+    
+    for title_path, text_path in _FONT_CANDIDATES:
+        try:
+            return ImageFont.truetype(title_path, title_size), ImageFont.truetype(text_path, text_size)
+        except OSError:
+            continue
+    return ImageFont.load_default(), ImageFont.load_default()
+
+
+@lru_cache(maxsize=8)
+def _get_background(
+    background_type: str,
+    background_color: Optional[str],
+    background_image_path: Optional[str],
+    image_mtime: Optional[float],
+    resolution: Tuple[int, int]
+):
+    """
+    Build a scene background once per render settings
+    
+    The returned image is shared; callers copy it before drawing. image_mtime is
+    part of the key so a replaced upload is reloaded.
+    """
+    from PIL import Image
+    
+    width, height = resolution
+    if background_type == "upload":
+        with Image.open(background_image_path) as bg_image:
+            return bg_image.convert('RGB').resize((width, height), Image.Resampling.LANCZOS)
+    
+    if background_type == "placeholder":
+        # Vertical gradient from gray 30 to 50, built as whole rows instead of one line per row
+        try:
+            import numpy as np
+            rows = (30 + (np.arange(height) / height) * 20).astype(np.uint8)
+            pixels = np.ascontiguousarray(np.broadcast_to(rows[:, None, None], (height, width, 3)))
+            return Image.fromarray(pixels, 'RGB')
+        except ImportError:
+            column = Image.new('L', (1, height))
+            column.putdata([int(30 + (y / height) * 20) for y in range(height)])
+            return column.resize((width, height), Image.Resampling.NEAREST).convert('RGB')
+    
+    return Image.new('RGB', (width, height), color=background_color)
+
+
+@lru_cache(maxsize=4096)
+def _text_width(text: str, font) -> int:
+    """Rendered width of text in a font"""
+    bbox = font.getbbox(text)
+    return bbox[2] - bbox[0]
+
+
+@lru_cache(maxsize=256)
+def _wrap_text(text: str, font, max_width: int) -> Tuple[str, ...]:
+    """Greedy word wrap of text to max_width pixels"""
+    lines = []
+    current_line = []
+    current_width = 0
+    
+    for word in text.split():
+        word_width = _text_width(word + " ", font)
+        
+        if current_width + word_width > max_width and current_line:
+            lines.append(" ".join(current_line))
+            current_line = [word]
+            current_width = word_width
+        else:
+            current_line.append(word)
+            current_width += word_width
+    
+    if current_line:
+        lines.append(" ".join(current_line))
+    return tuple(lines)
+
+
+def render_scene_frame(
+    scene_title: str,
+    scene_text: str,
+    resolution: Tuple[int, int],
+    background_type: str,
+    background_color: str,
+    background_image_path: Optional[str],
+    output_path: Path
+) -> Path:
+    """
+    Render the still frame for a scene
+    
+    Module-level so frame rendering can run on the frame worker pool. Fonts,
+    backgrounds and text layout are cached per process.
+    """
+    from PIL import ImageDraw
+    
+    width, height = resolution
+    
+    # Normalize the background key so scenes with the same look share one buffer
+    image_mtime = None
+    if background_type == "upload" and background_image_path and os.path.exists(background_image_path):
+        image_mtime = os.path.getmtime(background_image_path)
+    elif background_type != "placeholder":
+        background_type, background_image_path = "solid", None
+    else:
+        background_color, background_image_path = None, None
+    
+    image = _get_background(background_type, background_color, background_image_path, image_mtime, (width, height)).copy()
+    draw = ImageDraw.Draw(image)
+    title_font, text_font = _get_fonts()
+    
+    # Draw scene title (centered, top) with shadow for readability
+    title_x = (width - _text_width(scene_title, title_font)) // 2
+    title_y = height // 6
+    draw.text((title_x + 2, title_y + 2), scene_title, font=title_font, fill="#000000")
+    draw.text((title_x, title_y), scene_title, font=title_font, fill="#FFFFFF")
+    
+    # Draw scene text (centered, middle), wrapped to fit width
+    lines = _wrap_text(scene_text, text_font, width - 200)
+    test_bbox = text_font.getbbox("A")
+    line_height = (test_bbox[3] - test_bbox[1]) + 10
+    
+    total_text_height = len(lines) * line_height
+    start_y = (height - total_text_height) // 2
+    
+    for i, line in enumerate(lines):
+        line_x = (width - _text_width(line, text_font)) // 2
+        line_y = start_y + i * line_height
+        
+        # Draw text with shadow
+        draw.text((line_x + 2, line_y + 2), line, font=text_font, fill="#000000")
+        draw.text((line_x, line_y), line, font=text_font, fill="#FFFFFF")
+    
+    # Frames are intermediates for the encoder, so favour speed over PNG size
+    image.save(output_path, "PNG", compress_level=1)
+    return Path(output_path)
+
+
+# Global frame worker pool
+_frame_pool = None
+_frame_pool_lock = threading.Lock()
+
+
+def get_frame_pool():
+    """Get global scene frame worker pool (None when VIDEO_FRAME_WORKERS <= 1)"""
+    global _frame_pool
+    if VIDEO_FRAME_WORKERS <= 1:
+        return None
+    if _frame_pool is None:
+        with _frame_pool_lock:
+            if _frame_pool is None:
+                import multiprocessing
+                from concurrent.futures import ProcessPoolExecutor
+                # Spawn rather than fork: forking the threaded API server is unsafe
+                _frame_pool = ProcessPoolExecutor(
+                    max_workers=VIDEO_FRAME_WORKERS,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+                logger.info(f"Started scene frame pool with {VIDEO_FRAME_WORKERS} workers")
+    return _frame_pool
+
+
+def shutdown_frame_pool():
+    """Stop the global frame worker pool (called on application shutdown)"""
+    global _frame_pool
+    with _frame_pool_lock:
+        if _frame_pool is not None:
+            _frame_pool.shutdown(wait=False, cancel_futures=True)
+            _frame_pool = None
+
 
 class VideoProvider(ABC):
     """Abstract base class for video rendering providers"""
@@ -34,10 +221,14 @@ class VideoProvider(ABC):
                 - background_image_path: Optional[str] (for upload type)
                 - include_narration: bool, default True (uses voiceover_audio if available)
                 - renderer: str ("baseline", "comfyui"), default "baseline"
+                - pipeline: str ("ffmpeg", "moviepy"), baseline renderer only,
+                  default VIDEO_RENDER_PIPELINE
         
         Returns:
             Dict containing:
-            - video_file: bytes (mp4)
+            - video_path: str, path of the rendered mp4
+            - work_dir: str, directory holding video_path and asset files; the
+              caller removes it once the files are stored
             - metadata: Dict with duration_sec, resolution, fps, scenes_count, renderer, model_used?
             - assets: List[Dict] with type, file_path, metadata for storyboard images, clips, etc.
         """
@@ -59,17 +250,29 @@ class BaselineVideoRenderer(VideoProvider):
     
     def __init__(self):
         """Initialize baseline video renderer"""
+        self._moviepy_available = self._check_moviepy()
         self._available = self._check_availability()
     
+    def _check_moviepy(self) -> bool:
+        """Check if moviepy is available (only needed by the moviepy pipeline)"""
+        try:
+            import moviepy
+            return True
+        except ImportError:
+            return False
+    
     def _check_availability(self) -> bool:
         """Check if required dependencies are available"""
         try:
             import PIL
-            import moviepy
         except ImportError as e:
             logger.warning(f"BaselineVideoRenderer dependencies not available: {e}")
             return False
         
+        if VIDEO_RENDER_PIPELINE == "moviepy" and not self._moviepy_available:
+            logger.warning("BaselineVideoRenderer dependencies not available: moviepy is not installed")
+            return False
+        
         # Check ffmpeg availability
         try:
             import subprocess
@@ -131,6 +334,7 @@ class BaselineVideoRenderer(VideoProvider):
         
         import tempfile
         import shutil
+        import time
         from pathlib import Path
         
         # Parse options
@@ -142,6 +346,7 @@ class BaselineVideoRenderer(VideoProvider):
         background_image_path = opts.get("background_image_path")
         include_narration = opts.get("include_narration", True)
         narration_audio_path = opts.get("narration_audio_path")  # Path to voiceover audio file
+        pipeline = opts.get("pipeline", VIDEO_RENDER_PIPELINE)
         
         # Extract scenes from video script
         # Video script may have hook, scenes, conclusion structure
@@ -173,70 +378,60 @@ class BaselineVideoRenderer(VideoProvider):
         assets = []
         
         try:
-            # Generate frames for each scene
-            scene_clips = []
-            total_duration = 0.0
+            render_start_time = time.time()
+            
+            # Generate a frame image for each scene
+            frame_jobs = []
+            durations = []
             
             for idx, scene in enumerate(scenes):
-                scene_title = scene.get("title", f"Scene {idx + 1}")
-                scene_text = scene.get("content", "")
-                scene_duration = scene.get("duration_seconds", 5.0)  # Default 5 seconds per scene
-                
-                logger.info(f"Rendering scene {idx + 1}/{len(scenes)}: {scene_title}")
-                
-                # Create frame image for this scene
-                frame_path = self._create_scene_frame(
-                    scene_title=scene_title,
-                    scene_text=scene_text,
-                    resolution=resolution,
-                    background_type=background_type,
-                    background_color=background_color,
-                    background_image_path=background_image_path,
-                    output_path=temp_dir / f"scene_{idx:03d}.png"
-                )
-                
-                # Create video clip from frame
-                clip_path = self._create_scene_clip(
-                    frame_path=frame_path,
-                    duration=scene_duration,
-                    fps=fps,
-                    output_path=temp_dir / f"scene_{idx:03d}.mp4"
-                )
-                
-                scene_clips.append(clip_path)
-                total_duration += scene_duration
-                
-                # Add to assets
-                assets.append({
-                    "type": "video_clip",
-                    "file_path": str(clip_path),
-                    "metadata": {
-                        "scene_index": idx,
-                        "scene_title": scene_title,
-                        "duration_sec": scene_duration
-                    }
+                frame_jobs.append({
+                    "scene_title": scene.get("title", f"Scene {idx + 1}"),
+                    "scene_text": scene.get("content", ""),
+                    "resolution": tuple(resolution),
+                    "background_type": background_type,
+                    "background_color": background_color,
+                    "background_image_path": background_image_path,
+                    "output_path": temp_dir / f"scene_{idx:03d}.png"
                 })
+                durations.append(float(scene.get("duration_seconds", 5.0)))  # Default 5 seconds per scene
             
-            # Concatenate all scene clips
-            final_video_path = temp_dir / "final_video.mp4"
-            self._concatenate_clips(
-                clip_paths=scene_clips,
-                output_path=final_video_path,
-                fps=fps
-            )
+            frame_paths = self._render_scene_frames(frame_jobs)
             
-            # Add narration audio if available
+            total_duration = sum(durations)
+            audio_path = None
             if include_narration and narration_audio_path and os.path.exists(narration_audio_path):
-                logger.info("Adding narration audio to video")
-                final_video_path = self._add_audio(
-                    video_path=final_video_path,
-                    audio_path=narration_audio_path,
-                    output_path=temp_dir / "final_video_with_audio.mp4"
+                audio_path = narration_audio_path
+            
+            final_video_path = None
+            if pipeline == "ffmpeg":
+                try:
+                    final_video_path = self._render_single_pass(
+                        frame_paths=frame_paths,
+                        durations=durations,
+                        fps=fps,
+                        audio_path=audio_path,
+                        output_path=temp_dir / "final_video.mp4"
+                    )
+                except Exception as e:
+                    if not self._moviepy_available:
+                        raise
+                    logger.warning(f"Single-pass ffmpeg render failed, falling back to moviepy pipeline: {e}")
+                    pipeline = "moviepy"
+            
+            if final_video_path is None:
+                final_video_path = self._render_moviepy(
+                    scenes=scenes,
+                    frame_paths=frame_paths,
+                    durations=durations,
+                    fps=fps,
+                    audio_path=audio_path,
+                    temp_dir=temp_dir,
+                    assets=assets
                 )
             
-            # Read final video file
-            with open(final_video_path, 'rb') as f:
-                video_bytes = f.read()
+            render_seconds = time.time() - render_start_time
+            logger.info(f"Rendered {len(scenes)} scenes ({total_duration:.1f}s of video) with {pipeline} pipeline in {render_seconds:.2f}s")
             
             metadata = {
                 "duration_sec": total_duration,
@@ -244,130 +439,160 @@ class BaselineVideoRenderer(VideoProvider):
                 "fps": fps,
                 "scenes_count": len(scenes),
                 "renderer": "baseline",
-                "background_type": background_type
+                "background_type": background_type,
+                "pipeline": pipeline,
+                "render_seconds": round(render_seconds, 3)
             }
             
+            # The video and asset files stay on disk for the caller to stream into storage
             return {
-                "video_file": video_bytes,
+                "video_path": str(final_video_path),
+                "work_dir": str(temp_dir),
                 "metadata": metadata,
                 "assets": assets
             }
             
-        finally:
+        except BaseException:
             # Clean up temp directory
+            shutil.rmtree(temp_dir, ignore_errors=True)
+            raise
+    
+    def _render_scene_frames(self, frame_jobs: List[Dict[str, Any]]) -> List[Path]:
+        """
+        Render scene frames, concurrently on the frame worker pool when there are several
+        
+        Args:
+            frame_jobs: render_scene_frame keyword arguments per scene, in order
+        
+        Returns:
+            Frame paths in scene order
+        """
+        from concurrent.futures.process import BrokenProcessPool
+        
+        pool = get_frame_pool() if len(frame_jobs) > 1 else None
+        if pool is not None:
+            logger.info(f"Rendering {len(frame_jobs)} scene frames on {VIDEO_FRAME_WORKERS} workers")
             try:
-                shutil.rmtree(temp_dir)
-            except Exception as e:
-                logger.warning(f"Failed to clean up temp directory: {e}")
+                futures = [pool.submit(render_scene_frame, **job) for job in frame_jobs]
+                return [future.result() for future in futures]
+            except BrokenProcessPool as e:
+                # A worker died; drop the pool and render in-process
+                logger.warning(f"Scene frame pool failed, rendering frames in-process: {e}")
+                shutdown_frame_pool()
+        
+        frame_paths = []
+        for idx, job in enumerate(frame_jobs):
+            logger.info(f"Rendering scene {idx + 1}/{len(frame_jobs)}: {job['scene_title']}")
+            frame_paths.append(render_scene_frame(**job))
+        return frame_paths
     
-    def _create_scene_frame(
+    def _render_single_pass(
         self,
-        scene_title: str,
-        scene_text: str,
-        resolution: Tuple[int, int],
-        background_type: str,
-        background_color: str,
-        background_image_path: Optional[str],
+        frame_paths: List[Path],
+        durations: List[float],
+        fps: int,
+        audio_path: Optional[str],
         output_path: Path
     ) -> Path:
-        """Create a single frame image for a scene"""
-        from PIL import Image, ImageDraw, ImageFont
-        
-        width, height = resolution
-        
-        # Create background
-        if background_type == "upload" and background_image_path and os.path.exists(background_image_path):
-            # Use uploaded image as background
-            bg_image = Image.open(background_image_path)
-            bg_image = bg_image.resize((width, height), Image.Resampling.LANCZOS)
-            image = bg_image.copy()
-        elif background_type == "placeholder":
-            # Create gradient placeholder
-            image = Image.new('RGB', (width, height), color='#1a1a1a')
-            draw = ImageDraw.Draw(image)
-            # Draw simple gradient
-            for y in range(height):
-                color_val = int(30 + (y / height) * 20)
-                draw.line([(0, y), (width, y)], fill=(color_val, color_val, color_val))
-        else:
-            # Solid color background
-            image = Image.new('RGB', (width, height), color=background_color)
-        
-        draw = ImageDraw.Draw(image)
+        """
+        Encode scene frames and narration into the final video in one ffmpeg run
         
-        # Try to load a font, fallback to default if not available
-        try:
-            # Try to use a system font
-            title_font = ImageFont.truetype("arial.ttf", 72)
-            text_font = ImageFont.truetype("arial.ttf", 48)
-        except:
-            try:
-                title_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 72)
-                text_font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 48)
-            except:
-                # Use default font
-                title_font = ImageFont.load_default()
-                text_font = ImageFont.load_default()
-        
-        # Draw scene title (centered, top)
-        title_bbox = draw.textbbox((0, 0), scene_title, font=title_font)
-        title_width = title_bbox[2] - title_bbox[0]
-        title_height = title_bbox[3] - title_bbox[1]
-        title_x = (width - title_width) // 2
-        title_y = height // 6
-        
-        # Draw title with shadow for readability
-        draw.text((title_x + 2, title_y + 2), scene_title, font=title_font, fill="#000000")
-        draw.text((title_x, title_y), scene_title, font=title_font, fill="#FFFFFF")
-        
-        # Draw scene text (centered, middle)
-        # Wrap text to fit width
-        max_text_width = width - 200
-        words = scene_text.split()
-        lines = []
-        current_line = []
-        current_width = 0
-        
-        for word in words:
-            word_bbox = draw.textbbox((0, 0), word + " ", font=text_font)
-            word_width = word_bbox[2] - word_bbox[0]
-            
-            if current_width + word_width > max_text_width and current_line:
-                lines.append(" ".join(current_line))
-                current_line = [word]
-                current_width = word_width
-            else:
-                current_line.append(word)
-                current_width += word_width
+        The concat demuxer shows each still frame for its scene duration, so every
+        frame is H.264-encoded once. Narration is muxed in the same pass, looped or
+        trimmed to the video length like _add_audio.
+        """
+        import subprocess
+        
+        # Frames sit next to the list file, so entries are plain file names
+        list_path = output_path.with_suffix(".ffconcat")
+        lines = ["ffconcat version 1.0"]
+        for frame_path, duration in zip(frame_paths, durations):
+            lines.append(f"file '{frame_path.name}'")
+            lines.append(f"duration {duration:.3f}")
+        # The demuxer drops the last entry's duration unless the last file is repeated
+        lines.append(f"file '{frame_paths[-1].name}'")
+        list_path.write_text("\n".join(lines) + "\n")
+        
+        total_duration = sum(durations)
+        cmd = [
+            "ffmpeg", "-y", "-loglevel", "error",
+            "-f", "concat", "-safe", "0", "-i", str(list_path),
+        ]
+        if audio_path:
+            cmd += ["-stream_loop", "-1", "-i", audio_path]
+        cmd += [
+            "-map", "0:v",
+            "-vf", f"fps={fps},format=yuv420p",
+            "-c:v", "libx264", "-preset", VIDEO_X264_PRESET, "-tune", "stillimage",
+        ]
+        if audio_path:
+            cmd += ["-map", "1:a", "-c:a", "aac", "-b:a", "128k"]
+        cmd += [
+            "-t", f"{total_duration:.3f}",
+            "-movflags", "+faststart",
+            str(output_path)
+        ]
         
-        if current_line:
-            lines.append(" ".join(current_line))
+        result = subprocess.run(cmd, capture_output=True, timeout=max(300, total_duration * 10))
+        if result.returncode != 0:
+            raise RuntimeError(f"ffmpeg failed: {result.stderr.decode(errors='replace')[-2000:]}")
         
-        # Draw text lines
-        try:
-            # Try to get line height using textbbox
-            test_bbox = draw.textbbox((0, 0), "A", font=text_font)
-            line_height = (test_bbox[3] - test_bbox[1]) + 10
-        except:
-            # Fallback
-            line_height = 50
-        
-        total_text_height = len(lines) * line_height
-        start_y = (height - total_text_height) // 2
-        
-        for i, line in enumerate(lines):
-            line_bbox = draw.textbbox((0, 0), line, font=text_font)
-            line_width = line_bbox[2] - line_bbox[0]
-            line_x = (width - line_width) // 2
-            line_y = start_y + i * line_height
+        return output_path
+    
+    def _render_moviepy(
+        self,
+        scenes: List[Dict[str, Any]],
+        frame_paths: List[Path],
+        durations: List[float],
+        fps: int,
+        audio_path: Optional[str],
+        temp_dir: Path,
+        assets: List[Dict[str, Any]]
+    ) -> Path:
+        """Render with moviepy: one clip per scene, concatenated, then audio added"""
+        if not self._moviepy_available:
+            raise RuntimeError("The moviepy render pipeline requires moviepy. Install moviepy or use VIDEO_RENDER_PIPELINE=ffmpeg.")
+        
+        scene_clips = []
+        for idx, (scene, frame_path, scene_duration) in enumerate(zip(scenes, frame_paths, durations)):
+            # Create video clip from frame
+            clip_path = self._create_scene_clip(
+                frame_path=frame_path,
+                duration=scene_duration,
+                fps=fps,
+                output_path=temp_dir / f"scene_{idx:03d}.mp4"
+            )
+            scene_clips.append(clip_path)
             
-            # Draw text with shadow
-            draw.text((line_x + 2, line_y + 2), line, font=text_font, fill="#000000")
-            draw.text((line_x, line_y), line, font=text_font, fill="#FFFFFF")
+            # Add to assets
+            assets.append({
+                "type": "video_clip",
+                "file_path": str(clip_path),
+                "metadata": {
+                    "scene_index": idx,
+                    "scene_title": scene.get("title", f"Scene {idx + 1}"),
+                    "duration_sec": scene_duration
+                }
+            })
+        
+        # Concatenate all scene clips
+        final_video_path = temp_dir / "final_video.mp4"
+        self._concatenate_clips(
+            clip_paths=scene_clips,
+            output_path=final_video_path,
+            fps=fps
+        )
         
-        # Save frame
-        image.save(output_path, "PNG")
-        return output_path
+        # Add narration audio if available
+        if audio_path:
+            logger.info("Adding narration audio to video")
+            final_video_path = self._add_audio(
+                video_path=final_video_path,
+                audio_path=audio_path,
+                output_path=temp_dir / "final_video_with_audio.mp4"
+            )
+        
+        return final_video_path
     
     def _create_scene_clip(
         self,
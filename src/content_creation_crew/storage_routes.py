@@ -0,0 +1,299 @@
+"""
+Storage media routes
+Serves stored voiceovers, videos and images with byte ranges, ETags and long-lived caching
+"""
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.types import Receive, Scope, Send
+from email.utils import formatdate
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import hashlib
+import logging
+import mimetypes
+import time
+
+from .config import config
+from .services.storage_provider import S3_PRESIGNED_URL_REFRESH_MARGIN, StorageProvider, get_storage_provider
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/storage", tags=["storage"])
+
+# Read size when streaming a file body without zero-copy send
+CHUNK_SIZE = 256 * 1024
+
+# ASGI extension for os.sendfile-style responses (advertised by the server in scope["extensions"])
+ZEROCOPY_EXTENSION = "http.response.zerocopysend"
+
+# Key prefixes of generated media; other stored objects (invoices, credit notes,
+# TTS cache) have guessable keys and are never served by this unauthenticated route
+SERVED_PREFIXES = ("voiceovers/", "videos/", "storyboard_images/", "video_clips/")
+
+# Storage provider for serving; local disk and S3 providers are stateless, so one is reused
+_storage: Optional[StorageProvider] = None
+
+
+class RangeNotSatisfiable(Exception):
+    """Range header that does not overlap the file"""
+    pass
+
+
+def _get_storage() -> StorageProvider:
+    """Get the storage provider used for serving media"""
+    global _storage
+    if _storage is None:
+        _storage = get_storage_provider()
+    return _storage
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    Parse a Range header for a file of the given size
+    
+    Only single byte ranges are honoured; multi-range and malformed headers are
+    ignored and the whole file is served, which RFC 9110 allows.
+    
+    Args:
+        header: Range header value (e.g. "bytes=0-1023", "bytes=1024-", "bytes=-500")
+        size: File size in bytes
+    
+    Returns:
+        Inclusive (start, end) byte positions, or None to serve the whole file
+    
+    Raises:
+        RangeNotSatisfiable: If the range starts beyond the end of the file
+    """
+    if not header:
+        return None
+    
+    unit, _, byte_range = header.partition("=")
+    if unit.strip().lower() != "bytes" or "," in byte_range:
+        return None
+    start_text, separator, end_text = byte_range.strip().partition("-")
+    if not separator:
+        return None
+    
+    try:
+        if not start_text:
+            # Suffix range: the last N bytes
+            suffix_length = int(end_text)
+            if suffix_length <= 0 or size == 0:
+                raise RangeNotSatisfiable(header)
+            return max(0, size - suffix_length), size - 1
+        start = int(start_text)
+        end = int(end_text) if end_text else None
+    except ValueError:
+        return None
+    
+    if end is not None and start > end:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable(header)
+    return start, size - 1 if end is None else min(end, size - 1)
+
+
+@lru_cache(maxsize=4096)
+def file_etag(path: str, size: int, mtime_ns: int) -> str:
+    """
+    Strong ETag for a stored file, keyed by path, size and modification time
+    
+    Files up to STORAGE_ETAG_HASH_MAX_BYTES are hashed once and the result is
+    memoized; larger files use size and mtime so a first request does not have
+    to read the whole file.
+    """
+    if size > config.STORAGE_ETAG_HASH_MAX_BYTES:
+        return f'"{size:x}-{mtime_ns:x}"'
+    
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(header: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)"""
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    bare_etag = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == bare_etag:
+            return True
+    return False
+
+
+class MediaFileResponse(Response):
+    """Response whose body is a byte range of a file, sent with zero-copy send when the server supports it"""
+    
+    def __init__(
+        self,
+        path: Path,
+        start: int,
+        end: int,
+        status_code: int,
+        headers: Dict[str, str],
+        media_type: str,
+        send_body: bool = True
+    ):
+        """
+        Initialize media file response
+        
+        Args:
+            path: File to send
+            start: First byte to send
+            end: Last byte to send (inclusive)
+            status_code: 200 or 206
+            headers: Response headers, including Content-Length
+            media_type: Content type
+            send_body: False for HEAD requests
+        """
+        super().__init__(content=b"", status_code=status_code, headers=headers, media_type=media_type)
+        self.path = path
+        self.start = start
+        self.end = end
+        self.send_body = send_body
+    
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        
+        count = self.end - self.start + 1
+        if not self.send_body or count <= 0:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        
+        file = await run_in_threadpool(open, self.path, 'rb')
+        try:
+            if ZEROCOPY_EXTENSION in scope.get("extensions", {}):
+                # The server sends straight from the file descriptor (os.sendfile)
+                await send({"type": ZEROCOPY_EXTENSION, "file": file, "offset": self.start, "count": count})
+                return
+            
+            await run_in_threadpool(file.seek, self.start)
+            remaining = count
+            while remaining > 0:
+                chunk = await run_in_threadpool(file.read, min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:
+                # File shrank while sending; end the body rather than hang the client
+                await send({"type": "http.response.body", "body": b""})
+        finally:
+            await run_in_threadpool(file.close)
+
+
+@router.api_route(
+    "/{key:path}",
+    methods=["GET", "HEAD"],
+    summary="Get stored media",
+    description="""
+    Serve a stored file (voiceover audio, video, storyboard image).
+    Only generated media prefixes are served; other keys return 404.
+    
+    Local disk storage supports `Range` (single byte range), `If-Range` and
+    `If-None-Match`, with content-hash ETags and long-lived cache headers.
+    S3 storage redirects to a presigned URL, which S3 serves with the same
+    range and caching support.
+    """
+)
+async def get_storage_object(key: str, request: Request):
+    """
+    Serve a stored object
+    
+    Args:
+        key: Storage key/path
+    
+    Returns:
+        File body (200/206), 304 Not Modified, or a redirect to a presigned URL
+    """
+    key = key.lstrip("/")
+    if not key.startswith(SERVED_PREFIXES) or ".." in key:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    
+    storage = _get_storage()
+    path = await run_in_threadpool(storage.local_path, key)
+    
+    if path is None:
+        if hasattr(storage, "get_presigned_url"):
+            try:
+                url, expires_at = await run_in_threadpool(storage.get_presigned_url, key, require_exists=True)
+            except FileNotFoundError:
+                raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+            # Browsers may reuse the redirect while the URL stays valid
+            max_age = max(0, int(expires_at - time.time()) - S3_PRESIGNED_URL_REFRESH_MARGIN)
+            return RedirectResponse(
+                url,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={"Cache-Control": f"private, max-age={max_age}"}
+            )
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="File not found")
+    
+    media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+    cache_control = f"public, max-age={config.STORAGE_MEDIA_MAX_AGE}, immutable"
+    
+    if config.STORAGE_ACCEL_REDIRECT_PREFIX:
+        # nginx sends the file itself (sendfile, ranges, ETag) from its internal location
+        relative_key = path.relative_to(storage.base_path.resolve()).as_posix()
+        return Response(
+            status_code=status.HTTP_200_OK,
+            media_type=media_type,
+            headers={
+                "X-Accel-Redirect": config.STORAGE_ACCEL_REDIRECT_PREFIX.rstrip("/") + "/" + relative_key,
+                "Cache-Control": cache_control
+            }
+        )
+    
+    stat_result = await run_in_threadpool(path.stat)
+    size = stat_result.st_size
+    etag = await run_in_threadpool(file_etag, str(path), size, stat_result.st_mtime_ns)
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Last-Modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "Cache-Control": cache_control
+    }
+    
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range.strip() != etag:
+        # The client's partial copy is stale; send the whole file
+        range_header = None
+    
+    try:
+        byte_range = parse_range(range_header, size)
+    except RangeNotSatisfiable:
+        return Response(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            headers={"Content-Range": f"bytes */{size}", "Accept-Ranges": "bytes"}
+        )
+    
+    if byte_range is None:
+        start, end, status_code = 0, size - 1, status.HTTP_200_OK
+    else:
+        start, end = byte_range
+        status_code = status.HTTP_206_PARTIAL_CONTENT
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    
+    return MediaFileResponse(
+        path=path,
+        start=start,
+        end=end,
+        status_code=status_code,
+        headers=headers,
+        media_type=media_type,
+        send_body=request.method != "HEAD"
+    )
+
@@ -0,0 +1,233 @@
+"""
+Generation worker - Runs queued content generation jobs outside the API process
+
+Usage:
+    JOB_EXECUTION_MODE=queue REDIS_URL=redis://... python -m content_creation_crew.worker
+
+The API (with JOB_EXECUTION_MODE=queue) only enqueues jobs; any number of
+worker processes claim them from Postgres, so API and generation capacity scale
+independently. Each worker runs up to WORKER_CONCURRENCY jobs, renews their
+leases by heartbeat, and stops jobs that are cancelled through the API.
+
+On SIGTERM/SIGINT the worker stops claiming and drains in-flight jobs. A second
+signal hands the remaining jobs back to the queue and exits immediately.
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Set
+
+from .config import config
+from .database import SessionLocal, User
+from .logging_config import setup_logging
+from .services.job_queue import ClaimedJob, JobQueue, get_job_queue
+from .services.metrics import increment_counter, set_gauge
+from .services.plan_policy import PlanPolicy
+
+logger = logging.getLogger(__name__)
+
+
+class GenerationWorker:
+    """Claims queued generation jobs and runs them with bounded concurrency"""
+
+    def __init__(
+        self,
+        concurrency: Optional[int] = None,
+        poll_interval: Optional[float] = None,
+        queue: Optional[JobQueue] = None,
+        worker_id: Optional[str] = None
+    ):
+        """
+        Initialize worker
+
+        Args:
+            concurrency: Maximum concurrent jobs (default: WORKER_CONCURRENCY)
+            poll_interval: Seconds between queue polls when idle (default: WORKER_POLL_INTERVAL)
+            queue: Job queue (default: global queue)
+            worker_id: Lease owner ID (default: hostname-pid-random)
+        """
+        self.concurrency = concurrency or config.WORKER_CONCURRENCY
+        self.poll_interval = poll_interval or config.WORKER_POLL_INTERVAL
+        self.queue = queue or get_job_queue()
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+        self.heartbeat_interval = max(1.0, self.queue.lease_seconds / 3)
+
+        self._tasks: Dict[int, asyncio.Task] = {}
+        self._lease_lost: Set[int] = set()  # Jobs stopped because another worker took over their lease
+        self._stopping = False
+        self._wakeup: Optional[asyncio.Event] = None
+
+    def request_stop(self):
+        """Stop claiming new jobs; in-flight jobs are drained"""
+        if self._stopping:
+            logger.warning(f"[WORKER] Second stop signal, handing {len(self._tasks)} job(s) back to the queue")
+            for job_id in list(self._tasks):
+                try:
+                    self.queue.abandon(self.worker_id, job_id)
+                except Exception as e:
+                    logger.error(f"[WORKER] Failed to abandon job {job_id}: {e}")
+            os._exit(1)
+        logger.info(f"[WORKER] Stop requested, draining {len(self._tasks)} in-flight job(s)")
+        self._stopping = True
+        if self._wakeup:
+            self._wakeup.set()
+
+    async def run(self):
+        """Main loop: claim, run, heartbeat until stopped and drained"""
+        loop = asyncio.get_running_loop()
+        # Generation runs crew.kickoff via run_in_executor(None, ...) - give it a pool sized for this worker
+        loop.set_default_executor(ThreadPoolExecutor(
+            max_workers=max(4, self.concurrency * 2),
+            thread_name_prefix="generation"
+        ))
+        self._wakeup = asyncio.Event()
+        last_heartbeat = loop.time()
+
+        logger.info(f"[WORKER] Worker {self.worker_id} started, concurrency={self.concurrency}, lease={self.queue.lease_seconds}s")
+
+        while not (self._stopping and not self._tasks):
+            if not self._stopping:
+                await self._fill_slots()
+
+            if loop.time() - last_heartbeat >= self.heartbeat_interval:
+                await self._heartbeat()
+                last_heartbeat = loop.time()
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+        logger.info(f"[WORKER] Worker {self.worker_id} stopped")
+
+    async def _fill_slots(self):
+        """Fail exhausted orphans and claim jobs for free slots"""
+        free_slots = self.concurrency - len(self._tasks)
+        try:
+            await asyncio.to_thread(self.queue.fail_exhausted)
+            claimed = await asyncio.to_thread(self.queue.claim, self.worker_id, free_slots) if free_slots > 0 else []
+        except Exception as e:
+            logger.error(f"[WORKER] Queue poll failed: {type(e).__name__}: {e}")
+            return
+
+        for job in claimed:
+            if job.recovered:
+                increment_counter("worker_jobs_recovered_total")
+            increment_counter("worker_jobs_claimed_total")
+            task = asyncio.create_task(self._run_job(job))
+            self._tasks[job.job_id] = task
+        set_gauge("worker_jobs_in_flight", float(len(self._tasks)), {"worker": self.worker_id})
+
+    async def _heartbeat(self):
+        """Renew leases, stop jobs cancelled through the API and jobs whose lease was lost"""
+        if not self._tasks:
+            return
+        try:
+            result = await asyncio.to_thread(self.queue.heartbeat, self.worker_id, list(self._tasks))
+        except Exception as e:
+            # Lease expiry is the safety net - keep running and retry next interval
+            logger.warning(f"[WORKER] Heartbeat failed: {type(e).__name__}: {e}")
+            return
+
+        for job_id in result.cancelled:
+            task = self._tasks.get(job_id)
+            if task is None or task.done():
+                continue
+            logger.info(f"[WORKER] Job {job_id} was cancelled, stopping it")
+            task.cancel()
+
+        # Another worker owns these now: stop without recording CANCELLED or sending events
+        for job_id in result.lost:
+            task = self._tasks.get(job_id)
+            if task is None or task.done():
+                continue
+            logger.warning(f"[WORKER] Job {job_id} lost its lease to another worker, stopping it")
+            increment_counter("worker_leases_lost_total")
+            self._lease_lost.add(job_id)
+            task.cancel()
+
+    def _resolve_plan(self, user_id: int) -> str:
+        """Look up the job owner's plan at execution time"""
+        db = SessionLocal()
+        try:
+            user = db.query(User).filter(User.id == user_id).first()
+            if not user:
+                raise ValueError(f"User {user_id} not found")
+            return PlanPolicy(db, user).get_plan()
+        finally:
+            db.close()
+
+    async def _run_job(self, job: ClaimedJob):
+        """Run one claimed job and release it from the queue"""
+        from .content_routes import execute_generation_job
+
+        logger.info(f"[WORKER] Running job {job.job_id} (attempt {job.attempt}{', recovered' if job.recovered else ''})")
+        finished = False
+        try:
+            plan = await asyncio.to_thread(self._resolve_plan, job.user_id)
+            await execute_generation_job(
+                job.job_id, job.topic, job.content_types, plan, job.user_id, org_id=job.org_id,
+                is_lease_lost=lambda: job.job_id in self._lease_lost
+            )
+            finished = True
+        except asyncio.CancelledError:
+            if job.job_id in self._lease_lost:
+                logger.info(f"[WORKER] Job {job.job_id} stopped after losing its lease")
+            else:
+                logger.info(f"[WORKER] Job {job.job_id} cancelled")
+                finished = True
+        except Exception as e:
+            # execute_generation_job records failures itself; this only catches setup errors,
+            # which are retried until JOB_MAX_ATTEMPTS and then failed by fail_exhausted()
+            logger.error(f"[WORKER] Job {job.job_id} could not be started: {type(e).__name__}: {e}", exc_info=True)
+        finally:
+            self._tasks.pop(job.job_id, None)
+            lease_lost = job.job_id in self._lease_lost
+            self._lease_lost.discard(job.job_id)
+            try:
+                if lease_lost:
+                    pass  # The new owner releases it
+                elif finished:
+                    await asyncio.to_thread(self.queue.release, self.worker_id, job.job_id)
+                else:
+                    await asyncio.to_thread(self.queue.abandon, self.worker_id, job.job_id)
+            except Exception as e:
+                logger.error(f"[WORKER] Failed to release job {job.job_id}: {e}")
+            set_gauge("worker_jobs_in_flight", float(len(self._tasks)), {"worker": self.worker_id})
+            if self._wakeup:
+                self._wakeup.set()
+
+
+def main():
+    """Worker entry point"""
+    setup_logging(env=config.ENV, log_level=config.LOG_LEVEL)
+    if config.JOB_EXECUTION_MODE != "queue":
+        logger.warning("[WORKER] JOB_EXECUTION_MODE is not 'queue' - the API will not enqueue jobs for this worker")
+    if not config.REDIS_URL:
+        # Job events would stay in this process's in-memory event store and never reach API streams
+        logger.error("[WORKER] REDIS_URL is required to run the generation worker")
+        sys.exit(1)
+
+    worker = GenerationWorker()
+
+    async def run_worker():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, worker.request_stop)
+            except (NotImplementedError, AttributeError):
+                # Windows: fall back to default KeyboardInterrupt handling
+                pass
+        await worker.run()
+
+    asyncio.run(run_worker())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Tests for voiceover rendition encoding
+"""
+import pytest
+
+
+class TestTranscodeCommand:
+    """Test the ffmpeg command line"""
+
+    def test_single_run_for_all_renditions(self):
+        """Test that every rendition is an output of one ffmpeg invocation"""
+        from content_creation_crew.services.audio_transcoder import build_transcode_command
+
+        cmd = build_transcode_command("/tmp/voice.wav", {"mp3": "/tmp/voice.mp3", "opus": "/tmp/voice.opus"})
+
+        assert cmd.count("-i") == 1
+        assert cmd[cmd.index("-i") + 1] == "/tmp/voice.wav"
+        assert cmd.count("-map") == 2
+        assert cmd.index("libmp3lame") < cmd.index("/tmp/voice.mp3") < cmd.index("libopus") < cmd.index("/tmp/voice.opus")
+
+
+class TestTranscodeWav:
+    """Test encoding with a stubbed ffmpeg"""
+
+    def test_missing_ffmpeg(self, monkeypatch):
+        """Test that a missing ffmpeg binary raises TranscoderUnavailable"""
+        from content_creation_crew.services import audio_transcoder
+
+        monkeypatch.setattr(audio_transcoder.shutil, "which", lambda name: None)
+
+        with pytest.raises(audio_transcoder.TranscoderUnavailable):
+            audio_transcoder.transcode_wav("/tmp/voice.wav", ["mp3"])
+
+    def test_outputs_next_to_source(self, monkeypatch, tmp_path):
+        """Test that renditions are written beside the WAV and unknown names are ignored"""
+        import subprocess
+        from content_creation_crew.services import audio_transcoder
+
+        commands = []
+
+        def fake_run(cmd, **kwargs):
+            commands.append(cmd)
+            return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+        monkeypatch.setattr(audio_transcoder.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(audio_transcoder.subprocess, "run", fake_run)
+
+        outputs = audio_transcoder.transcode_wav(str(tmp_path / "voice.wav"), ["mp3", "aac", "flac"])
+
+        assert outputs == {"mp3": str(tmp_path / "voice.mp3"), "aac": str(tmp_path / "voice.m4a")}
+        assert len(commands) == 1
+
+    def test_failure_removes_partial_output(self, monkeypatch, tmp_path):
+        """Test that a failed encode raises and leaves no partial files"""
+        import subprocess
+        from content_creation_crew.services import audio_transcoder
+
+        def fake_run(cmd, **kwargs):
+            (tmp_path / "voice.mp3").write_bytes(b"partial")
+            return subprocess.CompletedProcess(cmd, 1, b"", b"Invalid data found")
+
+        monkeypatch.setattr(audio_transcoder.shutil, "which", lambda name: "/usr/bin/ffmpeg")
+        monkeypatch.setattr(audio_transcoder.subprocess, "run", fake_run)
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            audio_transcoder.transcode_wav(str(tmp_path / "voice.wav"), ["mp3"])
+        assert not (tmp_path / "voice.mp3").exists()
+
+
+class TestTranscodeVoiceover:
+    """Test the async transcode stage"""
+
+    def test_runs_on_transcode_pool_and_records_metrics(self, monkeypatch):
+        """Test that encoding runs on the bounded pool and its outcome is recorded"""
+        import asyncio
+        import threading
+        from content_creation_crew.services import audio_transcoder
+        from content_creation_crew.services.metrics import TTSMetrics
+
+        threads = []
+        recorded = []
+
+        def fake_transcode(wav_path, renditions=None):
+            threads.append(threading.current_thread().name)
+            return {"mp3": "/tmp/voice.mp3"}
+
+        monkeypatch.setattr(audio_transcoder, "transcode_wav", fake_transcode)
+        monkeypatch.setattr(
+            TTSMetrics, "record_transcode",
+            staticmethod(lambda provider, duration, success=True: recorded.append((provider, success)))
+        )
+
+        outputs = asyncio.run(audio_transcoder.transcode_voiceover("/tmp/voice.wav", "piper"))
+
+        assert outputs == {"mp3": "/tmp/voice.mp3"}
+        assert threads[0].startswith("audio-transcode")
+        assert recorded == [("piper", True)]
+        audio_transcoder.shutdown_transcode_executor()
@@ -0,0 +1,167 @@
+"""
+Tests for the bounded in-memory content cache and single-flight fills
+"""
+import asyncio
+import time
+import pytest
+
+
+@pytest.fixture
+def content_cache():
+    """In-memory content cache with a small byte budget"""
+    from content_creation_crew.services.content_cache import ContentCache
+    return ContentCache(default_ttl=60, max_bytes=4000, fill_timeout=5)
+
+
+class TestContentCacheBounds:
+    """Test LRU eviction, size accounting and expiry"""
+
+    def test_lru_eviction_by_bytes(self, content_cache):
+        """Test that the least recently used entry is evicted when over budget"""
+        for topic in ("a", "b", "c"):
+            content_cache.set(topic, {'content': 'x' * 1000})
+        content_cache.get("a")  # "b" becomes least recently used
+        content_cache.set("d", {'content': 'x' * 1000})
+
+        assert content_cache.get("b") is None
+        assert content_cache.get("a") is not None
+        assert content_cache.get_stats()['bytes'] <= content_cache.max_bytes
+
+    def test_oversized_entry_not_cached(self, content_cache):
+        """Test that an entry larger than the whole budget is skipped"""
+        content_cache.set("big", {'content': 'x' * 5000})
+        assert content_cache.get("big") is None
+        assert content_cache.get_stats()['bytes'] == 0
+
+    def test_replacing_entry_keeps_byte_count(self, content_cache):
+        """Test that overwriting a key does not double count its bytes"""
+        content_cache.set("a", {'content': 'x' * 1000})
+        content_cache.set("a", {'content': 'x' * 1000})
+        entry = content_cache.cache[content_cache.get_cache_key("a")]
+        assert content_cache.get_stats()['bytes'] == entry['size']
+
+    def test_cleanup_expired(self, content_cache):
+        """Test that the sweep removes expired entries and their bytes"""
+        content_cache.set("a", {'content': 'short'}, ttl=1)
+        content_cache.cache[content_cache.get_cache_key("a")]['expires_at'] = time.time() - 1
+
+        assert content_cache.cleanup_expired() == 1
+        assert content_cache.get_stats()['bytes'] == 0
+
+    def test_popular_topics_from_live_entries(self, content_cache):
+        """Test that access counts are dropped with evicted entries"""
+        content_cache.set("a", {'content': 'short'})
+        content_cache.get("a")
+        assert content_cache.get_popular_topics() == [content_cache.get_cache_key("a")]
+
+        content_cache.clear("a")
+        assert content_cache.get_popular_topics() == []
+
+    def test_explicit_content_types(self, content_cache):
+        """Test that entries can be keyed by the requested content types"""
+        content_cache.set("a", {'content': 'blog text'}, content_types=['blog'])
+        assert content_cache.get("a", ['blog'])['content'] == 'blog text'
+
+
+class TestSingleFlight:
+    """Test coalescing of concurrent misses"""
+
+    def test_second_claim_is_refused(self, content_cache):
+        """Test that only one job claims a fill for a key"""
+        assert content_cache.begin_fill("a") is True
+        assert content_cache.begin_fill("a") is False
+        assert content_cache.begin_fill("b") is True
+
+        content_cache.end_fill("a")
+        assert content_cache.begin_fill("a") is True
+
+    def test_stale_claim_is_taken_over(self):
+        """Test that a claim past its timeout can be taken over"""
+        from content_creation_crew.services.content_cache import ContentCache
+        cache = ContentCache(fill_timeout=0)
+        assert cache.begin_fill("a") is True
+        time.sleep(0.01)
+        assert cache.begin_fill("a") is True
+
+    @pytest.mark.asyncio
+    async def test_waiter_receives_filled_content(self, content_cache):
+        """Test that a waiting job gets the leader's content"""
+        assert content_cache.begin_fill("a") is True
+
+        async def leader():
+            await asyncio.sleep(0.1)
+            content_cache.set("a", {'content': 'generated'})
+            content_cache.end_fill("a")
+
+        leader_task = asyncio.create_task(leader())
+        result = await content_cache.wait_for_fill("a", timeout=2)
+        await leader_task
+
+        assert result['content'] == 'generated'
+
+    @pytest.mark.asyncio
+    async def test_waiter_gets_none_when_leader_fails(self, content_cache):
+        """Test that waiters fall through to their own generation if the fill fails"""
+        assert content_cache.begin_fill("a") is True
+        asyncio.get_running_loop().call_later(0.1, content_cache.end_fill, "a")
+
+        assert await content_cache.wait_for_fill("a", timeout=2) is None
+        assert content_cache.begin_fill("a") is True
+
+
+class TestCacheHitJob:
+    """Test that a generation job completes from the content cache"""
+
+    @pytest.mark.parametrize("lookup", ["get", "get_similar"])
+    def test_job_completes_on_cache_hit(self, monkeypatch, tmp_path, lookup):
+        """Test that an exact or near-duplicate cache hit stores the artifact on a fresh session and completes the job"""
+        from unittest.mock import AsyncMock, Mock, patch
+        from sqlalchemy import create_engine
+        from sqlalchemy.dialects.postgresql import JSONB
+        from sqlalchemy.ext.compiler import compiles
+        from sqlalchemy.orm import sessionmaker
+        from content_creation_crew import content_routes
+        from content_creation_crew.config import config
+        from content_creation_crew.db.models.content import ContentArtifact, ContentJob
+        from content_creation_crew.db.models.user import User
+
+        @compiles(JSONB, "sqlite")
+        def _compile_jsonb_sqlite(element, compiler, **kw):
+            return "JSON"
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'jobs.db'}")
+        User.metadata.create_all(engine, tables=[User.__table__, ContentJob.__table__, ContentArtifact.__table__])
+        session_factory = sessionmaker(bind=engine)
+        setup = session_factory()
+        setup.add(User(id=1, email="a@example.com", hashed_password="x"))
+        setup.add(ContentJob(id=1, user_id=1, org_id=1, topic="remote work", formats_requested=["blog"], status="pending"))
+        setup.commit()
+        setup.close()
+
+        cache = Mock()
+        cache.get.return_value = None
+        cache.get_similar.return_value = None
+        getattr(cache, lookup).return_value = {'content': 'Cached blog post about remote work.'}
+        policy = Mock()
+        policy.get_model_name.return_value = "gpt-4o-mini"
+        policy.get_plan.return_value = "free"
+        policy._get_user_org_id.return_value = 1
+        sse_store = Mock()
+        set_job_status = AsyncMock()
+        monkeypatch.setattr(config, "ENABLE_CONTENT_MODERATION", False)
+
+        with patch("content_creation_crew.database.SessionLocal", session_factory), \
+                patch("content_creation_crew.services.plan_policy.PlanPolicy", return_value=policy), \
+                patch("content_creation_crew.services.content_cache.get_cache", return_value=cache), \
+                patch("content_creation_crew.services.sse_store.get_sse_store", return_value=sse_store), \
+                patch.object(content_routes, "_set_job_status", set_job_status):
+            asyncio.run(content_routes.run_generation_async(1, "remote work", ["blog"], "free", 1))
+
+        check = session_factory()
+        artifact = check.query(ContentArtifact).filter(ContentArtifact.job_id == 1).one()
+        check.close()
+        assert artifact.content_text == 'Cached blog post about remote work.'
+        assert set_job_status.call_args_list[-1].args[2] == "completed"
+        event_types = [call.args[1] for call in sse_store.add_event.call_args_list]
+        assert 'complete' in event_types and 'error' not in event_types
+        cache.begin_fill.assert_not_called()
@@ -0,0 +1,54 @@
+"""
+Tests for extracting generated content from CrewAI results
+"""
+import logging
+import pytest
+from crewai.tasks.task_output import TaskOutput
+
+
+def _crew_result(*outputs):
+    """Build a minimal CrewOutput-like result from (task name, raw) pairs"""
+    from crewai.crews.crew_output import CrewOutput
+
+    tasks_output = [
+        TaskOutput(name=name, description="Task description", raw=raw, agent="agent")
+        for name, raw in outputs
+    ]
+    return CrewOutput(raw=tasks_output[-1].raw, tasks_output=tasks_output)
+
+
+class TestContentExtraction:
+    """Test in-memory task output extraction"""
+
+    def test_matches_task_by_name(self):
+        """Test that each content type reads its own task's output"""
+        from api_server import extract_content_from_result
+
+        result = _crew_result(
+            ("research_task", "Research notes that are long enough"),
+            ("editing_task", "The edited blog post body"),
+            ("social_media_task", '{"linkedin_post": "Social copy"}'),
+            ("audio_content_task", '{"intro_hook": "Audio script"}'),
+        )
+
+        assert extract_content_from_result(result, 'editing') == "The edited blog post body"
+        assert extract_content_from_result(result, 'social') == '{"linkedin_post": "Social copy"}'
+        assert extract_content_from_result(result, 'audio') == '{"intro_hook": "Audio script"}'
+
+    @pytest.mark.asyncio
+    async def test_extraction_ignores_working_directory_files(self, tmp_path, monkeypatch):
+        """Test that a stale output file from another job is never read"""
+        from api_server import extract_content_async, extract_video_content_async
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "content_output.md").write_text("Another job's blog post " * 10)
+        (tmp_path / "video_output.md").write_text("Another job's video script " * 10)
+
+        result = _crew_result(
+            ("editing_task", "This job's blog post"),
+            ("video_content_task", '{"hook": "This job\'s video"}'),
+        )
+        test_logger = logging.getLogger(__name__)
+
+        assert await extract_content_async(result, "topic", test_logger) == "This job's blog post"
+        assert await extract_video_content_async(result, "topic", test_logger) == '{"hook": "This job\'s video"}'
@@ -0,0 +1,67 @@
+"""
+Tests for pooled crew templates
+"""
+import pytest
+
+
+@pytest.fixture
+def crew_pool(monkeypatch):
+    """Empty crew pool with an OpenAI key configured (no network calls are made)"""
+    from content_creation_crew.config import config
+    from content_creation_crew.services.crew_pool import CrewPool
+
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    return CrewPool(max_templates=2)
+
+
+class TestCrewPool:
+    """Test crew template reuse"""
+
+    def test_template_reused_per_key(self, crew_pool):
+        """Test that the second job for the same key is served from the template"""
+        first, first_hit = crew_pool.get_crew('free', ['blog'])
+        second, second_hit = crew_pool.get_crew('free', ['blog'])
+
+        assert (first_hit, second_hit) == (False, True)
+        assert len(crew_pool) == 1
+        assert [task.name for task in second.tasks] == ['research_task', 'writing_task', 'editing_task']
+
+    def test_copies_are_independent(self, crew_pool):
+        """Test that each job gets its own agents, tasks and LLM copies"""
+        first, _ = crew_pool.get_crew('free', ['blog'])
+        second, _ = crew_pool.get_crew('free', ['blog'])
+
+        assert first is not second
+        assert first.agents[0] is not second.agents[0]
+        assert first.tasks[1] is not second.tasks[1]
+        # Task context points at the copy's own tasks, not the template's
+        assert second.tasks[1].context[0] is second.tasks[0]
+        assert first.agents[0].llm is not second.agents[0].llm
+
+    def test_keys_by_content_type_and_lru_bound(self, crew_pool):
+        """Test that content types get separate templates within the LRU bound"""
+        crew_pool.get_crew('free', ['blog'])
+        social, hit = crew_pool.get_crew('free', ['social'])
+        assert hit is False
+        assert [task.name for task in social.tasks] == ['social_media_standalone_task']
+
+        crew_pool.get_crew('pro', ['blog'])
+        assert len(crew_pool) == 2
+        _, hit = crew_pool.get_crew('free', ['blog'])
+        assert hit is False  # Evicted as least recently used
+
+    def test_llm_clients_shared_across_templates(self, crew_pool):  # crew_pool sets the API key
+        """Test that templates with identical LLM settings share one client"""
+        from content_creation_crew.crew import ContentCreationCrew
+
+        first = ContentCreationCrew(tier='free', content_types=['audio'])
+        second = ContentCreationCrew(tier='free', content_types=['video'])
+        assert first.llm is second.llm
+
+    def test_tier_config_parsed_once(self):
+        """Test that tiers.yaml is parsed once per process"""
+        from content_creation_crew.crew import load_tier_config
+
+        assert load_tier_config() is load_tier_config()
+        assert load_tier_config()['enterprise']['max_parallel_tasks'] == 8
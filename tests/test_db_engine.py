@@ -0,0 +1,182 @@
+"""
+Tests for database session acquisition and connection liveness checks
+"""
+import socket
+import pytest
+
+
+class FakeDBAPIConnection:
+    """Idle psycopg2-like connection backed by a socket pair"""
+
+    def __init__(self, poll_error=None, notice=None):
+        self.client, self.server = socket.socketpair()
+        self.closed = 0
+        self.notices = []
+        self.polls = 0
+        self.poll_error = poll_error
+        self.notice = notice
+
+    def fileno(self):
+        return self.client.fileno()
+
+    def poll(self):
+        self.polls += 1
+        self.client.recv(1024)
+        if self.poll_error:
+            raise self.poll_error
+        if self.notice:
+            self.notices.append(self.notice)
+        return 0
+
+
+class TestOptimisticLivenessCheck:
+    """Test the no-round-trip checkout check used by DB_LIVENESS_STRATEGY=optimistic"""
+
+    def test_idle_connection_passes_without_reading(self):
+        """Test that a healthy idle connection is handed out untouched"""
+        from content_creation_crew.db.engine import check_connection_alive
+
+        conn = FakeDBAPIConnection()
+
+        check_connection_alive(conn, None, None)
+
+        assert conn.polls == 0
+
+    def test_closed_connection(self):
+        """Test that a locally closed connection is rejected"""
+        from sqlalchemy.exc import DisconnectionError
+        from content_creation_crew.db.engine import check_connection_alive
+
+        conn = FakeDBAPIConnection()
+        conn.closed = 1
+
+        with pytest.raises(DisconnectionError):
+            check_connection_alive(conn, None, None)
+
+    def test_server_eof(self):
+        """Test that a connection the server closed is rejected so the pool reconnects"""
+        import psycopg2
+        from sqlalchemy.exc import DisconnectionError
+        from content_creation_crew.db.engine import check_connection_alive
+
+        conn = FakeDBAPIConnection(poll_error=psycopg2.OperationalError("server closed the connection unexpectedly"))
+        conn.server.close()
+
+        with pytest.raises(DisconnectionError):
+            check_connection_alive(conn, None, None)
+
+    def test_server_fatal_notice(self):
+        """Test that a FATAL notice received before EOF is treated as a disconnect"""
+        from sqlalchemy.exc import DisconnectionError
+        from content_creation_crew.db.engine import check_connection_alive
+
+        conn = FakeDBAPIConnection(notice="FATAL:  terminating connection due to administrator command\n")
+        conn.server.send(b"E")
+
+        with pytest.raises(DisconnectionError, match="administrator command"):
+            check_connection_alive(conn, None, None)
+
+
+class TestGetDb:
+    """Test that get_db adds no health check queries of its own"""
+
+    def test_no_extra_statements(self, monkeypatch):
+        """Test that get_db checks out a connection and commits without running queries"""
+        import importlib
+        engine_module = importlib.import_module("content_creation_crew.db.engine")
+
+        calls = []
+
+        class FakeSession:
+            def connection(self):
+                calls.append("connection")
+
+            def execute(self, *args, **kwargs):
+                calls.append("execute")
+
+            def commit(self):
+                calls.append("commit")
+
+            def close(self):
+                calls.append("close")
+
+        monkeypatch.setattr(engine_module, "SessionLocal", FakeSession)
+
+        session_gen = engine_module.get_db()
+        next(session_gen)
+        with pytest.raises(StopIteration):
+            next(session_gen)
+
+        assert calls == ["connection", "commit", "close"]
+
+
+def make_dropping_engine(drops):
+    """SQLite engine whose next `drops` statements fail as if the server connection was lost"""
+    import sqlite3
+    from sqlalchemy import create_engine, event
+
+    engine = create_engine("sqlite://")
+    remaining = [drops]
+    executed = []
+
+    @event.listens_for(engine, "do_execute")
+    def drop_connection(cursor, statement, parameters, context):
+        if remaining[0]:
+            remaining[0] -= 1
+            raise sqlite3.OperationalError("server closed the connection unexpectedly")
+        executed.append(statement)
+
+    @event.listens_for(engine, "handle_error")
+    def mark_disconnect(context):
+        if "server closed the connection" in str(context.original_exception):
+            context.is_disconnect = True
+
+    return engine, executed
+
+
+class TestDisconnectRetrySession:
+    """Test the first-statement retry used by DB_LIVENESS_STRATEGY=optimistic"""
+
+    def test_first_statement_retried(self):
+        """Test that a disconnect on the first statement is retried on a new connection"""
+        from sqlalchemy import text
+        from content_creation_crew.db.engine import DisconnectRetrySession
+
+        engine, executed = make_dropping_engine(1)
+        session = DisconnectRetrySession(bind=engine)
+        session.connection()
+
+        assert session.execute(text("SELECT 1")).scalar() == 1
+        assert executed == ["SELECT 1"]
+        session.close()
+
+    def test_later_statements_not_retried(self):
+        """Test that a disconnect after the transaction has run a statement is raised"""
+        from sqlalchemy import text
+        from sqlalchemy.exc import DBAPIError
+        from content_creation_crew.db.engine import DisconnectRetrySession
+
+        engine, executed = make_dropping_engine(0)
+        session = DisconnectRetrySession(bind=engine)
+        session.execute(text("SELECT 1"))
+
+        engine, _ = make_dropping_engine(1)
+        session.bind = engine
+        with pytest.raises(DBAPIError):
+            session.execute(text("SELECT 2"))
+        session.close()
+
+    def test_new_transaction_retries_again(self):
+        """Test that the first statement after a commit is retryable again"""
+        from sqlalchemy import text
+        from content_creation_crew.db.engine import DisconnectRetrySession
+
+        engine, executed = make_dropping_engine(0)
+        session = DisconnectRetrySession(bind=engine)
+        session.execute(text("SELECT 1"))
+        session.commit()
+
+        engine, _ = make_dropping_engine(1)
+        session.bind = engine
+        assert session.execute(text("SELECT 2")).scalar() == 2
+        session.close()
@@ -0,0 +1,156 @@
+"""
+Tests for tier-aware generation scheduling
+"""
+import asyncio
+import pytest
+
+
+@pytest.fixture
+def scheduler():
+    """Scheduler with two process slots and fixed tier settings"""
+    from content_creation_crew.services.generation_scheduler import GenerationScheduler
+
+    scheduler = GenerationScheduler(max_concurrent_jobs=2, aging_seconds=3600)
+    scheduler._tier_settings = {
+        'free': (False, 1),
+        'basic': (False, 2),
+        'enterprise': (True, 8),
+    }
+    return scheduler
+
+
+async def _admit(scheduler, job_id, plan, org_id, admitted, release_event):
+    """Hold a slot until release_event is set, recording admission order"""
+    async with scheduler.slot(job_id, plan, org_id=org_id):
+        admitted.append(job_id)
+        await release_event.wait()
+
+
+class TestGenerationScheduler:
+    """Test generation scheduler admission"""
+
+    @pytest.mark.asyncio
+    async def test_process_limit_bounds_running_jobs(self, scheduler):
+        """Test that no more than max_concurrent_jobs run at once"""
+        admitted, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(_admit(scheduler, i, 'enterprise', 1, admitted, release)) for i in range(4)]
+        await asyncio.sleep(0)
+
+        assert admitted == [0, 1]
+        assert scheduler.get_stats() == {'queued': 2, 'running': 2}
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert admitted == [0, 1, 2, 3]
+        assert scheduler.get_stats() == {'queued': 0, 'running': 0}
+
+    @pytest.mark.asyncio
+    async def test_priority_tier_admitted_first(self, scheduler):
+        """Test that priority_processing jobs jump ahead of queued free-tier jobs"""
+        blockers, release_blockers = [], asyncio.Event()
+        for i in range(2):
+            asyncio.create_task(_admit(scheduler, 100 + i, 'basic', 100, blockers, release_blockers))
+        await asyncio.sleep(0)
+
+        admitted, release = [], asyncio.Event()
+        tasks = [
+            asyncio.create_task(_admit(scheduler, 1, 'free', 1, admitted, release)),
+            asyncio.create_task(_admit(scheduler, 2, 'free', 2, admitted, release)),
+            asyncio.create_task(_admit(scheduler, 3, 'enterprise', 3, admitted, release)),
+        ]
+        await asyncio.sleep(0)
+        assert admitted == []
+
+        release_blockers.set()
+        await asyncio.sleep(0.01)
+        assert admitted == [3, 1]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert admitted == [3, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_org_parallel_limit(self, scheduler):
+        """Test that an org at max_parallel_tasks does not block other orgs"""
+        admitted, release = [], asyncio.Event()
+        tasks = [
+            asyncio.create_task(_admit(scheduler, 1, 'free', 1, admitted, release)),
+            asyncio.create_task(_admit(scheduler, 2, 'free', 1, admitted, release)),
+            asyncio.create_task(_admit(scheduler, 3, 'free', 2, admitted, release)),
+        ]
+        await asyncio.sleep(0)
+
+        # Free tier allows one job per org: job 2 waits, job 3 (another org) runs
+        assert admitted == [1, 3]
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert admitted == [1, 3, 2]
+
+    @pytest.mark.asyncio
+    async def test_aged_jobs_are_promoted(self, scheduler):
+        """Test that long-waiting standard jobs are not starved by priority jobs"""
+        scheduler.aging_seconds = 0.05
+        scheduler.max_concurrent_jobs = 1
+
+        admitted, release_first = [], asyncio.Event()
+        first = asyncio.create_task(_admit(scheduler, 1, 'enterprise', 1, admitted, release_first))
+        await asyncio.sleep(0)
+
+        release = asyncio.Event()
+        waiting = [asyncio.create_task(_admit(scheduler, 2, 'free', 2, admitted, release))]
+        await asyncio.sleep(0.06)
+        waiting.append(asyncio.create_task(_admit(scheduler, 3, 'enterprise', 3, admitted, release)))
+        await asyncio.sleep(0)
+
+        release_first.set()
+        await asyncio.sleep(0.01)
+        assert admitted == [1, 2]
+
+        release.set()
+        await asyncio.gather(first, *waiting)
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_leaves_queue(self, scheduler):
+        """Test that cancelling a waiting job removes it without leaking a slot"""
+        scheduler.max_concurrent_jobs = 1
+        admitted, release = [], asyncio.Event()
+        running = asyncio.create_task(_admit(scheduler, 1, 'free', 1, admitted, release))
+        waiting = asyncio.create_task(_admit(scheduler, 2, 'free', 2, admitted, release))
+        await asyncio.sleep(0)
+
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        assert scheduler.get_stats() == {'queued': 0, 'running': 1}
+
+        release.set()
+        await running
+        assert admitted == [1]
+        assert scheduler.get_stats() == {'queued': 0, 'running': 0}
+
+    @pytest.mark.asyncio
+    async def test_wait_time_metrics(self, scheduler):
+        """Test that queue depth and wait time are exported"""
+        from content_creation_crew.services.metrics import get_metrics_collector
+
+        admitted, release = [], asyncio.Event()
+        tasks = [asyncio.create_task(_admit(scheduler, i, 'enterprise', 1, admitted, release)) for i in range(3)]
+        await asyncio.sleep(0)
+
+        collector = get_metrics_collector()
+        assert collector.get_gauge("generation_scheduler_queue_depth") == 1.0
+        assert collector.get_gauge("generation_scheduler_running_jobs") == 2.0
+        assert collector.get_histogram_stats("generation_scheduler_wait_seconds", {"plan": "enterprise"})["count"] >= 2
+
+        release.set()
+        await asyncio.gather(*tasks)
+
+    def test_tier_settings_from_tiers_yaml(self):
+        """Test that priority and parallel limits come from tiers.yaml"""
+        from content_creation_crew.services.generation_scheduler import GenerationScheduler
+
+        scheduler = GenerationScheduler(max_concurrent_jobs=2)
+        assert scheduler._get_tier_settings('free') == (False, 1)
+        assert scheduler._get_tier_settings('enterprise') == (True, 8)
+        assert scheduler._get_tier_settings('unknown') == (False, 1)
@@ -0,0 +1,217 @@
+"""
+Tests for the durable generation job queue
+"""
+import pytest
+from datetime import datetime, timedelta
+from unittest.mock import Mock, patch
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def job_queue(db_session):
+    """Job queue whose sessions join the test transaction"""
+    from content_creation_crew.services.job_queue import JobQueue
+
+    factory = sessionmaker(
+        bind=db_session.connection(),
+        autocommit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint"
+    )
+    return JobQueue(lease_seconds=60, max_attempts=2, session_factory=factory)
+
+
+@pytest.fixture
+def make_job(db_session):
+    """Create content jobs owned by a queue test user"""
+    from content_creation_crew.database import ContentJob, Organization, User
+
+    user = User(email="queue@example.com", hashed_password="not-a-real-hash", is_active=True)
+    db_session.add(user)
+    db_session.commit()
+    org = Organization(name="Queue Test Org", owner_user_id=user.id)
+    db_session.add(org)
+    db_session.commit()
+
+    def _make_job(topic="Queue topic"):
+        job = ContentJob(
+            org_id=org.id,
+            user_id=user.id,
+            topic=topic,
+            formats_requested=["blog"],
+            status="pending"
+        )
+        db_session.add(job)
+        db_session.commit()
+        return job
+
+    return _make_job
+
+
+class TestJobQueue:
+    """Test job queue claim, lease and recovery"""
+
+    def test_claim_leases_queued_job(self, job_queue, make_job, db_session):
+        """Test that an enqueued job is claimed once"""
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+
+        claimed = job_queue.claim("worker-a", 5)
+        assert [c.job_id for c in claimed] == [job.id]
+        assert claimed[0].content_types == ["blog"]
+        assert claimed[0].attempt == 1
+        assert claimed[0].recovered is False
+
+        # Leased - a second worker gets nothing
+        assert job_queue.claim("worker-b", 5) == []
+
+    def test_unqueued_pending_jobs_are_ignored(self, job_queue, make_job):
+        """Test that PENDING jobs not on the queue (e.g. standalone voiceover) are never claimed"""
+        make_job()
+        assert job_queue.claim("worker-a", 5) == []
+
+    def test_claim_respects_limit_and_order(self, job_queue, make_job, db_session):
+        """Test that jobs are claimed oldest first up to the limit"""
+        jobs = [make_job(topic=f"topic {i}") for i in range(3)]
+        for job in jobs:
+            job_queue.enqueue(db_session, job.id)
+
+        claimed = job_queue.claim("worker-a", 2)
+        assert [c.job_id for c in claimed] == [jobs[0].id, jobs[1].id]
+
+    def test_claim_prefers_priority_tiers(self, job_queue, make_job, db_session):
+        """Test that priority_processing tiers are claimed before older standard jobs"""
+        standard, priority = make_job(topic="standard"), make_job(topic="priority")
+        job_queue.enqueue(db_session, standard.id, plan="free")
+        job_queue.enqueue(db_session, priority.id, plan="pro")
+
+        claimed = job_queue.claim("worker-a", 1)
+        assert [c.job_id for c in claimed] == [priority.id]
+
+    def test_aged_standard_job_competes_with_priority(self, job_queue, make_job, db_session):
+        """Test that a standard job waiting past the aging threshold is claimed before newer priority jobs"""
+        from content_creation_crew.database import ContentJob
+
+        standard, priority = make_job(topic="standard"), make_job(topic="priority")
+        job_queue.enqueue(db_session, standard.id, plan="free")
+        job_queue.enqueue(db_session, priority.id, plan="pro")
+        db_session.query(ContentJob).filter(ContentJob.id == standard.id).update({
+            "queued_at": datetime.utcnow() - timedelta(seconds=job_queue.aging_seconds + 1)
+        })
+        db_session.commit()
+
+        claimed = job_queue.claim("worker-a", 1)
+        assert [c.job_id for c in claimed] == [standard.id]
+
+    def test_expired_lease_is_recovered(self, job_queue, make_job, db_session):
+        """Test that a job orphaned by a dead worker is reclaimed"""
+        from content_creation_crew.database import ContentJob
+
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+        job_queue.claim("worker-a", 1)
+
+        db_session.query(ContentJob).filter(ContentJob.id == job.id).update({
+            "status": "running",
+            "lease_expires_at": datetime.utcnow() - timedelta(seconds=1)
+        })
+        db_session.commit()
+
+        claimed = job_queue.claim("worker-b", 1)
+        assert claimed[0].job_id == job.id
+        assert claimed[0].recovered is True
+        assert claimed[0].attempt == 2
+
+    def test_heartbeat_reports_cancelled_jobs(self, job_queue, make_job, db_session):
+        """Test that heartbeat tells the worker to stop cancelled jobs"""
+        from content_creation_crew.database import ContentJob
+
+        running, cancelled = make_job(), make_job()
+        for job in (running, cancelled):
+            job_queue.enqueue(db_session, job.id)
+        job_queue.claim("worker-a", 2)
+
+        db_session.query(ContentJob).filter(ContentJob.id == cancelled.id).update({"status": "cancelled"})
+        db_session.commit()
+
+        result = job_queue.heartbeat("worker-a", [running.id, cancelled.id])
+        assert result.cancelled == [cancelled.id]
+        assert result.lost == []
+
+    def test_heartbeat_reports_lost_leases_separately(self, job_queue, make_job, db_session):
+        """Test that a job re-claimed by another worker is reported as lost, not cancelled"""
+        from content_creation_crew.database import ContentJob
+
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+        job_queue.claim("worker-a", 1)
+
+        db_session.query(ContentJob).filter(ContentJob.id == job.id).update({"lease_owner": "worker-b"})
+        db_session.commit()
+
+        result = job_queue.heartbeat("worker-a", [job.id])
+        assert result.lost == [job.id]
+        assert result.cancelled == []
+
+    def test_release_dequeues_job(self, job_queue, make_job, db_session):
+        """Test that a released job leaves the queue"""
+        from content_creation_crew.database import ContentJob
+
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+        job_queue.claim("worker-a", 1)
+        job_queue.release("worker-a", job.id)
+
+        db_session.expire_all()
+        stored = db_session.query(ContentJob).filter(ContentJob.id == job.id).first()
+        assert stored.queued_at is None
+        assert stored.lease_owner is None
+
+    def test_abandoned_job_backs_off_before_reclaim(self, job_queue, make_job, db_session):
+        """Test that a job handed back by a worker is only reclaimed after its per-attempt backoff"""
+        from content_creation_crew.database import ContentJob
+
+        job_queue.retry_backoff_seconds = 10
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+        job_queue.claim("worker-a", 1)
+        job_queue.abandon("worker-a", job.id)
+
+        assert job_queue.claim("worker-b", 1) == []
+        db_session.expire_all()
+        stored = db_session.query(ContentJob).filter(ContentJob.id == job.id).first()
+        assert timedelta(seconds=5) < stored.available_at - datetime.utcnow() <= timedelta(seconds=10)
+        assert job_queue._retry_delay(2) == 20
+
+        db_session.query(ContentJob).filter(ContentJob.id == job.id).update({
+            "available_at": datetime.utcnow() - timedelta(seconds=1)
+        })
+        db_session.commit()
+
+        claimed = job_queue.claim("worker-b", 1)
+        assert [c.job_id for c in claimed] == [job.id]
+        assert claimed[0].attempt == 2
+
+    def test_exhausted_jobs_are_failed(self, job_queue, make_job, db_session):
+        """Test that jobs orphaned max_attempts times are failed with an error event"""
+        from content_creation_crew.database import ContentJob
+
+        job = make_job()
+        job_queue.enqueue(db_session, job.id)
+        db_session.query(ContentJob).filter(ContentJob.id == job.id).update({
+            "status": "running",
+            "attempts": 2,
+            "lease_owner": "worker-a",
+            "lease_expires_at": datetime.utcnow() - timedelta(seconds=1)
+        })
+        db_session.commit()
+
+        mock_store = Mock()
+        with patch("content_creation_crew.services.job_queue.get_sse_store", return_value=mock_store):
+            assert job_queue.fail_exhausted() == [job.id]
+
+        db_session.expire_all()
+        assert db_session.query(ContentJob).filter(ContentJob.id == job.id).first().status == "failed"
+        event_types = [call.args[1] for call in mock_store.add_event.call_args_list]
+        assert event_types == ["status_update", "error"]
+        assert job_queue.claim("worker-b", 1) == []
@@ -0,0 +1,75 @@
+"""
+Tests for off-loop password hashing
+"""
+import asyncio
+import pytest
+
+
+class TestBcryptCost:
+    """Test detecting outdated hashes"""
+
+    def test_cost_parsing(self):
+        """Test that the cost is read from bcrypt hashes and missing for anything else"""
+        from content_creation_crew.services.password_hasher import bcrypt_cost
+
+        assert bcrypt_cost("$2b$12$" + "a" * 53) == 12
+        assert bcrypt_cost("$2a$10$" + "a" * 53) == 10
+        assert bcrypt_cost("pbkdf2:sha256:abc") is None
+        assert bcrypt_cost("") is None
+
+    def test_verify_rehashes_outdated_cost(self, monkeypatch):
+        """Test that a valid password with an old cost comes back with a hash at the configured cost"""
+        import bcrypt
+        from content_creation_crew import auth
+        from content_creation_crew.services.password_hasher import bcrypt_cost, verify_and_rehash
+
+        monkeypatch.setattr(auth, "BCRYPT_ROUNDS", 5)
+        old_hash = bcrypt.hashpw(b"Secret-pass1", bcrypt.gensalt(rounds=4)).decode()
+
+        assert verify_and_rehash("wrong", old_hash) == (False, None)
+        valid, new_hash = verify_and_rehash("Secret-pass1", old_hash)
+        assert valid
+        assert bcrypt_cost(new_hash) == 5
+        assert verify_and_rehash("Secret-pass1", new_hash) == (True, None)
+
+
+class TestPasswordHasher:
+    """Test the bounded hashing pool"""
+
+    def test_runs_off_the_event_loop(self):
+        """Test that work runs on a pool thread"""
+        import threading
+        from content_creation_crew.services.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=2)
+
+        thread_name = asyncio.run(hasher.run("hash", lambda: threading.current_thread().name))
+
+        assert thread_name.startswith("password-hash")
+        assert hasher.pending == 0
+        hasher.shutdown()
+
+    def test_saturated_pool_returns_503(self):
+        """Test that operations beyond max_pending are refused instead of queued"""
+        import threading
+        from fastapi import HTTPException
+        from content_creation_crew.services.password_hasher import PasswordHasher
+
+        hasher = PasswordHasher(workers=1, max_pending=2)
+        release = threading.Event()
+
+        async def burst():
+            running = [asyncio.ensure_future(hasher.run("verify", release.wait)) for _ in range(2)]
+            await asyncio.sleep(0)
+            with pytest.raises(HTTPException) as exc_info:
+                await hasher.run("verify", release.wait)
+            release.set()
+            await asyncio.gather(*running)
+            return exc_info.value
+
+        error = asyncio.run(burst())
+
+        assert error.status_code == 503
+        assert error.headers["Retry-After"] == "1"
+        assert hasher.pending == 0
+        hasher.shutdown()
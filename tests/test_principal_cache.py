@@ -0,0 +1,231 @@
+"""
+Tests for the authenticated principal cache
+"""
+import asyncio
+import pytest
+
+
+class FakeRedis:
+    """Minimal Redis hash commands"""
+
+    def __init__(self):
+        self.hashes = {}
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def expire(self, key, ttl):
+        pass
+
+    def delete(self, key):
+        self.hashes.pop(key, None)
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Pipeline that runs commands on execute()"""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        for name, args in self.commands:
+            getattr(self.redis_client, name)(*args)
+
+
+def make_principal(user_id=1, is_active=True):
+    from content_creation_crew.services.principal_cache import AuthPrincipal
+    return AuthPrincipal(id=user_id, email=f"user{user_id}@example.com", is_active=is_active, is_admin=False, org_id=10, plan="pro")
+
+
+class TestPrincipalCache:
+    """Test the L1/L2 principal cache"""
+
+    def test_keyed_by_user_and_iat(self):
+        """Test that a principal is only served for the token it was cached for"""
+        from content_creation_crew.services.principal_cache import PrincipalCache
+
+        cache = PrincipalCache()
+        cache.set(make_principal(), 1000)
+
+        assert cache.get(1, 1000) == make_principal()
+        assert cache.get(1, 2000) is None
+        assert cache.get(2, 1000) is None
+
+    def test_l1_expiry_and_bound(self):
+        """Test that L1 entries expire and the least recently used are evicted"""
+        from content_creation_crew.services.principal_cache import PrincipalCache
+
+        expired = PrincipalCache(l1_ttl=0)
+        expired.set(make_principal(), 1000)
+        assert expired.get(1, 1000) is None
+
+        bounded = PrincipalCache(max_l1_entries=2)
+        for user_id in (1, 2, 3):
+            bounded.set(make_principal(user_id), 1000)
+        assert bounded.get(1, 1000) is None
+        assert bounded.get(3, 1000) is not None
+
+    def test_shared_redis_and_invalidation(self):
+        """Test that processes share principals through Redis and invalidation drops every token's entry"""
+        from content_creation_crew.services.principal_cache import PrincipalCache
+
+        redis_client = FakeRedis()
+        writer = PrincipalCache(redis_client=redis_client)
+        reader = PrincipalCache(redis_client=redis_client)
+        writer.set(make_principal(), 1000)
+        writer.set(make_principal(), 2000)
+
+        assert reader.get(1, 2000) == make_principal()
+
+        writer.invalidate(1)
+
+        assert writer.get(1, 1000) is None
+        assert redis_client.hget("auth_principal:1", "2000") is None
+
+
+class TestGetCurrentPrincipal:
+    """Test the get_current_principal dependency"""
+
+    @pytest.fixture
+    def auth_env(self, monkeypatch):
+        """Principal cache and a counting loader in place of the database"""
+        from content_creation_crew import auth
+        from content_creation_crew.services.principal_cache import PrincipalCache
+
+        cache = PrincipalCache()
+        loads = []
+
+        class FakeSession:
+            async def __aenter__(self):
+                return self
+
+            async def __aexit__(self, *args):
+                return False
+
+        async def fake_load(db, user_id):
+            loads.append(user_id)
+            return make_principal(user_id, is_active=user_id != 2)
+
+        monkeypatch.setattr(auth, "get_principal_cache", lambda: cache)
+        monkeypatch.setattr(auth, "AsyncSessionLocal", FakeSession)
+        monkeypatch.setattr(auth, "load_principal", fake_load)
+        return auth, cache, loads
+
+    def test_loads_once_per_token(self, auth_env):
+        """Test that only the first request with a token loads the user"""
+        auth, cache, loads = auth_env
+        token = auth.create_access_token({"sub": "1"})
+
+        first = asyncio.run(auth.get_current_principal(token))
+        second = asyncio.run(auth.get_current_principal(token))
+
+        assert first == second == make_principal(1)
+        assert loads == [1]
+
+    def test_inactive_user_rejected(self, auth_env):
+        """Test that an inactive principal gets 403"""
+        from fastapi import HTTPException
+
+        auth, cache, loads = auth_env
+        token = auth.create_access_token({"sub": "2"})
+
+        with pytest.raises(HTTPException) as exc_info:
+            asyncio.run(auth.get_current_principal(token))
+
+        assert exc_info.value.status_code == 403
+
+    def test_invalidation_hook_forces_reload(self, auth_env, monkeypatch):
+        """Test that CacheInvalidationService.invalidate_user drops the cached principal"""
+        from content_creation_crew.services import principal_cache
+        from content_creation_crew.services.cache_invalidation import CacheInvalidationService
+
+        auth, cache, loads = auth_env
+        monkeypatch.setattr(principal_cache, "get_principal_cache", lambda: cache)
+        token = auth.create_access_token({"sub": "1"})
+
+        asyncio.run(auth.get_current_principal(token))
+        CacheInvalidationService().invalidate_user(1, reason="test")
+        asyncio.run(auth.get_current_principal(token))
+
+        assert loads == [1, 1]
+
+    def test_org_plan_change_evicts_member_principals(self, auth_env, monkeypatch):
+        """Test that invalidate_org_plan drops the cached principal of every org member"""
+        import importlib
+        from content_creation_crew.services import principal_cache
+        from content_creation_crew.services.cache_invalidation import CacheInvalidationService
+
+        class FakeQuery:
+            def filter(self, *criteria):
+                self.criteria = criteria
+                return self
+
+            def all(self):
+                return [(1,)]
+
+        class FakeDB:
+            def query(self, *entities):
+                return FakeQuery()
+
+            def close(self):
+                pass
+
+        auth, cache, loads = auth_env
+        monkeypatch.setattr(principal_cache, "get_principal_cache", lambda: cache)
+        # content_creation_crew.db re-exports the Engine object as `engine`, shadowing the module
+        monkeypatch.setattr(importlib.import_module("content_creation_crew.db.engine"), "SessionLocal", FakeDB)
+        token = auth.create_access_token({"sub": "1"})
+
+        asyncio.run(auth.get_current_principal(token))
+        CacheInvalidationService().invalidate_org_on_subscription_change(10)
+        asyncio.run(auth.get_current_principal(token))
+
+        assert loads == [1, 1]
+
+
+class TestPrincipalRoutes:
+    """Test that read-only organization endpoints authenticate without loading the User row"""
+
+    @pytest.mark.parametrize("path", [
+        "/v1/billing/subscription",
+        "/v1/invoices/",
+        "/v1/invoices/1",
+        "/v1/invoices/1/pdf",
+        "/v1/refunds/",
+        "/v1/refunds/1",
+    ])
+    def test_read_endpoints_use_principal(self, path):
+        """Test that the handler gets the cached principal and never resolves get_current_user"""
+        from unittest.mock import Mock
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from content_creation_crew import billing_routes, invoice_routes, refund_routes
+        from content_creation_crew.auth import get_current_principal, get_current_user
+        from content_creation_crew.database import get_db
+
+        def fail():
+            raise AssertionError("read endpoint loaded the User row")
+
+        db = Mock()
+        db.query.return_value.filter.return_value.first.return_value = None  # No organization
+        app = FastAPI()
+        for module in (billing_routes, invoice_routes, refund_routes):
+            app.include_router(module.router)
+        app.dependency_overrides[get_current_user] = fail
+        app.dependency_overrides[get_current_principal] = lambda: make_principal(1)
+        app.dependency_overrides[get_db] = lambda: db
+
+        response = TestClient(app).get(path)
+
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Organization not found"
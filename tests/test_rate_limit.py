@@ -0,0 +1,123 @@
+"""
+Tests for the rate limiting middleware
+"""
+import pytest
+
+
+class FakeScript:
+    """Registered script that counts calls and always allows"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, keys=None, args=None):
+        self.calls.append((keys, args))
+        return [1, args[1] - 1, args[2]]
+
+
+class FakeRedis:
+    """Redis client that only supports script registration"""
+
+    def __init__(self):
+        self.scripts = []
+
+    def register_script(self, script):
+        self.scripts.append(FakeScript())
+        return self.scripts[-1]
+
+    def eval(self, *args):
+        raise AssertionError("token bucket script must run via EVALSHA")
+
+
+def make_app(redis_client):
+    from fastapi import FastAPI
+    from content_creation_crew.middleware.rate_limit import RateLimitMiddleware
+
+    app = FastAPI()
+    app.add_middleware(RateLimitMiddleware, redis_client=redis_client)
+
+    @app.get("/v1/things")
+    async def things():
+        return {"ok": True}
+
+    return app
+
+
+def make_principal(user_id=1, plan="pro", is_admin=False):
+    from content_creation_crew.services.principal_cache import AuthPrincipal
+    return AuthPrincipal(id=user_id, email=f"user{user_id}@example.com", is_active=True, is_admin=is_admin, org_id=10, plan=plan)
+
+
+@pytest.fixture
+def no_database(monkeypatch):
+    """Fail the test if the limiter opens a database session"""
+    from content_creation_crew.db import async_engine
+
+    def fail():
+        raise AssertionError("rate limiter opened a database session")
+
+    monkeypatch.setattr(async_engine, "AsyncSessionLocal", fail)
+
+
+class TestRateLimitMiddleware:
+    """Test plan lookup and token bucket calls"""
+
+    def test_plan_from_principal_cache(self, monkeypatch, no_database):
+        """Test that an authenticated user's tier limit comes from the principal cache without a DB session"""
+        from fastapi.testclient import TestClient
+        from jose import jwt
+        from content_creation_crew.auth import create_access_token, get_secret_key, ALGORITHM
+        from content_creation_crew.services import principal_cache
+        from content_creation_crew.services.principal_cache import PrincipalCache
+
+        cache = PrincipalCache()
+        monkeypatch.setattr(principal_cache, "get_principal_cache", lambda: cache)
+        token = create_access_token({"sub": "1"})
+        cache.set(make_principal(plan="pro"), jwt.decode(token, get_secret_key(), algorithms=[ALGORITHM])["iat"])
+
+        redis_client = FakeRedis()
+        client = TestClient(make_app(redis_client))
+        response = client.get("/v1/things", headers={"Authorization": f"Bearer {token}"})
+
+        assert response.status_code == 200
+        keys, args = redis_client.scripts[0].calls[0]
+        assert keys == ["ratelimit:user:1"]
+        assert response.headers["X-RateLimit-Limit"] == str(args[0])
+        assert args[0] >= 100  # pro tier
+
+    def test_plan_cache_skips_principal_lookup(self, monkeypatch, no_database):
+        """Test that repeat requests reuse the limiter's plan cache"""
+        from fastapi.testclient import TestClient
+        from content_creation_crew.auth import create_access_token
+        from content_creation_crew.services import principal_cache
+
+        lookups = []
+
+        class CountingCache:
+            def get(self, user_id, issued_at):
+                lookups.append(user_id)
+                return make_principal(user_id=2, plan="basic")
+
+        monkeypatch.setattr(principal_cache, "get_principal_cache", lambda: CountingCache())
+        token = create_access_token({"sub": "2"})
+
+        redis_client = FakeRedis()
+        client = TestClient(make_app(redis_client))
+        for _ in range(3):
+            assert client.get("/v1/things", headers={"Authorization": f"Bearer {token}"}).status_code == 200
+
+        assert lookups == [2]
+        assert len(redis_client.scripts) == 1
+        assert len(redis_client.scripts[0].calls) == 3
+
+    def test_invalid_token_limited_by_ip(self, no_database):
+        """Test that requests with an invalid token fall back to the IP bucket"""
+        from fastapi.testclient import TestClient
+
+        redis_client = FakeRedis()
+        client = TestClient(make_app(redis_client))
+        response = client.get("/v1/things", headers={"Authorization": "Bearer not-a-jwt"})
+
+        assert response.status_code == 200
+        keys, _ = redis_client.scripts[0].calls[0]
+        assert keys[0].startswith("ratelimit:ip:")
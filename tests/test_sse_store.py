@@ -0,0 +1,311 @@
+"""
+Tests for SSE event store and push notification bus
+"""
+import threading
+import pytest
+from unittest.mock import Mock
+
+
+@pytest.fixture
+def event_bus():
+    """In-process SSE event bus (no Redis)"""
+    from content_creation_crew.services.sse_event_bus import SSEEventBus
+    bus = SSEEventBus(redis_client=None)
+    bus.redis_client = None
+    bus.use_redis = False
+    return bus
+
+
+@pytest.fixture
+def sse_store(event_bus, monkeypatch):
+    """In-memory SSE event store wired to the test bus"""
+    from content_creation_crew.services import sse_store as sse_store_module
+    monkeypatch.setattr(sse_store_module, "get_sse_event_bus", lambda: event_bus)
+    store = sse_store_module.SSEEventStore(redis_client=None)
+    store.redis_client = None
+    store.use_redis = False
+    return store
+
+
+class TestSSEEventBus:
+    """Test SSE event bus fan-out"""
+
+    @pytest.mark.asyncio
+    async def test_publish_wakes_subscriber(self, event_bus):
+        """Test that a publish wakes a waiting subscriber"""
+        subscription = event_bus.subscribe(1)
+        try:
+            event_bus.publish(1)
+            assert await subscription.wait(timeout=1.0) is True
+        finally:
+            subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_wait_times_out_without_publish(self, event_bus):
+        """Test that wait returns False when nothing is published"""
+        subscription = event_bus.subscribe(1)
+        try:
+            assert await subscription.wait(timeout=0.05) is False
+        finally:
+            subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_only_wakes_matching_job(self, event_bus):
+        """Test that subscribers of other jobs are not woken"""
+        subscription = event_bus.subscribe(2)
+        try:
+            event_bus.publish(1)
+            assert await subscription.wait(timeout=0.05) is False
+        finally:
+            subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_publish_from_worker_thread(self, event_bus):
+        """Test that publishes from executor threads reach the event loop"""
+        subscription = event_bus.subscribe(1)
+        try:
+            thread = threading.Thread(target=event_bus.publish, args=(1,))
+            thread.start()
+            thread.join()
+            assert await subscription.wait(timeout=1.0) is True
+        finally:
+            subscription.close()
+
+    @pytest.mark.asyncio
+    async def test_close_unsubscribes(self, event_bus):
+        """Test that closing a subscription removes it from the bus"""
+        subscription = event_bus.subscribe(1)
+        assert event_bus.subscriber_count(1) == 1
+        subscription.close()
+        assert event_bus.subscriber_count(1) == 0
+
+    def test_publish_uses_redis_when_available(self):
+        """Test that publishes go to the job's Redis channel"""
+        from content_creation_crew.services.sse_event_bus import SSEEventBus
+
+        mock_redis = Mock()
+        bus = SSEEventBus(redis_client=mock_redis)
+        bus.publish(42, event_id=7)
+
+        channel = mock_redis.publish.call_args[0][0]
+        assert channel == "sse:notify:42"
+
+    def test_publish_survives_redis_failure(self):
+        """Test that a Redis publish failure does not raise"""
+        from content_creation_crew.services.sse_event_bus import SSEEventBus
+
+        mock_redis = Mock()
+        mock_redis.publish.side_effect = Exception("connection refused")
+        bus = SSEEventBus(redis_client=mock_redis)
+        bus.publish(42)  # Should not raise
+
+    @pytest.mark.asyncio
+    async def test_listener_survives_idle_and_reconnects(self):
+        """Test that the listener keeps delivering after idle polls and a dropped connection"""
+        import asyncio
+        import json
+        import queue
+        from content_creation_crew.services.sse_event_bus import SSEEventBus
+
+        messages = queue.Queue()
+        connections = []
+
+        class FakePubSub:
+            def __init__(self):
+                self.failed = False
+                connections.append(self)
+
+            def psubscribe(self, pattern):
+                pass
+
+            def get_message(self, timeout=0.0):
+                # First connection drops after one idle poll
+                if len(connections) == 1 and not self.failed:
+                    self.failed = True
+                    return None
+                if len(connections) == 1:
+                    raise ConnectionError("Timeout reading from socket")
+                try:
+                    return messages.get(timeout=min(timeout, 0.05))
+                except queue.Empty:
+                    return None
+
+            def close(self):
+                pass
+
+        mock_redis = Mock()
+        mock_redis.pubsub.side_effect = lambda **kwargs: FakePubSub()
+        bus = SSEEventBus(redis_client=mock_redis)
+        bus.RECONNECT_DELAY = 0.01
+        subscription = bus.subscribe(5)
+        try:
+            for _ in range(100):
+                if len(connections) >= 2:
+                    break
+                await asyncio.sleep(0.01)
+            messages.put({
+                'type': 'pmessage',
+                'channel': 'sse:notify:5',
+                'data': json.dumps({'source': 'other-instance'})
+            })
+            assert await subscription.wait(timeout=2.0) is True
+            assert len(connections) == 2
+        finally:
+            subscription.close()
+            bus.shutdown()
+
+
+class TestSSEEventStore:
+    """Test SSE event store"""
+
+    def test_add_and_replay_events(self, sse_store):
+        """Test that events are returned in order after last_event_id"""
+        first_id = sse_store.add_event(1, 'job_started', {'status': 'pending'})
+        sse_store.add_event(1, 'content', {'chunk': 'hello'})
+
+        events = sse_store.get_events_since(1, first_id)
+        assert [e['type'] for e in events] == ['content']
+
+    def test_event_ids_are_per_job_sequences(self, sse_store):
+        """Test that rapid events get distinct, increasing IDs per job"""
+        ids = [sse_store.add_event(1, 'content', {'chunk': str(i)}) for i in range(50)]
+        other_id = sse_store.add_event(2, 'job_started', {})
+
+        assert ids == list(range(1, 51))
+        assert other_id == 1
+
+    def test_event_ids_unique_across_threads(self, sse_store):
+        """Test that concurrent writers never share an event ID"""
+        ids = []
+        ids_lock = threading.Lock()
+
+        def writer():
+            for _ in range(20):
+                event_id = sse_store.add_event(1, 'agent_progress', {})
+                with ids_lock:
+                    ids.append(event_id)
+
+        threads = [threading.Thread(target=writer) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert sorted(ids) == list(range(1, 101))
+
+    def test_replay_after_trim(self, sse_store):
+        """Test that replay returns only retained events after the given ID"""
+        sse_store.max_events_per_job = 10
+        for i in range(25):
+            sse_store.add_event(1, 'content', {'chunk': str(i)})
+
+        events = sse_store.get_events_since(1, 20)
+        assert [e['id'] for e in events] == [21, 22, 23, 24, 25]
+        assert len(sse_store.get_events_since(1)) == 10
+        assert sse_store.get_latest_event_id(1) == 25
+
+    def test_redis_backend_uses_counter_and_range_read(self):
+        """Test that the Redis backend issues IDs with INCR and replays by score"""
+        from content_creation_crew.services.sse_store import SSEEventStore
+
+        mock_redis = Mock()
+        mock_redis.incr.return_value = 7
+        mock_redis.zrangebyscore.return_value = ['{"id": 8, "type": "content", "data": {}}']
+        store = SSEEventStore(redis_client=mock_redis)
+
+        assert store._store_event(1, 'content', {}, None) == 7
+        mock_redis.incr.assert_called_once_with("sse:seq:1")
+
+        events = store.get_events_since(1, 7)
+        mock_redis.zrangebyscore.assert_called_once_with("sse:eventlog:1", "(7", "+inf")
+        assert events[0]['id'] == 8
+
+    @pytest.mark.asyncio
+    async def test_add_event_notifies_subscribers(self, sse_store, event_bus):
+        """Test that storing an event wakes streams for that job"""
+        subscription = event_bus.subscribe(1)
+        try:
+            sse_store.add_event(1, 'agent_progress', {'message': 'working'})
+            assert await subscription.wait(timeout=1.0) is True
+        finally:
+            subscription.close()
+
+
+class TestSSEEventStoreMemoryLimits:
+    """Test in-memory SSE store budget, TTL and eviction"""
+
+    @pytest.fixture
+    def bounded_store(self, event_bus, monkeypatch):
+        """In-memory store with a small event budget"""
+        from content_creation_crew.services import sse_store as sse_store_module
+        monkeypatch.setattr(sse_store_module, "get_sse_event_bus", lambda: event_bus)
+        store = sse_store_module.SSEEventStore(redis_client=None, max_memory_events=10, max_memory_bytes=10 ** 6)
+        store.redis_client = None
+        store.use_redis = False
+        return store
+
+    def test_finished_jobs_evicted_first(self, bounded_store):
+        """Test that finished jobs are evicted before active ones, in LRU order"""
+        for _ in range(3):
+            bounded_store.add_event(1, 'content', {})
+        bounded_store.add_event(1, 'complete', {'content': 'done'})
+        for _ in range(4):
+            bounded_store.add_event(2, 'agent_progress', {})
+
+        # Job 3 pushes the store over its 10-event budget
+        for _ in range(4):
+            bounded_store.add_event(3, 'agent_progress', {})
+
+        assert bounded_store.get_events_since(1) == []
+        assert len(bounded_store.get_events_since(2)) == 4
+        assert len(bounded_store.get_events_since(3)) == 4
+
+    def test_active_jobs_evicted_as_last_resort(self, bounded_store):
+        """Test that the budget holds even when no job has finished"""
+        for job_id in range(1, 5):
+            for _ in range(4):
+                bounded_store.add_event(job_id, 'agent_progress', {})
+
+        stats = bounded_store.get_memory_stats()
+        assert stats['events'] <= 10
+        assert len(bounded_store.get_events_since(4)) == 4
+
+    def test_byte_budget_enforced(self, bounded_store):
+        """Test that large events are bounded by the byte budget"""
+        bounded_store.max_memory_bytes = 5000
+        for job_id in range(1, 6):
+            bounded_store.add_event(job_id, 'content', {'chunk': 'x' * 2000})
+
+        assert bounded_store.get_memory_stats()['bytes'] <= 5000
+
+    def test_expired_jobs_are_dropped(self, bounded_store):
+        """Test that jobs past the 24h TTL are not replayed"""
+        import time
+
+        bounded_store.add_event(1, 'content', {})
+        bounded_store.memory_store[1].expires_at = time.time() - 1
+
+        assert bounded_store.get_events_since(1) == []
+        assert bounded_store.get_memory_stats()['jobs'] == 0
+
+    def test_event_ids_not_reused_after_eviction(self, bounded_store):
+        """Test that an evicted job keeps counting from its last event ID"""
+        for _ in range(3):
+            bounded_store.add_event(1, 'content', {})
+        bounded_store.add_event(1, 'complete', {'content': 'done'})
+        for _ in range(10):
+            bounded_store.add_event(2, 'agent_progress', {})
+
+        assert bounded_store.add_event(1, 'artifact_ready', {}) == 5
+
+    def test_occupancy_reported_to_metrics(self, bounded_store):
+        """Test that occupancy gauges track the store"""
+        from content_creation_crew.services.metrics import get_metrics_collector
+
+        bounded_store.add_event(1, 'content', {})
+        bounded_store.add_event(1, 'content', {})
+
+        collector = get_metrics_collector()
+        assert collector.get_gauge("sse_memory_store_events") == 2.0
+        assert collector.get_gauge("sse_memory_store_jobs") == 1.0
+        assert collector.get_gauge("sse_memory_store_bytes") == bounded_store.get_memory_stats()['bytes']
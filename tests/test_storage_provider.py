@@ -0,0 +1,293 @@
+"""
+Tests for streamed storage writes and reads
+"""
+import io
+import pytest
+
+
+@pytest.fixture
+def local_storage(tmp_path):
+    from content_creation_crew.services.storage_provider import LocalDiskStorageProvider
+    return LocalDiskStorageProvider(base_path=str(tmp_path / "storage"))
+
+
+class TestLocalDiskStreaming:
+    """Test the local disk streaming API"""
+
+    def test_put_file_move(self, local_storage, tmp_path):
+        """Test that a moved file is renamed into storage and leaves no source behind"""
+        source = tmp_path / "render.mp4"
+        source.write_bytes(b"video" * 100)
+
+        local_storage.put_file("videos/out.mp4", str(source), content_type="video/mp4", move=True)
+
+        assert not source.exists()
+        assert local_storage.get("videos/out.mp4") == b"video" * 100
+
+    def test_put_file_copy_keeps_source(self, local_storage, tmp_path):
+        """Test that put_file copies by default"""
+        source = tmp_path / "voice.wav"
+        source.write_bytes(b"audio")
+
+        local_storage.put_file("voiceovers/voice.wav", str(source))
+
+        assert source.exists()
+        assert local_storage.get("voiceovers/voice.wav") == b"audio"
+
+    def test_put_stream_in_chunks(self, local_storage, monkeypatch):
+        """Test that a stream larger than the chunk size is written completely"""
+        monkeypatch.setattr(local_storage, "STREAM_CHUNK_SIZE", 7)
+        data = bytes(range(256)) * 10
+
+        key = local_storage.put_stream("artifacts/blob.bin", io.BytesIO(data))
+
+        assert local_storage.get(key) == data
+        assert [path.name for path in (local_storage.base_path / "artifacts").iterdir()] == ["blob.bin"]
+
+    def test_failed_stream_leaves_no_partial_file(self, local_storage):
+        """Test that a stream error does not leave a partial object or temp file"""
+        class FailingStream:
+            def read(self, size=-1):
+                raise IOError("connection reset")
+
+        with pytest.raises(IOError):
+            local_storage.put_stream("artifacts/blob.bin", FailingStream())
+
+        assert list((local_storage.base_path / "artifacts").iterdir()) == []
+
+    def test_moved_and_streamed_files_get_default_mode(self, local_storage, tmp_path):
+        """Test that moved and streamed files are created with the same mode as put()"""
+        import stat
+
+        source = tmp_path / "render.mp4"
+        source.write_bytes(b"video")
+        source.chmod(0o600)
+
+        local_storage.put("artifacts/put.bin", b"data")
+        local_storage.put_file("videos/out.mp4", str(source), move=True)
+        local_storage.put_stream("artifacts/stream.bin", io.BytesIO(b"data"))
+
+        def mode(key):
+            return stat.S_IMODE((local_storage.base_path / key).stat().st_mode)
+
+        assert mode("videos/out.mp4") == mode("artifacts/put.bin")
+        assert mode("artifacts/stream.bin") == mode("artifacts/put.bin")
+
+    def test_open_read(self, local_storage):
+        """Test that stored objects can be read as streams"""
+        local_storage.put("voiceovers/voice.wav", b"audio")
+
+        with local_storage.open_read("voiceovers/voice.wav") as stream:
+            assert stream.read(2) == b"au"
+            assert stream.read() == b"dio"
+        assert local_storage.open_read("voiceovers/missing.wav") is None
+
+
+class TestDefaultStreaming:
+    """Test the base class fallbacks used by providers without streaming support"""
+
+    @pytest.fixture
+    def memory_storage(self):
+        from content_creation_crew.services.storage_provider import StorageProvider
+
+        class MemoryStorage(StorageProvider):
+            def __init__(self):
+                self.objects = {}
+
+            def put(self, key, data, content_type="application/octet-stream"):
+                self.objects[key] = data
+                return key
+
+            def get(self, key):
+                return self.objects.get(key)
+
+            def delete(self, key):
+                return self.objects.pop(key, None) is not None
+
+            def get_url(self, key):
+                return f"/storage/{key}"
+
+        return MemoryStorage()
+
+    def test_put_file_move_removes_source(self, memory_storage, tmp_path):
+        """Test that move removes the local file after it is stored"""
+        source = tmp_path / "clip.mp4"
+        source.write_bytes(b"clip")
+
+        memory_storage.put_file("video_clips/clip.mp4", str(source), move=True)
+
+        assert memory_storage.objects["video_clips/clip.mp4"] == b"clip"
+        assert not source.exists()
+
+    def test_open_read_wraps_get(self, memory_storage):
+        """Test that open_read falls back to get()"""
+        memory_storage.put("voiceovers/voice.wav", b"audio")
+
+        assert memory_storage.open_read("voiceovers/voice.wav").read() == b"audio"
+        assert memory_storage.open_read("voiceovers/missing.wav") is None
+
+
+class TestPresignedURLCache:
+    """Test reuse of presigned S3 URLs"""
+
+    def test_reused_until_refresh_margin(self, monkeypatch):
+        """Test that a cached URL is served until shortly before it expires"""
+        import time
+        from content_creation_crew.services.storage_provider import PresignedURLCache
+
+        cache = PresignedURLCache(refresh_margin=300)
+        now = time.time()
+        cache.put("bucket", "videos/a.mp4", "https://signed", now + 3600)
+
+        assert cache.get("bucket", "videos/a.mp4") == ("https://signed", now + 3600)
+
+        monkeypatch.setattr(time, "time", lambda: now + 3400)
+        assert cache.get("bucket", "videos/a.mp4") is None
+
+    def test_s3_get_url_signs_once(self):
+        """Test that repeat get_url calls do not re-sign the URL"""
+        from content_creation_crew.services import storage_provider as storage_module
+
+        class FakeS3Client:
+            def __init__(self):
+                self.signed = 0
+
+            def generate_presigned_url(self, operation, Params, ExpiresIn):
+                self.signed += 1
+                return f"https://signed/{Params['Key']}?n={self.signed}"
+
+        storage = storage_module.S3StorageProvider.__new__(storage_module.S3StorageProvider)
+        storage.bucket_name = "presign-test-bucket"
+        storage.s3_client = FakeS3Client()
+        storage._available = True
+
+        assert storage.get_url("videos/a.mp4") == storage.get_url("videos/a.mp4")
+        assert storage.s3_client.signed == 1
+
+
+class TestS3Uploads:
+    """Test S3 multipart routing and batch deletes against a recording client"""
+
+    @pytest.fixture
+    def s3_storage(self):
+        from content_creation_crew.services import storage_provider as storage_module
+
+        class RecordingS3Client:
+            def __init__(self):
+                self.calls = []
+                self.missing = set()
+
+            def put_object(self, **kwargs):
+                self.calls.append(("put_object", kwargs["Key"]))
+
+            def upload_fileobj(self, stream, bucket, key, ExtraArgs=None, Config=None):
+                self.calls.append(("upload_fileobj", key, len(stream.read())))
+
+            def delete_objects(self, Bucket, Delete):
+                keys = [item["Key"] for item in Delete["Objects"]]
+                self.calls.append(("delete_objects", len(keys)))
+                return {"Errors": [{"Key": key, "Code": "AccessDenied"} for key in keys if key in self.missing]}
+
+        storage = storage_module.S3StorageProvider.__new__(storage_module.S3StorageProvider)
+        storage.bucket_name = "upload-test-bucket"
+        storage.s3_client = RecordingS3Client()
+        storage._transfer_config = None
+        storage._available = True
+        return storage
+
+    def test_large_put_uses_multipart_transfer(self, s3_storage, monkeypatch):
+        """Test that payloads over the threshold go through the transfer manager"""
+        from content_creation_crew.services import storage_provider as storage_module
+
+        monkeypatch.setattr(storage_module, "S3_MULTIPART_THRESHOLD_MB", 1)
+        s3_storage.put("small.bin", b"x" * 1024)
+        s3_storage.put("large.bin", b"x" * (2 * 1024 * 1024))
+
+        assert s3_storage.s3_client.calls == [
+            ("put_object", "small.bin"),
+            ("upload_fileobj", "large.bin", 2 * 1024 * 1024),
+        ]
+
+    def test_delete_many_batches(self, s3_storage):
+        """Test that keys are deleted in batches of 1000 and failures are reported per key"""
+        keys = [f"videos/{index}.mp4" for index in range(2500)]
+        s3_storage.s3_client.missing = {"videos/7.mp4"}
+
+        results = s3_storage.delete_many(keys)
+
+        assert s3_storage.s3_client.calls == [("delete_objects", 1000), ("delete_objects", 1000), ("delete_objects", 500)]
+        assert results["videos/7.mp4"] is False
+        assert sum(results.values()) == 2499
+
+    def test_async_put_runs_on_storage_pool(self, s3_storage):
+        """Test that async uploads run on the storage I/O threads"""
+        import asyncio
+        import threading
+
+        threads = []
+        s3_storage.s3_client.put_object = lambda **kwargs: threads.append(threading.current_thread().name)
+
+        asyncio.run(s3_storage.aput("voiceovers/a.wav", b"audio"))
+
+        assert threads[0].startswith("storage-io")
+
+
+class TestS3AgainstMoto:
+    """Round trips against moto's S3 stand-in (skipped when moto is not installed)"""
+
+    @pytest.fixture
+    def moto_storage(self, monkeypatch):
+        moto = pytest.importorskip("moto")
+        from content_creation_crew.services import storage_provider as storage_module
+
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+        monkeypatch.delenv("S3_ENDPOINT_URL", raising=False)
+        monkeypatch.setattr(storage_module, "S3_MULTIPART_THRESHOLD_MB", 5)
+        monkeypatch.setattr(storage_module, "S3_MULTIPART_CHUNKSIZE_MB", 5)
+        monkeypatch.setattr(storage_module, "_s3_clients", {})
+        with moto.mock_aws():
+            storage = storage_module.S3StorageProvider(bucket_name="moto-test-bucket")
+            storage.s3_client.create_bucket(Bucket="moto-test-bucket")
+            yield storage
+
+    def test_multipart_round_trip(self, moto_storage, tmp_path):
+        """Test that a file over the threshold uploads in parts and reads back intact"""
+        data = bytes(range(256)) * (48 * 1024)  # 12MB, three 5MB parts
+        source = tmp_path / "video.mp4"
+        source.write_bytes(data)
+
+        moto_storage.put_file("videos/video.mp4", str(source), content_type="video/mp4")
+
+        head = moto_storage.s3_client.head_object(Bucket="moto-test-bucket", Key="videos/video.mp4")
+        assert head["ETag"].endswith('-3"')  # Multipart ETags carry the part count
+        with moto_storage.open_read("videos/video.mp4") as stream:
+            assert stream.read() == data
+
+    def test_delete_many(self, moto_storage):
+        """Test that a batch delete removes every key"""
+        keys = [f"voiceovers/{index}.wav" for index in range(5)]
+        for key in keys:
+            moto_storage.put(key, b"audio")
+
+        assert all(moto_storage.delete_many(keys).values())
+        assert moto_storage.get(keys[0]) is None
+
+    def test_presigned_url_requires_existing_object(self, moto_storage):
+        """Test that require_exists refuses to sign a URL for a missing object"""
+        moto_storage.put("videos/out.mp4", b"video")
+
+        assert moto_storage.get_presigned_url("videos/out.mp4", require_exists=True)[0]
+        with pytest.raises(FileNotFoundError):
+            moto_storage.get_presigned_url("videos/missing.mp4", require_exists=True)
+
+    def test_list_objects(self, moto_storage):
+        """Test that listing returns only keys under the prefix with sizes"""
+        moto_storage.put("tts_cache/abc.json", b"{}")
+        moto_storage.put("tts_cache/abc.wav", b"audio")
+        moto_storage.put("voiceovers/1.wav", b"audio")
+
+        objects = moto_storage.list_objects("tts_cache/")
+
+        assert sorted((item['key'], item['size']) for item in objects) == [("tts_cache/abc.json", 2), ("tts_cache/abc.wav", 5)]
+        assert all(item['last_modified'] > 0 for item in objects)
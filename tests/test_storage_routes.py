@@ -0,0 +1,173 @@
+"""
+Tests for /v1/storage media serving (byte ranges, ETags, presigned redirects)
+"""
+import pytest
+
+
+@pytest.fixture
+def media_client(tmp_path, monkeypatch):
+    """Client for the storage routes serving a local disk storage directory"""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from content_creation_crew import storage_routes
+    from content_creation_crew.services.storage_provider import LocalDiskStorageProvider
+
+    storage = LocalDiskStorageProvider(base_path=str(tmp_path / "storage"))
+    storage.put("voiceovers/voice.wav", bytes(range(100)))
+    monkeypatch.setattr(storage_routes, "_storage", storage)
+
+    app = FastAPI()
+    app.include_router(storage_routes.router)
+    return TestClient(app)
+
+
+class TestRangeParsing:
+    """Test Range header parsing"""
+
+    def test_ranges(self):
+        """Test explicit, open-ended and suffix byte ranges"""
+        from content_creation_crew.storage_routes import parse_range
+
+        assert parse_range("bytes=0-9", 100) == (0, 9)
+        assert parse_range("bytes=90-", 100) == (90, 99)
+        assert parse_range("bytes=-10", 100) == (90, 99)
+        assert parse_range("bytes=50-500", 100) == (50, 99)
+
+    def test_ignored_ranges(self):
+        """Test that missing, malformed and multi-range headers serve the whole file"""
+        from content_creation_crew.storage_routes import parse_range
+
+        assert parse_range(None, 100) is None
+        assert parse_range("items=0-9", 100) is None
+        assert parse_range("bytes=0-9,20-29", 100) is None
+        assert parse_range("bytes=abc-", 100) is None
+        assert parse_range("bytes=9-0", 100) is None
+
+    def test_unsatisfiable(self):
+        """Test that a range past the end of the file is rejected"""
+        from content_creation_crew.storage_routes import RangeNotSatisfiable, parse_range
+
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=100-", 100)
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=-0", 100)
+
+
+class TestLocalMediaServing:
+    """Test serving files from local disk storage"""
+
+    def test_full_response_headers(self, media_client):
+        """Test that a plain GET returns the file with caching headers"""
+        response = media_client.get("/v1/storage/voiceovers/voice.wav")
+
+        assert response.status_code == 200
+        assert response.content == bytes(range(100))
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-type"].startswith("audio/")
+        assert "max-age=" in response.headers["cache-control"]
+        assert response.headers["etag"].startswith('"')
+
+    def test_partial_content(self, media_client):
+        """Test that a byte range is served as 206 with Content-Range"""
+        response = media_client.get("/v1/storage/voiceovers/voice.wav", headers={"Range": "bytes=10-19"})
+
+        assert response.status_code == 206
+        assert response.content == bytes(range(10, 20))
+        assert response.headers["content-range"] == "bytes 10-19/100"
+        assert response.headers["content-length"] == "10"
+
+    def test_range_not_satisfiable(self, media_client):
+        """Test that a range past the end returns 416"""
+        response = media_client.get("/v1/storage/voiceovers/voice.wav", headers={"Range": "bytes=200-"})
+
+        assert response.status_code == 416
+        assert response.headers["content-range"] == "bytes */100"
+
+    def test_if_none_match(self, media_client):
+        """Test that a matching ETag returns 304 without a body"""
+        etag = media_client.get("/v1/storage/voiceovers/voice.wav").headers["etag"]
+
+        response = media_client.get("/v1/storage/voiceovers/voice.wav", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+
+    def test_stale_if_range_serves_whole_file(self, media_client):
+        """Test that a range with an outdated If-Range validator gets the full file"""
+        response = media_client.get(
+            "/v1/storage/voiceovers/voice.wav",
+            headers={"Range": "bytes=10-19", "If-Range": '"outdated"'}
+        )
+
+        assert response.status_code == 200
+        assert len(response.content) == 100
+
+    def test_head(self, media_client):
+        """Test that HEAD returns headers without a body"""
+        response = media_client.head("/v1/storage/voiceovers/voice.wav")
+
+        assert response.status_code == 200
+        assert response.headers["content-length"] == "100"
+        assert response.content == b""
+
+    def test_missing_and_outside_files(self, media_client, tmp_path):
+        """Test that missing files and paths outside storage are not served"""
+        (tmp_path / "secret.txt").write_text("secret")
+
+        assert media_client.get("/v1/storage/voiceovers/missing.wav").status_code == 404
+        assert media_client.get("/v1/storage/..%2Fsecret.txt").status_code == 404
+
+    def test_only_media_prefixes_served(self, media_client):
+        """Test that stored objects outside the generated media prefixes are not served"""
+        from content_creation_crew import storage_routes
+
+        storage_routes._storage.put("invoices/1/INV-0001.pdf", b"%PDF")
+        storage_routes._storage.put("tts_cache/abc.wav", b"audio")
+
+        assert media_client.get("/v1/storage/invoices/1/INV-0001.pdf").status_code == 404
+        assert media_client.get("/v1/storage/tts_cache/abc.wav").status_code == 404
+        assert media_client.get("/v1/storage/voiceovers/..%2Finvoices/1/INV-0001.pdf").status_code == 404
+
+    def test_accel_redirect(self, media_client, monkeypatch):
+        """Test that nginx is handed the file when X-Accel-Redirect is configured"""
+        from content_creation_crew.config import config
+
+        monkeypatch.setattr(config, "STORAGE_ACCEL_REDIRECT_PREFIX", "/internal-storage/")
+
+        response = media_client.get("/v1/storage/voiceovers/voice.wav")
+
+        assert response.headers["x-accel-redirect"] == "/internal-storage/voiceovers/voice.wav"
+        assert response.content == b""
+
+
+class TestPresignedRedirect:
+    """Test serving objects from remote storage"""
+
+    def test_redirects_to_presigned_url(self, monkeypatch):
+        """Test that remote objects redirect to a presigned URL cacheable until it nears expiry"""
+        import time
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from content_creation_crew import storage_routes
+
+        class RemoteStorage:
+            def local_path(self, key):
+                return None
+
+            def get_presigned_url(self, key, require_exists=False):
+                if key.endswith("missing.mp4"):
+                    raise FileNotFoundError(key)
+                return f"https://bucket.example.com/{key}?sig=abc", time.time() + 3600
+
+        monkeypatch.setattr(storage_routes, "_storage", RemoteStorage())
+        app = FastAPI()
+        app.include_router(storage_routes.router)
+
+        response = TestClient(app).get("/v1/storage/videos/out.mp4", follow_redirects=False)
+
+        assert response.status_code == 307
+        assert response.headers["location"] == "https://bucket.example.com/videos/out.mp4?sig=abc"
+        max_age = int(response.headers["cache-control"].split("max-age=")[1])
+        assert 0 < max_age <= 3600
+        assert TestClient(app).get("/v1/storage/videos/missing.mp4", follow_redirects=False).status_code == 404
+        assert TestClient(app).get("/v1/storage/invoices/1/INV-0001.pdf", follow_redirects=False).status_code == 404
@@ -0,0 +1,229 @@
+"""
+Tests for the token blacklist (Bloom filter in front of Redis)
+"""
+import queue
+import threading
+import time
+
+
+class FakeRedis:
+    """Minimal Redis string, sorted set and pub/sub commands shared by several instances"""
+
+    def __init__(self):
+        self.values = {}
+        self.sorted_sets = {}
+        self.subscribers = []
+        self.exists_calls = 0
+        self.lock = threading.Lock()
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def exists(self, key):
+        self.exists_calls += 1
+        return int(key in self.values)
+
+    def zadd(self, key, mapping):
+        self.sorted_sets.setdefault(key, {}).update(mapping)
+
+    def zremrangebyscore(self, key, low, high):
+        members = self.sorted_sets.get(key, {})
+        for member in [member for member, score in members.items() if score <= float(high)]:
+            del members[member]
+
+    def zrangebyscore(self, key, low, high):
+        return [member for member, score in self.sorted_sets.get(key, {}).items() if score >= float(low)]
+
+    def publish(self, channel, message):
+        with self.lock:
+            for pubsub in self.subscribers:
+                if channel in pubsub.channels:
+                    pubsub.messages.put({'type': 'message', 'channel': channel, 'data': message})
+
+    def pubsub(self, ignore_subscribe_messages=False):
+        pubsub = FakePubSub()
+        with self.lock:
+            self.subscribers.append(pubsub)
+        return pubsub
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+
+class FakePubSub:
+    """Pub/sub subscription fed by FakeRedis.publish"""
+
+    def __init__(self):
+        self.channels = set()
+        self.messages = queue.Queue()
+
+    def subscribe(self, channel):
+        self.channels.add(channel)
+
+    def get_message(self, timeout=0.0):
+        try:
+            return self.messages.get(timeout=min(timeout, 0.05))
+        except queue.Empty:
+            return None
+
+    def close(self):
+        self.channels.clear()
+
+
+class FakePipeline:
+    """Pipeline that runs commands on execute() and returns their results"""
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.commands = []
+
+    def __getattr__(self, name):
+        return lambda *args: self.commands.append((name, args))
+
+    def execute(self):
+        return [getattr(self.redis_client, name)(*args) for name, args in self.commands]
+
+
+def wait_for(condition, timeout=2.0):
+    """Poll until condition() is true or the timeout passes"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return condition()
+
+
+class TestBloomFilter:
+    """Test the Bloom filter"""
+
+    def test_no_false_negatives(self):
+        """Test that every added item is reported as present"""
+        from content_creation_crew.services.token_blacklist import BloomFilter
+
+        bloom = BloomFilter(1000, 0.01)
+        items = [f"jti-{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+
+        assert all(item in bloom for item in items)
+
+    def test_false_positive_rate(self):
+        """Test that the false positive rate stays near the configured rate at capacity"""
+        from content_creation_crew.services.token_blacklist import BloomFilter
+
+        bloom = BloomFilter(1000, 0.01)
+        for i in range(1000):
+            bloom.add(f"jti-{i}")
+
+        false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+        assert false_positives < 300
+
+
+class TestTokenBlacklist:
+    """Test token revocation"""
+
+    def test_filter_miss_skips_redis(self):
+        """Test that a token that was never revoked is answered without a Redis lookup"""
+        from content_creation_crew.services.token_blacklist import TokenBlacklist
+
+        redis_client = FakeRedis()
+        blacklist = TokenBlacklist(redis_client=redis_client)
+        try:
+            assert blacklist.is_revoked("never-revoked") is False
+            assert redis_client.exists_calls == 0
+        finally:
+            blacklist.shutdown()
+
+    def test_revoke_stores_token_with_ttl_key(self):
+        """Test that revoking writes the jti key and is confirmed on lookup"""
+        from content_creation_crew.services.token_blacklist import TokenBlacklist
+
+        redis_client = FakeRedis()
+        blacklist = TokenBlacklist(redis_client=redis_client)
+        try:
+            blacklist.revoke("jti-1", 900)
+
+            assert redis_client.values["blacklist:token:jti-1"] == "1"
+            assert blacklist.is_revoked("jti-1") is True
+            assert redis_client.exists_calls == 1
+        finally:
+            blacklist.shutdown()
+
+    def test_revocation_reaches_other_instances(self):
+        """Test that other instances learn of a revocation through pub/sub and on startup"""
+        from content_creation_crew.services.token_blacklist import TokenBlacklist
+
+        redis_client = FakeRedis()
+        first = TokenBlacklist(redis_client=redis_client)
+        second = TokenBlacklist(redis_client=redis_client)
+        try:
+            assert wait_for(lambda: len(redis_client.subscribers) == 2)
+            first.revoke("jti-2", 900)
+
+            assert wait_for(lambda: "jti-2" in second._bloom)
+            assert second.is_revoked("jti-2") is True
+
+            third = TokenBlacklist(redis_client=redis_client)
+            try:
+                assert third.is_revoked("jti-2") is True
+            finally:
+                third.shutdown()
+        finally:
+            first.shutdown()
+            second.shutdown()
+
+    def test_reload_drops_expired_tokens(self):
+        """Test that rebuilding the filter drops revocations whose tokens have expired"""
+        from content_creation_crew.services.token_blacklist import TokenBlacklist
+
+        redis_client = FakeRedis()
+        blacklist = TokenBlacklist(redis_client=redis_client)
+        try:
+            blacklist.revoke("jti-3", 900)
+            redis_client.sorted_sets["blacklist:tokens"]["jti-3"] = time.time() - 1
+            blacklist.reload()
+
+            assert "jti-3" not in redis_client.sorted_sets["blacklist:tokens"]
+            assert "jti-3" not in blacklist._bloom
+        finally:
+            blacklist.shutdown()
+
+    def test_user_revocation(self):
+        """Test that tokens issued before a user-wide revocation are rejected and later ones are not"""
+        from content_creation_crew.services.token_blacklist import TokenBlacklist
+
+        redis_client = FakeRedis()
+        first = TokenBlacklist(redis_client=redis_client)
+        second = TokenBlacklist(redis_client=redis_client)
+        try:
+            now = int(time.time())
+            assert second.is_user_revoked(7, now - 10) is False  # Cached as "not revoked"
+
+            first.revoke_all_user_tokens(7, ttl=900)
+
+            assert first.is_user_revoked(7, now - 10) is True
+            assert first.is_user_revoked(7, now + 10) is False
+            assert wait_for(lambda: second.is_user_revoked(7, now - 10))
+        finally:
+            first.shutdown()
+            second.shutdown()
+
+    def test_memory_fallback(self, monkeypatch):
+        """Test that revocation works in process memory without Redis"""
+        from datetime import datetime, timedelta
+        from content_creation_crew.services import token_blacklist
+
+        monkeypatch.setattr(token_blacklist, "get_redis_client", lambda: None)
+        blacklist = token_blacklist.TokenBlacklist()
+
+        blacklist.revoke("jti-4", 900)
+        blacklist.revoke_all_user_tokens(8, ttl=900)
+
+        assert blacklist.is_revoked("jti-4") is True
+        assert blacklist.is_revoked("jti-5") is False
+        assert blacklist.is_user_revoked(8, datetime.utcnow() - timedelta(minutes=1)) is True
+        assert blacklist.is_user_revoked(9, datetime.utcnow() - timedelta(minutes=1)) is False
@@ -0,0 +1,117 @@
+"""
+Tests for near-duplicate topic fingerprints and the topic index
+"""
+import pytest
+
+
+class TestTopicNormalization:
+    """Test topic normalization and shingles"""
+
+    def test_stopwords_punctuation_and_stemming(self):
+        """Test that topic variants normalize to the same words"""
+        from content_creation_crew.services.topic_index import normalize_topic
+
+        assert normalize_topic("Benefits of remote work") == normalize_topic("The benefits of remote working!")
+
+    def test_stem_variants(self):
+        """Test that common suffix variants share a stem"""
+        from content_creation_crew.services.topic_index import stem
+
+        assert stem("working") == stem("works") == stem("work")
+        assert stem("making") == stem("make")
+        assert stem("businesses") == stem("business")
+        assert stem("studies") == stem("study")
+
+    def test_stopword_only_topic_keeps_tokens(self):
+        """Test that a topic of only stopwords still has a fingerprint"""
+        from content_creation_crew.services.topic_index import topic_shingles
+
+        assert topic_shingles("What is it") != frozenset()
+
+
+class TestTopicIndex:
+    """Test near-duplicate lookup"""
+
+    @pytest.fixture
+    def topic_index(self):
+        from content_creation_crew.services.topic_index import TopicIndex
+        return TopicIndex(threshold=0.8, max_entries=3)
+
+    def test_finds_near_duplicate(self, topic_index):
+        """Test that a reworded topic matches the cached one"""
+        topic_index.add("blog", "Benefits of remote work")
+        topic_index.add("blog", "History of Rome")
+
+        match, similarity, _ = topic_index.find_similar("blog", "the benefits of remote working")
+        assert match == "Benefits of remote work"
+        assert similarity == 1.0
+
+    def test_different_topic_does_not_match(self, topic_index):
+        """Test that topics below the threshold are rejected"""
+        topic_index.add("blog", "Benefits of remote work")
+
+        match, _, _ = topic_index.find_similar("blog", "Benefits of remote work for startups")
+        assert match is None
+
+    def test_scopes_are_isolated(self, topic_index):
+        """Test that topics cached for other content types or models do not match"""
+        topic_index.add("blog", "Benefits of remote work")
+
+        match, _, _ = topic_index.find_similar("social", "the benefits of remote working")
+        assert match is None
+
+    def test_exact_topic_excluded(self, topic_index):
+        """Test that the identical topic is left to the exact lookup"""
+        topic_index.add("blog", "Benefits of remote work")
+
+        match, _, _ = topic_index.find_similar("blog", "benefits of remote work ")
+        assert match is None
+
+    def test_bounded_and_removable(self, topic_index):
+        """Test that the oldest topics are dropped and removal clears buckets"""
+        for topic in ("alpha topic", "beta topic", "gamma topic", "delta topic"):
+            topic_index.add("blog", topic)
+        assert len(topic_index) == 3
+        assert topic_index.find_similar("blog", "alpha topics")[0] is None
+
+        topic_index.remove("blog", "delta topic")
+        assert topic_index.find_similar("blog", "delta topics")[0] is None
+        assert len(topic_index) == 2
+
+
+class TestSimilarCacheLookup:
+    """Test the content cache's near-duplicate lookup layer"""
+
+    @pytest.fixture
+    def similar_cache(self, monkeypatch):
+        from content_creation_crew.config import config
+        from content_creation_crew.services import topic_index as topic_index_module
+        from content_creation_crew.services.content_cache import ContentCache
+
+        monkeypatch.setattr(config, "CONTENT_CACHE_SIMILAR_TOPICS", True)
+        monkeypatch.setattr(topic_index_module, "_topic_index_instance", topic_index_module.TopicIndex())
+        return ContentCache()
+
+    def test_similar_topic_served(self, similar_cache):
+        """Test that a reworded topic is served the cached content"""
+        similar_cache.set("Benefits of remote work", {'content': 'cached post'}, content_types=['blog'])
+
+        assert similar_cache.get("the benefits of remote working", ['blog']) is None
+        result = similar_cache.get_similar("the benefits of remote working", ['blog'])
+        assert result['content'] == 'cached post'
+        assert result['similar_topic'] == "Benefits of remote work"
+
+    def test_evicted_topic_not_served(self, similar_cache):
+        """Test that an index entry for an evicted topic is dropped"""
+        similar_cache.set("Benefits of remote work", {'content': 'cached post'}, content_types=['blog'])
+        similar_cache.clear("Benefits of remote work", ['blog'])
+
+        assert similar_cache.get_similar("the benefits of remote working", ['blog']) is None
+
+    def test_disabled_by_default(self, similar_cache, monkeypatch):
+        """Test that the lookup layer is off unless configured"""
+        from content_creation_crew.config import config
+
+        similar_cache.set("Benefits of remote work", {'content': 'cached post'}, content_types=['blog'])
+        monkeypatch.setattr(config, "CONTENT_CACHE_SIMILAR_TOPICS", False)
+        assert similar_cache.get_similar("the benefits of remote working", ['blog']) is None
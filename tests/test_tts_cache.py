@@ -0,0 +1,201 @@
+"""
+Tests for the content-addressed TTS output cache
+"""
+import pytest
+
+
+@pytest.fixture
+def storage(tmp_path):
+    """Local disk storage in a temporary directory"""
+    from content_creation_crew.services.storage_provider import LocalDiskStorageProvider
+    return LocalDiskStorageProvider(base_path=str(tmp_path))
+
+
+@pytest.fixture
+def tts_cache():
+    """TTS output cache without Redis"""
+    from content_creation_crew.services.tts_cache import TTSOutputCache
+    return TTSOutputCache(max_index_entries=2)
+
+
+def store_voiceover(storage, tts_cache, key, with_mp3=True):
+    """Store artifact audio as the voiceover job does and add it to the cache"""
+    storage_key = storage.generate_key('voiceovers', '.wav')
+    storage.put(storage_key, b'RIFF-wav-audio', content_type='audio/wav')
+    mp3_storage_key = None
+    if with_mp3:
+        mp3_storage_key = storage.generate_key('voiceovers', '.mp3')
+        storage.put(mp3_storage_key, b'ID3-mp3-audio', content_type='audio/mpeg')
+    metadata = {'format': 'wav', 'duration_sec': 1.5, 'sample_rate': 22050, 'provider': 'piper'}
+    tts_cache.save(key, storage, storage_key, metadata, 14, mp3_storage_key=mp3_storage_key)
+    return storage_key, mp3_storage_key
+
+
+class TestTTSCacheKey:
+    """Test content addressing"""
+
+    def test_key_covers_every_parameter(self):
+        """Test that text, voice, speed, format and provider all change the key"""
+        from content_creation_crew.services.tts_cache import TTSOutputCache
+
+        base = ("Hello world.", "en_US-lessac-medium", 1.0, "wav", "piper")
+        key = TTSOutputCache.make_key(*base)
+        assert TTSOutputCache.make_key(*base) == key
+        for index, value in enumerate(("Hello world!", "en_US-amy-medium", 1.25, "mp3", "gtts")):
+            changed = list(base)
+            changed[index] = value
+            assert TTSOutputCache.make_key(*changed) != key
+
+
+class TestTTSCacheRestore:
+    """Test reusing stored audio"""
+
+    def test_hit_copies_audio_to_new_keys(self, storage, tts_cache):
+        """Test that a hit returns fresh artifact keys holding the cached audio"""
+        storage_key, mp3_storage_key = store_voiceover(storage, tts_cache, "abc")
+
+        restored = tts_cache.restore("abc", storage)
+
+        assert restored['storage_key'] not in (storage_key, mp3_storage_key)
+        assert storage.get(restored['storage_key']) == b'RIFF-wav-audio'
+        assert storage.get(restored['mp3_storage_key']) == b'ID3-mp3-audio'
+        assert restored['metadata']['duration_sec'] == 1.5
+        assert restored['size'] == 14
+
+    def test_deleting_artifact_keeps_cache(self, storage, tts_cache):
+        """Test that deleting an artifact's audio does not break later hits"""
+        storage_key, mp3_storage_key = store_voiceover(storage, tts_cache, "abc")
+        storage.delete(storage_key)
+        storage.delete(mp3_storage_key)
+
+        assert storage.get(tts_cache.restore("abc", storage)['storage_key']) == b'RIFF-wav-audio'
+
+    def test_record_survives_hot_index(self, storage, tts_cache):
+        """Test that a record evicted from the hot index is read back from storage"""
+        store_voiceover(storage, tts_cache, "abc")
+        store_voiceover(storage, tts_cache, "def")
+        store_voiceover(storage, tts_cache, "ghi")
+
+        assert "abc" not in tts_cache._index
+        assert tts_cache.restore("abc", storage) is not None
+
+    def test_miss(self, storage, tts_cache):
+        """Test that an unknown key is a miss"""
+        assert tts_cache.restore("unknown", storage) is None
+
+    def test_missing_audio_drops_entry(self, storage, tts_cache):
+        """Test that an entry whose cached audio was removed is invalidated"""
+        store_voiceover(storage, tts_cache, "abc", with_mp3=False)
+        storage.delete(tts_cache.lookup("abc", storage)['storage_key'])
+
+        assert tts_cache.restore("abc", storage) is None
+        assert tts_cache.lookup("abc", storage) is None
+
+
+def age_objects(storage, prefix, seconds):
+    """Backdate stored files under a prefix"""
+    import os
+    import time
+    when = time.time() - seconds
+    for item in storage.list_objects(prefix):
+        os.utime(storage.local_path(item['key']), (when, when))
+
+
+class TestTTSCacheEviction:
+    """Test expiry, the size budget and erasure of stored entries"""
+
+    def test_expired_entry_dropped_on_lookup(self, storage):
+        """Test that an entry older than max_age is a miss and its stored audio is deleted"""
+        from content_creation_crew.services.tts_cache import TTSOutputCache
+
+        tts_cache = TTSOutputCache(max_age=60)
+        store_voiceover(storage, tts_cache, "abc")
+        tts_cache._index["abc"]['created_at'] -= 120
+
+        assert tts_cache.restore("abc", storage) is None
+        assert storage.list_objects("tts_cache/") == []
+
+    def test_sweep_evicts_expired_entries(self, storage):
+        """Test that the sweep deletes entries whose objects are older than max_age"""
+        from content_creation_crew.services.tts_cache import TTSOutputCache
+
+        tts_cache = TTSOutputCache(max_age=60)
+        store_voiceover(storage, tts_cache, "abc")
+        store_voiceover(storage, tts_cache, "def")
+        age_objects(storage, "tts_cache/abc", 120)
+
+        assert tts_cache.sweep(storage) == 1
+        assert {item['key'].split('/')[1].split('.')[0] for item in storage.list_objects("tts_cache/")} == {"def"}
+        assert "abc" not in tts_cache._index
+        assert tts_cache.restore("def", storage) is not None
+
+    def test_sweep_evicts_oldest_over_budget(self, storage):
+        """Test that the sweep evicts the oldest entries until stored audio fits max_bytes"""
+        from content_creation_crew.services.tts_cache import TTSOutputCache
+
+        tts_cache = TTSOutputCache(max_age=0)
+        store_voiceover(storage, tts_cache, "abc")
+        entry_bytes = sum(item['size'] for item in storage.list_objects("tts_cache/"))
+        store_voiceover(storage, tts_cache, "def")
+        age_objects(storage, "tts_cache/abc", 10)
+        tts_cache.max_bytes = entry_bytes + 10
+
+        assert tts_cache.sweep(storage) == 1
+        assert tts_cache.restore("abc", storage) is None
+        assert tts_cache.restore("def", storage) is not None
+
+    def test_erase_deletes_stored_audio(self, storage, tts_cache):
+        """Test that erasing an entry removes its audio, record and index entry"""
+        store_voiceover(storage, tts_cache, "abc")
+
+        assert tts_cache.erase(["abc", "abc"], storage) == 1
+        assert storage.list_objects("tts_cache/") == []
+        assert tts_cache.restore("abc", storage) is None
+
+
+class TestTTSCacheGDPR:
+    """Test GDPR deletion of cache entries made from a user's scripts"""
+
+    def test_user_deletion_erases_cache_entries(self, storage, tts_cache):
+        """Test that deleting a user's artifacts erases the TTS cache entries they recorded"""
+        from unittest.mock import Mock, patch
+        from content_creation_crew.services.gdpr_deletion_service import GDPRDeletionService
+
+        artifact_key, _ = store_voiceover(storage, tts_cache, "abc", with_mp3=False)
+        store_voiceover(storage, tts_cache, "other", with_mp3=False)
+        artifact = Mock(content_json={'storage_key': artifact_key, 'tts_cache_key': "abc"})
+        db = Mock()
+        db.query.return_value.filter.return_value.all.side_effect = [[Mock(id=1)], [artifact]]
+
+        with patch("content_creation_crew.services.storage_provider.get_storage_provider", return_value=storage), \
+                patch("content_creation_crew.services.tts_cache.get_tts_cache", return_value=tts_cache):
+            result = GDPRDeletionService(db, Mock(id=7))._delete_artifacts_and_files()
+
+        assert result['tts_cache_entries_erased'] == 1
+        assert storage.get(artifact_key) is None
+        assert tts_cache.restore("abc", storage) is None
+        assert tts_cache.restore("other", storage) is not None
+
+    def test_user_deletion_removes_every_rendition(self, storage, tts_cache):
+        """Test that deleting a voiceover artifact removes its MP3 and other rendition files too"""
+        from unittest.mock import Mock, patch
+        from content_creation_crew.services.gdpr_deletion_service import GDPRDeletionService
+
+        artifact_key, mp3_key = store_voiceover(storage, tts_cache, "abc")
+        opus_key = storage.generate_key('voiceovers', '.opus')
+        storage.put(opus_key, b'OggS-opus-audio', content_type='audio/ogg')
+        artifact = Mock(content_json={
+            'storage_key': artifact_key,
+            'mp3_storage_key': mp3_key,
+            'renditions': {'mp3': {'storage_key': mp3_key}, 'opus': {'storage_key': opus_key}}
+        })
+        db = Mock()
+        db.query.return_value.filter.return_value.all.side_effect = [[Mock(id=1)], [artifact]]
+
+        with patch("content_creation_crew.services.storage_provider.get_storage_provider", return_value=storage):
+            result = GDPRDeletionService(db, Mock(id=7))._delete_artifacts_and_files()
+
+        assert result['files_deleted'] == 3
+        assert result['files_failed'] == 0
+        for key in (artifact_key, mp3_key, opus_key):
+            assert storage.get(key) is None
@@ -0,0 +1,232 @@
+"""
+Tests for the Piper voice registry and streamed synthesis
+"""
+import threading
+import time
+import pytest
+
+
+@pytest.fixture
+def piper_provider(monkeypatch):
+    """Piper provider whose loaded voice echoes each text chunk as PCM"""
+    from content_creation_crew.services import tts_provider as tts_module
+
+    class FakeAudioChunk:
+        sample_rate = 22050
+        sample_width = 2
+        sample_channels = 1
+
+        def __init__(self, text):
+            self.audio_int16_bytes = text.encode()
+
+    class FakeVoice:
+        def __init__(self):
+            self.calls = []
+
+        def synthesize(self, text):
+            self.calls.append(text)
+            yield FakeAudioChunk(text)
+
+    loaded_voice = tts_module.LoadedVoice(FakeVoice())
+    provider = tts_module.PiperTTSProvider.__new__(tts_module.PiperTTSProvider)
+    provider.model_path = "models/piper"
+    monkeypatch.setattr(provider, "_get_loaded_voice", lambda voice_id: loaded_voice, raising=False)
+    return provider, loaded_voice
+
+
+class TestPiperVoiceRegistry:
+    """Test process-wide reuse of loaded voices"""
+
+    def test_voice_loaded_once(self):
+        """Test that repeat requests reuse the loaded voice"""
+        from content_creation_crew.services.tts_provider import PiperVoiceRegistry
+
+        registry = PiperVoiceRegistry(max_voices=2)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            return object()
+
+        first = registry.get(("models", "en_US-lessac-medium"), loader)
+        second = registry.get(("models", "en_US-lessac-medium"), loader)
+
+        assert first is second
+        assert len(loads) == 1
+
+    def test_concurrent_first_requests_share_one_load(self):
+        """Test that threads racing on a cold voice wait for a single load"""
+        from content_creation_crew.services.tts_provider import PiperVoiceRegistry
+
+        registry = PiperVoiceRegistry(max_voices=2)
+        loads = []
+
+        def loader():
+            loads.append(1)
+            time.sleep(0.05)
+            return object()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(registry.get(("models", "voice"), loader)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert len({id(result) for result in results}) == 1
+
+    def test_lru_cap(self):
+        """Test that the least recently used voice is unloaded over the cap"""
+        from content_creation_crew.services.tts_provider import PiperVoiceRegistry
+
+        registry = PiperVoiceRegistry(max_voices=2)
+        first = registry.get(("models", "a"), object)
+        registry.get(("models", "b"), object)
+        registry.get(("models", "a"), object)  # "b" becomes least recently used
+        registry.get(("models", "c"), object)
+
+        assert len(registry) == 2
+        assert registry.get(("models", "a"), object) is first
+        assert registry.get(("models", "b"), object).voice is not None  # Reloaded
+
+    def test_failed_load_not_cached(self):
+        """Test that a loader error propagates and the next request retries"""
+        from content_creation_crew.services.tts_provider import PiperVoiceRegistry
+
+        registry = PiperVoiceRegistry()
+
+        def failing_loader():
+            raise FileNotFoundError("model missing")
+
+        with pytest.raises(FileNotFoundError):
+            registry.get(("models", "voice"), failing_loader)
+
+        assert len(registry) == 0
+        assert registry.get(("models", "voice"), object) is not None
+
+
+class TestSentenceChunking:
+    """Test splitting narration into synthesis chunks"""
+
+    def test_splits_at_sentence_boundaries(self):
+        """Test that sentences are packed into chunks up to the limit"""
+        from content_creation_crew.services.tts_provider import split_sentences
+
+        text = "First sentence here. Second one! Third?\n\nNew paragraph."
+        assert split_sentences(text, max_chars=40) == [
+            "First sentence here. Second one! Third?",
+            "New paragraph.",
+        ]
+
+    def test_long_sentence_split_at_spaces(self):
+        """Test that a sentence over the limit is split between words"""
+        from content_creation_crew.services.tts_provider import split_sentences
+
+        chunks = split_sentences("word " * 50, max_chars=32)
+        assert all(len(chunk) <= 32 for chunk in chunks)
+        assert " ".join(chunks).split() == ["word"] * 50
+
+    def test_blank_text_has_no_chunks(self):
+        """Test that whitespace-only text yields nothing to synthesize"""
+        from content_creation_crew.services.tts_provider import split_sentences
+
+        assert split_sentences("  \n\n ") == []
+
+
+class TestStreamedSynthesis:
+    """Test chunk-by-chunk WAV output"""
+
+    def test_write_wav_stream(self, tmp_path):
+        """Test that chunks are written to a valid WAV with progress per chunk"""
+        import wave
+        from content_creation_crew.services.tts_provider import PCMChunk, write_wav_stream
+
+        chunks = [PCMChunk(b'\x00\x01' * 1000, 1000, 2, 1, index, 3) for index in range(3)]
+        progress = []
+        output_path = tmp_path / "out.wav"
+
+        duration_sec, sample_rate = write_wav_stream(
+            iter(chunks), str(output_path), lambda done, total: progress.append((done, total))
+        )
+
+        assert (duration_sec, sample_rate) == (3.0, 1000)
+        assert progress == [(1, 3), (2, 3), (3, 3)]
+        with wave.open(str(output_path), 'rb') as wav_file:
+            assert wav_file.getnframes() == 3000
+            assert wav_file.getframerate() == 1000
+
+    def test_write_wav_stream_requires_audio(self, tmp_path):
+        """Test that synthesis producing no audio is an error"""
+        from content_creation_crew.services.tts_provider import write_wav_stream
+
+        with pytest.raises(RuntimeError):
+            write_wav_stream(iter([]), str(tmp_path / "out.wav"))
+
+    def test_piper_stream_synthesizes_per_chunk(self, piper_provider, monkeypatch):
+        """Test that Piper synthesizes each sentence chunk separately under the voice lock"""
+        from content_creation_crew.services import tts_provider as tts_module
+
+        provider, loaded_voice = piper_provider
+        monkeypatch.setattr(tts_module, "TTS_CHUNK_MAX_CHARS", 20)
+
+        chunks = list(provider.synthesize_stream("One two three. Four five six. Seven."))
+
+        assert loaded_voice.voice.calls == ["One two three.", "Four five six.", "Seven."]
+        assert [(chunk.index, chunk.total) for chunk in chunks] == [(0, 3), (1, 3), (2, 3)]
+        assert not loaded_voice.lock.locked()
+
+
+class TestSynthesisPool:
+    """Test sharding narration across synthesis workers"""
+
+    @pytest.fixture
+    def thread_pool(self, piper_provider, monkeypatch):
+        """Synthesis pool backed by threads running the worker code in-process"""
+        from concurrent.futures import ThreadPoolExecutor
+        from content_creation_crew.services import tts_provider as tts_module
+
+        monkeypatch.setattr(tts_module, "_worker_provider", piper_provider[0])
+        pool = tts_module.SynthesisPool.__new__(tts_module.SynthesisPool)
+        pool.workers = 2
+        pool.broken = False
+        pool._executor = ThreadPoolExecutor(max_workers=2)
+        yield pool
+        pool.shutdown()
+
+    def test_batches_stitched_in_order(self, thread_pool, piper_provider):
+        """Test that pooled output matches serial synthesis chunk for chunk"""
+        provider, _ = piper_provider
+        text_chunks = [f"Sentence number {index}." for index in range(9)]
+
+        pooled = list(thread_pool.synthesize("default", text_chunks))
+        serial = list(provider._synthesize_chunks("default", text_chunks, 0, len(text_chunks)))
+
+        assert [chunk.index for chunk in pooled] == list(range(9))
+        assert [chunk.audio for chunk in pooled] == [chunk.audio for chunk in serial]
+
+    def test_mismatched_sample_rate_rejected(self, thread_pool, piper_provider, monkeypatch):
+        """Test that batches with a different audio format are not stitched"""
+        provider, loaded_voice = piper_provider
+        original = loaded_voice.voice.synthesize
+
+        def synthesize(text):
+            for chunk in original(text):
+                if text.endswith("5."):
+                    chunk.sample_rate = 16000
+                yield chunk
+
+        monkeypatch.setattr(loaded_voice.voice, "synthesize", synthesize)
+
+        with pytest.raises(RuntimeError):
+            list(thread_pool.synthesize("default", [f"Sentence {index}." for index in range(8)]))
+
+    def test_disabled_by_default(self, monkeypatch):
+        """Test that no pool is started unless workers are configured"""
+        from content_creation_crew.services import tts_provider as tts_module
+
+        monkeypatch.setattr(tts_module, "TTS_SYNTHESIS_WORKERS", 0)
+        assert tts_module.get_synthesis_pool("models/piper") is None
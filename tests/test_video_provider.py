@@ -0,0 +1,183 @@
+"""
+Tests for the baseline video renderer's single-pass ffmpeg pipeline
+"""
+import subprocess
+import time
+import pytest
+
+
+@pytest.fixture
+def ffmpeg_calls(monkeypatch):
+    """Record ffmpeg invocations instead of running them"""
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+    monkeypatch.setattr(subprocess, "run", fake_run)
+    return calls
+
+
+@pytest.fixture
+def renderer():
+    from content_creation_crew.services.video_provider import BaselineVideoRenderer
+    return BaselineVideoRenderer.__new__(BaselineVideoRenderer)
+
+
+class TestSinglePassRender:
+    """Test the concat list and ffmpeg command"""
+
+    def test_concat_list_durations(self, renderer, ffmpeg_calls, tmp_path):
+        """Test that every frame is listed with its duration and the last frame is repeated"""
+        frames = [tmp_path / "scene_000.png", tmp_path / "scene_001.png"]
+
+        renderer._render_single_pass(frames, [5.0, 2.5], 30, None, tmp_path / "final_video.mp4")
+
+        assert (tmp_path / "final_video.ffconcat").read_text().splitlines() == [
+            "ffconcat version 1.0",
+            "file 'scene_000.png'",
+            "duration 5.000",
+            "file 'scene_001.png'",
+            "duration 2.500",
+            "file 'scene_001.png'",
+        ]
+        assert len(ffmpeg_calls) == 1
+        cmd = ffmpeg_calls[0]
+        assert cmd[cmd.index("-t") + 1] == "7.500"
+        assert "-c:a" not in cmd
+
+    def test_narration_muxed_in_same_pass(self, renderer, ffmpeg_calls, tmp_path):
+        """Test that narration is looped, mapped and encoded by the same ffmpeg run"""
+        renderer._render_single_pass([tmp_path / "scene_000.png"], [5.0], 30, "narration.wav", tmp_path / "out.mp4")
+
+        cmd = ffmpeg_calls[0]
+        assert cmd.count("-i") == 2
+        assert cmd[cmd.index("-stream_loop") + 1] == "-1"
+        assert ["-map", "1:a"] == cmd[cmd.index("1:a") - 1:cmd.index("1:a") + 1]
+        assert cmd.count("libx264") == 1
+
+    def test_ffmpeg_failure_raises(self, renderer, monkeypatch, tmp_path):
+        """Test that an ffmpeg error surfaces with its stderr"""
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, b"", b"Invalid data found")
+        )
+
+        with pytest.raises(RuntimeError, match="Invalid data found"):
+            renderer._render_single_pass([tmp_path / "scene_000.png"], [5.0], 30, None, tmp_path / "out.mp4")
+
+
+class TestSceneFrames:
+    """Test cached text layout and pooled frame rendering"""
+
+    def test_wrap_text_fits_width(self):
+        """Test that words are wrapped greedily to the pixel width"""
+        from content_creation_crew.services.video_provider import _wrap_text
+
+        class FixedWidthFont:
+            def getbbox(self, text):
+                return (0, 0, 10 * len(text), 10)
+
+        lines = _wrap_text("one two three four five", FixedWidthFont(), 100)
+        assert lines == ("one two", "three", "four five")
+
+    def test_frames_rendered_in_scene_order(self, renderer, monkeypatch, tmp_path):
+        """Test that pooled frames come back in scene order"""
+        from concurrent.futures import ThreadPoolExecutor
+        from content_creation_crew.services import video_provider as video_module
+
+        def fake_render(scene_title, output_path, **kwargs):
+            time.sleep(0.01 * (3 - int(scene_title)))
+            return output_path
+
+        executor = ThreadPoolExecutor(max_workers=3)
+        monkeypatch.setattr(video_module, "render_scene_frame", fake_render)
+        monkeypatch.setattr(video_module, "get_frame_pool", lambda: executor)
+        jobs = [{"scene_title": str(index), "output_path": tmp_path / f"scene_{index:03d}.png"} for index in range(3)]
+
+        try:
+            assert renderer._render_scene_frames(jobs) == [job["output_path"] for job in jobs]
+        finally:
+            executor.shutdown()
+
+    def test_broken_pool_falls_back_to_serial(self, renderer, monkeypatch, tmp_path):
+        """Test that a dead frame worker pool does not fail the render"""
+        from concurrent.futures.process import BrokenProcessPool
+        from content_creation_crew.services import video_provider as video_module
+
+        class BrokenPool:
+            def submit(self, *args, **kwargs):
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(video_module, "render_scene_frame", lambda scene_title, output_path, **kwargs: output_path)
+        monkeypatch.setattr(video_module, "get_frame_pool", lambda: BrokenPool())
+        monkeypatch.setattr(video_module, "shutdown_frame_pool", lambda: None)
+        jobs = [{"scene_title": str(index), "output_path": tmp_path / f"scene_{index:03d}.png"} for index in range(2)]
+
+        assert renderer._render_scene_frames(jobs) == [job["output_path"] for job in jobs]
+
+    def test_render_scene_frame(self, tmp_path):
+        """Test that a frame is written at the requested resolution"""
+        pytest.importorskip("PIL")
+        from PIL import Image
+        from content_creation_crew.services.video_provider import render_scene_frame
+
+        output_path = render_scene_frame(
+            "Title", "Some scene text " * 10, (320, 180), "placeholder", "#000000", None, tmp_path / "frame.png"
+        )
+
+        with Image.open(output_path) as image:
+            assert image.size == (320, 180)
+            assert image.getpixel((0, 0)) == (30, 30, 30)
+
+
+class TestRenderOutput:
+    """Test that the rendered video is handed over as a file"""
+
+    def test_render_returns_video_path(self, renderer, monkeypatch):
+        """Test that the video stays on disk in a caller-owned work dir"""
+        import os
+        import shutil
+        from content_creation_crew.services import video_provider as video_module
+
+        def fake_run(cmd, **kwargs):
+            with open(cmd[-1], "wb") as f:
+                f.write(b"mp4")
+            return subprocess.CompletedProcess(cmd, 0, b"", b"")
+
+        monkeypatch.setattr(subprocess, "run", fake_run)
+        monkeypatch.setattr(video_module, "render_scene_frame", lambda output_path, **kwargs: output_path)
+        renderer._available = True
+        renderer._moviepy_available = False
+
+        result = renderer.render({"scenes": [{"title": "One", "content": "Text"}]}, {"pipeline": "ffmpeg"})
+
+        try:
+            assert "video_file" not in result
+            assert os.path.dirname(result["video_path"]) == result["work_dir"]
+            with open(result["video_path"], "rb") as f:
+                assert f.read() == b"mp4"
+        finally:
+            shutil.rmtree(result["work_dir"])
+
+    def test_failed_render_removes_work_dir(self, renderer, monkeypatch, tmp_path):
+        """Test that a failed render cleans up its own temp files"""
+        import tempfile
+        from content_creation_crew.services import video_provider as video_module
+
+        work_dir = tmp_path / "render"
+        work_dir.mkdir()
+        monkeypatch.setattr(tempfile, "mkdtemp", lambda: str(work_dir))
+        monkeypatch.setattr(
+            subprocess, "run",
+            lambda cmd, **kwargs: subprocess.CompletedProcess(cmd, 1, b"", b"encoder error")
+        )
+        monkeypatch.setattr(video_module, "render_scene_frame", lambda output_path, **kwargs: output_path)
+        renderer._available = True
+        renderer._moviepy_available = False
+
+        with pytest.raises(RuntimeError):
+            renderer.render({"scenes": [{"title": "One", "content": "Text"}]}, {"pipeline": "ffmpeg"})
+
+        assert not work_dir.exists()
@@ -0,0 +1,139 @@
+"""
+Tests for the queue generation worker
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock, patch
+
+
+class FakeQueue:
+    """Job queue double that records lease calls"""
+
+    lease_seconds = 3
+
+    def __init__(self, heartbeat_result):
+        self.heartbeat_result = heartbeat_result
+        self.released = []
+        self.abandoned = []
+
+    def heartbeat(self, worker_id, job_ids):
+        return self.heartbeat_result
+
+    def release(self, worker_id, job_id):
+        self.released.append(job_id)
+
+    def abandon(self, worker_id, job_id):
+        self.abandoned.append(job_id)
+
+
+def make_claimed_job(job_id=1):
+    from content_creation_crew.services.job_queue import ClaimedJob
+    return ClaimedJob(job_id=job_id, user_id=7, org_id=3, topic="topic", content_types=["blog"], attempt=1, recovered=True)
+
+
+class TestGenerationWorker:
+    """Test lease loss and cancellation handling"""
+
+    @pytest.mark.asyncio
+    async def test_lost_lease_stops_job_without_recording_cancel(self):
+        """Test that a job whose lease moved to another worker is stopped without status writes or events"""
+        from content_creation_crew import content_routes
+        from content_creation_crew.services.job_queue import HeartbeatResult
+        from content_creation_crew.worker import GenerationWorker
+
+        started = asyncio.Event()
+
+        async def run_forever(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(3600)
+
+        queue = FakeQueue(HeartbeatResult(lost=[1]))
+        worker = GenerationWorker(concurrency=1, poll_interval=0.01, queue=queue, worker_id="worker-a")
+        session_factory = Mock()
+        sse_store = Mock()
+
+        with patch.object(worker, "_resolve_plan", return_value="free"), \
+                patch.object(content_routes, "run_generation_async", run_forever), \
+                patch("content_creation_crew.database.SessionLocal", session_factory), \
+                patch("content_creation_crew.services.sse_store.get_sse_store", return_value=sse_store):
+            task = asyncio.create_task(worker._run_job(make_claimed_job()))
+            worker._tasks[1] = task
+            await asyncio.wait_for(started.wait(), timeout=2.0)
+
+            await worker._heartbeat()
+            await asyncio.gather(task, return_exceptions=True)
+
+        session_factory.assert_not_called()
+        sse_store.add_event.assert_not_called()
+        assert queue.released == [] and queue.abandoned == []
+        assert worker._lease_lost == set()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_job_is_stopped_and_released(self):
+        """Test that a job cancelled through the API is stopped and released from the queue"""
+        from content_creation_crew.services.job_queue import HeartbeatResult
+        from content_creation_crew.worker import GenerationWorker
+
+        queue = FakeQueue(HeartbeatResult(cancelled=[1]))
+        worker = GenerationWorker(concurrency=1, poll_interval=0.01, queue=queue, worker_id="worker-a")
+
+        async def run_forever(*args, **kwargs):
+            await asyncio.sleep(3600)
+
+        with patch.object(worker, "_resolve_plan", return_value="free"), \
+                patch("content_creation_crew.content_routes.execute_generation_job", run_forever):
+            task = asyncio.create_task(worker._run_job(make_claimed_job()))
+            worker._tasks[1] = task
+            await asyncio.sleep(0.05)
+
+            await worker._heartbeat()
+            await asyncio.gather(task, return_exceptions=True)
+
+        assert queue.released == [1]
+
+    @pytest.mark.asyncio
+    async def test_api_cancelled_job_sends_no_second_event(self):
+        """Test that stopping a job the API already marked CANCELLED leaves its status and events alone"""
+        from content_creation_crew import content_routes
+        from content_creation_crew.services.job_queue import HeartbeatResult
+        from content_creation_crew.worker import GenerationWorker
+
+        started = asyncio.Event()
+
+        async def run_forever(*args, **kwargs):
+            started.set()
+            await asyncio.sleep(3600)
+
+        queue = FakeQueue(HeartbeatResult(cancelled=[1]))
+        worker = GenerationWorker(concurrency=1, poll_interval=0.01, queue=queue, worker_id="worker-a")
+        content_service = Mock()
+        content_service.get_job.return_value = Mock(status="cancelled")
+        sse_store = Mock()
+
+        with patch.object(worker, "_resolve_plan", return_value="free"), \
+                patch.object(content_routes, "run_generation_async", run_forever), \
+                patch("content_creation_crew.database.SessionLocal", Mock()), \
+                patch("content_creation_crew.services.content_service.ContentService", return_value=content_service), \
+                patch("content_creation_crew.services.sse_store.get_sse_store", return_value=sse_store):
+            task = asyncio.create_task(worker._run_job(make_claimed_job()))
+            worker._tasks[1] = task
+            await asyncio.wait_for(started.wait(), timeout=2.0)
+
+            await worker._heartbeat()
+            await asyncio.gather(task, return_exceptions=True)
+
+        content_service.update_job_status.assert_not_called()
+        sse_store.add_event.assert_not_called()
+        assert queue.released == [1]
+
+    def test_main_requires_redis(self, monkeypatch):
+        """Test that the worker refuses to start without Redis, since job events could not reach API streams"""
+        from content_creation_crew import worker
+        from content_creation_crew.config import config
+
+        monkeypatch.setattr(config, "REDIS_URL", None)
+        monkeypatch.setattr(worker, "setup_logging", lambda **kwargs: None)
+        monkeypatch.setattr(worker, "GenerationWorker", lambda: pytest.fail("worker started without Redis"))
+
+        with pytest.raises(SystemExit):
+            worker.main()